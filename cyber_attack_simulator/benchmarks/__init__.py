@@ -0,0 +1 @@
+"""Benchmarks de performance du simulateur (sans dépendance externe)."""
@@ -0,0 +1,46 @@
+# benchmarks/__main__.py
+"""
+Point d'entrée de la suite de benchmarks.
+
+    python -m cyber_attack_simulator.benchmarks --output bench.json
+    python -m cyber_attack_simulator.benchmarks --compare bench.json --threshold 0.25
+"""
+import argparse
+import sys
+
+from cyber_attack_simulator.benchmarks.suite import (DEFAULT_SIZES, DEFAULT_THRESHOLD, compare, load,
+                                                     print_summary, run_suite, save)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks du Cyber Attack Simulator")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="tailles des catalogues synthétiques")
+    parser.add_argument("--repeat", type=int, default=3, help="répétitions des mesures de démarrage")
+    parser.add_argument("--iterations", type=int, default=20, help="appels par handler")
+    parser.add_argument("--no-catalog", action="store_true", help="ignore le catalogue livré")
+    parser.add_argument("--output", help="enregistre les résultats JSON dans ce fichier")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare à un fichier de référence")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="écart relatif toléré avant de signaler une régression")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.repeat, args.iterations, not args.no_catalog)
+    print_summary(results)
+    if args.output:
+        save(results, args.output)
+        print(f"💾 Résultats enregistrés dans {args.output}")
+
+    if args.compare:
+        regressions = compare(load(args.compare), results, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} régression(s) au-delà de {args.threshold:.0%} :")
+            for metric, old, new, change in regressions:
+                print(f"  - {metric}: {old:.4g} -> {new:.4g} ({change:+.0%})")
+            return 1
+        print(f"✅ Aucune régression au-delà de {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# benchmarks/bench_completion.py
+"""
+Mesure la construction des index de complétion et la latence des requêtes
+(complétion par préfixe, suggestions « vouliez-vous dire ») sur un catalogue synthétique.
+
+    python -m cyber_attack_simulator.benchmarks.bench_completion [nombre_de_noms]
+"""
+import random
+import sys
+import time
+
+from cyber_attack_simulator.utils.completion import CommandCompleter
+from cyber_attack_simulator.benchmarks.synthetic import make_synthetic_commands
+
+
+def typo(rng: random.Random, word: str) -> str:
+    """Introduit une faute de frappe (substitution, suppression ou inversion)."""
+    i = rng.randrange(len(word) - 1)
+    kind = rng.randrange(3)
+    if kind == 0:
+        return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]
+    if kind == 1:
+        return word[:i] + word[i + 1:]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def run(count: int = 10000, queries: int = 1000, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    metadata = {c["name"]: c["params"] for c in make_synthetic_commands(count, seed)}
+    names = list(metadata)
+
+    start = time.perf_counter()
+    completer = CommandCompleter(metadata)
+    build = time.perf_counter() - start
+
+    prefixes = [name[:rng.randint(2, 8)] for name in rng.sample(names, queries)]
+    start = time.perf_counter()
+    for prefix in prefixes:
+        completer.complete_command(prefix, limit=20)
+    prefix_latency = (time.perf_counter() - start) / queries
+
+    lines = [f"{name} " for name in rng.sample(names, queries)]
+    start = time.perf_counter()
+    for line in lines:
+        completer.complete(line)
+    param_latency = (time.perf_counter() - start) / queries
+
+    typos = [(typo(rng, name), name) for name in rng.sample(names, queries)]
+    start = time.perf_counter()
+    suggestions = [(completer.suggest(word), name) for word, name in typos]
+    suggest_latency = (time.perf_counter() - start) / queries
+    hits = sum(1 for found, name in suggestions if name in found)
+
+    start = time.perf_counter()
+    completer.bktree
+    bktree_build = time.perf_counter() - start
+
+    return {
+        "names": count,
+        "build_s": build,
+        "prefix_ms": prefix_latency * 1000,
+        "param_ms": param_latency * 1000,
+        "suggest_ms": suggest_latency * 1000,
+        "suggest_hit_ratio": hits / queries,
+        "bktree_build_s": bktree_build,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 10000
+    results = run(count)
+    print(f"📊 Complétion sur {results['names']} noms (construction {results['build_s'] * 1000:.1f} ms)")
+    print(f"  - Complétion par préfixe : {results['prefix_ms']:.4f} ms/requête")
+    print(f"  - Paramètre positionnel  : {results['param_ms']:.4f} ms/requête")
+    print(f"  - Suggestion             : {results['suggest_ms']:.3f} ms/requête "
+          f"({results['suggest_hit_ratio']:.0%} des noms d'origine proposés)")
+    print(f"  - Construction de l'arbre BK (différée) : {results['bktree_build_s'] * 1000:.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main()
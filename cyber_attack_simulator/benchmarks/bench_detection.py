@@ -0,0 +1,58 @@
+# benchmarks/bench_detection.py
+"""
+Compare l'évaluation du risque de détection action par action et par lot NumPy.
+
+    python -m cyber_attack_simulator.benchmarks.bench_detection [nombre_d_actions]
+"""
+import random
+import sys
+import time
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.risk_calculator import DetectionEngine
+from cyber_attack_simulator.benchmarks.synthetic import make_synthetic_commands
+
+
+def make_actions(detection: DetectionEngine, catalog: CommandCatalog, count: int, sessions: int, seed: int = 0):
+    rng = random.Random(seed)
+    engines = []
+    for _ in range(sessions):
+        engine = CyberAttackEngine()
+        engine.detection = detection
+        engines.append(engine)
+    names = [spec.name for spec in catalog]
+    return [(rng.choice(engines), rng.choice(names), {"ip": f"10.0.{rng.randint(0, 3)}.1"}) for _ in range(count)]
+
+
+def run(count: int = 10000, sessions: int = 1000) -> dict:
+    catalog = CommandCatalog(CommandCatalog.compile_commands(make_synthetic_commands(1800)))
+    detection = DetectionEngine(catalog, sensitivity={"10.0.0.1": 3.0})
+
+    actions = make_actions(detection, catalog, count, sessions)
+    start = time.perf_counter()
+    for engine, command, params in actions:
+        engine.update_detection(engine.detection_risk(command, params))
+        engine.repetitions[command] = engine.repetitions.get(command, 0) + 1
+    per_action = time.perf_counter() - start
+
+    actions = make_actions(detection, catalog, count, sessions)
+    start = time.perf_counter()
+    detection.apply_batch(actions)
+    batch = time.perf_counter() - start
+
+    return {"actions": count, "sessions": sessions, "per_action_s": per_action, "batch_s": batch}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 10000
+    results = run(count)
+    print(f"📊 Détection de {results['actions']} actions sur {results['sessions']} sessions")
+    print(f"  - Action par action : {results['per_action_s'] * 1000:.2f} ms")
+    print(f"  - Lot NumPy         : {results['batch_s'] * 1000:.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/bench_directory.py
+"""
+Annuaire simulé : génération de 500 000 objets, puis requêtes LDAP évaluées sur les
+index (première exécution et exécution répétée), comparées à un parcours de tous les
+objets, et pagination d'un résultat volumineux.
+
+    python -m cyber_attack_simulator.benchmarks.bench_directory [utilisateurs]
+"""
+import re
+import sys
+import time
+
+from cyber_attack_simulator.utils.directory import Directory, dn_name
+
+NAIVE_OBJECTS = 5_000
+QUERIES = {
+    "admins_transitifs": "(&(objectClass=user)(memberOf:1.2.840.113556.1.4.1941:="
+                         "CN=Admins du domaine,OU=Groupes,DC=corp,DC=local))",
+    "it_actifs": "(&(objectClass=user)(department=IT)(title=Directeur)(!(userAccountControl=514)))",
+    "kerberoastables": "(&(objectClass=user)(servicePrincipalName=*))",
+    "prefixe": "(sAMAccountName=jdup*)",
+    "serveurs": "(|(operatingSystem=Windows Server 2019)(operatingSystem=Windows Server 2022))",
+}
+
+
+def naive_match(directory: Directory, node: tuple, object_id: int, entry: dict = None) -> bool:
+    """Référence : le filtre est évalué sur l'entrée complète de chaque objet."""
+    entry = entry if entry is not None else directory.entry(object_id)
+    kind = node[0]
+    if kind == "and":
+        return all(naive_match(directory, child, object_id, entry) for child in node[1])
+    if kind == "or":
+        return any(naive_match(directory, child, object_id, entry) for child in node[1])
+    if kind == "not":
+        return not naive_match(directory, node[1], object_id, entry)
+    values = {key.lower(): value for key, value in entry.items()}
+    if node[1] == "memberof":
+        groups = [dn_name(dn).lower() for dn in values.get("memberof", [])]
+        if kind == "present":
+            return bool(groups)
+        target = dn_name(node[2]).lower()
+        if kind == "eq":
+            return target in groups
+        # Règle transitive : parcours des groupes parents
+        seen, pending = set(), list(groups)
+        while pending:
+            group = pending.pop()
+            if group == target:
+                return True
+            if group not in seen:
+                seen.add(group)
+                pending.extend(dn_name(dn).lower() for dn in directory.entry(directory.find(group)).get("memberOf", []))
+        return False
+    value = values.get(node[1]) if node[1] not in ("cn", "name") else values["samaccountname"]
+    if value is None:
+        return False
+    if kind == "present":
+        return True
+    if kind == "like":
+        return re.fullmatch(".*".join(map(re.escape, node[2])), value, re.IGNORECASE | re.DOTALL) is not None
+    return value.lower() == node[2].lower()
+
+
+def run(users: int = 400_000) -> dict:
+    start = time.perf_counter()
+    directory = Directory.generate(users=users, groups=users // 20, computers=users // 5)
+    generate_s = time.perf_counter() - start
+
+    results = {"objects": directory.size, "generate_s": generate_s}
+    for name, query in QUERIES.items():
+        start = time.perf_counter()
+        found = directory.search(query)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        directory.search(query)
+        warm = time.perf_counter() - start
+        node = directory.compile(query)
+        sample = range(0, directory.size, max(1, directory.size // NAIVE_OBJECTS))
+        start = time.perf_counter()
+        expected = [i for i in sample if naive_match(directory, node, i)]
+        naive = (time.perf_counter() - start) / len(sample) * directory.size
+        assert expected == [i for i in found.ids.tolist() if i in set(sample)]
+        results[name] = {"matches": len(found), "cold_ms": cold * 1e3, "warm_ms": warm * 1e3,
+                         "naive_projected_s": naive}
+
+    found = directory.search("(objectClass=user)")
+    start = time.perf_counter()
+    first = found.page(1, 100)
+    results["page_ms"] = (time.perf_counter() - start) * 1e3
+    results["page_entries"] = len(first)
+    results["user_pages"] = found.page_count(100)
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    r = run(int(argv[0]) if argv else 400_000)
+    print(f"📊 Annuaire : {r['objects']} objets générés en {r['generate_s']:.2f} s")
+    for name in QUERIES:
+        q = r[name]
+        print(f"  - {name:<18}: {q['matches']:>6} résultats, index {q['cold_ms']:.1f} ms (1re) / "
+              f"{q['warm_ms']:.2f} ms, parcours ~{q['naive_projected_s']:.1f} s")
+    print(f"  - Page de {r['page_entries']} utilisateurs ({r['user_pages']} pages) : {r['page_ms']:.2f} ms")
+    return r
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# benchmarks/bench_dispatch.py
+"""
+Mesure le chemin d'une commande : analyse de la ligne saisie, surcoût de dispatch
+d'`execute_command` et latence de chaque handler enregistré.
+
+Sur un catalogue synthétique, chaque commande déclare un comportement exécuté par le
+handler générique (handlers.generic) ; le catalogue réel est mesuré avec ses vrais handlers.
+
+    python -m cyber_attack_simulator.benchmarks.bench_dispatch [nombre_de_commandes]
+"""
+import sys
+import tempfile
+import time
+
+from cyber_attack_simulator.command_catalog import DEFAULT_COMMANDS_FILE
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.main import parse_command
+from cyber_attack_simulator.benchmarks.synthetic import write_synthetic_catalog
+
+SAMPLE_VALUES = {
+    "domaine": "example.com", "ip": "10.0.0.1", "url": "http://example.com/login",
+    "ports": "1-1024", "cible": "CibleCorp", "wordlist": "common.txt", "type": "A",
+    "organisation": "CibleCorp", "parametre": "id", "reseau": "10.0.0.0/24",
+}
+
+
+def sample_params(param_names) -> dict:
+    return {name: SAMPLE_VALUES.get(name, "valeur") for name in param_names}
+
+
+def command_line(name: str, param_names) -> str:
+    return " ".join([name] + [SAMPLE_VALUES.get(p, "valeur") for p in param_names])
+
+
+def synthetic_engine(commands_file: str) -> CyberAttackEngine:
+    engine = CyberAttackEngine(seed=0)
+    CommandHandlerFactory(engine, commands_file).initialize_all_handlers()
+    return engine
+
+
+def per_second(func, items: list, min_time: float = 0.05) -> float:
+    """Débit (appels par seconde) de `func` sur `items`, répété au moins `min_time` secondes."""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        for item in items:
+            func(item)
+        calls += len(items)
+        elapsed = time.perf_counter() - start
+    return calls / elapsed
+
+
+def handler_latencies(engine: CyberAttackEngine, iterations: int = 20) -> dict:
+    """Latence moyenne (µs) d'un appel direct à chaque handler enregistré."""
+    latencies = {}
+    for name, handler in engine.handlers.items():
+        params = sample_params(engine.command_metadata.get(name, ()))
+        start = time.perf_counter()
+        for _ in range(iterations):
+            handler(params)
+        latencies[name] = (time.perf_counter() - start) / iterations * 1e6
+    return latencies
+
+
+def summarize(latencies: dict) -> dict:
+    values = sorted(latencies.values())
+    if not values:
+        return {"handlers": 0}
+    return {
+        "handlers": len(values),
+        "handler_mean_us": sum(values) / len(values),
+        "handler_p50_us": values[len(values) // 2],
+        "handler_max_us": values[-1],
+    }
+
+
+def measure(engine: CyberAttackEngine, iterations: int = 20, per_handler: bool = False) -> dict:
+    names = list(engine.handlers)
+    lines = [command_line(name, engine.command_metadata.get(name, ())) for name in names]
+    calls = [(name, sample_params(engine.command_metadata.get(name, ()))) for name in names]
+    # Le cache de résultats et le journal sont hors sujet : on mesure le dispatch brut
+    engine.catalog = None
+
+    noop = {"success": False, "output": ""}
+    direct = {name: engine.handlers[name] for name in names}
+    for name in names:
+        engine.handlers[name] = lambda params: noop
+    dispatch_rate = per_second(lambda call: engine.execute_command(*call), calls)
+    direct_rate = per_second(lambda call: noop, calls)
+    engine.handlers.update(direct)
+
+    latencies = handler_latencies(engine, iterations)
+    results = {
+        "parse_per_s": per_second(lambda line: parse_command(engine, line), lines),
+        "dispatch_overhead_us": max(1e6 / dispatch_rate - 1e6 / direct_rate, 0.0),
+        "execute_per_s": per_second(lambda call: engine.execute_command(*call), calls),
+    }
+    results.update(summarize(latencies))
+    if per_handler:
+        results["per_handler_us"] = latencies
+    return results
+
+
+def run(count: int = 1000, iterations: int = 20) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = synthetic_engine(write_synthetic_catalog(tmp, count, behaviors=True))
+        results = measure(engine, iterations)
+    results["commands"] = count
+    return results
+
+
+def run_real_catalog(commands_file: str = DEFAULT_COMMANDS_FILE, iterations: int = 200) -> dict:
+    """Mesure les handlers réellement implémentés du catalogue livré."""
+    engine = CyberAttackEngine(seed=0)
+    CommandHandlerFactory(engine, commands_file).initialize_all_handlers()
+    return measure(engine, iterations, per_handler=True)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 1000
+    results = run(count)
+    print(f"📊 Dispatch sur un catalogue synthétique de {count} commandes")
+    print(f"  - Analyse des lignes        : {results['parse_per_s']:.0f} lignes/s")
+    print(f"  - Surcoût de dispatch       : {results['dispatch_overhead_us']:.2f} µs/commande")
+    print(f"  - execute_command complet   : {results['execute_per_s']:.0f} commandes/s")
+    print(f"  - Handler (moyenne / max)   : {results['handler_mean_us']:.2f} / {results['handler_max_us']:.2f} µs")
+    return results
+
+
+if __name__ == "__main__":
+    main()
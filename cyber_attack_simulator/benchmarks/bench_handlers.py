@@ -0,0 +1,159 @@
+# benchmarks/bench_handlers.py
+"""
+Compare une classe de handler par commande (ancienne approche de dns_handler.py)
+au handler générique piloté par le catalogue : temps d'import/chargement, mémoire
+et latence d'appel, pour un catalogue synthétique.
+
+    python -m cyber_attack_simulator.benchmarks.bench_handlers [nombre_de_commandes]
+"""
+import importlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.command_handler_factory import to_camel_case
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.handlers.generic import GenericHandler
+from cyber_attack_simulator.utils.rng import use_rng
+from cyber_attack_simulator.benchmarks.synthetic import make_synthetic_commands
+
+MODULE_HEADER = '''
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.rng import get_rng
+from cyber_attack_simulator.utils.results import CommandResult
+'''
+
+CLASS_TEMPLATE = '''
+class {class_name}(BaseHandler):
+    """Handler pour {name}"""
+    def handle_{name}(self, params: dict) -> dict:
+        value = params.get("{param}")
+        if not value:
+            return CommandResult.failure("❌ Erreur: {param} manquant.")
+
+        rng = get_rng()
+        results = [f"{{value.upper()}}-{{rng.randint(1, 254)}}" for _ in range(rng.randint(1, 3))]
+        return self._generate_mock_response("{name}", params, {{"Cible": value, "Résultats": results}})
+'''
+
+
+def write_class_module(directory: str, specs, module_name: str) -> str:
+    """Écrit un module contenant une classe par commande, comme les anciens handlers."""
+    parts = [MODULE_HEADER]
+    for spec in specs:
+        parts.append(CLASS_TEMPLATE.format(class_name=f"{to_camel_case(spec.name)}Handler",
+                                           name=spec.name, param=spec.params[0]))
+    path = os.path.join(directory, f"{module_name}.py")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("".join(parts))
+    return path
+
+
+def _measure(load, reset=None) -> tuple:
+    """
+    Exécute `load` deux fois : chronométré, puis sous tracemalloc (qui fausse les temps).
+    Retourne (résultat, secondes, octets alloués encore vivants).
+    """
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    if reset is not None:
+        reset()
+    tracemalloc.start()
+    result = load()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def _call_latency_us(engine, handlers: dict, specs, iterations: int) -> float:
+    calls = [(handlers[spec.name], {spec.params[0]: "example.com"}) for spec in specs]
+    with use_rng(engine.rng):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for handler, params in calls:
+                handler(params)
+    return (time.perf_counter() - start) / (iterations * len(calls)) * 1e6
+
+
+def class_equivalent_behavior(param: str) -> dict:
+    """Comportement déclaratif identique à CLASS_TEMPLATE, pour une comparaison à travail égal."""
+    return {
+        "required": {param: f"❌ Erreur: {param} manquant."},
+        "output": {
+            "Cible": {"template": f"{{{param}}}"},
+            "Résultats": {"template": f"{{{param}|upper}}-{{rand:1-254}}", "count": [1, 3]},
+        },
+    }
+
+
+def run(count: int = 1800, iterations: int = 5) -> dict:
+    commands = make_synthetic_commands(count)
+    for command in commands:
+        command["behavior"] = class_equivalent_behavior(command["params"][0])
+    catalog = CommandCatalog(CommandCatalog.compile_commands(commands))
+    engine = CyberAttackEngine(seed=0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        module_name = f"_bench_handlers_{os.getpid()}"
+        write_class_module(tmp, catalog, module_name)
+        sys.path.insert(0, tmp)
+        try:
+            def load_classes():
+                module = importlib.import_module(module_name)
+                handlers = {}
+                for spec in catalog:
+                    instance = getattr(module, f"{to_camel_case(spec.name)}Handler")(engine)
+                    if instance.initialize():
+                        handlers[spec.name] = getattr(instance, f"handle_{spec.name}")
+                return handlers
+
+            def unload():
+                sys.modules.pop(module_name, None)
+
+            # Import préalable : le bytecode est en cache, comme pour les vrais handlers
+            load_classes()
+            unload()
+            class_handlers, class_s, class_bytes = _measure(load_classes, unload)
+        finally:
+            sys.path.remove(tmp)
+            sys.modules.pop(module_name, None)
+
+    def load_generic():
+        generic = GenericHandler(engine)
+        return {spec.name: generic.handler_for(spec) for spec in catalog}
+
+    generic_handlers, generic_s, generic_bytes = _measure(load_generic)
+
+    return {
+        "commands": count,
+        "class_per_command": {
+            "load_ms": class_s * 1e3,
+            "memory_kb": class_bytes / 1024,
+            "call_us": _call_latency_us(engine, class_handlers, catalog, iterations),
+        },
+        "generic": {
+            "load_ms": generic_s * 1e3,
+            "memory_kb": generic_bytes / 1024,
+            "call_us": _call_latency_us(engine, generic_handlers, catalog, iterations),
+        },
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 1800
+    results = run(count)
+    print(f"📊 Handlers pour {count} commandes")
+    for name in ("class_per_command", "generic"):
+        values = results[name]
+        print(f"  - {name:17s}: chargement {values['load_ms']:.1f} ms, mémoire {values['memory_kb']:.0f} Ko, "
+              f"appel {values['call_us']:.2f} µs")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/bench_hints.py
+"""
+Branches de session : mémoire et temps par branche (copie sur écriture) pour une
+session ayant découvert un /16, comparés à une copie profonde de l'état, puis débit
+(nœuds/s) de la recherche d'indice best-first depuis une session neuve et depuis
+cette session avancée (dont les branches rejouent aussi ses balayages).
+
+    python -m cyber_attack_simulator.benchmarks.bench_hints [branches]
+"""
+import copy
+import sys
+import time
+import tracemalloc
+
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.hints import search_hint
+
+DEEP_COPIES = 10
+SEARCH_NODES = 2000
+
+
+def make_engine(seed: int = 7) -> CyberAttackEngine:
+    engine = CyberAttackEngine(seed=seed)
+    CommandHandlerFactory(engine).initialize_all_handlers(lazy=True)
+    return engine
+
+
+def make_session(network: str = "10.0.0.0/16", seed: int = 7) -> CyberAttackEngine:
+    """Session avancée : un réseau entier découvert et un historique rempli."""
+    engine = make_engine(seed)
+    for _ in range(10):
+        if engine.execute_command("scannerhotes", {"reseau": network})["success"]:
+            break
+    else:
+        raise RuntimeError("scannerhotes indisponible")
+    for index in range(engine.command_history.capacity):
+        engine.command_history.record("resoudredns", {"domaine": f"hote{index}.cible.example"})
+    return engine
+
+
+def deep_branch(engine: CyberAttackEngine) -> tuple:
+    """Référence : ce qu'une branche coûte sans partage (état, historique et flags copiés)."""
+    return copy.deepcopy(engine.game_state), copy.deepcopy(engine.command_history), set(engine.flags)
+
+
+def measure(make_branch, count: int) -> tuple:
+    """(octets retenus par branche, secondes par branche) pour `count` branches gardées en vie."""
+    # Durée et mémoire sont mesurées séparément : tracemalloc ralentit chaque allocation
+    start = time.perf_counter()
+    branches = [make_branch() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    del branches
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    branches = [make_branch() for _ in range(count)]
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del branches
+    return retained / count, elapsed / count
+
+
+def play(engine: CyberAttackEngine, ip: str) -> CyberAttackEngine:
+    branch = engine.fork()
+    branch.execute_command("scanneros", {"ip": ip})
+    return branch
+
+
+def run(branches: int = 1000) -> dict:
+    engine = make_session()
+    ip = next(iter(engine.game_state.discovered_targets))
+    fork_bytes, fork_s = measure(engine.fork, branches)
+    played_bytes, played_s = measure(lambda: play(engine, ip), branches)
+    deep_bytes, deep_s = measure(lambda: deep_branch(engine), DEEP_COPIES)
+
+    fresh = search_hint(make_engine(), goals={"HOST_COMPROMISED"}, max_nodes=SEARCH_NODES, max_depth=3)
+    loaded = search_hint(engine, goals={"HOST_COMPROMISED"}, max_nodes=SEARCH_NODES, max_depth=3)
+    return {
+        "targets": len(engine.game_state.discovered_targets),
+        "branches": branches,
+        "fork_bytes": fork_bytes,
+        "fork_us": fork_s * 1e6,
+        "played_bytes": played_bytes,
+        "played_us": played_s * 1e6,
+        "deepcopy_bytes": deep_bytes,
+        "deepcopy_ms": deep_s * 1e3,
+        "search_nodes": fresh.nodes,
+        "search_nodes_per_s": fresh.nodes / fresh.elapsed,
+        "search_depth": len(fresh.path),
+        "loaded_search_nodes": loaded.nodes,
+        "loaded_search_nodes_per_s": loaded.nodes / loaded.elapsed,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    r = run(int(argv[0]) if argv else 1000)
+    print(f"📊 Branches d'une session : {r['targets']} cibles découvertes, {r['branches']} branches")
+    print(f"  - Branche seule                 : {r['fork_bytes'] / 1e3:.1f} Ko, {r['fork_us']:.1f} µs")
+    print(f"  - Branche + une commande jouée  : {r['played_bytes'] / 1e3:.1f} Ko, {r['played_us']:.0f} µs")
+    print(f"  - Copie profonde (référence)    : {r['deepcopy_bytes'] / 1e6:.1f} Mo, {r['deepcopy_ms']:.0f} ms")
+    print(f"  - Recherche d'indice (neuve)    : {r['search_nodes']} nœuds, "
+          f"{r['search_nodes_per_s']:.0f} nœuds/s (chemin de {r['search_depth']} commandes)")
+    print(f"  - Recherche d'indice (avancée)  : {r['loaded_search_nodes']} nœuds, "
+          f"{r['loaded_search_nodes_per_s']:.0f} nœuds/s")
+    return r
+
+
+if __name__ == "__main__":
+    main()
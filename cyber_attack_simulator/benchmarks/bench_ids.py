@@ -0,0 +1,114 @@
+# benchmarks/bench_ids.py
+"""
+Défenseur simulé : débit de corrélation de 100 règles à fenêtres glissantes sur un flux
+d'un million d'événements, comparé au réexamen de l'historique à chaque événement.
+
+    python -m cyber_attack_simulator.benchmarks.bench_ids [événements] [règles]
+"""
+import random
+import sys
+import time
+from array import array
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.utils.intrusion import IDSRuleset, IntrusionDetector, _target
+from cyber_attack_simulator.benchmarks.synthetic import make_synthetic_commands, make_synthetic_ids_rules
+
+NAIVE_EVENTS = 5_000
+
+
+def make_events(catalog: CommandCatalog, count: int, targets: int = 500, seed: int = 0) -> tuple:
+    """Flux d'événements en colonnes : commande, paramètres, succès, horodatage."""
+    rng = random.Random(seed)
+    names = [spec.name for spec in catalog]
+    pool = [{"ip": f"10.0.{n // 256}.{n % 256}"} for n in range(targets)]
+    commands = [rng.choice(names) for _ in range(count)]
+    params = array('i', (rng.randrange(targets) for _ in range(count)))
+    success = array('b', (rng.random() < 0.9 for _ in range(count)))
+    times = array('d')
+    now = 0.0
+    for _ in range(count):
+        now += rng.expovariate(5.0)
+        times.append(now)
+    return commands, [pool[i] for i in params], success, times
+
+
+def naive_alerts(ruleset: IDSRuleset, events: tuple) -> int:
+    """Référence : recompte chaque fenêtre en relisant l'historique à chaque événement."""
+    history = []
+    alerts = 0
+    for command, params, success, now in zip(*events):
+        history.append((command, _target(params), bool(success), now))
+        target = _target(params)
+        for rule in ruleset.rules_for(command):
+            if rule.outcome is not None and rule.outcome is not bool(success):
+                continue
+            seen = set()
+            count = 0
+            for past_command, past_target, past_success, past_time in reversed(history):
+                if past_time <= now - rule.window:
+                    break
+                if rule not in ruleset.rules_for(past_command):
+                    continue
+                if rule.outcome is not None and rule.outcome is not past_success:
+                    continue
+                if rule.key == "target" and past_target != target:
+                    continue
+                if rule.key == "command" and past_command != command:
+                    continue
+                count += 1
+                seen.add(past_target)
+            if (len(seen) if rule.type == "sweep" else count) >= rule.threshold:
+                alerts += 1
+    return alerts
+
+
+def run(events_count: int = 1_000_000, rules: int = 100) -> dict:
+    commands = make_synthetic_commands(1800)
+    catalog = CommandCatalog(CommandCatalog.compile_commands(commands))
+    ruleset = IDSRuleset(make_synthetic_ids_rules(commands, rules), catalog)
+    events = make_events(catalog, events_count)
+
+    detector = IntrusionDetector(ruleset)
+    observe = detector.observe
+    raised = 0
+    start = time.perf_counter()
+    for command, params, success, now in zip(*events):
+        if observe(command, params, success, now):
+            raised += 1
+    elapsed = time.perf_counter() - start
+
+    head = tuple(column[:NAIVE_EVENTS] for column in events)
+    start = time.perf_counter()
+    naive_alerts(ruleset, head)
+    naive = time.perf_counter() - start
+
+    return {
+        "events": events_count,
+        "rules": rules,
+        "events_per_s": events_count / elapsed,
+        "us_per_event": elapsed / events_count * 1e6,
+        "naive_us_per_event": naive / len(head[0]) * 1e6,
+        "alerting_events": raised,
+        "retained_events": detector.pending_events(),
+        "windows": len(detector.windows),
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    events_count = int(argv[0]) if argv else 1_000_000
+    rules = int(argv[1]) if len(argv) > 1 else 100
+    results = run(events_count, rules)
+    print(f"📊 IDS : {results['rules']} règles, {results['events']} événements")
+    print(f"  - Fenêtres glissantes   : {results['events_per_s'] / 1e3:.0f} k événements/s "
+          f"({results['us_per_event']:.2f} µs/événement)")
+    print(f"  - Relecture historique  : {results['naive_us_per_event']:.2f} µs/événement "
+          f"(sur {NAIVE_EVENTS} événements)")
+    print(f"  - Événements alertants  : {results['alerting_events']}")
+    print(f"  - Fenêtres / événements retenus : {results['windows']} / {results['retained_events']}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_journal.py
+"""
+Coût du journal de session sur le chemin des commandes, et temps de restauration
+en fonction de la longueur de l'historique (avec et sans instantané).
+
+    python -m cyber_attack_simulator.benchmarks.bench_journal [longueurs...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.utils.journal import SessionJournal, restore_session, replay_session
+
+SCRIPT = [
+    ("resoudredns", {"domaine": "example.com"}),
+    ("trouversousdomaines", {"domaine": "example.com"}),
+    ("collecterosint", {"cible": "CibleCorp"}),
+    ("analyserwhois", {"domaine": "example.org"}),
+]
+
+
+def _engine(registry, seed: int = 1) -> CyberAttackEngine:
+    engine = CyberAttackEngine(seed=seed)
+    engine.share_registry(registry)
+    # Le cache rendrait les commandes répétées gratuites : on mesure le chemin complet
+    engine.catalog = None
+    return engine
+
+
+def _play(engine, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        command, params = SCRIPT[i % len(SCRIPT)]
+        engine.execute_command(command, params)
+    return time.perf_counter() - start
+
+
+def command_overhead(registry, count: int, directory: str) -> dict:
+    """Latence moyenne par commande (µs) sans journal et avec chaque mode fsync."""
+    results = {"none": _play(_engine(registry), count) / count * 1e6}
+    for mode in ("never", "batch", "always"):
+        n = count if mode != "always" else min(count, 500)
+        path = os.path.join(directory, f"overhead-{mode}.journal")
+        engine = _engine(registry)
+        journal = SessionJournal(path, fsync=mode, snapshot_every=0)
+        journal.attach(engine)
+        elapsed = _play(engine, n)
+        journal.close()
+        results[mode] = elapsed / n * 1e6
+    return results
+
+
+def restore_times(registry, length: int, directory: str) -> dict:
+    path = os.path.join(directory, f"restore-{length}.journal")
+    engine = _engine(registry)
+    journal = SessionJournal(path, fsync="never", snapshot_every=1000)
+    journal.attach(engine)
+    _play(engine, length)
+    journal.close()
+
+    timings = {"journal_bytes": os.path.getsize(path)}
+    start = time.perf_counter()
+    restore_session(path)
+    timings["restore_snapshot_ms"] = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    restore_session(path, use_snapshot=False)
+    timings["restore_deltas_ms"] = (time.perf_counter() - start) * 1e3
+    if length <= 10000:
+        start = time.perf_counter()
+        replay_session(path, registry)
+        timings["replay_ms"] = (time.perf_counter() - start) * 1e3
+    return timings
+
+
+def run(lengths=(1000, 10000, 100000), overhead_commands: int = 5000) -> dict:
+    registry = CyberAttackEngine()
+    CommandHandlerFactory(registry).initialize_all_handlers(lazy=True)
+    with tempfile.TemporaryDirectory() as directory:
+        return {
+            "command_latency_us": command_overhead(registry, overhead_commands, directory),
+            "restore": {length: restore_times(registry, length, directory) for length in lengths},
+        }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lengths = tuple(int(arg) for arg in argv) or (1000, 10000, 100000)
+    results = run(lengths)
+    print("📊 Latence par commande (µs)")
+    for mode, value in results["command_latency_us"].items():
+        print(f"  - fsync={mode:7s}: {value:.1f}")
+    print("📊 Restauration de session")
+    for length, timings in results["restore"].items():
+        line = (f"  - {length:>7d} commandes : instantané + deltas {timings['restore_snapshot_ms']:.1f} ms, "
+                f"deltas seuls {timings['restore_deltas_ms']:.1f} ms")
+        if "replay_ms" in timings:
+            line += f", rejeu complet {timings['replay_ms']:.1f} ms"
+        print(line + f" ({timings['journal_bytes'] / 1024:.0f} Ko)")
+    return results
+
+
+if __name__ == "__main__":
+    main()
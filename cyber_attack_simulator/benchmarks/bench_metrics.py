@@ -0,0 +1,57 @@
+# benchmarks/bench_metrics.py
+"""
+Surcoût de l'instrumentation sur `execute_command` : métriques désactivées, activées,
+et coût brut d'un enregistrement dans l'histogramme.
+
+    python -m cyber_attack_simulator.benchmarks.bench_metrics [itérations]
+"""
+import sys
+import time
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.metrics import EngineMetrics, LatencyHistogram
+
+
+def _engine() -> CyberAttackEngine:
+    engine = CyberAttackEngine()
+    result = {"success": True, "output": ""}
+    engine.register_handler("noop", lambda params: result)
+    return engine
+
+
+def _per_call_us(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int = 200000) -> dict:
+    params = {}
+    disabled = _engine()
+    enabled = _engine()
+    EngineMetrics().attach(enabled)
+    histogram = LatencyHistogram()
+    results = {
+        "disabled_us": _per_call_us(lambda: disabled.execute_command("noop", params), iterations),
+        "enabled_us": _per_call_us(lambda: enabled.execute_command("noop", params), iterations),
+        "histogram_record_us": _per_call_us(lambda: histogram.record(12345), iterations),
+    }
+    results["overhead_us"] = results["enabled_us"] - results["disabled_us"]
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    iterations = int(argv[0]) if argv else 200000
+    results = run(iterations)
+    print(f"📊 Instrumentation de execute_command ({iterations} appels)")
+    print(f"  - Métriques désactivées : {results['disabled_us']:.2f} µs/commande")
+    print(f"  - Métriques activées    : {results['enabled_us']:.2f} µs/commande "
+          f"(+{results['overhead_us']:.2f} µs)")
+    print(f"  - Enregistrement seul   : {results['histogram_record_us']:.2f} µs")
+    return results
+
+
+if __name__ == "__main__":
+    main()
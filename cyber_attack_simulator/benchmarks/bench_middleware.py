@@ -0,0 +1,60 @@
+# benchmarks/bench_middleware.py
+"""
+Surcoût de la chaîne de middlewares sur `execute_command`, en fonction du nombre de
+middlewares (crochets pre et post vides), comparé au chemin sans middleware.
+
+    python -m cyber_attack_simulator.benchmarks.bench_middleware [itérations]
+"""
+import sys
+import time
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+
+COUNTS = (0, 1, 2, 4, 8)
+
+
+def _engine(middlewares: int) -> CyberAttackEngine:
+    engine = CyberAttackEngine()
+    result = {"success": False, "output": ""}
+    engine.register_handler("noop", lambda params: result)
+    for i in range(middlewares):
+        engine.add_middleware(f"m{i}", pre=lambda e, c, p: None, post=lambda e, c, p, r: None)
+    return engine
+
+
+def _best_per_call_us(engine: CyberAttackEngine, iterations: int, repeat: int = 3) -> float:
+    params = {}
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            engine.execute_command("noop", params)
+        best = min(best, (time.perf_counter() - start) / iterations * 1e6)
+    return best
+
+
+def run(iterations: int = 100000, counts=COUNTS) -> dict:
+    latencies = {count: _best_per_call_us(_engine(count), iterations) for count in counts}
+    baseline = latencies[counts[0]]
+    return {
+        "latency_us": latencies,
+        "overhead_per_middleware_us": {count: (latency - baseline) / count
+                                       for count, latency in latencies.items() if count},
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    iterations = int(argv[0]) if argv else 100000
+    results = run(iterations)
+    print(f"📊 Chaîne de middlewares ({iterations} appels)")
+    for count, latency in results["latency_us"].items():
+        line = f"  - {count} middleware(s) : {latency:.2f} µs/commande"
+        if count:
+            line += f" (+{results['overhead_per_middleware_us'][count]:.2f} µs par middleware)"
+        print(line)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_progression.py
+"""
+Progression sur un arbre de 1800 commandes : compilation du scénario (avec détection
+de cycles) et coût d'un `add_flag`, incrémental contre un parcours complet des nœuds.
+
+    python -m cyber_attack_simulator.benchmarks.bench_progression [nombre_de_commandes]
+"""
+import sys
+import time
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.progression import Progression, attach_progression
+from cyber_attack_simulator.benchmarks.synthetic import make_synthetic_commands, make_synthetic_progression
+
+
+def naive_unlocks(progression: Progression, engine: CyberAttackEngine) -> list:
+    """Référence : réexamine tous les nœuds après chaque flag."""
+    state = engine.game_state
+    unlocked = []
+    for node in progression.nodes:
+        if all(flag in engine.flags for flag in node.requires_flags) \
+                and all(progression.by_id[d].unlocks[0] in state.unlocked_commands for d in node.after) \
+                and state.level >= node.min_level and state.experience >= node.min_xp:
+            unlocked.extend(c for c in node.unlocks if c not in state.unlocked_commands)
+    return unlocked
+
+
+def _play(engine: CyberAttackEngine, flags: list) -> float:
+    start = time.perf_counter()
+    for flag in flags:
+        engine.add_flag(flag)
+    return time.perf_counter() - start
+
+
+def run(count: int = 1800) -> dict:
+    commands = make_synthetic_commands(count)
+    catalog = CommandCatalog(CommandCatalog.compile_commands(commands))
+    data = make_synthetic_progression(commands)
+
+    start = time.perf_counter()
+    progression = Progression(data, catalog)
+    compile_s = time.perf_counter() - start
+
+    flags = [spec.flags[0] for spec in catalog]
+
+    engine = CyberAttackEngine()
+    engine.catalog = catalog
+    attach_progression(engine, progression, enforce=False)
+    engine.game_state.add_experience(10**6, progression.level_thresholds)
+    incremental = _play(engine, flags)
+    unlocked = len(engine.game_state.unlocked_commands)
+
+    naive = CyberAttackEngine()
+    naive.game_state.level, naive.game_state.experience = engine.game_state.level, engine.game_state.experience
+    start = time.perf_counter()
+    for flag in flags:
+        naive.flags.add(flag)
+        for command in naive_unlocks(progression, naive):
+            naive.game_state.unlock_command(command)
+    rescan = time.perf_counter() - start
+
+    return {
+        "commands": count,
+        "nodes": len(progression.nodes),
+        "flag_bits": len(progression.flag_bits),
+        "compile_ms": compile_s * 1e3,
+        "incremental_us_per_flag": incremental / len(flags) * 1e6,
+        "rescan_us_per_flag": rescan / len(flags) * 1e6,
+        "unlocked_commands": unlocked,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 1800
+    results = run(count)
+    print(f"📊 Progression : {results['commands']} commandes, {results['nodes']} nœuds, "
+          f"{results['flag_bits']} bits")
+    print(f"  - Compilation + détection de cycles : {results['compile_ms']:.2f} ms")
+    print(f"  - add_flag incrémental              : {results['incremental_us_per_flag']:.2f} µs/flag")
+    print(f"  - Parcours complet des nœuds        : {results['rescan_us_per_flag']:.2f} µs/flag")
+    print(f"  - Commandes débloquées              : {results['unlocked_commands']}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_results.py
+"""
+Compare l'ancien résultat dict (rapport construit par concaténation) et CommandResult
+(rendu différé) : latence et allocations par commande.
+
+    python -m cyber_attack_simulator.benchmarks.bench_results [itérations]
+"""
+import sys
+import time
+import tracemalloc
+
+from cyber_attack_simulator.utils.results import CommandResult
+
+OUTPUT_DATA = {
+    "Registrar": "Simulated Registrar Inc.",
+    "Creation Date": "2022-01-15",
+    "Admin Email": "admin@example.com",
+    "IPs": ["192.168.1.10", "192.168.4.22", "192.168.9.3"],
+}
+PARAMS = {"domaine": "example.com"}
+
+
+def eager_dict(command_name: str, params: dict, output_data: dict) -> dict:
+    """Ancienne implémentation de `_generate_mock_response`."""
+    report = f"--- Rapport pour {command_name} ---\n"
+    for key, value in output_data.items():
+        report += f"  - {key}: {value}\n"
+    report += "---------------------------------\n"
+    return {
+        "success": True,
+        "output": report,
+        "new_state": {f"last_{command_name}": {"params": params, "time": time.time()}},
+        "flags": [f"{command_name.upper()}_EXECUTED"],
+        "time_consumed": 0.1
+    }
+
+
+def lazy_result(command_name: str, params: dict, output_data: dict) -> CommandResult:
+    return CommandResult(
+        command_name,
+        data=output_data,
+        new_state={f"last_{command_name}": {"params": params, "time": time.time()}},
+        flags=[f"{command_name.upper()}_EXECUTED"],
+        time_consumed=0.1
+    )
+
+
+def lazy_rendered(command_name: str, params: dict, output_data: dict) -> CommandResult:
+    result = lazy_result(command_name, params, output_data)
+    result["output"]
+    return result
+
+
+def measure(factory, iterations: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        factory("analyserwhois", PARAMS, OUTPUT_DATA)
+    latency = (time.perf_counter() - start) / iterations
+
+    # Allocations : pic mémoire pour conserver 1000 résultats vivants
+    tracemalloc.start()
+    kept = [factory("analyserwhois", PARAMS, OUTPUT_DATA) for _ in range(1000)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return {"latency_us": latency * 1e6, "bytes_per_result": current / 1000}
+
+
+def run(iterations: int = 100000) -> dict:
+    return {
+        "dict_eager": measure(eager_dict, iterations),
+        "result_lazy": measure(lazy_result, iterations),
+        "result_rendered": measure(lazy_rendered, iterations),
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    iterations = int(argv[0]) if argv else 100000
+    results = run(iterations)
+    print(f"📊 Construction d'un résultat de commande ({iterations} itérations)")
+    for name, values in results.items():
+        print(f"  - {name:16s}: {values['latency_us']:.2f} µs, {values['bytes_per_result']:.0f} octets/résultat")
+    return results
+
+
+if __name__ == "__main__":
+    main()
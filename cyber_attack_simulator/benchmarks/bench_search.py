@@ -0,0 +1,96 @@
+# benchmarks/bench_search.py
+"""
+Recherche plein texte dans le catalogue : construction de l'index inversé, chargement
+depuis le cache binaire et latence des requêtes (BM25, accents repliés) sur un
+catalogue synthétique, comparées à un balayage de toutes les commandes par requête.
+
+    python -m cyber_attack_simulator.benchmarks.bench_search [nombre_de_commandes]
+"""
+import sys
+import tempfile
+import time
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.utils.command_search import CommandIndex, fold, tokenize
+from cyber_attack_simulator.benchmarks.synthetic import write_synthetic_catalog
+
+QUERIES = ("résolution dns", "enumeration smb", "scan", "kerb", "exploitation furtif",
+           "détection ldap complet", "motsdepasse", "cartographie des hotes rapide")
+REPEAT = 200
+NAIVE_REPEAT = 3
+
+
+def naive_search(specs, query: str, limit: int = 10) -> list:
+    """Référence : chaque commande est repliée et parcourue à chaque requête."""
+    terms = tokenize(query)
+    scored = []
+    for index, spec in enumerate(specs):
+        text = fold(" ".join((spec.name, spec.category, " ".join(spec.flags), spec.description)))
+        score = sum(text.count(term) for term in terms)
+        if score:
+            scored.append((-score, index))
+    scored.sort()
+    return [index for _, index in scored[:limit]]
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def run(count: int = 10_000) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        commands_file = write_synthetic_catalog(tmp, count)
+        start = time.perf_counter()
+        catalog = CommandCatalog.load(commands_file)
+        cold_load_s = time.perf_counter() - start
+        start = time.perf_counter()
+        warm = CommandCatalog.load(commands_file)
+        warm_load_s = time.perf_counter() - start
+    start = time.perf_counter()
+    index = CommandIndex.build(catalog.specs)
+    build_s = time.perf_counter() - start
+    assert warm.search_index.search("scan") == index.search("scan")
+
+    latencies = []
+    for query in QUERIES:
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            catalog.search(query)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(NAIVE_REPEAT):
+        for query in QUERIES:
+            naive_search(catalog.specs, query)
+    naive_s = (time.perf_counter() - start) / (NAIVE_REPEAT * len(QUERIES))
+
+    return {
+        "commands": count,
+        "terms": len(index),
+        "postings": int(index.docs.size),
+        "build_s": build_s,
+        "cold_load_s": cold_load_s,
+        "warm_load_s": warm_load_s,
+        "query_mean_us": sum(latencies) / len(latencies) * 1e6,
+        "query_p99_us": percentile(latencies, 99) * 1e6,
+        "queries_per_s": len(latencies) / sum(latencies),
+        "naive_query_ms": naive_s * 1e3,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    r = run(int(argv[0]) if argv else 10_000)
+    print(f"📊 Recherche dans un catalogue de {r['commands']} commandes : "
+          f"{r['terms']} termes, {r['postings']} occurrences")
+    print(f"  - Construction de l'index        : {r['build_s'] * 1e3:.0f} ms")
+    print(f"  - Chargement à froid / cache     : {r['cold_load_s'] * 1e3:.0f} ms / {r['warm_load_s'] * 1e3:.1f} ms")
+    print(f"  - Requête (moyenne / p99)        : {r['query_mean_us']:.0f} µs / {r['query_p99_us']:.0f} µs "
+          f"({r['queries_per_s']:.0f} requêtes/s)")
+    print(f"  - Balayage du catalogue (réf.)   : {r['naive_query_ms']:.1f} ms/requête")
+    return r
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_startup.py
+"""
+Mesure le temps de démarrage (catalogue + enregistrement des handlers) sur un
+catalogue synthétique.
+
+    python -m cyber_attack_simulator.benchmarks.bench_startup [nombre_de_commandes]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.benchmarks.synthetic import write_synthetic_catalog
+
+
+def boot(commands_file: str, lazy: bool = True) -> CyberAttackEngine:
+    engine = CyberAttackEngine()
+    CommandHandlerFactory(engine, commands_file).initialize_all_handlers(lazy=lazy)
+    return engine
+
+
+def time_call(func, repeat: int = 5) -> float:
+    """Retourne le meilleur temps (en secondes) sur `repeat` exécutions."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count: int = 2000, repeat: int = 5) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        commands_file = write_synthetic_catalog(tmp, count)
+        cache_file = CommandCatalog.cache_path_for(commands_file)
+
+        def cold():
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+            boot(commands_file)
+
+        results = {
+            "commands": count,
+            "cold_boot_s": time_call(cold, repeat),
+            "warm_boot_s": time_call(lambda: boot(commands_file), repeat),
+            "eager_boot_s": time_call(lambda: boot(commands_file, lazy=False), repeat),
+        }
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 2000
+    results = run(count)
+    print(f"📊 Démarrage sur un catalogue synthétique de {results['commands']} commandes")
+    print(f"  - Démarrage à froid (compilation JSON) : {results['cold_boot_s'] * 1000:.2f} ms")
+    print(f"  - Démarrage à chaud (cache binaire)    : {results['warm_boot_s'] * 1000:.2f} ms")
+    print(f"  - Démarrage eager (imports immédiats)  : {results['eager_boot_s'] * 1000:.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main()
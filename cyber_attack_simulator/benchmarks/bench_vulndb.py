@@ -0,0 +1,81 @@
+# benchmarks/bench_vulndb.py
+"""
+Base de vulnérabilités : construction des arbres d'intervalles pour 200 000 avis, puis
+recherche des vulnérabilités de tous les services d'un /16 (65 536 hôtes), avec et
+sans cache (produit, version), comparée au parcours linéaire de la liste d'avis.
+
+    python -m cyber_attack_simulator.benchmarks.bench_vulndb [avis] [hôtes]
+"""
+import sys
+import time
+
+from cyber_attack_simulator.utils.vulndb import VulnerabilityDatabase, encode_version
+from cyber_attack_simulator.benchmarks.synthetic import make_synthetic_advisories, make_synthetic_services
+
+NAIVE_SERVICES = 200
+
+
+def naive_match(advisories: list, product: str, version: str) -> list:
+    """Référence : chaque avis de la base est comparé au service."""
+    point = encode_version(version)
+    return [a for a in advisories if a["product"] == product
+            and encode_version(a["introduced"]) <= point
+            and (a["fixed"] is None or point < encode_version(a["fixed"]))]
+
+
+def _scan(database: VulnerabilityDatabase, hosts: list) -> tuple:
+    start = time.perf_counter()
+    findings = 0
+    for _, services in hosts:
+        for _, found in database.match_services(services):
+            findings += len(found)
+    return time.perf_counter() - start, findings
+
+
+def run(advisories: int = 200_000, hosts: int = 65_536) -> dict:
+    data = make_synthetic_advisories(advisories)
+    start = time.perf_counter()
+    database = VulnerabilityDatabase.from_data(data)
+    build_s = time.perf_counter() - start
+
+    network = list(make_synthetic_services(hosts))
+    services = sum(len(s) for _, s in network)
+    cached_s, findings = _scan(database, network)
+    uncached_s, uncached_findings = _scan(VulnerabilityDatabase.from_data(data, cache_size=0), network)
+    assert findings == uncached_findings
+
+    sample = [service for _, s in network[:NAIVE_SERVICES] for service in s][:NAIVE_SERVICES]
+    start = time.perf_counter()
+    for service in sample:
+        naive_match(data["advisories"], service["product"], service["version"])
+    naive_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+    return {
+        "advisories": advisories,
+        "hosts": hosts,
+        "services": services,
+        "findings": findings,
+        "build_s": build_s,
+        "scan_cached_s": cached_s,
+        "scan_uncached_s": uncached_s,
+        "tree_us_per_service": uncached_s / services * 1e6,
+        "naive_us_per_service": naive_us,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    advisories = int(argv[0]) if argv else 200_000
+    hosts = int(argv[1]) if len(argv) > 1 else 65_536
+    r = run(advisories, hosts)
+    print(f"📊 Base de vulnérabilités : {r['advisories']} avis, {r['hosts']} hôtes, {r['services']} services")
+    print(f"  - Construction des arbres       : {r['build_s']:.2f} s")
+    print(f"  - Réseau complet, avec cache    : {r['scan_cached_s']:.3f} s ({r['findings']} correspondances)")
+    print(f"  - Réseau complet, sans cache    : {r['scan_uncached_s']:.3f} s "
+          f"({r['tree_us_per_service']:.2f} µs/service)")
+    print(f"  - Parcours linéaire des avis    : {r['naive_us_per_service']:.0f} µs/service")
+    return r
+
+
+if __name__ == "__main__":
+    main()
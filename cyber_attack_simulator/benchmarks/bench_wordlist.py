@@ -0,0 +1,80 @@
+# benchmarks/bench_wordlist.py
+"""
+Wordlists en flux : débit du pipeline (mutation, filtre, dédoublonnage) et pic mémoire
+selon la taille du fichier, comparé à un chargement complet avec un `set`.
+
+    python -m cyber_attack_simulator.benchmarks.bench_wordlist [lignes ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from cyber_attack_simulator.utils.wordlist import Wordlist
+from cyber_attack_simulator.benchmarks.synthetic import write_synthetic_wordlist
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def streamed(path: str) -> int:
+    pipeline = Wordlist(path).mutate(["lower"], keep_original=False).length(3, 32).dedupe()
+    count = 0
+    for words in pipeline.chunks():
+        count += len(words)
+    return count
+
+
+def loaded(path: str) -> int:
+    """Référence : tout le fichier en mémoire, dédoublonnage exact."""
+    with open(path, encoding='utf-8') as f:
+        words = [w.strip().lower() for w in f.read().splitlines()]
+    return len({w for w in words if 3 <= len(w) <= 32})
+
+
+def _measure(function, path: str) -> tuple:
+    start = time.perf_counter()
+    count = function(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def run(sizes=DEFAULT_SIZES) -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for lines in sizes:
+            path = write_synthetic_wordlist(os.path.join(tmp, f"words_{lines}.txt"), lines)
+            count, elapsed, peak = _measure(streamed, path)
+            exact, loaded_s, loaded_peak = _measure(loaded, path)
+            results.append({
+                "lines": lines,
+                "file_mb": os.path.getsize(path) / 1e6,
+                "candidates": count,
+                "exact_unique": exact,
+                "stream_words_per_s": lines / elapsed,
+                "stream_peak_mb": peak / 1e6,
+                "loaded_words_per_s": lines / loaded_s,
+                "loaded_peak_mb": loaded_peak / 1e6,
+            })
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    sizes = tuple(int(a) for a in argv) or DEFAULT_SIZES
+    results = run(sizes)
+    print("📊 Wordlists : flux mmap + filtre de Bloom contre chargement complet")
+    for r in results:
+        print(f"  - {r['lines']:>9} lignes ({r['file_mb']:.1f} Mo) : "
+              f"{r['stream_words_per_s'] / 1e3:.0f} k mots/s, pic {r['stream_peak_mb']:.1f} Mo "
+              f"| chargé : pic {r['loaded_peak_mb']:.1f} Mo "
+              f"| {r['candidates']} candidats ({r['exact_unique']} uniques exacts)")
+    return results
+
+
+if __name__ == "__main__":
+    main()
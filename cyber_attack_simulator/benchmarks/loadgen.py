@@ -0,0 +1,124 @@
+# benchmarks/loadgen.py
+"""
+Générateur de charge local pour le serveur headless.
+
+    python -m cyber_attack_simulator.benchmarks.loadgen --sessions 2000 --connections 50
+    python -m cyber_attack_simulator.benchmarks.loadgen --port 7777     # serveur déjà lancé
+
+Sans --port ni --unix, un serveur est démarré dans le même processus.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+DEFAULT_SCRIPT = [
+    "resoudredns example.com",
+    "analyserwhois example.com",
+    "obtenirrecordsdns example.com MX",
+    "trouversousdomaines example.com",
+    "collecterosint example.com",
+    "resoudredns_inverse 10.0.0.1",
+]
+
+
+async def run_connection(reader, writer, session_ids: list, commands_per_session: int,
+                         script: list, rng: random.Random, latencies: list) -> int:
+    """Envoie les commandes de plusieurs sessions sur une même connexion."""
+    failures = 0
+    for _ in range(commands_per_session):
+        for session_id in session_ids:
+            line = f"{session_id} {rng.choice(script)}\n"
+            start = time.perf_counter()
+            writer.write(line.encode('utf-8'))
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if not response.get("success"):
+                failures += 1
+    return failures
+
+
+async def fetch_stats(reader, writer) -> dict:
+    writer.write(b"STATS\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def run_load(host: str = "127.0.0.1", port: int = None, unix_path: str = None,
+                   sessions: int = 1000, connections: int = 50, commands_per_session: int = 10,
+                   seed: int = 0) -> dict:
+    server = None
+    if port is None and unix_path is None:
+        from cyber_attack_simulator.server import SimulatorServer
+        server = await SimulatorServer(host=host, port=0).start()
+        port = server.port
+
+    async def connect():
+        if unix_path:
+            return await asyncio.open_unix_connection(unix_path)
+        return await asyncio.open_connection(host, port)
+
+    connections = max(1, min(connections, sessions))
+    streams = [await connect() for _ in range(connections)]
+    session_groups = [[f"joueur{i}" for i in range(c, sessions, connections)] for c in range(connections)]
+    latencies = []
+
+    start = time.perf_counter()
+    failures = await asyncio.gather(*(
+        run_connection(reader, writer, group, commands_per_session, DEFAULT_SCRIPT,
+                       random.Random(seed + index), latencies)
+        for index, ((reader, writer), group) in enumerate(zip(streams, session_groups))
+    ))
+    elapsed = time.perf_counter() - start
+
+    server_stats = await fetch_stats(*streams[0])
+    for _, writer in streams:
+        writer.close()
+        await writer.wait_closed()
+    if server is not None:
+        await server.stop()
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "sessions": sessions,
+        "connections": connections,
+        "requests": len(latencies),
+        "failures": sum(failures),
+        "elapsed_s": elapsed,
+        "requests_per_s": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "client_latency_ms": {"p50": percentile(0.50), "p95": percentile(0.95), "p99": percentile(0.99)},
+        "server": server_stats,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Générateur de charge pour le serveur headless")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--unix", dest="unix_path")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--commands", type=int, default=10, help="commandes par session")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_load(args.host, args.port, args.unix_path,
+                                   args.sessions, args.connections, args.commands))
+    server = results["server"]
+    print(f"📊 {results['requests']} requêtes, {results['sessions']} sessions, "
+          f"{results['connections']} connexions en {results['elapsed_s']:.2f} s "
+          f"({results['requests_per_s']:.0f} req/s)")
+    print(f"  - Latence client p50/p95/p99 : {results['client_latency_ms']['p50']:.2f} / "
+          f"{results['client_latency_ms']['p95']:.2f} / {results['client_latency_ms']['p99']:.2f} ms")
+    print(f"  - Serveur : {server['sessions']} sessions, {server['sessions_per_core']:.1f} sessions/cœur, "
+          f"latence p99 {server['latency_ms']['p99']:.3f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main()
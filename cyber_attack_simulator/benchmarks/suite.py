@@ -0,0 +1,96 @@
+# benchmarks/suite.py
+"""
+Suite de benchmarks complète : démarrage, analyse, dispatch et handlers, sur des
+catalogues synthétiques de plusieurs tailles, avec comparaison à une référence.
+"""
+import json
+import platform
+import sys
+import time
+
+from cyber_attack_simulator.benchmarks import bench_dispatch, bench_startup
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_THRESHOLD = 0.20  # Écart relatif toléré avant de signaler une régression
+
+# Métriques où une valeur plus grande est meilleure ; toutes les autres sont des durées
+HIGHER_IS_BETTER = ("_per_s",)
+# Valeurs descriptives ou trop bruitées (maximum sur quelques appels), jamais comparées
+IGNORED = ("commands", "handlers", "handler_max_us")
+
+
+def run_suite(sizes=DEFAULT_SIZES, repeat: int = 3, iterations: int = 20, real_catalog: bool = True) -> dict:
+    """Exécute toute la suite et retourne un dict sérialisable en JSON."""
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "sizes": {},
+    }
+    for size in sizes:
+        results["sizes"][str(size)] = {
+            "startup": bench_startup.run(size, repeat),
+            "dispatch": bench_dispatch.run(size, iterations),
+        }
+    if real_catalog:
+        results["catalog"] = bench_dispatch.run_real_catalog()
+    return results
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    """Aplatit les résultats en {"sizes.100.startup.cold_boot_s": valeur}."""
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and not path.startswith("meta."):
+            flat[path] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Compare deux résultats et retourne les régressions sous forme de tuples
+    (métrique, référence, actuel, variation relative).
+    """
+    before, after = flatten(baseline), flatten(current)
+    regressions = []
+    for metric, old in before.items():
+        new = after.get(metric)
+        if new is None or old <= 0 or metric.rsplit(".", 1)[-1] in IGNORED:
+            continue
+        change = (new - old) / old
+        worse = -change if metric.endswith(HIGHER_IS_BETTER) else change
+        if worse > threshold:
+            regressions.append((metric, old, new, change))
+    return sorted(regressions, key=lambda r: -abs(r[3]))
+
+
+def save(results: dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def print_summary(results: dict, out=sys.stdout):
+    for size, sections in results["sizes"].items():
+        startup, dispatch = sections["startup"], sections["dispatch"]
+        print(f"📊 Catalogue de {size} commandes", file=out)
+        print(f"  - Démarrage froid / chaud : {startup['cold_boot_s'] * 1000:.2f} / "
+              f"{startup['warm_boot_s'] * 1000:.2f} ms", file=out)
+        print(f"  - Analyse des lignes      : {dispatch['parse_per_s']:.0f} lignes/s", file=out)
+        print(f"  - Surcoût de dispatch     : {dispatch['dispatch_overhead_us']:.2f} µs/commande", file=out)
+        print(f"  - Handler (moyenne / max) : {dispatch['handler_mean_us']:.2f} / "
+              f"{dispatch['handler_max_us']:.2f} µs", file=out)
+    catalog = results.get("catalog")
+    if catalog:
+        print(f"📊 Catalogue livré : {catalog['handlers']} handlers implémentés", file=out)
+        for name, latency in sorted(catalog.get("per_handler_us", {}).items()):
+            print(f"  - {name:28s}: {latency:.2f} µs", file=out)
@@ -0,0 +1,208 @@
+# benchmarks/synthetic.py
+import json
+import os
+import random
+
+VERBS = ["scanner", "enumerer", "trouver", "analyser", "tester", "obtenir", "resoudre",
+         "collecter", "verifier", "identifier", "exploiter", "extraire", "detecter", "cartographier"]
+OBJECTS = ["dns", "ports", "sousdomaines", "whois", "smb", "ldap", "sql", "xss", "certificatssl",
+           "versions", "hotes", "partages", "utilisateurs", "groupes", "services", "motsdepasse",
+           "headershttp", "technologies", "rangesip", "empreintedigitale", "snmp", "kerberos"]
+SUFFIXES = ["", "_api", "_inverse", "_udp", "_syn", "_furtif", "_rapide", "_complet"]
+DESCRIPTIONS = ["Résolution", "Énumération", "Découverte", "Analyse", "Vérification",
+                "Identification", "Détection", "Exploitation", "Extraction", "Cartographie"]
+CATEGORIES = {
+    "reconnaissance": ["dns_handler", "osint_handler", "network_handler"],
+    "scanning": ["port_scanner", "service_detector"],
+    "enumeration": ["smb_enum", "ldap_enum"],
+    "vuln_assessment": ["network_vuln", "web_vuln"],
+    "exploitation": ["exploit_handler"],
+}
+PARAMS = ["domaine", "ip", "url", "ports", "cible", "wordlist", "type", "organisation", "parametre"]
+
+
+def make_synthetic_commands(count: int, seed: int = 42) -> list:
+    """Génère `count` entrées de commandes au format de data/commands.json."""
+    rng = random.Random(seed)
+    categories = list(CATEGORIES)
+    commands = []
+    seen = set()
+    while len(commands) < count:
+        base = f"{rng.choice(VERBS)}{rng.choice(OBJECTS)}{rng.choice(SUFFIXES)}"
+        name = base if base not in seen else f"{base}_{len(commands)}"
+        seen.add(name)
+        category = rng.choice(categories)
+        obj = name[len(next(v for v in VERBS if name.startswith(v))):]
+        commands.append({
+            "id": len(commands) + 1,
+            "name": name,
+            "category": category,
+            "params": rng.sample(PARAMS, rng.randint(1, 3)),
+            "description": f"{rng.choice(DESCRIPTIONS)} {obj.replace('_', ' ')} sur la cible",
+            "risk": round(rng.uniform(0.01, 0.3), 3),
+            "time": round(rng.uniform(0.05, 1.0), 2),
+            "flags": [f"{name.upper()}_DONE"],
+            "template": rng.choice(CATEGORIES[category]),
+        })
+    return commands
+
+
+def write_synthetic_catalog(directory: str, count: int, seed: int = 42, behaviors: bool = False) -> str:
+    """Écrit un commands.json synthétique dans `directory` et retourne son chemin."""
+    commands = make_synthetic_commands(count, seed)
+    if behaviors:
+        add_synthetic_behaviors(commands, seed)
+    path = os.path.join(directory, f"commands_{count}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"commands": commands}, f, ensure_ascii=False)
+    return path
+
+
+def make_synthetic_progression(commands: list, per_node: int = 3, initial: int = 10, seed: int = 42) -> dict:
+    """
+    Arbre de progression sur des commandes synthétiques : chaque nœud débloque
+    `per_node` commandes et requiert un ou deux flags produits par celles de son parent.
+    """
+    rng = random.Random(seed)
+    names = [c["name"] for c in commands]
+    flags_of = {c["name"]: c["flags"] for c in commands}
+    nodes = []
+    # Commandes débloquées par chaque nœud (la racine virtuelle débloque les commandes initiales)
+    unlocked = [names[:initial]]
+    position = initial
+    while position < len(names):
+        parent = rng.randrange(max(0, len(unlocked) - 20), len(unlocked))
+        sources = unlocked[parent]
+        required = sorted({flags_of[name][0] for name in rng.sample(sources, min(len(sources), rng.randint(1, 2)))})
+        requires = {"flags": required}
+        if parent > 0:
+            requires["after"] = [f"n{parent - 1}"]
+        if rng.random() < 0.1:
+            requires["level"] = rng.randint(2, 6)
+        batch = names[position:position + per_node]
+        nodes.append({"id": f"n{len(nodes)}", "requires": requires, "unlocks": batch, "rewards": {"xp": 20}})
+        unlocked.append(batch)
+        position += per_node
+    return {"initial_commands": names[:initial], "nodes": nodes}
+
+
+def add_synthetic_behaviors(commands: list, seed: int = 42) -> list:
+    """Ajoute à chaque commande un bloc `behavior` (handlers.generic) de forme réaliste."""
+    rng = random.Random(seed)
+    for command in commands:
+        first = command["params"][0]
+        output = {
+            "Cible": {"template": f"{{{first}}}"},
+            "Résultats": {"template": f"{{{first}|upper}}-{{rand:1-254}}", "count": [1, rng.randint(2, 5)]},
+        }
+        if rng.random() < 0.5:
+            output["Score"] = {"int": [0, 100]}
+        command["behavior"] = {
+            "required": {first: f"❌ Erreur: {first} manquant."},
+            "output": output,
+            "success_rate": round(rng.uniform(0.9, 1.0), 2),
+        }
+    return commands
+
+
+def write_synthetic_wordlist(path: str, lines: int, seed: int = 42, duplicates: float = 0.1) -> str:
+    """Écrit une wordlist de `lines` mots (dont une part de doublons) par blocs, sans la garder en mémoire."""
+    rng = random.Random(seed)
+    syllables = ["an", "ba", "co", "de", "ex", "fi", "go", "hu", "in", "jo", "ka", "lo", "mi",
+                 "no", "or", "pa", "qu", "ri", "so", "te", "un", "vi", "wa", "xe", "yo", "ze"]
+    with open(path, 'w', encoding='utf-8') as f:
+        batch = []
+        for n in range(lines):
+            if n and rng.random() < duplicates:
+                batch.append(batch[-1] if batch else "www")
+            else:
+                batch.append("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) + str(n))
+            if len(batch) == 10000:
+                f.write("\n".join(batch) + "\n")
+                batch = []
+        if batch:
+            f.write("\n".join(batch) + "\n")
+    return path
+
+
+def make_synthetic_ids_rules(commands: list, count: int = 100, seed: int = 42) -> dict:
+    """Génère `count` règles IDS (format data/ids_rules.json) portant sur les commandes données."""
+    rng = random.Random(seed)
+    names = [command["name"] for command in commands]
+    rules = []
+    for n in range(count):
+        rule_type = rng.choice(["rate", "rate", "sweep", "failures"])
+        if rng.random() < 0.5:
+            match = {"categories": [rng.choice(list(CATEGORIES))]}
+        else:
+            match = {"commands": rng.sample(names, min(len(names), rng.randint(1, 20)))}
+        rules.append({
+            "id": f"r{n}",
+            "type": rule_type,
+            "match": match,
+            "key": rng.choice(["global", "target"]) if rule_type == "sweep" else rng.choice(["target", "target", "command"]),
+            "window": rng.choice([5, 10, 30, 60, 300]),
+            "threshold": rng.randint(2, 20),
+            "detection": 0.01,
+        })
+    return {"alert_ttl": 300, "max_alerts": 50, "rules": rules}
+
+
+def _synthetic_version(rng: random.Random) -> str:
+    return f"{rng.randint(0, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 50)}"
+
+
+def make_synthetic_advisories(count: int, products: int = 2000, seed: int = 42) -> dict:
+    """Génère une base de `count` vulnérabilités (format data/vulnerabilities.json)."""
+    rng = random.Random(seed)
+    advisories = []
+    for n in range(count):
+        # Une faille touche en général quelques versions mineures d'une même branche
+        major, minor = rng.randint(0, 9), rng.randint(0, 20)
+        low = (minor, rng.randint(0, 50))
+        high = max(low, (minor + rng.randint(0, 2), rng.randint(0, 50)))
+        low, high = f"{major}.{low[0]}.{low[1]}", f"{major}.{high[0]}.{high[1]}"
+        advisories.append({
+            "id": f"CVE-SIM-{n:06d}",
+            "product": f"produit{rng.randrange(products)}",
+            "introduced": low,
+            "fixed": high if rng.random() < 0.9 else None,
+            "severity": rng.choice(["low", "medium", "high", "critical"]),
+            "cvss": round(rng.uniform(1.0, 10.0), 1),
+        })
+    return {"advisories": advisories}
+
+
+def make_synthetic_services(hosts: int, products: int = 2000, versions: int = 20, seed: int = 42):
+    """Services de `hosts` hôtes simulés ; un parc réel réutilise peu de versions par produit."""
+    rng = random.Random(seed)
+    catalog = [(f"produit{p}", [_synthetic_version(rng) for _ in range(versions)]) for p in range(products)]
+    for host in range(hosts):
+        services = []
+        for port in rng.sample(range(1, 1024), rng.randint(1, 5)):
+            product, known = rng.choice(catalog)
+            services.append({"port": port, "product": product, "version": rng.choice(known)})
+        yield f"10.{host >> 16 & 255}.{host >> 8 & 255}.{host & 255}", services
+
+
+def make_synthetic_attack_deltas(hosts: int, seed: int = 42):
+    """
+    Deltas `discovered_targets` d'une campagne qui s'étend hôte après hôte : ports,
+    exploits, identifiants réutilisés dans le /24, relations de confiance et hôtes compromis.
+    """
+    rng = random.Random(seed)
+    address = lambda host: f"10.{host >> 16 & 255}.{host >> 8 & 255}.{host & 255}"
+    for host in range(hosts):
+        ports = rng.sample((22, 80, 88, 135, 443, 445, 3306, 3389, 5985, 8080), rng.randint(1, 4))
+        info = {"alive": True, "ports": ports}
+        if rng.random() < 0.1:
+            info["exploits"] = [{"id": f"CVE-SYN-{host}", "port": rng.choice(ports)}]
+        if rng.random() < 0.1:
+            subnet = host & ~0xFF
+            info["credentials"] = [{"user": f"user{rng.randrange(50)}", "realm": address(subnet),
+                                    "valid_on": [address(subnet + rng.randrange(256)) for _ in range(rng.randint(1, 6))]}]
+        if rng.random() < 0.05:
+            info["trusts"] = [address(rng.randrange(hosts)) for _ in range(rng.randint(1, 3))]
+        if rng.random() < 0.001:
+            info["compromised"] = True
+        yield address(host), info
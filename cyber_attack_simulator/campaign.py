@@ -0,0 +1,225 @@
+# campaign.py
+"""
+Simulateur de campagnes Monte-Carlo.
+
+Rejoue un grand nombre de parties (scriptées ou aléatoires) du moteur, réparties sur
+un ProcessPoolExecutor, et agrège les distributions utiles à l'équilibrage du jeu.
+
+    python -m cyber_attack_simulator.campaign --runs 100000 --workers 4 --seed 7
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.command_catalog import DEFAULT_COMMANDS_FILE
+from cyber_attack_simulator.main import parse_command
+
+DEFAULT_SCRIPT = [
+    "resoudredns cible.example",
+    "trouversousdomaines cible.example",
+    "analyserwhois cible.example",
+    "collecterosint cible.example",
+    "trouveripspubliques CibleCorp",
+]
+
+HISTOGRAM_BINS = 20
+# Histogramme du temps de jeu avant obtention du flag (dernière case = débordement)
+TIME_BIN_WIDTH = 0.05
+TIME_BINS = 400
+
+# Registre de handlers chargé une seule fois par processus de travail
+_worker_registry = {}
+
+
+def playthrough_seed(campaign_seed: int, run_index: int) -> int:
+    """Graine d'une partie : indépendante du nombre de processus et du découpage en lots."""
+    return int(np.random.SeedSequence([campaign_seed, run_index]).generate_state(1, dtype=np.uint64)[0])
+
+
+def _registry(commands_file: str) -> CyberAttackEngine:
+    registry = _worker_registry.get(commands_file)
+    if registry is None:
+        registry = CyberAttackEngine()
+        CommandHandlerFactory(registry, commands_file).initialize_all_handlers(lazy=True)
+        _worker_registry[commands_file] = registry
+    return registry
+
+
+class CampaignStats:
+    """Statistiques agrégées (fusionnables) d'un ensemble de parties."""
+
+    def __init__(self, steps: int):
+        self.steps = steps
+        self.runs = 0
+        self.success_histogram = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+        self.detection_histogram = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+        self.credits_sum = np.zeros(steps, dtype=np.float64)
+        self.detection_sum = np.zeros(steps, dtype=np.float64)
+        self.flag_reached = 0
+        self.time_to_flag_sum = 0.0
+        self.time_to_flag_histogram = np.zeros(TIME_BINS, dtype=np.int64)
+
+    @staticmethod
+    def _bin(value: float) -> int:
+        return min(int(value * HISTOGRAM_BINS), HISTOGRAM_BINS - 1)
+
+    def add_run(self, successes: int, detection: float, credits_curve, detection_curve, time_to_flag):
+        self.runs += 1
+        self.success_histogram[self._bin(successes / self.steps if self.steps else 0.0)] += 1
+        self.detection_histogram[self._bin(detection)] += 1
+        self.credits_sum += credits_curve
+        self.detection_sum += detection_curve
+        if time_to_flag is not None:
+            self.flag_reached += 1
+            self.time_to_flag_sum += time_to_flag
+            self.time_to_flag_histogram[min(int(time_to_flag / TIME_BIN_WIDTH), TIME_BINS - 1)] += 1
+
+    def merge(self, other: "CampaignStats") -> "CampaignStats":
+        self.runs += other.runs
+        self.success_histogram += other.success_histogram
+        self.detection_histogram += other.detection_histogram
+        self.credits_sum += other.credits_sum
+        self.detection_sum += other.detection_sum
+        self.flag_reached += other.flag_reached
+        self.time_to_flag_sum += other.time_to_flag_sum
+        self.time_to_flag_histogram += other.time_to_flag_histogram
+        return self
+
+    def time_to_flag_percentile(self, p: float):
+        """Percentile (borne haute de case) du temps d'obtention du flag."""
+        if not self.flag_reached:
+            return None
+        cumulative = np.cumsum(self.time_to_flag_histogram)
+        index = int(np.searchsorted(cumulative, p / 100 * self.flag_reached))
+        return (index + 1) * TIME_BIN_WIDTH
+
+    def to_dict(self) -> dict:
+        runs = max(self.runs, 1)
+        return {
+            "runs": self.runs,
+            "steps": self.steps,
+            "success_ratio_histogram": self.success_histogram.tolist(),
+            "final_detection_histogram": self.detection_histogram.tolist(),
+            "histogram_bins": HISTOGRAM_BINS,
+            "mean_credits_curve": (self.credits_sum / runs).tolist(),
+            "mean_detection_curve": (self.detection_sum / runs).tolist(),
+            "flag_reached_ratio": self.flag_reached / runs,
+            "time_to_flag": {
+                "mean": self.time_to_flag_sum / self.flag_reached if self.flag_reached else None,
+                "p50": self.time_to_flag_percentile(50),
+                "p95": self.time_to_flag_percentile(95),
+                "histogram": self.time_to_flag_histogram.tolist(),
+                "bin_width": TIME_BIN_WIDTH,
+            },
+        }
+
+
+def run_playthrough(registry: CyberAttackEngine, seed: int, script: list, randomize: bool,
+                    steps: int, target_flag: str = None) -> tuple:
+    """Joue une partie complète et retourne ses mesures brutes."""
+    engine = CyberAttackEngine(history_capacity=max(steps, 1), seed=seed)
+    engine.share_registry(registry)
+
+    successes = 0
+    game_time = 0.0
+    time_to_flag = None
+    credits_curve = np.empty(steps, dtype=np.float64)
+    detection_curve = np.empty(steps, dtype=np.float64)
+
+    for step in range(steps):
+        line = engine.rng.choice(script) if randomize else script[step % len(script)]
+        cmd_name, params = parse_command(engine, line)
+        result = engine.execute_command(cmd_name, params or {})
+        game_time += result.get("time_consumed", 0.0)
+        if result.get("success"):
+            successes += 1
+        if time_to_flag is None and target_flag is not None and target_flag in engine.flags:
+            time_to_flag = game_time
+        credits_curve[step] = engine.game_state.credits
+        detection_curve[step] = engine.detection_level
+
+    return successes, engine.detection_level, credits_curve, detection_curve, time_to_flag
+
+
+def _run_chunk(args: tuple) -> CampaignStats:
+    """Exécute un lot de parties dans un processus de travail."""
+    commands_file, campaign_seed, first_run, count, script, randomize, steps, target_flag = args
+    registry = _registry(commands_file)
+    stats = CampaignStats(steps)
+    for run_index in range(first_run, first_run + count):
+        seed = playthrough_seed(campaign_seed, run_index)
+        stats.add_run(*run_playthrough(registry, seed, script, randomize, steps, target_flag))
+    return stats
+
+
+class CampaignSimulator:
+    """Lance des parties Monte-Carlo en parallèle et agrège leurs statistiques."""
+
+    def __init__(self, script: list = None, randomize: bool = False, steps: int = None,
+                 target_flag: str = None, commands_file: str = DEFAULT_COMMANDS_FILE):
+        self.script = list(script or DEFAULT_SCRIPT)
+        self.randomize = randomize
+        self.steps = steps if steps is not None else len(self.script)
+        self.target_flag = target_flag
+        self.commands_file = commands_file
+
+    def _chunks(self, runs: int, seed: int, chunk_size: int):
+        for first in range(0, runs, chunk_size):
+            yield (self.commands_file, seed, first, min(chunk_size, runs - first),
+                   self.script, self.randomize, self.steps, self.target_flag)
+
+    def run(self, runs: int, seed: int = 0, workers: int = None, chunk_size: int = 1000) -> dict:
+        """
+        Joue `runs` parties. Le résultat ne dépend que de `seed` : ni le nombre de
+        processus ni la taille des lots ne changent les graines des parties.
+        """
+        workers = workers or os.cpu_count() or 1
+        stats = CampaignStats(self.steps)
+        chunks = self._chunks(runs, seed, chunk_size)
+        if workers == 1:
+            for chunk in chunks:
+                stats.merge(_run_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for partial in pool.map(_run_chunk, chunks):
+                    stats.merge(partial)
+        return stats.to_dict()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation Monte-Carlo de campagnes")
+    parser.add_argument("--runs", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--steps", type=int, default=None, help="nombre de commandes par partie")
+    parser.add_argument("--random", action="store_true", help="tire les commandes du script au hasard")
+    parser.add_argument("--script", help="fichier texte : une commande par ligne")
+    parser.add_argument("--flag", dest="target_flag", default="TROUVERSOUSDOMAINES_EXECUTED",
+                        help="flag dont on mesure le temps d'obtention")
+    parser.add_argument("--output", help="fichier JSON de sortie")
+    args = parser.parse_args(argv)
+
+    script = None
+    if args.script:
+        with open(args.script, 'r', encoding='utf-8') as f:
+            script = [line.strip() for line in f if line.strip()]
+
+    simulator = CampaignSimulator(script, args.random, args.steps, args.target_flag)
+    results = simulator.run(args.runs, args.seed, args.workers)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    summary = {k: v for k, v in results.items() if not k.endswith("histogram")}
+    summary["time_to_flag"] = {k: v for k, v in results["time_to_flag"].items() if k != "histogram"}
+    print(json.dumps(summary, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# command_catalog.py
+import hashlib
+import json
+import os
+import pickle
+from typing import NamedTuple, Optional
+
+from cyber_attack_simulator.utils.command_search import CommandIndex
+
+DEFAULT_COMMANDS_FILE = os.path.join(os.path.dirname(__file__), 'data', 'commands.json')
+
+# À incrémenter dès que la structure de CommandSpec ou du cache change
+CATALOG_FORMAT_VERSION = 4
+
+
+class CommandSpec(NamedTuple):
+    """Spécification compacte et immuable d'une commande du catalogue."""
+    index: int
+    id: int
+    name: str
+    category: str
+    template: str
+    params: tuple
+    risk: float
+    time: float
+    flags: tuple
+    description: str
+    cache_ttl: float = 0.0  # Durée de validité d'un résultat en cache (0 = non cacheable)
+    behavior: Optional[dict] = None  # Comportement déclaratif (handlers.generic), sinon classe dédiée
+
+
+class CommandCatalog:
+    """
+    Catalogue compilé des commandes.
+
+    Le JSON source n'est analysé qu'en cas de besoin : le résultat de la compilation
+    (spécifications et index de recherche) est sérialisé dans un cache binaire
+    (``<commands.json>.cache``) invalidé par mtime/taille, puis par empreinte SHA-256
+    du fichier source.
+    """
+
+    def __init__(self, specs: list, source_hash: str = "", search_index: CommandIndex = None):
+        self.specs = tuple(specs)
+        self.source_hash = source_hash
+        self.by_name = {spec.name: spec for spec in self.specs}
+        self._search_index = search_index
+
+    def __len__(self):
+        return len(self.specs)
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __contains__(self, command_name: str) -> bool:
+        return command_name in self.by_name
+
+    def get(self, command_name: str) -> Optional[CommandSpec]:
+        """Retourne la spécification d'une commande, ou None."""
+        return self.by_name.get(command_name)
+
+    @property
+    def search_index(self) -> CommandIndex:
+        """Index plein texte du catalogue (construit au chargement, ou à la première recherche)."""
+        if self._search_index is None:
+            self._search_index = CommandIndex.build(self.specs)
+        return self._search_index
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """Commandes les plus pertinentes pour une requête libre, de la plus à la moins pertinente."""
+        return [self.specs[index] for _, index in self.search_index.search(query, limit)]
+
+    # --- Compilation ---
+
+    @staticmethod
+    def compile_commands(commands: list) -> list:
+        """Transforme les entrées JSON brutes en CommandSpec, en ignorant les entrées invalides."""
+        specs = []
+        for command_info in commands:
+            command_name = command_info.get("name")
+            category = command_info.get("category")
+            handler_template = command_info.get("template")
+
+            if not all([command_name, category, handler_template]):
+                print(f"⚠️ Avertissement: Entrée de commande invalide ignorée: {command_info}")
+                continue
+
+            specs.append(CommandSpec(
+                index=len(specs),
+                id=int(command_info.get("id", len(specs))),
+                name=command_name,
+                category=category,
+                template=handler_template,
+                params=tuple(command_info.get("params", [])),
+                risk=float(command_info.get("risk", 0.1)),
+                time=float(command_info.get("time", 0.0)),
+                flags=tuple(command_info.get("flags", [])),
+                description=command_info.get("description", ""),
+                cache_ttl=float(command_info.get("cache_ttl", 0.0)),
+                behavior=command_info.get("behavior"),
+            ))
+        return specs
+
+    @classmethod
+    def from_json_bytes(cls, raw: bytes, source_hash: str = "") -> "CommandCatalog":
+        """Compile un catalogue depuis le contenu brut d'un commands.json."""
+        data = json.loads(raw.decode('utf-8'))
+        return cls(cls.compile_commands(data.get("commands", [])), source_hash)
+
+    # --- Chargement avec cache ---
+
+    @staticmethod
+    def cache_path_for(commands_file: str) -> str:
+        return commands_file + ".cache"
+
+    @classmethod
+    def load(cls, commands_file: str = DEFAULT_COMMANDS_FILE, use_cache: bool = True) -> "CommandCatalog":
+        """
+        Charge le catalogue, depuis le cache binaire s'il est encore valide.
+
+        Lève FileNotFoundError si le fichier source est absent et
+        json.JSONDecodeError s'il est invalide, comme un json.load classique.
+        """
+        stat = os.stat(commands_file)
+        cache_file = cls.cache_path_for(commands_file)
+
+        cached = cls._read_cache(cache_file) if use_cache else None
+        if cached is not None and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return cls(cached["specs"], cached["hash"], cached["index"])
+
+        with open(commands_file, 'rb') as f:
+            raw = f.read()
+        source_hash = hashlib.sha256(raw).hexdigest()
+
+        if cached is not None and cached["hash"] == source_hash:
+            # Fichier simplement "touché" : le contenu n'a pas changé
+            catalog = cls(cached["specs"], source_hash, cached["index"])
+        else:
+            catalog = cls.from_json_bytes(raw, source_hash)
+            catalog._search_index = CommandIndex.build(catalog.specs)
+
+        if use_cache:
+            cls._write_cache(cache_file, catalog, stat)
+        return catalog
+
+    @staticmethod
+    def _read_cache(cache_file: str) -> Optional[dict]:
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(cached, dict) or cached.get("version") != CATALOG_FORMAT_VERSION:
+            return None
+        try:
+            cached["specs"] = [CommandSpec(*spec) for spec in cached["specs"]]
+            cached["index"] = CommandIndex.from_state(cached["index"])
+        except (KeyError, TypeError):
+            return None
+        return cached
+
+    @staticmethod
+    def _write_cache(cache_file: str, catalog: "CommandCatalog", stat: os.stat_result):
+        payload = {
+            "version": CATALOG_FORMAT_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": catalog.source_hash,
+            "specs": [tuple(spec) for spec in catalog.specs],
+            "index": catalog.search_index.to_state(),
+        }
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # Cache non inscriptible (répertoire en lecture seule...) : on s'en passe
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
@@ -1,8 +1,10 @@
 # command_handler_factory.py
 import json
 import importlib
-import os
 from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.command_catalog import CommandCatalog, CommandSpec, DEFAULT_COMMANDS_FILE
+from cyber_attack_simulator.utils.risk_calculator import DetectionEngine
+from cyber_attack_simulator.handlers.generic import GenericHandler
 
 def to_camel_case(snake_str: str) -> str:
     """Convertit une chaîne snake_case en CamelCase."""
@@ -11,60 +13,94 @@ def to_camel_case(snake_str: str) -> str:
 class CommandHandlerFactory:
     """Factory pour créer et gérer tous les handlers en les chargeant dynamiquement."""
 
-    def __init__(self, engine: CyberAttackEngine):
+    def __init__(self, engine: CyberAttackEngine, commands_file: str = DEFAULT_COMMANDS_FILE):
         self.engine = engine
+        self.commands_file = commands_file
+        self.catalog = None
+        # Handler partagé par toutes les commandes déclarant un bloc `behavior`
+        self.generic = GenericHandler(engine)
 
-    def initialize_all_handlers(self):
-        """Charge dynamiquement tous les handlers à partir de data/commands.json."""
-        commands_file = os.path.join(os.path.dirname(__file__), 'data', 'commands.json')
-
+    def load_catalog(self):
+        """Charge le catalogue compilé (depuis le cache binaire si possible)."""
         try:
-            with open(commands_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                commands = data.get("commands", [])
+            self.catalog = CommandCatalog.load(self.commands_file)
         except FileNotFoundError:
-            print(f"❌ Erreur: Fichier de commandes '{commands_file}' introuvable.")
-            return
+            print(f"❌ Erreur: Fichier de commandes '{self.commands_file}' introuvable.")
+            return None
         except json.JSONDecodeError:
-            print(f"❌ Erreur: Impossible de décoder le JSON depuis '{commands_file}'.")
+            print(f"❌ Erreur: Impossible de décoder le JSON depuis '{self.commands_file}'.")
+            return None
+        return self.catalog
+
+    def initialize_all_handlers(self, lazy: bool = False):
+        """
+        Charge tous les handlers à partir de data/commands.json.
+
+        En mode `lazy`, seules les métadonnées sont enregistrées : le module et la classe
+        du handler ne sont importés qu'à la première exécution de la commande.
+        """
+        catalog = self.load_catalog()
+        if catalog is None:
             return
 
-        for command_info in commands:
-            command_name = command_info.get("name")
-            category = command_info.get("category")
-            handler_template = command_info.get("template")
+        self.engine.catalog = catalog
+        self.engine.detection = DetectionEngine(catalog)
 
-            if not all([command_name, category, handler_template]):
-                print(f"⚠️ Avertissement: Entrée de commande invalide ignorée: {command_info}")
+        for spec in catalog:
+            if lazy:
+                self.engine.register_command_metadata(spec.name, list(spec.params))
+                self.engine.register_lazy_handler(spec.name, self._make_loader(spec))
                 continue
 
+            handler_method = self.load_handler(spec)
+            if handler_method is not None:
+                # La factory est responsable de l'enregistrement du handler ET de ses métadonnées
+                self.engine.register_handler(spec.name, handler_method)
+                self.engine.register_command_metadata(spec.name, list(spec.params))
+
+    def _make_loader(self, spec: CommandSpec):
+        return lambda: self.load_handler(spec)
+
+    def load_handler(self, spec: CommandSpec):
+        """
+        Retourne l'appelable d'une commande, ou None.
+
+        Une classe `<Commande>Handler` dans le module du template a la priorité ; à défaut,
+        une commande déclarant un bloc `behavior` est servie par le handler générique.
+        """
+        handler = self._load_handler_class(spec)
+        if handler is None and spec.behavior is not None:
             try:
-                module_path = f"handlers.{category}.{handler_template}"
-                class_name = f"{to_camel_case(command_name)}Handler"
-
-                # Importation dynamique du module
-                handler_module = importlib.import_module(module_path)
-
-                # Obtention de la classe depuis le module
-                HandlerClass = getattr(handler_module, class_name)
-
-                # Instanciation et initialisation
-                handler_instance = HandlerClass(self.engine)
-                if handler_instance.initialize():
-                    # La factory est responsable de l'enregistrement du handler ET de ses métadonnées
-                    handler_method = getattr(handler_instance, f"handle_{command_name}")
-                    self.engine.register_handler(command_name, handler_method)
-
-                    param_names = command_info.get("params", [])
-                    self.engine.register_command_metadata(command_name, param_names)
-                else:
-                    print(f"⚠️ Avertissement: Échec de l'initialisation du handler pour '{command_name}'.")
-
-            except ModuleNotFoundError:
-                # Attendu si le fichier du handler n'a pas encore été créé
-                pass
-            except AttributeError:
-                # Attendu si la classe du handler n'est pas définie dans le fichier
-                pass
+                handler = self.generic.handler_for(spec)
             except Exception as e:
-                print(f"❌ Erreur lors du chargement du handler pour '{command_name}': {e}")
+                print(f"❌ Erreur dans le comportement déclaré de '{spec.name}': {e}")
+        return handler
+
+    def _load_handler_class(self, spec: CommandSpec):
+        """Importe et instancie le handler d'une commande. Retourne la méthode `handle_*` ou None."""
+        command_name = spec.name
+        try:
+            module_path = f"handlers.{spec.category}.{spec.template}"
+            class_name = f"{to_camel_case(command_name)}Handler"
+
+            # Importation dynamique du module
+            handler_module = importlib.import_module(module_path)
+
+            # Obtention de la classe depuis le module
+            HandlerClass = getattr(handler_module, class_name)
+
+            # Instanciation et initialisation
+            handler_instance = HandlerClass(self.engine)
+            if handler_instance.initialize():
+                return getattr(handler_instance, f"handle_{command_name}")
+            print(f"⚠️ Avertissement: Échec de l'initialisation du handler pour '{command_name}'.")
+
+        except ModuleNotFoundError:
+            # Attendu si le fichier du handler n'a pas encore été créé
+            pass
+        except AttributeError:
+            # Attendu si la classe du handler n'est pas définie dans le fichier
+            pass
+        except Exception as e:
+            print(f"❌ Erreur lors du chargement du handler pour '{command_name}': {e}")
+        return None
@@ -1,16 +1,71 @@
 # game_engine.py
-from cyber_attack_simulator.game_state import GameState
+import asyncio
+import inspect
+import random
+import secrets
+import weakref
+from functools import partial
+from time import perf_counter_ns
+
+from cyber_attack_simulator.game_state import GameState, scan_spill_path
+from cyber_attack_simulator.utils.command_history import CommandHistory, DEFAULT_HISTORY_CAPACITY, deep_getsizeof
+from cyber_attack_simulator.utils.risk_calculator import RiskCalculator
+from cyber_attack_simulator.utils.rng import use_rng
+from cyber_attack_simulator.utils.session import use_state
+from cyber_attack_simulator.utils.result_cache import ResultCache, make_cache_key, mark_cached
+from cyber_attack_simulator.utils.middleware import MiddlewareChain
+from cyber_attack_simulator.utils.scheduler import EventScheduler, Job, JOB_CANCELLED, JOB_DONE
 
 class CyberAttackEngine:
     """Moteur principal du simulateur de cyber attaque"""
 
-    def __init__(self):
-        self.game_state = GameState()
+    def __init__(self, history_capacity: int = DEFAULT_HISTORY_CAPACITY, history_spill_path: str = None,
+                 seed: int = None):
+        self.game_state = GameState(history_capacity, scan_spill_path(history_spill_path))
+        # Générateur propre à la session : une même graine rejoue exactement la même partie.
+        # Sans graine, une graine est tirée puis conservée : toute session reste rejouable.
+        self.seed = secrets.randbits(64) if seed is None else seed
+        self.rng = random.Random(self.seed)
         self.handlers = {}
+        self.lazy_handlers = {}  # Chargeurs différés: nom de commande -> callable retournant le handler
+        self.catalog = None
         self.command_metadata = {}  # Pour stocker les noms de paramètres
-        self.command_history = []
+        self.command_history = CommandHistory(history_capacity, history_spill_path)
         self.detection_level = 0.0
+        self.detection = None  # DetectionEngine partagé, construit depuis le catalogue
+        self.repetitions = {}  # Nombre d'exécutions réussies par commande
+        # En mode lot, les risques sont mis en attente et évalués par DetectionEngine.apply_pending
+        self.batch_detection = False
+        self.pending_detection = []
+        # Cache des résultats des commandes idempotentes (TTL déclaré par commande dans le catalogue,
+        # en secondes de jeu : l'expiration ne dépend pas de l'horloge murale)
+        self.result_cache = ResultCache(clock=self._game_time)
         self.flags = set()
+        # Journal de session optionnel (utils.journal.SessionJournal)
+        self.journal = None
+        # Instrumentation optionnelle (utils.metrics.EngineMetrics) : None = aucun coût
+        self.metrics = None
+        # Crochets pre/post/on_error, partagés avec le registre (voir share_registry)
+        self.middleware = MiddlewareChain()
+        # Suivi de progression de la session (utils.progression.ProgressionTracker)
+        self.progression = None
+        # Défenseur simulé de la session (utils.intrusion.IntrusionDetector)
+        self.ids = None
+        # Graphe d'attaque de la session (utils.attack_graph.AttackGraph)
+        self.attack_graph = None
+        # Horloge de jeu : chaque commande l'avance de sa durée, les jobs s'y terminent
+        self.clock = EventScheduler()
+        self.jobs = {}  # Jobs en arrière-plan en cours, par identifiant
+        self.finished_jobs = []  # Jobs terminés pas encore signalés au joueur
+        self._next_job_id = 1
+        # Facteur temps réel appliqué à `time_consumed` par le chemin asynchrone (0 = instantané)
+        self.time_scale = 0.0
+        # Exécute les handlers synchrones dans un thread pour ne pas bloquer la boucle asyncio
+        self.offload_sync_handlers = False
+        self._next_ticket = 0
+        self._applied_ticket = 0
+        # Une condition par boucle asyncio : une asyncio.Condition reste liée à sa boucle
+        self._apply_turns = weakref.WeakKeyDictionary()
 
     def register_command_metadata(self, command_name: str, params: list):
         """Enregistre les métadonnées (comme les noms de paramètres) pour une commande."""
@@ -20,40 +75,484 @@ class CyberAttackEngine:
         """Enregistre un nouveau handler de commande"""
         self.handlers[command_name] = handler
 
+    def share_registry(self, other: "CyberAttackEngine"):
+        """
+        Partage les handlers, chargeurs différés et métadonnées d'un autre moteur.
+
+        Seul l'état de jeu (GameState, historique, flags, détection) reste propre à ce moteur :
+        un serveur peut ainsi héberger de nombreuses sessions sur un registre unique.
+        """
+        self.handlers = other.handlers
+        self.lazy_handlers = other.lazy_handlers
+        self.command_metadata = other.command_metadata
+        self.catalog = other.catalog
+        self.detection = other.detection
+        self.middleware = other.middleware
+
+    def add_middleware(self, name: str, pre=None, post=None, on_error=None, index: int = None):
+        """Enregistre un middleware (voir utils.middleware.Middleware pour la signature des crochets)."""
+        return self.middleware.add(name, pre, post, on_error, index)
+
+    def remove_middleware(self, name: str) -> bool:
+        return self.middleware.remove(name)
+
+    def register_lazy_handler(self, command_name: str, loader):
+        """Enregistre un chargeur appelé à la première exécution de la commande."""
+        self.lazy_handlers[command_name] = loader
+
+    def resolve_handler(self, command_name: str):
+        """Retourne le handler d'une commande, en le chargeant si nécessaire."""
+        handler = self.handlers.get(command_name)
+        if handler is None:
+            loader = self.lazy_handlers.pop(command_name, None)
+            if loader is not None:
+                handler = loader()
+                if handler is not None:
+                    self.handlers[command_name] = handler
+        return handler
+
     def execute_command(self, command: str, params: dict) -> dict:
-        """Exécute une commande et retourne les résultats."""
-        handler = self.handlers.get(command)
+        """
+        Exécute une commande et retourne les résultats.
+
+        Sur ce chemin, un handler peut transmettre des deltas partiels (`utils.session.stream_update`)
+        appliqués à l'état au fil de son exécution.
+        """
+        early, handler, cache_key, cache_ttl = self._prepare(command, params)
+        if early is not None:
+            return early
+        streamed = []
+        result, error = self._invoke(command, handler, params, streamed)
+        return self._complete(command, params, result, error, cache_key, cache_ttl, streamed=streamed)
 
+    # --- Étapes communes aux chemins synchrone, asynchrone et aux jobs ---
+
+    def _prepare(self, command: str, params: dict, cacheable: bool = True) -> tuple:
+        """
+        Résout le handler, applique le middleware `pre`, historise et consulte le cache.
+
+        Retourne (résultat anticipé, handler, clé de cache, ttl) : si le résultat anticipé
+        n'est pas None, la commande est terminée sans appel au handler.
+        """
+        handler = self.handlers.get(command) or self.resolve_handler(command)
         if not handler:
-            return {"success": False, "output": f"❌ Commande '{command}' non reconnue."}
+            return {"success": False, "output": f"❌ Commande '{command}' non reconnue."}, None, None, 0.0
+
+        if self.middleware.pre is not None:
+            shortcut = self.middleware.pre(self, command, params)
+            if shortcut is not None:
+                return shortcut, None, None, 0.0
+
+        self.command_history.record(command, params)
+
+        cache_key, cache_ttl = self._cache_key(command, params) if cacheable else (None, 0.0)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return self._serve_cached(command, params, cached), None, None, 0.0
+        return None, handler, cache_key, cache_ttl
+
+    def _invoke(self, command: str, handler, params: dict, streamed: list = None) -> tuple:
+        """
+        Appelle le handler avec le générateur et l'état de la session ; retourne (résultat, exception).
+
+        Avec `streamed`, les deltas partiels du handler sont appliqués aussitôt et y sont conservés.
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            start = perf_counter_ns()
+        sink = partial(self._apply_streamed, streamed) if streamed is not None else None
+        try:
+            with use_rng(self.rng), use_state(self.game_state, sink):
+                result = handler(params)
+                if inspect.isawaitable(result):
+                    result = self._run_coroutine(result)
+        except Exception as e:
+            if metrics is not None:
+                metrics.record(command, None, perf_counter_ns() - start, e)
+            return None, e
+        if metrics is not None:
+            metrics.record(command, result, perf_counter_ns() - start)
+        return result, None
 
-        self.command_history.append({"command": command, "params": params})
+    def _apply_streamed(self, streamed: list, delta: dict):
+        self.game_state.update_state(delta)
+        streamed.append(delta)
+        # Le crochet post du graphe d'attaque ne lit que `new_state` : les blocs l'alimentent ici
+        if self.attack_graph is not None and isinstance(delta.get("discovered_targets"), dict):
+            self.attack_graph.ingest(delta["discovered_targets"])
 
-        # Le handler lui-même est la fonction à appeler, enregistrée via `register_handler`
+    async def _invoke_async(self, command: str, handler, params: dict) -> tuple:
+        """Variante asynchrone de `_invoke` (handler coroutine, thread ou délai temps réel)."""
+        metrics = self.metrics
+        if metrics is not None:
+            start = perf_counter_ns()
         try:
-            result = handler(params)
+            with use_rng(self.rng), use_state(self.game_state):
+                if self.offload_sync_handlers and not inspect.iscoroutinefunction(handler):
+                    result = await asyncio.to_thread(handler, params)
+                else:
+                    result = handler(params)
+                if inspect.isawaitable(result):
+                    result = await result
+            if self.time_scale > 0:
+                await asyncio.sleep(result.get("time_consumed", 0.0) * self.time_scale)
         except Exception as e:
-            return {"success": False, "output": f"❌ Erreur critique lors de l'exécution de '{command}': {e}"}
+            if metrics is not None:
+                metrics.record(command, None, perf_counter_ns() - start, e)
+            return None, e
+        if metrics is not None:
+            metrics.record(command, result, perf_counter_ns() - start)
+        return result, None
+
+    def _complete(self, command: str, params: dict, result, error: Exception = None,
+                  cache_key=None, cache_ttl: float = 0.0, job: int = None, streamed: list = None) -> dict:
+        """
+        Applique le résultat à l'état, avance l'horloge, remplit le cache puis passe au middleware `post`.
+
+        Le résultat d'un job (`job` = son identifiant) est appliqué à son échéance : l'horloge n'avance pas.
+        `streamed` : deltas partiels déjà appliqués pendant l'exécution, journalisés avec la commande.
+        """
+        if error is not None:
+            return self._handler_error(command, params, error, job, streamed)
+        duration = self.command_duration(command, result) if job is None else 0.0
+        self._apply_result(command, params, result, job, duration, streamed)
+        if job is None:
+            self.clock.advance(duration)
+        if cache_key is not None and result.get("success"):
+            self.result_cache.put(cache_key, result, cache_ttl)
+        if self.middleware.post is not None:
+            return self.middleware.post(self, command, params, result)
+        return result
+
+    def _cache_key(self, command: str, params: dict) -> tuple:
+        """
+        Retourne (clé, ttl) si la commande est déclarée cacheable, (None, 0) sinon.
+
+        Un résultat servi depuis le cache n'est pas réappliqué à l'état du jeu : il ne
+        rapporte ni flags, ni expérience, ni détection une seconde fois.
+        """
+        spec = self.catalog.get(command) if self.catalog is not None else None
+        if spec is None or spec.cache_ttl <= 0:
+            return None, 0.0
+        return make_cache_key(command, params), spec.cache_ttl
+
+    def command_duration(self, command: str, result) -> float:
+        """Durée de jeu d'une commande : `time_consumed` du résultat, sinon celle du catalogue."""
+        elapsed = result.get("time_consumed")
+        if elapsed is None:
+            spec = self.catalog.get(command) if self.catalog is not None else None
+            elapsed = spec.time if spec is not None else 0.0
+        return elapsed
+
+    def _handler_error(self, command: str, params: dict, error: Exception, job: int = None,
+                       streamed: list = None) -> dict:
+        result = None
+        if self.middleware.on_error is not None:
+            result = self.middleware.on_error(self, command, params, error)
+        if result is None:
+            result = {"success": False, "output": f"❌ Erreur critique lors de l'exécution de '{command}': {error}"}
+        if self.journal is not None:
+            self.journal.record(self, command, params, result, job=job, streamed=streamed)
+        return result
+
+    def _serve_cached(self, command: str, params: dict, cached: dict) -> dict:
+        result = mark_cached(cached)
+        if self.journal is not None:
+            self.journal.record(self, command, params, result, applied=False)
+        if self.middleware.post is not None:
+            return self.middleware.post(self, command, params, result)
+        return result
 
-        # Mise à jour de l'état du jeu avec les résultats
+    def _apply_result(self, command: str, params: dict, result: dict, job: int = None, duration: float = 0.0,
+                      streamed: list = None):
+        """Met à jour l'état du jeu avec les résultats d'une commande (journalisée à sa fin, `now + duration`)."""
         if result.get("success"):
             if "new_state" in result and isinstance(result["new_state"], dict):
                 self.game_state.update_state(result["new_state"])
 
-            if "flags" in result and isinstance(result["flags"], list):
-                for flag in result["flags"]:
-                    self.add_flag(flag)
+            self.apply_rewards(command, result.get("flags"))
 
-            # Mise à jour du niveau de détection (placeholder)
-            # risk = RiskCalculator.calculate_detection_risk(command, params)
-            # self.update_detection(risk)
+            # Mise à jour du niveau de détection
+            if self.batch_detection:
+                self.pending_detection.append((command, params))
+            else:
+                self.update_detection(self.detection_risk(command, params))
+                self.repetitions[command] = self.repetitions.get(command, 0) + 1
 
-        return result
+        if self.journal is not None:
+            self.journal.record(self, command, params, result, job=job, clock=self.clock.now + duration,
+                                streamed=streamed)
+
+    def apply_rewards(self, command: str, flags: list = None):
+        """Attribue les flags d'une commande réussie (résultat et catalogue) et son expérience."""
+        if isinstance(flags, list):
+            for flag in flags:
+                self.add_flag(flag)
+        spec = self.catalog.get(command) if self.catalog is not None else None
+        if spec is not None:
+            for flag in spec.flags:
+                self.add_flag(flag)
+        if self.progression is not None:
+            self.progression.on_success(command)
+
+    @staticmethod
+    def _run_coroutine(coroutine):
+        """Exécute un handler asynchrone depuis le chemin synchrone."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        coroutine.close()
+        raise RuntimeError("handler asynchrone appelé depuis une boucle active, utilisez execute_command_async")
+
+    # --- Jobs en arrière-plan ---
+
+    @property
+    def now(self) -> float:
+        """Heure de jeu courante, en secondes."""
+        return self.clock.now
+
+    def _game_time(self) -> float:
+        return self.clock.now
+
+    def launch_job(self, command: str, params: dict) -> Job:
+        """
+        Lance une commande en arrière-plan.
+
+        Le handler s'exécute immédiatement, mais son résultat (état, flags, détection)
+        n'est appliqué qu'à l'échéance `now + durée`, quand l'horloge l'atteint. L'horloge
+        n'avance pas au lancement : le joueur peut enchaîner d'autres commandes. Les jobs
+        ne passent pas par le cache de résultats. Un job refusé (commande inconnue,
+        middleware, erreur du handler) est retourné déjà terminé.
+
+        Le lancement est journalisé dès l'appel du handler : le rejeu tire les nombres
+        aléatoires dans le même ordre que la session.
+        """
+        job = Job(self._next_job_id, command, params, self.clock.now)
+        self._next_job_id += 1
+        early, handler, _, _ = self._prepare(command, params, cacheable=False)
+        if early is None:
+            result, error = self._invoke(command, handler, params)
+        if self.journal is not None:
+            self.journal.record_launch(job.id, command, params, accepted=early is None)
+        if early is not None:
+            return self._finish_job(job, early)
+        if error is not None:
+            return self._finish_job(job, self._handler_error(command, params, error, job.id))
+
+        job.result = result
+        job.event = self.clock.schedule(self.command_duration(command, result), partial(self._complete_job, job))
+        job.due = job.event.due
+        self.jobs[job.id] = job
+        return job
+
+    def _complete_job(self, job: Job):
+        del self.jobs[job.id]
+        self._finish_job(job, self._complete(job.command, job.params, job.result, job=job.id))
+
+    def _finish_job(self, job: Job, result) -> Job:
+        job.result = result
+        job.status = JOB_DONE
+        job.due = self.clock.now
+        self.finished_jobs.append(job)
+        return job
+
+    def cancel_job(self, job_id: int) -> bool:
+        """Annule un job en cours : son résultat ne sera jamais appliqué."""
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return False
+        self.clock.cancel(job.event)
+        job.status = JOB_CANCELLED
+        if self.journal is not None:
+            self.journal.record_cancel(job_id)
+        return True
+
+    def wait_for_job(self, job_id: int = None) -> bool:
+        """
+        Avance l'horloge jusqu'à la fin d'un job (ou de tous les jobs si `job_id` est None).
+
+        Retourne False si le job n'est pas en cours.
+        """
+        if job_id is not None and job_id not in self.jobs:
+            return False
+        while (job_id in self.jobs) if job_id is not None else self.jobs:
+            if not self.clock.run_next():
+                break
+        if self.journal is not None:
+            self.journal.record_clock(self.clock.now)
+        return True
+
+    def drain_finished_jobs(self) -> list:
+        """Retourne et oublie les jobs terminés depuis le dernier appel."""
+        finished, self.finished_jobs = self.finished_jobs, []
+        return finished
+
+    # --- Chemin d'exécution asynchrone ---
+
+    async def execute_command_async(self, command: str, params: dict) -> dict:
+        """
+        Version asynchrone de `execute_command`.
+
+        Les handlers peuvent être des coroutines ; les handlers synchrones sont adaptés
+        automatiquement. Plusieurs commandes peuvent s'exécuter en parallèle, mais leurs
+        effets (update_state, add_flag) sont appliqués dans l'ordre de soumission.
+        """
+        early, handler, cache_key, cache_ttl = self._prepare(command, params)
+        if early is not None:
+            return early
+
+        # Le ticket est pris avant tout `await` : il fixe l'ordre d'application des effets
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        try:
+            result, error = await self._invoke_async(command, handler, params)
+            await self._wait_for_turn(ticket)
+            return self._complete(command, params, result, error, cache_key, cache_ttl)
+        finally:
+            await self._release_turn(ticket)
+
+    async def execute_many_async(self, commands: list) -> list:
+        """
+        Exécute une liste de couples (commande, paramètres) de manière concurrente.
+
+        Les résultats sont retournés dans l'ordre de la liste. Pour plusieurs sessions,
+        il suffit de regrouper les appels de plusieurs moteurs dans un même `asyncio.gather`.
+        """
+        return await asyncio.gather(*(self.execute_command_async(command, params)
+                                      for command, params in commands))
+
+    def _turn_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        condition = self._apply_turns.get(loop)
+        if condition is None:
+            condition = self._apply_turns[loop] = asyncio.Condition()
+        return condition
+
+    async def _wait_for_turn(self, ticket: int):
+        if self._applied_ticket == ticket:
+            return
+        condition = self._turn_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._applied_ticket == ticket)
+
+    async def _release_turn(self, ticket: int):
+        """Passe la main au ticket suivant (même en cas d'échec du handler)."""
+        if self._applied_ticket != ticket:
+            await self._wait_for_turn(ticket)
+        self._applied_ticket = ticket + 1
+        condition = self._apply_turns.get(asyncio.get_running_loop())
+        if condition is not None:
+            async with condition:
+                condition.notify_all()
+
+    def memory_usage(self) -> dict:
+        """Mémoire approximative propre à la session (hors registre partagé), en octets."""
+        seen = set()
+        usage = {
+            "game_state": self.game_state.memory_usage(seen),
+            "command_history": self.command_history.memory_usage(seen),
+            "flags": deep_getsizeof(self.flags, seen),
+            "result_cache": self.result_cache.bytes,
+        }
+        usage["total"] = sum(usage.values())
+        return usage
+
+    # --- Instantanés ---
+
+    def snapshot(self) -> dict:
+        """Instantané sérialisable de la session (hors registre partagé et cache de résultats)."""
+        snapshot = {
+            "seed": self.seed,
+            "rng_state": self.rng.getstate(),
+            "game_state": self.game_state.snapshot(),
+            "command_history": self.command_history.snapshot(),
+            "flags": set(self.flags),
+            "detection_level": self.detection_level,
+            "repetitions": dict(self.repetitions),
+            "clock": self.clock.now,
+            "next_job_id": self._next_job_id,
+        }
+        if self.progression is not None:
+            # Les nœuds sans déblocage ne se déduisent pas de l'état : leurs récompenses seraient redonnées
+            snapshot["progression_nodes"] = self.progression.node_ids()
+        return snapshot
+
+    # --- Branches ---
+
+    def fork(self) -> "CyberAttackEngine":
+        """
+        Branche « et si » de la session, jouable indépendamment de l'originale.
+
+        Le registre est partagé (comme `share_registry`) et l'état de jeu est dupliqué
+        par copie sur écriture (`GameState.fork`) : créer une branche ne coûte que
+        quelques objets, quelle que soit la taille de l'état. La branche tire la même
+        suite aléatoire que l'originale, mais n'a ni jobs, ni cache de résultats, ni
+        journal, métriques, IDS ou graphe d'attaque ; la progression est copiée.
+        """
+        engine = CyberAttackEngine.__new__(CyberAttackEngine)
+        engine.__dict__.update(self.__dict__)
+        engine.game_state = self.game_state.fork()
+        engine.command_history = self.command_history.fork()
+        engine.rng = random.Random(0)  # Graine fixe : évite la lecture d'os.urandom
+        engine.rng.setstate(self.rng.getstate())
+        engine.flags = set(self.flags)
+        engine.repetitions = dict(self.repetitions)
+        engine.pending_detection = list(self.pending_detection)
+        engine.result_cache = ResultCache(clock=engine._game_time)
+        engine.clock = EventScheduler(self.clock.now)
+        engine.jobs = {}
+        engine.finished_jobs = []
+        engine.journal = engine.metrics = engine.ids = engine.attack_graph = None
+        engine._next_ticket = engine._applied_ticket = 0
+        engine._apply_turns = weakref.WeakKeyDictionary()
+        if self.progression is not None:
+            engine.progression = self.progression.fork(engine)
+        return engine
+
+    def restore_snapshot(self, snapshot: dict):
+        """
+        Remplace l'état de la session par celui d'un instantané.
+
+        Les jobs en arrière-plan ne font pas partie de l'instantané : ceux en cours sont abandonnés.
+        """
+        self.seed = snapshot["seed"]
+        self.rng.setstate(snapshot["rng_state"])
+        self.game_state = GameState.from_snapshot(snapshot["game_state"], self.game_state.scan_history.spill_path)
+        self.command_history = CommandHistory.from_snapshot(snapshot["command_history"],
+                                                            self.command_history.spill_path)
+        self.flags = set(snapshot["flags"])
+        self.detection_level = snapshot["detection_level"]
+        self.repetitions = dict(snapshot["repetitions"])
+        self.clock = EventScheduler(snapshot.get("clock", 0.0))
+        self._next_job_id = snapshot.get("next_job_id", 1)
+        self.jobs = {}
+        self.finished_jobs = []
+        self.result_cache.clear()
+        if self.progression is not None:
+            self.progression.sync(snapshot.get("progression_nodes"))
+        if self.ids is not None:
+            self.ids.reset()
+        if self.attack_graph is not None:
+            self.attack_graph.clear()
+            self.attack_graph.ingest(self.game_state.discovered_targets)
+
+    def detection_risk(self, command: str, params: dict) -> float:
+        """Risque de détection d'une commande dans l'état courant de la session."""
+        if self.detection is None:
+            return RiskCalculator.calculate_detection_risk(command, params, self.catalog)
+        return self.detection.score(command, params, self.game_state.stealth_level,
+                                    self.repetitions.get(command, 0))
 
     def update_detection(self, risk: float):
         """Met à jour le niveau de détection"""
-        pass
+        self.detection_level = min(1.0, max(0.0, self.detection_level + risk))
 
     def add_flag(self, flag: str):
         """Ajoute un flag au joueur"""
+        if flag in self.flags:
+            return
         self.flags.add(flag)
+        if self.progression is not None:
+            self.progression.on_flag(flag)
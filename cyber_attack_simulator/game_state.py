@@ -1,31 +1,185 @@
 # game_state.py
+import bisect
+import sys
+import time
+
+from cyber_attack_simulator.utils.command_history import (
+    CommandHistory, DEFAULT_HISTORY_CAPACITY, intern_command, command_name,
+    compact_params, expand_params, deep_getsizeof,
+)
+from cyber_attack_simulator.utils.layered_map import LayeredMap
+
+# Expérience totale requise pour atteindre chaque niveau (niveau 1 = index 0)
+DEFAULT_LEVEL_THRESHOLDS = (0, 100, 250, 500, 900, 1400, 2000, 2800)
+
+def scan_spill_path(history_spill_path: str):
+    """Fichier de débordement de `scan_history`, à côté de celui de l'historique des commandes."""
+    return history_spill_path + ".scans" if history_spill_path else None
+
+
 class GameState:
     """État du jeu du joueur"""
 
-    def __init__(self):
+    # Attributs fixes : pas de __dict__ par session, et aucun attribut ne peut être ajouté à la volée
+    STATE_SLOTS = (
+        "player_name", "level", "experience", "credits", "unlocked_commands",
+        "discovered_targets", "scan_history", "active_alerts", "stealth_level",
+        "last_results",
+    )
+    __slots__ = STATE_SLOTS + ("_shared",)
+    # Petits conteneurs partagés avec les branches (`fork`) jusqu'à leur première modification
+    SHARED_CONTAINERS = ("unlocked_commands", "active_alerts", "last_results")
+
+    # Préfixe des clés `new_state` décrivant la dernière exécution d'une commande
+    LAST_RESULT_PREFIX = "last_"
+    # Attributs complétés cible par cible plutôt que remplacés par `update_state`
+    MERGED_ATTRIBUTES = ("discovered_targets",)
+    # Informations de cible dont les listes s'accumulent d'un scan à l'autre
+    UNION_TARGET_KEYS = ("ports",)
+    # Historiques complétés par une liste d'entrées (commande, paramètres)
+    APPENDED_ATTRIBUTES = ("scan_history",)
+
+    def __init__(self, history_capacity: int = DEFAULT_HISTORY_CAPACITY, history_spill_path: str = None):
         self.player_name = "Anonyme"
         self.level = 1
         self.experience = 0
         self.credits = 1000
         self.unlocked_commands = set()
-        self.discovered_targets = {}
-        self.scan_history = []
+        # Table par couches : les branches partagent les cibles qu'elles ne modifient pas
+        self.discovered_targets = LayeredMap()
+        self.scan_history = CommandHistory(history_capacity, history_spill_path)
         self.active_alerts = []
         self.stealth_level = 1.0
+        # id de commande interné -> (id de schéma de paramètres, valeurs, horodatage)
+        self.last_results = {}
+        self._shared = set()  # Conteneurs encore partagés avec une autre branche
 
-    def add_experience(self, xp: int):
-        """Ajoute de l'expérience au joueur"""
-        pass
+    def add_experience(self, xp: int, thresholds=DEFAULT_LEVEL_THRESHOLDS) -> int:
+        """Ajoute de l'expérience au joueur et retourne le nombre de niveaux gagnés."""
+        self.experience = max(0, self.experience + xp)
+        level = max(self.level, bisect.bisect_right(thresholds, self.experience))
+        gained = level - self.level
+        self.level = level
+        return gained
 
-    def unlock_command(self, command: str):
-        """Débloque une nouvelle commande"""
-        pass
+    def unlock_command(self, command: str) -> bool:
+        """Débloque une nouvelle commande. Retourne False si elle l'était déjà."""
+        if command in self.unlocked_commands:
+            return False
+        self._own("unlocked_commands").add(command)
+        return True
 
     def update_state(self, data: dict):
         """Met à jour l'état du jeu de manière contrôlée."""
         for key, value in data.items():
-            if hasattr(self, key):
+            if key.startswith(self.LAST_RESULT_PREFIX) and isinstance(value, dict):
+                self.record_last_result(key[len(self.LAST_RESULT_PREFIX):], value)
+            elif key in self.MERGED_ATTRIBUTES and isinstance(value, dict):
+                # Copie de chemin : les infos d'une cible ne sont jamais modifiées en place,
+                # elles peuvent donc rester partagées avec les branches
+                merged = getattr(self, key)
+                for target, info in value.items():
+                    current = merged.get(target)
+                    merged[target] = self._merge_target(current, info) if current else dict(info)
+            elif key in self.APPENDED_ATTRIBUTES and isinstance(value, list):
+                history = getattr(self, key)
+                for command, params in value:
+                    history.record(command, params)
+            elif key in self.STATE_SLOTS:
+                self._shared.discard(key)
                 setattr(self, key, value)
             else:
                 # Empêche l'ajout d'attributs non définis
                 print(f"⚠️ Avertissement: Tentative de mise à jour d'un attribut d'état inconnu: {key}")
+
+    def _merge_target(self, current: dict, info: dict) -> dict:
+        """Complète les infos d'une cible : un nouveau scan ajoute des ports sans oublier les anciens."""
+        merged = {**current, **info}
+        for key in self.UNION_TARGET_KEYS:
+            if key in current and key in info:
+                merged[key] = sorted(set(current[key]).union(info[key]))
+        return merged
+
+    def record_last_result(self, command: str, value: dict):
+        """Mémorise de façon compacte la dernière exécution d'une commande."""
+        layout_id, values = compact_params(value.get("params") or {})
+        self._own("last_results")[intern_command(command)] = (layout_id, values, value.get("time", time.time()))
+
+    def get_last_result(self, command: str):
+        """Retourne {"params": ..., "time": ...} pour la dernière exécution d'une commande, ou None."""
+        entry = self.last_results.get(intern_command(command))
+        if entry is None:
+            return None
+        layout_id, values, timestamp = entry
+        return {"params": expand_params(layout_id, values), "time": timestamp}
+
+    def last_result_commands(self) -> list:
+        return [command_name(command_id) for command_id in self.last_results]
+
+    # --- Branches (copie sur écriture) ---
+
+    def fork(self) -> "GameState":
+        """
+        Branche de l'état en O(1) : les cibles découvertes et l'historique sont partagés
+        structurellement, les autres conteneurs sont copiés par le premier des deux états
+        qui les modifie.
+        """
+        state = GameState.__new__(GameState)
+        for name in self.STATE_SLOTS:
+            setattr(state, name, getattr(self, name))
+        state.discovered_targets = self.discovered_targets.fork()
+        state.scan_history = self.scan_history.fork()
+        state._shared = set(self.SHARED_CONTAINERS)
+        self._shared.update(self.SHARED_CONTAINERS)
+        return state
+
+    def _own(self, name: str):
+        """Retourne le conteneur `name`, copié d'abord s'il est encore partagé."""
+        container = getattr(self, name)
+        if name in self._shared:
+            self._shared.discard(name)
+            container = container.copy()
+            setattr(self, name, container)
+        return container
+
+    def own_alerts(self) -> list:
+        """Liste des alertes actives, modifiable en place par le défenseur simulé."""
+        return self._own("active_alerts")
+
+    # --- Instantanés ---
+
+    def snapshot(self) -> dict:
+        """Copie sérialisable de l'état (pickle), indépendante du processus et de l'état lui-même."""
+        snapshot = {name: getattr(self, name) for name in self.STATE_SLOTS
+                    if name not in ("scan_history", "last_results")}
+        # Conteneurs modifiables en place : copiés (les infos de cible, jamais modifiées, restent partagées)
+        snapshot["unlocked_commands"] = set(self.unlocked_commands)
+        snapshot["active_alerts"] = list(self.active_alerts)
+        snapshot["discovered_targets"] = dict(self.discovered_targets)
+        snapshot["scan_history"] = self.scan_history.snapshot()
+        snapshot["last_results"] = {command: self.get_last_result(command) for command in self.last_result_commands()}
+        return snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, scan_spill_path: str = None) -> "GameState":
+        state = cls.__new__(cls)
+        state._shared = set()
+        for name in cls.STATE_SLOTS:
+            if name not in ("scan_history", "last_results"):
+                setattr(state, name, snapshot[name])
+        # Un même instantané peut être restauré plusieurs fois
+        state.unlocked_commands = set(snapshot["unlocked_commands"])
+        state.active_alerts = list(snapshot["active_alerts"])
+        state.discovered_targets = LayeredMap(snapshot["discovered_targets"])
+        state.scan_history = CommandHistory.from_snapshot(snapshot["scan_history"], scan_spill_path)
+        state.last_results = {}
+        for command, value in snapshot["last_results"].items():
+            state.record_last_result(command, value)
+        return state
+
+    def memory_usage(self, seen: set = None) -> int:
+        """Taille mémoire approximative de l'état (en octets)."""
+        if seen is None:
+            seen = set()
+        seen.add(id(self))
+        return sys.getsizeof(self) + sum(deep_getsizeof(getattr(self, name), seen) for name in self.STATE_SLOTS)
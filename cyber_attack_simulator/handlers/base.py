@@ -0,0 +1,43 @@
+# handlers/base.py
+import time
+
+from cyber_attack_simulator.utils.rng import get_rng
+from cyber_attack_simulator.utils.results import CommandResult
+
+
+def mock_response(command_name: str, params: dict, output_data: dict, success_rate: float,
+                  time_consumed: float) -> CommandResult:
+    """Réponse simulée standard : échec aléatoire selon `success_rate`, sinon rapport structuré."""
+    if get_rng().random() > success_rate:
+        return CommandResult.failure(f"Échec de la simulation pour {command_name}.", command_name)
+
+    return CommandResult(
+        command_name,
+        data=output_data,
+        new_state={f"last_{command_name}": {"params": params, "time": time.time()}},
+        flags=[f"{command_name.upper()}_EXECUTED"],
+        time_consumed=time_consumed
+    )
+
+
+# --- Classe de base commune aux handlers écrits à la main ---
+class BaseHandler:
+    # Surchargée par les familles de handlers (DNS, OSINT...)
+    DEFAULT_CONFIG = {
+        "query_time": 0.1,
+        "detection_risk": 0.1,
+        "success_rate": 0.95
+    }
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.config = dict(self.DEFAULT_CONFIG)
+
+    def initialize(self):
+        """Initialise le handler. L'enregistrement est géré par la Factory."""
+        return True
+
+    def _generate_mock_response(self, command_name: str, params: dict, output_data: dict):
+        """Génère une réponse simulée standard (le rapport texte est rendu à la demande)."""
+        return mock_response(command_name, params, output_data, self.config["success_rate"],
+                             self.config["query_time"])
@@ -0,0 +1,75 @@
+# handlers/enumeration/ldap_enum.py
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.directory import DirectoryError, get_default_directory
+from cyber_attack_simulator.utils.network import get_default_universe
+from cyber_attack_simulator.utils.results import CommandResult
+
+# --- Classe de base pour les Handlers LDAP ---
+class BaseLDAPEnumHandler(BaseHandler):
+    DEFAULT_CONFIG = {
+        "query_time": 0.5,
+        "time_per_entry": 0.002,
+        "page_size": 25,
+        "detection_risk": 0.22,
+        "success_rate": 0.9
+    }
+
+# --- Handlers Spécifiques ---
+
+class EnumererldapHandler(BaseLDAPEnumHandler):
+    """Handler pour enumererldap : requête filtrée sur l'annuaire, résultats paginés."""
+    DEFAULT_FILTER = "(objectClass=user)"
+    # Un contrôleur de domaine du réseau simulé expose LDAP ou Kerberos
+    DC_PORTS = (389, 88)
+
+    @staticmethod
+    def _summary(entry: dict) -> str:
+        details = [entry["objectClass"]]
+        if "department" in entry:
+            details.append(entry["department"])
+        if entry.get("adminCount") == "1":
+            details.append("adminCount=1")
+        if entry.get("userAccountControl") == "514":
+            details.append("désactivé")
+        if "servicePrincipalName" in entry:
+            details.append(f"SPN {entry['servicePrincipalName']}")
+        return f"{entry['sAMAccountName']} ({', '.join(details)})"
+
+    def handle_enumererldap(self, params: dict) -> dict:
+        ip = params.get("ip")
+        if not ip:
+            return CommandResult.failure("❌ Erreur: IP manquante.")
+        universe = get_default_universe()
+        if not universe.contains(ip) or not universe.exposes(ip, self.DC_PORTS):
+            return CommandResult.failure(f"❌ Erreur: {ip} n'est pas un contrôleur de domaine (LDAP/Kerberos, ports 389/88).")
+        query = params.get("filtre") or self.DEFAULT_FILTER
+        try:
+            page = int(params.get("page") or 1)
+        except ValueError:
+            page = 0
+        if page < 1:
+            return CommandResult.failure("❌ Erreur: Numéro de page invalide.")
+
+        directory = get_default_directory()
+        try:
+            found = directory.search(query)
+        except DirectoryError as e:
+            return CommandResult.failure(f"❌ Erreur: Filtre LDAP invalide : {e}")
+        page_size = self.config["page_size"]
+        pages = max(1, found.page_count(page_size))
+        if page > pages:
+            return CommandResult.failure(f"❌ Erreur: Page {page} hors limites ({pages} pages).")
+
+        # Seule la page demandée est construite, quel que soit le nombre de résultats
+        entries = found.page(page, page_size)
+        result = self._generate_mock_response("enumererldap", params, {
+            "Domaine": directory.domain,
+            "Filtre": query,
+            "Résultats": len(found),
+            "Page": f"{page}/{pages}",
+            "Entrées": [self._summary(entry) for entry in entries],
+        })
+        if result["success"]:
+            result.time_consumed = self.config["query_time"] + self.config["time_per_entry"] * len(entries)
+            result.new_state["discovered_targets"] = {ip: {"role": "dc", "domain": directory.domain}}
+        return result
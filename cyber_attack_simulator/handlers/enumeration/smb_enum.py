@@ -0,0 +1,48 @@
+# handlers/enumeration/smb_enum.py
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.directory import EVERYONE, get_default_directory
+from cyber_attack_simulator.utils.network import get_default_universe
+from cyber_attack_simulator.utils.results import CommandResult
+
+# --- Classe de base pour les Handlers SMB ---
+class BaseSMBEnumHandler(BaseHandler):
+    DEFAULT_CONFIG = {
+        "query_time": 0.4,
+        "detection_risk": 0.2,
+        "success_rate": 0.9
+    }
+
+# --- Handlers Spécifiques ---
+
+class EnumerersmbHandler(BaseSMBEnumHandler):
+    """Handler pour enumerersmb : partages de l'hôte et leurs ACL, tirés de l'annuaire."""
+    SMB_PORTS = (445, 139)
+
+    def handle_enumerersmb(self, params: dict) -> dict:
+        ip = params.get("ip")
+        if not ip:
+            return CommandResult.failure("❌ Erreur: IP manquante.")
+        if not get_default_universe().exposes(ip, self.SMB_PORTS):
+            return CommandResult.failure(f"❌ Erreur: {ip} n'expose pas SMB (ports 445/139).")
+
+        directory = get_default_directory()
+        computer = directory.computer_for(ip)
+        entry = directory.entry(computer)
+        shares = directory.shares(computer)
+        # IPC$ est ouvert à tous par conception : seuls les vrais partages comptent
+        exposed = [share["name"] for share in shares if share["name"] != "IPC$"
+                   and any(group == EVERYONE for group, _ in share["acl"])]
+        result = self._generate_mock_response("enumerersmb", params, {
+            "Hôte": f"{entry['dNSHostName']} ({entry['operatingSystem']})",
+            "Partages": [f"{share['name']} : " + ", ".join(f"{group} {right}" for group, right in share["acl"])
+                         for share in shares],
+            "Ouverts à tous": exposed,
+        })
+        if result["success"]:
+            result.new_state["discovered_targets"] = {ip: {
+                "hostname": entry["dNSHostName"],
+                "shares": {share["name"]: share["acl"] for share in shares},
+            }}
+            if exposed:
+                result.flags.append("OPEN_SHARES_FOUND")
+        return result
@@ -0,0 +1,90 @@
+# handlers/exploitation/exploit_handler.py
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.network import get_default_universe
+from cyber_attack_simulator.utils.results import CommandResult
+from cyber_attack_simulator.utils.session import current_state, known_target
+from cyber_attack_simulator.utils.simulator import RealisticSimulator
+
+# --- Classe de base pour les Handlers d'exploitation ---
+class BaseExploitHandler(BaseHandler):
+    DEFAULT_CONFIG = {
+        "query_time": 1.5,
+        "detection_risk": 0.35,
+        "success_rate": 0.8
+    }
+
+# --- Handlers Spécifiques ---
+
+class ExploiterHandler(BaseExploitHandler):
+    """Handler pour exploiter : compromet un hôte via une vulnérabilité exploitable de ses services."""
+    def handle_exploiter(self, params: dict) -> dict:
+        ip, cve = params.get("ip"), params.get("cve")
+        if not ip or not cve:
+            return CommandResult.failure("❌ Erreur: IP et CVE requises.")
+        if "vulnerabilities" not in known_target(ip):
+            return CommandResult.failure(f"❌ Erreur: {ip} n'a pas été analysé (scannervulnerabilites d'abord).")
+
+        findings = RealisticSimulator.simulate_vulnerability_check(ip)["vulnerabilities"]
+        finding = next((f for f in findings if f["id"] == cve.upper() and f["exploit"]), None)
+        if finding is None:
+            return CommandResult.failure(f"❌ Erreur: aucun service exploitable de {ip} n'est affecté par {cve}.")
+
+        result = self._generate_mock_response("exploiter", params, {
+            "Cible": f"{ip}:{finding['port']} ({finding['product']} {finding['version']})",
+            "Vulnérabilité": f"{finding['id']} : {finding['title']}",
+            "Accès": "shell distant",
+        })
+        if result["success"]:
+            result.new_state["discovered_targets"] = {ip: {"compromised": True}}
+            result.flags.append("HOST_COMPROMISED")
+        return result
+
+
+class ExtrairecredentialsHandler(BaseExploitHandler):
+    """Handler pour extrairecredentials : identifiants stockés sur un hôte compromis."""
+    def handle_extrairecredentials(self, params: dict) -> dict:
+        ip = params.get("ip")
+        if not ip:
+            return CommandResult.failure("❌ Erreur: IP manquante.")
+        if not known_target(ip).get("compromised"):
+            return CommandResult.failure(f"❌ Erreur: {ip} n'est pas compromis (exploiter ou pivoter d'abord).")
+
+        credentials = get_default_universe().host_credentials(ip)
+        result = self._generate_mock_response("extrairecredentials", params, {
+            "Identifiants": [f"{c['user']}@{c['realm']} (valide sur {len(c['valid_on'])} hôtes)"
+                             for c in credentials],
+        })
+        if result["success"]:
+            result.new_state["discovered_targets"] = {ip: {"credentials": credentials}}
+            if credentials:
+                result.flags.append("CREDENTIALS_FOUND")
+        return result
+
+
+class PivoterHandler(BaseExploitHandler):
+    """Handler pour pivoter : connexion latérale à un hôte avec un identifiant récupéré."""
+    @staticmethod
+    def _realms(user: str) -> set:
+        """Domaines (/24) des identifiants `user` extraits par le joueur."""
+        state = current_state()
+        if state is None:
+            return set()
+        return {credential["realm"] for info in state.discovered_targets.values()
+                for credential in info.get("credentials", ()) if credential["user"] == user}
+
+    def handle_pivoter(self, params: dict) -> dict:
+        ip, user = params.get("ip"), params.get("utilisateur")
+        if not ip or not user:
+            return CommandResult.failure("❌ Erreur: IP et utilisateur requis.")
+        realms = self._realms(user)
+        if not realms:
+            return CommandResult.failure(f"❌ Erreur: aucun identifiant '{user}' récupéré (extrairecredentials d'abord).")
+        universe = get_default_universe()
+        if not any(universe.credential_valid(user, realm, ip) for realm in realms):
+            return CommandResult.failure(f"❌ Erreur: identifiant '{user}' refusé par {ip}.")
+
+        result = self._generate_mock_response("pivoter", params, {"Session": f"{user}@{ip}"})
+        if result["success"]:
+            result.new_state["discovered_targets"] = {ip: {"compromised": True}}
+            result.flags.append("HOST_COMPROMISED")
+        return result
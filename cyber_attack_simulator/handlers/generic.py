@@ -0,0 +1,158 @@
+# handlers/generic.py
+"""
+Handler générique piloté par le catalogue.
+
+Une commande qui déclare un bloc `behavior` dans commands.json n'a pas besoin de
+classe : son comportement est compilé une fois en un plan, exécuté par une fonction
+partagée. Exemple :
+
+    "behavior": {
+        "required": {"domaine": "❌ Erreur: Domaine manquant."},
+        "defaults": {"type": "ANY"},
+        "output": {
+            "IPs": {"template": "192.168.{rand:1-254}.{rand:1-254}", "count": [1, 4]},
+            "Records": {"template": "{type|upper} record {i} for {domaine}", "count": [1, 5]},
+            "Emails": {"template": "{item}@{cible}", "items": ["info", "contact"]},
+            "Mentions": {"int": [5, 50]},
+            "Registrar": {"value": "Simulated Registrar Inc."}
+        },
+        "success_rate": 0.95,
+        "time": 0.1
+    }
+"""
+import re
+from functools import partial
+
+from cyber_attack_simulator.handlers.base import BaseHandler, mock_response
+from cyber_attack_simulator.utils.rng import get_rng
+from cyber_attack_simulator.utils.results import CommandResult
+
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+TEMPLATE_FILTERS = {
+    "upper": str.upper,
+    "lower": str.lower,
+    "dashed": lambda value: value.replace(".", "-"),
+}
+
+# Morceaux de gabarit compilés
+_LITERAL, _RANDOM, _VARIABLE = 0, 1, 2
+
+
+def compile_template(template: str):
+    """Compile un gabarit en fonction (rng, valeurs) -> str."""
+    parts = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(template):
+        if match.start() > position:
+            parts.append((_LITERAL, template[position:match.start()], None))
+        token = match.group(1)
+        if token.startswith("rand:"):
+            low, _, high = token[5:].partition("-")
+            parts.append((_RANDOM, int(low), int(high)))
+        else:
+            name, _, filter_name = token.partition("|")
+            if filter_name and filter_name not in TEMPLATE_FILTERS:
+                raise ValueError(f"Filtre de gabarit inconnu: {filter_name}")
+            parts.append((_VARIABLE, name, TEMPLATE_FILTERS.get(filter_name)))
+        position = match.end()
+    if position < len(template):
+        parts.append((_LITERAL, template[position:], None))
+
+    if all(kind == _LITERAL for kind, _, _ in parts):
+        return lambda rng, values: template
+
+    def render(rng, values):
+        out = []
+        for kind, first, second in parts:
+            if kind == _LITERAL:
+                out.append(first)
+            elif kind == _RANDOM:
+                out.append(str(rng.randint(first, second)))
+            else:
+                value = str(values.get(first, ""))
+                out.append(second(value) if second is not None else value)
+        return "".join(out)
+    return render
+
+
+def compile_field(spec: dict):
+    """Compile le générateur d'un champ de sortie en fonction (rng, valeurs) -> valeur."""
+    if "value" in spec:
+        value = spec["value"]
+        return lambda rng, values: value
+    if "int" in spec:
+        low, high = spec["int"]
+        return lambda rng, values: rng.randint(low, high)
+    if "template" not in spec:
+        raise ValueError(f"Générateur de champ invalide: {spec}")
+
+    render = compile_template(spec["template"])
+    if "items" in spec:
+        items = tuple(spec["items"])
+
+        def generate_items(rng, values):
+            local = dict(values)
+            out = []
+            for item in items:
+                local["item"] = item
+                out.append(render(rng, local))
+            return out
+        return generate_items
+    if "count" in spec:
+        count = spec["count"]
+        low, high = (count, count) if isinstance(count, int) else count
+
+        def generate_count(rng, values):
+            local = dict(values)
+            out = []
+            for i in range(1, rng.randint(low, high) + 1):
+                local["i"] = i
+                out.append(render(rng, local))
+            return out
+        return generate_count
+    return render
+
+
+class BehaviorPlan:
+    """Comportement compilé d'une commande."""
+    __slots__ = ("command", "required", "defaults", "fields", "success_rate", "time_consumed")
+
+    def __init__(self, command: str, behavior: dict, default_time: float = 0.0):
+        self.command = command
+        required = behavior.get("required", {})
+        if isinstance(required, list):
+            required = {name: f"❌ Erreur: paramètre '{name}' manquant." for name in required}
+        self.required = tuple(required.items())
+        self.defaults = dict(behavior.get("defaults", {}))
+        self.fields = tuple((label, compile_field(spec)) for label, spec in behavior.get("output", {}).items())
+        self.success_rate = float(behavior.get("success_rate", BaseHandler.DEFAULT_CONFIG["success_rate"]))
+        self.time_consumed = float(behavior.get("time", default_time))
+
+
+def execute_plan(plan: BehaviorPlan, params: dict):
+    """Exécute un plan : vérification des paramètres, génération des champs, réponse simulée."""
+    for name, message in plan.required:
+        if not params.get(name):
+            return CommandResult.failure(message)
+    values = {**plan.defaults, **params} if plan.defaults else params
+    rng = get_rng()
+    data = {label: generate(rng, values) for label, generate in plan.fields}
+    return mock_response(plan.command, params, data, plan.success_rate, plan.time_consumed)
+
+
+class GenericHandler(BaseHandler):
+    """Handler unique partagé par toutes les commandes déclaratives d'un moteur."""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.plans = {}
+
+    def handler_for(self, spec):
+        """Retourne l'appelable de la commande, ou None si elle ne déclare pas de comportement."""
+        if spec.behavior is None:
+            return None
+        plan = self.plans.get(spec.name)
+        if plan is None:
+            plan = self.plans[spec.name] = BehaviorPlan(spec.name, spec.behavior, spec.time)
+        return partial(execute_plan, plan)
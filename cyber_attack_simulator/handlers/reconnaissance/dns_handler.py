@@ -1,88 +1,63 @@
 # handlers/reconnaissance/dns_handler.py
-import time
-import random
+import zlib
 
-# --- Classe de base pour les Handlers DNS ---
-class BaseDNSHandler:
-    def __init__(self, engine):
-        self.engine = engine
-        self.config = {
-            "query_time": 0.1,
-            "detection_risk": 0.02,
-            "success_rate": 0.95
-        }
-
-    def initialize(self):
-        """Initialise le handler. L'enregistrement est géré par la Factory."""
-        return True
-
-    def _generate_mock_response(self, command_name: str, params: dict, output_data: dict):
-        """Génère une réponse simulée standard."""
-        if random.random() > self.config["success_rate"]:
-            return {"success": False, "output": f"Échec de la simulation pour {command_name}."}
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.results import CommandResult
+from cyber_attack_simulator.utils.wordlist import Wordlist, WordlistError
 
-        report = f"--- Rapport pour {command_name} ---\n"
-        for key, value in output_data.items():
-            report += f"  - {key}: {value}\n"
-        report += "---------------------------------\n"
+# Les commandes DNS simples (resoudredns, obtenirrecordsdns...) sont déclarées dans
+# commands.json et exécutées par handlers.generic ; seules les commandes au
+# comportement spécifique gardent une classe, qui prend alors le pas sur le catalogue.
 
-        return {
-            "success": True,
-            "output": report,
-            "new_state": {f"last_{command_name}": {"params": params, "time": time.time()}},
-            "flags": [f"{command_name.upper()}_EXECUTED"],
-            "time_consumed": self.config["query_time"]
-        }
+# --- Classe de base pour les Handlers DNS ---
+class BaseDNSHandler(BaseHandler):
+    DEFAULT_CONFIG = {
+        "query_time": 0.1,
+        "detection_risk": 0.02,
+        "success_rate": 0.95
+    }
 
 # --- Handlers Spécifiques ---
 
-class ResoudrednsHandler(BaseDNSHandler):
-    """Handler pour la commande resoudredns"""
-    def handle_resoudredns(self, params: dict) -> dict:
-        domain = params.get("domaine")
-        if not domain:
-            return {"success": False, "output": "❌ Erreur: Domaine manquant."}
-
-        ips = [f"192.168.{random.randint(1, 254)}.{random.randint(1, 254)}" for _ in range(random.randint(1, 4))]
-        return self._generate_mock_response("resoudredns", params, {"IPs": ips})
-
-class ResoudrednsInverseHandler(BaseDNSHandler):
-    """Handler pour resoudredns_inverse"""
-    def handle_resoudredns_inverse(self, params: dict) -> dict:
-        ip = params.get("ip")
-        if not ip:
-            return {"success": False, "output": "❌ Erreur: IP manquante."}
-
-        domain = f"host-{ip.replace('.', '-')}.example.com"
-        return self._generate_mock_response("resoudredns_inverse", params, {"Hostname": domain})
-
-class ObtenirrecordsdnsHandler(BaseDNSHandler):
-    """Handler pour obtenirrecordsdns"""
-    def handle_obtenirrecordsdns(self, params: dict) -> dict:
-        domain = params.get("domaine")
-        record_type = params.get("type", "ANY")
-        if not domain:
-            return {"success": False, "output": "❌ Erreur: Domaine manquant."}
-
-        records = [f"{record_type.upper()} record {i+1} for {domain}" for i in range(random.randint(1, 5))]
-        return self._generate_mock_response("obtenirrecordsdns", params, {"Records": records})
-
 class TrouversousdomainesHandler(BaseDNSHandler):
-    """Handler pour trouversousdomaines"""
-    def handle_trouversousdomaines(self, params: dict) -> dict:
-        domain = params.get("domaine")
-        if not domain:
-            return {"success": False, "output": "❌ Erreur: Domaine manquant."}
-
-        subdomains = [f"{sub}.{domain}" for sub in ["www", "mail", "dev", "api"]]
-        return self._generate_mock_response("trouversousdomaines", params, {"Subdomains": subdomains})
+    """Handler pour trouversousdomaines : teste chaque candidat d'une wordlist en flux."""
+    DEFAULT_WORDLIST = "subdomains"
+    ALWAYS_PRESENT = frozenset({"www", "mail", "dev", "api"})
+    HIT_PERMILLE = 60            # Part des autres candidats qui "existent" sur le domaine
+    MAX_REPORTED = 25
+    TIME_PER_CANDIDATE = 0.0005
+    LABEL_PATTERN = r"[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?"
+
+    def _exists(self, domain: str, label: str) -> bool:
+        # Stable pour un domaine donné : relancer la commande retrouve les mêmes noms
+        return label in self.ALWAYS_PRESENT or \
+            zlib.crc32(f"{label}.{domain}".encode()) % 1000 < self.HIT_PERMILLE
 
-class TrouversousdomainesApiHandler(BaseDNSHandler):
-    """Handler pour trouversousdomaines_api"""
-    def handle_trouversousdomaines_api(self, params: dict) -> dict:
+    def handle_trouversousdomaines(self, params: dict) -> dict:
         domain = params.get("domaine")
         if not domain:
-            return {"success": False, "output": "❌ Erreur: Domaine manquant."}
-
-        subdomains = [f"{sub}.{domain}" for sub in ["blog", "shop", "support", "test"]]
-        return self._generate_mock_response("trouversousdomaines_api", params, {"Subdomains (API)": subdomains})
+            return CommandResult.failure("❌ Erreur: Domaine manquant.")
+
+        name = params.get("wordlist") or self.DEFAULT_WORDLIST
+        try:
+            candidates = Wordlist.named(name).mutate(["lower"], keep_original=False) \
+                .match(self.LABEL_PATTERN).dedupe()
+        except WordlistError as e:
+            return CommandResult.failure(f"❌ Erreur: {e}")
+
+        found, total = [], 0
+        for label in candidates:
+            if self._exists(domain, label):
+                total += 1
+                if len(found) < self.MAX_REPORTED:
+                    found.append(f"{label}.{domain}")
+
+        result = self._generate_mock_response("trouversousdomaines", params, {
+            "Subdomains": found,
+            "Trouvés": total,
+            "Candidats testés": candidates.progress.candidates,
+        })
+        if result["success"]:
+            result.time_consumed = self.config["query_time"] + \
+                candidates.progress.candidates * self.TIME_PER_CANDIDATE
+        return result
@@ -0,0 +1,156 @@
+# handlers/scanning/port_scanner.py
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.network import (DEFAULT_CHUNK_HOSTS, NetworkError, format_address,
+                                                  get_default_universe, parse_ports, parse_targets)
+from cyber_attack_simulator.utils.results import CommandResult
+from cyber_attack_simulator.utils.session import stream_update
+
+# --- Classe de base pour les Handlers de scan réseau ---
+class BasePortScannerHandler(BaseHandler):
+    DEFAULT_CONFIG = {
+        "query_time": 0.4,
+        "probes_per_second": 5000.0,  # Débit de sondes simulé (temps de jeu)
+        "detection_risk": 0.15,
+        "success_rate": 0.95
+    }
+    MAX_REPORTED = 20
+
+    def _probe_time(self, probes: int) -> float:
+        return self.config["query_time"] + probes / self.config["probes_per_second"]
+
+    @staticmethod
+    def _blocks(first: int, count: int):
+        """Plages (début, taille) des blocs d'hôtes produits par les balayages de l'univers."""
+        for start in range(0, count, DEFAULT_CHUNK_HOSTS):
+            yield first + start, min(DEFAULT_CHUNK_HOSTS, count - start)
+
+    @staticmethod
+    def _stream_block(pending: dict, command: str, block: tuple, targets: dict):
+        """
+        Transmet un bloc balayé à la session : cibles découvertes et entrée de `scan_history`.
+
+        Si le moteur n'applique pas les deltas au fil de l'eau, le bloc rejoint `pending`,
+        le delta final du résultat.
+        """
+        start, size = block
+        spec = format_address(start) if size == 1 else f"{format_address(start)}-{format_address(start + size - 1)}"
+        entry = (command, {"bloc": spec, "hotes": len(targets)})
+        if stream_update({"discovered_targets": targets, "scan_history": [entry]}):
+            return
+        pending["discovered_targets"].update(targets)
+        pending["scan_history"].append(entry)
+
+# --- Handlers Spécifiques ---
+
+class ScannerhotesHandler(BasePortScannerHandler):
+    """Handler pour scannerhotes : découverte des hôtes actifs d'un réseau, bloc par bloc."""
+    def handle_scannerhotes(self, params: dict) -> dict:
+        spec = params.get("reseau")
+        if not spec:
+            return CommandResult.failure("❌ Erreur: Réseau manquant.")
+        try:
+            first, count = parse_targets(spec)
+        except NetworkError as e:
+            return CommandResult.failure(f"❌ Erreur: {e}")
+
+        # Réussite tirée avant le balayage : les blocs sont transmis à la session au fur et à mesure
+        data = {}
+        result = self._generate_mock_response("scannerhotes", params, data)
+        if not result["success"]:
+            return result
+
+        pending = {"discovered_targets": {}, "scan_history": []}
+        total, reported = 0, []
+        blocks = self._blocks(first, count)
+        for addresses in get_default_universe().discover(first, count):
+            found = {}
+            for address in addresses.tolist():
+                ip = format_address(address)
+                found[ip] = {"alive": True}
+                if len(reported) < self.MAX_REPORTED:
+                    reported.append(ip)
+            total += len(found)
+            self._stream_block(pending, "scannerhotes", next(blocks), found)
+
+        data.update({"Hôtes actifs": reported, "Total": total, "Adresses sondées": count})
+        result.time_consumed = self._probe_time(count)
+        result.new_state.update(pending)
+        return result
+
+
+class ScannerportsHandler(BasePortScannerHandler):
+    """
+    Handler pour scannerports : ports TCP ouverts d'une IP ou d'un réseau (/16 au plus).
+
+    Le balayage avance par blocs d'hôtes vectorisés, sans matérialiser la grille
+    hôtes × ports ; chaque bloc est transmis à la session dès qu'il est balayé.
+    """
+    def handle_scannerports(self, params: dict) -> dict:
+        spec = params.get("ip")
+        if not spec:
+            return CommandResult.failure("❌ Erreur: IP manquante.")
+        try:
+            first, count = parse_targets(spec)
+            ports = parse_ports(params.get("ports"))
+        except NetworkError as e:
+            return CommandResult.failure(f"❌ Erreur: {e}")
+
+        # Réussite tirée avant le balayage : les blocs sont transmis à la session au fur et à mesure
+        result = self._generate_mock_response("scannerports", params, {})
+        if not result["success"]:
+            return result
+
+        pending = {"discovered_targets": {}, "scan_history": []}
+        hosts, reported, total_open = 0, [], 0
+        single = []
+        scan_ports = None if ports.size == 65535 else ports
+        blocks = self._blocks(first, count)
+        for addresses, open_ports in get_default_universe().scan(first, count, scan_ports):
+            found = {}
+            if addresses.size:
+                total_open += int(open_ports.size)
+                # Les ports arrivent triés par adresse : une coupure à chaque changement d'hôte
+                bounds = (addresses[1:] != addresses[:-1]).nonzero()[0] + 1
+                starts = [0, *bounds.tolist()]
+                ends = [*bounds.tolist(), int(addresses.size)]
+                port_list = open_ports.tolist()
+                for start, end in zip(starts, ends):
+                    ip = format_address(addresses[start])
+                    host_ports = port_list[start:end]
+                    found[ip] = {"alive": True, "ports": host_ports}
+                    single = host_ports
+                    if len(reported) < self.MAX_REPORTED:
+                        reported.append(f"{ip} : {', '.join(map(str, host_ports))}")
+            hosts += len(found)
+            self._stream_block(pending, "scannerports", next(blocks), found)
+
+        if count == 1:
+            # Une seule cible : la liste des ports suffit
+            result.data = {"Ports ouverts": single}
+        else:
+            result.data = {
+                "Ports ouverts": reported,
+                "Hôtes avec ports ouverts": hosts,
+                "Total ports ouverts": total_open,
+                "Sondes": count * int(ports.size),
+            }
+        result.time_consumed = self._probe_time(count * int(ports.size))
+        result.new_state.update(pending)
+        return result
+
+
+class ScannerosHandler(BasePortScannerHandler):
+    """Handler pour scanneros : empreinte du système d'exploitation d'une cible."""
+    def handle_scanneros(self, params: dict) -> dict:
+        ip = params.get("ip")
+        if not ip:
+            return CommandResult.failure("❌ Erreur: IP manquante.")
+        universe = get_default_universe()
+        if not universe.host_alive(ip):
+            return CommandResult.failure(f"❌ Erreur: {ip} ne répond pas.")
+
+        os_name = universe.host_os(ip)
+        result = self._generate_mock_response("scanneros", params, {"OS": os_name})
+        if result["success"]:
+            result.new_state["discovered_targets"] = {ip: {"os": os_name}}
+        return result
@@ -0,0 +1,38 @@
+# handlers/scanning/service_detector.py
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.network import get_default_universe
+from cyber_attack_simulator.utils.results import CommandResult
+
+# --- Classe de base pour les Handlers de détection de services ---
+class BaseServiceDetectorHandler(BaseHandler):
+    DEFAULT_CONFIG = {
+        "query_time": 0.6,
+        "time_per_port": 0.05,
+        "detection_risk": 0.15,
+        "success_rate": 0.9
+    }
+
+# --- Handlers Spécifiques ---
+
+class IdentifierversionsHandler(BaseServiceDetectorHandler):
+    """Handler pour identifierversions : bannière de chaque port ouvert de la cible."""
+    def handle_identifierversions(self, params: dict) -> dict:
+        ip = params.get("ip")
+        if not ip:
+            return CommandResult.failure("❌ Erreur: IP manquante.")
+        universe = get_default_universe()
+        if not universe.host_alive(ip):
+            return CommandResult.failure(f"❌ Erreur: {ip} ne répond pas.")
+
+        services = universe.host_services(ip)
+        result = self._generate_mock_response("identifierversions", params, {
+            "Services": [f"{s['port']}/tcp {s['product']} {s['version']}" for s in services],
+        })
+        if result["success"]:
+            result.time_consumed = self.config["query_time"] + self.config["time_per_port"] * len(services)
+            result.new_state["discovered_targets"] = {ip: {
+                "alive": True,
+                "ports": [s["port"] for s in services],
+                "services": {s["port"]: s for s in services},
+            }}
+        return result
@@ -0,0 +1,42 @@
+# handlers/vuln_assessment/network_vuln.py
+from cyber_attack_simulator.handlers.base import BaseHandler
+from cyber_attack_simulator.utils.results import CommandResult
+from cyber_attack_simulator.utils.simulator import RealisticSimulator
+
+# --- Classe de base pour les Handlers de recherche de vulnérabilités réseau ---
+class BaseNetworkVulnHandler(BaseHandler):
+    DEFAULT_CONFIG = {
+        "query_time": 1.0,
+        "time_per_service": 0.2,
+        "detection_risk": 0.25,
+        "success_rate": 0.9
+    }
+
+# --- Handlers Spécifiques ---
+
+class ScannervulnerabilitesHandler(BaseNetworkVulnHandler):
+    """Handler pour scannervulnerabilites : services de la cible confrontés à la base locale de CVE."""
+    def handle_scannervulnerabilites(self, params: dict) -> dict:
+        ip = params.get("ip")
+        if not ip:
+            return CommandResult.failure("❌ Erreur: IP manquante.")
+
+        check = RealisticSimulator.simulate_vulnerability_check(ip)
+        services, findings = check["services"], check["vulnerabilities"]
+        result = self._generate_mock_response("scannervulnerabilites", params, {
+            "Services": [f"{s['port']}/{s['product']} {s['version']}" for s in services],
+            "Vulnérabilités": [f"{f['id']} [{f['severity']}, CVSS {f['cvss']}] {f['product']} {f['version']} "
+                               f"(port {f['port']}) : {f['title']}" for f in findings],
+            "Critiques": sum(1 for f in findings if f["severity"] == "critical"),
+        })
+        if result["success"]:
+            result.time_consumed = self.config["query_time"] + self.config["time_per_service"] * len(services)
+            result.new_state["discovered_targets"] = {ip: {
+                "services": {s["port"]: s for s in services},
+                "vulnerabilities": [f["id"] for f in findings],
+                "exploits": [{"id": f["id"], "port": f["port"], "command": f["exploit"]}
+                             for f in findings if f["exploit"]],
+            }}
+            if findings:
+                result.flags.append("VULNS_FOUND")
+        return result
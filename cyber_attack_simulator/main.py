@@ -1,16 +1,25 @@
 # main.py
 from cyber_attack_simulator.game_engine import CyberAttackEngine
 from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.utils.completion import CommandCompleter, install_readline_completer
+from cyber_attack_simulator.utils.progression import attach_progression
+from cyber_attack_simulator.utils.intrusion import attach_ids
+from cyber_attack_simulator.utils.attack_graph import attach_attack_graph
+from cyber_attack_simulator.utils.hints import search_hint
+import argparse
+import os
 import shlex
 
-def parse_command(engine: CyberAttackEngine, command: str):
+def parse_command_line(engine: CyberAttackEngine, command: str):
     """
-    Parse la commande de l'utilisateur en nom de commande et dictionnaire de paramètres,
-    en utilisant les métadonnées pour les arguments positionnels.
+    Parse la commande de l'utilisateur en (nom de commande, paramètres, erreur), sans rien
+    afficher, en utilisant les métadonnées pour les arguments positionnels.
+
+    En cas d'erreur de parsing, les paramètres valent None et `erreur` est le message.
     """
     parts = shlex.split(command)
     if not parts:
-        return None, {}
+        return None, {}, None
 
     cmd_name = parts[0]
     args = parts[1:]
@@ -21,31 +30,227 @@ def parse_command(engine: CyberAttackEngine, command: str):
 
     if param_names is None:
         # Si la commande n'est pas reconnue, on ne peut pas parser les arguments
-        return cmd_name, {}
+        return cmd_name, {}, None
 
     if len(args) > len(param_names):
-        print(f"⚠️ Trop d'arguments pour la commande '{cmd_name}'. "
-              f"Attendus: {len(param_names)}, fournis: {len(args)}")
-        return cmd_name, None  # Indique une erreur de parsing
+        return cmd_name, None, (f"⚠️ Trop d'arguments pour la commande '{cmd_name}'. "
+                                f"Attendus: {len(param_names)}, fournis: {len(args)}")
 
     # Mapper les arguments positionnels aux noms de paramètres
     for i, arg in enumerate(args):
         params[param_names[i]] = arg
 
+    return cmd_name, params, None
+
+def parse_command(engine: CyberAttackEngine, command: str):
+    """Variante interactive de `parse_command_line` : affiche l'erreur, params None en cas d'erreur."""
+    cmd_name, params, error = parse_command_line(engine, command)
+    if error is not None:
+        print(error)
     return cmd_name, params
 
-def main():
+def unknown_command_message(completer: CommandCompleter, cmd_name: str) -> str:
+    """Message pour une commande inconnue, avec les suggestions les plus proches."""
+    message = f"❌ Commande '{cmd_name}' non reconnue."
+    suggestions = completer.suggest(cmd_name)
+    if suggestions:
+        message += f" Vouliez-vous dire : {', '.join(suggestions)} ?"
+    return message
+
+def print_result(cmd_name: str, result):
+    if result and "output" in result:
+        print(result["output"])
+    else:
+        # Fallback au cas où le handler retournerait une réponse mal formée
+        print(f"La commande '{cmd_name}' n'a pas retourné de résultat affichable.")
+
+def run_job_command(engine: CyberAttackEngine, command: str) -> bool:
+    """
+    Commandes de gestion des jobs en arrière-plan : `jobs`, `attendre [id]`, `annuler <id>`.
+
+    Retourne False si la ligne n'en est pas une.
+    """
+    parts = command.split()
+    if not parts or parts[0] not in ("jobs", "attendre", "annuler"):
+        return False
+    if len(parts) > 2 or (len(parts) == 2 and not parts[1].isdigit()):
+        print("⚠️ Usage : jobs | attendre [id] | annuler <id>")
+        return True
+    job_id = int(parts[1]) if len(parts) == 2 else None
+
+    if parts[0] == "jobs":
+        print(f"⏱️ Heure de jeu : {engine.now:.1f} s")
+        if not engine.jobs:
+            print("Aucun job en cours.")
+        for job in engine.jobs.values():
+            print(f"  [{job.id}] {job.command} ({job.status}, fin à {job.due:.1f} s, "
+                  f"reste {job.due - engine.now:.1f} s)")
+    elif parts[0] == "attendre":
+        if not engine.wait_for_job(job_id):
+            print(f"❌ Aucun job en cours avec l'identifiant {job_id}.")
+        print(f"⏱️ Heure de jeu : {engine.now:.1f} s")
+    elif job_id is None:
+        print("⚠️ Usage : annuler <id>")
+    elif engine.cancel_job(job_id):
+        print(f"🛑 Job [{job_id}] annulé.")
+    else:
+        print(f"❌ Aucun job en cours avec l'identifiant {job_id}.")
+    return True
+
+def run_path_command(engine: CyberAttackEngine, command: str) -> bool:
+    """
+    `chemin <cible>` : chemin le moins risqué vers une IP ou un rôle (`dc`) du graphe d'attaque.
+
+    Retourne False si la ligne n'en est pas une.
+    """
+    parts = command.split()
+    if not parts or parts[0] != "chemin" or engine.attack_graph is None:
+        return False
+    if len(parts) != 2:
+        print("⚠️ Usage : chemin <ip|dc>")
+        return True
+    steps = engine.attack_graph.path(parts[1])
+    if steps is None:
+        print(f"🔒 Aucun chemin connu vers {parts[1]}.")
+        return True
+    print(f"🔓 Chemin vers {parts[1]} (risque cumulé {steps[-1][2]:.2f}) :")
+    for node, action, cost in steps:
+        print(f"  → {node}  [{action}, {cost:.2f}]")
+    return True
+
+def run_hint_command(engine: CyberAttackEngine, command: str) -> bool:
+    """
+    `indice [flag]` : prochaine commande conseillée vers un flag non obtenu (ou vers `flag`).
+
+    Retourne False si la ligne n'en est pas une.
+    """
+    parts = command.split()
+    if not parts or parts[0] != "indice":
+        return False
+    if len(parts) > 2:
+        print("⚠️ Usage : indice [flag]")
+        return True
+    hint = search_hint(engine, goals={parts[1].upper()} if len(parts) == 2 else None)
+    if hint is None:
+        print("🔒 Aucune commande prometteuse trouvée pour l'instant.")
+        return True
+    arguments = " ".join(str(value) for value in hint.params.values())
+    print(f"💡 Essayez : {hint.command} {arguments}".rstrip())
+    if hint.flag is not None:
+        print(f"  → mène à {hint.flag} en {len(hint.path)} commande(s)")
+    print(f"  ({hint.nodes} branches explorées en {hint.elapsed * 1e3:.0f} ms)")
+    return True
+
+HELP_RESULTS = 8
+# Commandes propres au REPL, hors catalogue
+REPL_COMMANDS = (
+    ("aide <termes>", "recherche une commande par nom, description, catégorie ou flag"),
+    ("jobs | attendre [id] | annuler <id>", "gestion des commandes lancées en arrière-plan (`&`)"),
+    ("chemin <ip|dc>", "chemin le moins risqué du graphe d'attaque"),
+    ("indice [flag]", "prochaine commande conseillée"),
+    ("exit", "quitter"),
+)
+
+def run_help_command(engine: CyberAttackEngine, command: str) -> bool:
+    """
+    `aide [termes]` : commandes du catalogue classées par pertinence (sans terme : commandes du REPL).
+
+    Retourne False si la ligne n'en est pas une.
+    """
+    parts = command.split(maxsplit=1)
+    if not parts or parts[0] != "aide":
+        return False
+    if len(parts) == 1 or engine.catalog is None:
+        print("📖 Commandes du REPL :")
+        for usage, description in REPL_COMMANDS:
+            print(f"  {usage} — {description}")
+        return True
+    specs = engine.catalog.search(parts[1], limit=HELP_RESULTS)
+    if not specs:
+        print(f"❌ Aucune commande ne correspond à « {parts[1]} ».")
+        return True
+    print(f"📖 {len(specs)} commande(s) pour « {parts[1]} » :")
+    tracker = engine.progression
+    for spec in specs:
+        usage = " ".join([spec.name] + [f"<{name}>" for name in spec.params])
+        locked = " 🔒" if tracker is not None and not tracker.is_unlocked(spec.name) else ""
+        print(f"  {usage}{locked} — {spec.description}")
+    return True
+
+def print_notifications(engine: CyberAttackEngine):
+    """Jobs terminés, déblocages et alertes survenus depuis la dernière commande."""
+    for job in engine.drain_finished_jobs():
+        print(f"\n✅ Job [{job.id}] {job.command} terminé à {job.due:.1f} s :")
+        print_result(job.command, job.result)
+    if engine.progression is not None:
+        for unlocked in engine.progression.drain_unlocks():
+            print(f"🔓 Nouvelle commande débloquée : {unlocked}")
+    if engine.ids is not None:
+        for alert in engine.ids.drain_alerts():
+            print(f"🚨 Alerte IDS [{alert['severity']}] : {alert['message']}")
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Cyber Attack Simulator")
+    parser.add_argument("--serve", action="store_true", help="lance le serveur headless multi-sessions")
+    parser.add_argument("--host", default="127.0.0.1", help="adresse d'écoute TCP du serveur")
+    parser.add_argument("--port", type=int, default=7777, help="port TCP du serveur")
+    parser.add_argument("--unix", dest="unix_path", help="chemin d'un socket Unix (remplace TCP)")
+    parser.add_argument("--idle-timeout", type=float, default=600.0,
+                        help="secondes d'inactivité avant éviction d'une session")
+    parser.add_argument("--journal", help="journal de session : restauré au démarrage, complété ensuite")
+    parser.add_argument("--sans-progression", dest="progression", action="store_false",
+                        help="toutes les commandes sont disponibles dès le départ")
+    parser.add_argument("--sans-ids", dest="ids", action="store_false",
+                        help="désactive le défenseur simulé (alertes IDS)")
+    parser.add_argument("--historique", dest="history_spill_path",
+                        help="fichier JSON-lines où déborde l'historique au-delà de sa capacité")
+    parser.add_argument("--fsync", choices=["always", "batch", "never"], default="batch",
+                        help="durabilité des écritures du journal")
+    return parser
+
+def main(argv=None):
     """Point d'entrée principal du jeu"""
+    args = build_arg_parser().parse_args(argv)
+    if args.serve:
+        from cyber_attack_simulator.server import run_server
+        run_server(args.host, args.port, args.unix_path, args.idle_timeout,
+                   progression=args.progression, ids=args.ids)
+        return
+
     print("🎮 Cyber Attack Simulator - Démarrage...")
 
     # Initialiser le moteur
-    engine = CyberAttackEngine()
+    engine = CyberAttackEngine(history_spill_path=args.history_spill_path)
 
     # Initialiser la factory
     factory = CommandHandlerFactory(engine)
-    factory.initialize_all_handlers()
+    factory.initialize_all_handlers(lazy=True)
+
+    print(f"✅ {len(engine.command_metadata)} commandes au catalogue")
+
+    if args.progression:
+        tracker = attach_progression(engine)
+        tracker.drain_unlocks()
+        print(f"🔓 {len(engine.game_state.unlocked_commands)} commandes débloquées pour commencer")
+
+    if args.ids:
+        attach_ids(engine)
 
-    print(f"✅ {len(engine.handlers)} commandes chargées")
+    journal = None
+    if args.journal:
+        from cyber_attack_simulator.utils.journal import SessionJournal, restore_session
+        if os.path.exists(args.journal):
+            restore_session(args.journal, engine)
+            print(f"💾 Session restaurée : {engine.command_history.total} commandes, {len(engine.flags)} flags")
+        journal = SessionJournal(args.journal, fsync=args.fsync)
+        journal.attach(engine)
+
+    # Après la restauration : le graphe est reconstruit depuis les cibles découvertes
+    attach_attack_graph(engine)
+
+    # Index de complétion et de suggestions, construit une seule fois
+    completer = CommandCompleter.from_engine(engine)
+    install_readline_completer(completer)
 
     # Boucle de jeu principale
     while True:
@@ -55,22 +260,36 @@ def main():
                 print("👋 Au revoir !")
                 break
 
+            if (run_job_command(engine, command) or run_path_command(engine, command)
+                    or run_hint_command(engine, command) or run_help_command(engine, command)):
+                print_notifications(engine)
+                continue
+
+            # Un `&` final lance la commande en arrière-plan
+            background = command.endswith("&")
+            if background:
+                command = command[:-1].strip()
+
             # Parser la commande
             cmd_name, params = parse_command(engine, command)
 
             if params is None: # Gérer l'erreur de parsing
                 continue
 
-            if cmd_name:
+            if cmd_name and cmd_name not in engine.command_metadata:
+                print(unknown_command_message(completer, cmd_name))
+                continue
+
+            if cmd_name and background:
+                job = engine.launch_job(cmd_name, params)
+                if job.id in engine.jobs:
+                    print(f"⏳ Job [{job.id}] {cmd_name} lancé, fin prévue à {job.due:.1f} s")
+                print_notifications(engine)
+            elif cmd_name:
                 # Exécuter
                 result = engine.execute_command(cmd_name, params)
-
-                # Afficher le résultat
-                if result and "output" in result:
-                    print(result["output"])
-                else:
-                    # Fallback au cas où le handler retournerait une réponse mal formée
-                    print(f"La commande '{cmd_name}' n'a pas retourné de résultat affichable.")
+                print_result(cmd_name, result)
+                print_notifications(engine)
 
         except KeyboardInterrupt:
             print("\n🛑 Simulation interrompue. Au revoir !")
@@ -78,5 +297,8 @@ def main():
         except Exception as e:
             print(f"❌ Erreur inattendue: {e}")
 
+    if journal is not None:
+        journal.close()
+
 if __name__ == "__main__":
     main()
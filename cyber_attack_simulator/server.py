@@ -0,0 +1,282 @@
+# server.py
+import asyncio
+import itertools
+import json
+import os
+import time
+from collections import deque
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.command_catalog import DEFAULT_COMMANDS_FILE
+from cyber_attack_simulator.main import parse_command_line
+from cyber_attack_simulator.utils.attack_graph import attach_attack_graph
+from cyber_attack_simulator.utils.intrusion import IDSRuleset, attach_ids
+from cyber_attack_simulator.utils.metrics import EngineMetrics
+from cyber_attack_simulator.utils.progression import Progression, attach_progression
+
+# Protocole ligne par ligne (UTF-8), une réponse JSON par requête :
+#   <session> <commande> [arguments...]   exécute une commande dans la session
+#   CLOSE <session>                       ferme une session
+#   STATS                                 statistiques du serveur
+#   METRICS [prometheus]                  métriques par commande (JSON ou texte Prometheus)
+PROTOCOL_STATS = "STATS"
+PROTOCOL_CLOSE = "CLOSE"
+PROTOCOL_METRICS = "METRICS"
+
+
+class Session:
+    """Session isolée d'un joueur : un moteur propre, un registre partagé."""
+    __slots__ = ("session_id", "engine", "created", "last_seen", "requests")
+
+    def __init__(self, session_id: str, engine: CyberAttackEngine, now: float):
+        self.session_id = session_id
+        self.engine = engine
+        self.created = now
+        self.last_seen = now
+        self.requests = 0
+
+
+class SessionManager:
+    """
+    Crée, retrouve et évince les sessions d'un serveur.
+
+    Le scénario de progression et les règles IDS, chargés une fois, sont partagés ;
+    chaque session reçoit son propre suivi, son défenseur et son graphe d'attaque.
+    """
+
+    def __init__(self, registry: CyberAttackEngine, idle_timeout: float = 600.0, clock=time.monotonic,
+                 batch_detection: bool = False, metrics: EngineMetrics = None,
+                 progression: Progression = None, ids_ruleset: IDSRuleset = None):
+        self.registry = registry
+        self.batch_detection = batch_detection
+        self.metrics = metrics
+        self.progression = progression
+        self.ids_ruleset = ids_ruleset
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.sessions = {}
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def get_or_create(self, session_id: str) -> Session:
+        session = self.sessions.get(session_id)
+        now = self.clock()
+        if session is None:
+            engine = CyberAttackEngine()
+            engine.share_registry(self.registry)
+            engine.batch_detection = self.batch_detection
+            engine.metrics = self.metrics
+            if self.progression is not None:
+                attach_progression(engine, self.progression).drain_unlocks()
+            if self.ids_ruleset is not None:
+                attach_ids(engine, self.ids_ruleset)
+            attach_attack_graph(engine)
+            session = Session(session_id, engine, now)
+            self.sessions[session_id] = session
+        session.last_seen = now
+        return session
+
+    def close(self, session_id: str) -> bool:
+        return self.sessions.pop(session_id, None) is not None
+
+    def evict_idle(self) -> int:
+        """Supprime les sessions inactives depuis plus de `idle_timeout` secondes."""
+        deadline = self.clock() - self.idle_timeout
+        idle = [sid for sid, session in self.sessions.items() if session.last_seen < deadline]
+        for sid in idle:
+            del self.sessions[sid]
+        self.evicted += len(idle)
+        return len(idle)
+
+
+class SimulatorServer:
+    """Serveur headless multi-sessions (TCP local ou socket Unix)."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 7777, unix_path: str = None,
+                 idle_timeout: float = 600.0, commands_file: str = DEFAULT_COMMANDS_FILE,
+                 latency_window: int = 10000, detection_tick: float = 0.5, metrics: bool = True,
+                 progression: bool = True, ids: bool = True):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+
+        # Registre unique : handlers et catalogue partagés par toutes les sessions
+        self.registry = CyberAttackEngine()
+        CommandHandlerFactory(self.registry, commands_file).initialize_all_handlers(lazy=True)
+
+        # La détection est évaluée par lots vectorisés toutes les `detection_tick` secondes
+        self.detection_tick = detection_tick
+        # Métriques partagées par toutes les sessions
+        self.metrics = EngineMetrics(self.registry.catalog) if metrics else None
+        # Scénario et règles IDS chargés une fois (`--sans-progression` / `--sans-ids` les désactivent)
+        catalog = self.registry.catalog
+        self.sessions = SessionManager(self.registry, idle_timeout,
+                                       batch_detection=self.registry.detection is not None and detection_tick > 0,
+                                       metrics=self.metrics,
+                                       progression=Progression.load(catalog=catalog) if progression else None,
+                                       ids_ruleset=IDSRuleset.load(catalog=catalog) if ids else None)
+        self.latencies = deque(maxlen=latency_window)
+        self.requests = 0
+        self.errors = 0
+        self.started = time.monotonic()
+        self._cpu_started = time.process_time()
+        self._server = None
+        self._eviction_task = None
+        self._detection_task = None
+
+    # --- Cycle de vie ---
+
+    async def start(self):
+        if self.unix_path:
+            self._server = await asyncio.start_unix_server(self.handle_client, path=self.unix_path)
+        else:
+            self._server = await asyncio.start_server(self.handle_client, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+        self._eviction_task = asyncio.create_task(self._evict_periodically())
+        if self.sessions.batch_detection:
+            self._detection_task = asyncio.create_task(self._score_detection_periodically())
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        for task in (self._eviction_task, self._detection_task):
+            if task is not None:
+                task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _evict_periodically(self):
+        interval = max(self.sessions.idle_timeout / 2, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            self.sessions.evict_idle()
+
+    def score_detection(self):
+        """Évalue en une passe NumPy les actions en attente de toutes les sessions."""
+        return self.registry.detection.apply_pending(session.engine for session in self.sessions.sessions.values())
+
+    async def _score_detection_periodically(self):
+        while True:
+            await asyncio.sleep(self.detection_tick)
+            self.score_detection()
+
+    # --- Protocole ---
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self.handle_line(line.decode('utf-8', errors='replace').strip())
+                if response is not None:
+                    writer.write(json.dumps(response, ensure_ascii=False, default=str).encode('utf-8') + b"\n")
+                    await writer.drain()
+        except (ConnectionResetError, BrokenPipeError, asyncio.CancelledError):
+            # Client parti ou serveur en cours d'arrêt
+            pass
+        finally:
+            writer.close()
+
+    async def handle_line(self, line: str):
+        """Traite une ligne du protocole et retourne la réponse (None pour une ligne vide)."""
+        if not line:
+            return None
+        if line == PROTOCOL_STATS:
+            return self.stats()
+        if line.startswith(PROTOCOL_METRICS) and line.split()[0] == PROTOCOL_METRICS:
+            return self.metrics_report(line[len(PROTOCOL_METRICS):].strip())
+
+        session_id, _, command_line = line.partition(" ")
+        if session_id == PROTOCOL_CLOSE:
+            return {"success": self.sessions.close(command_line.strip())}
+
+        start = time.perf_counter()
+        self.requests += 1
+        session = self.sessions.get_or_create(session_id)
+        session.requests += 1
+        try:
+            cmd_name, params, error = parse_command_line(session.engine, command_line)
+            if not cmd_name:
+                result = {"success": False, "output": "❌ Commande vide."}
+            elif error is not None:
+                result = {"success": False, "output": error}
+            else:
+                result = await session.engine.execute_command_async(cmd_name, params)
+        except ValueError as e:
+            # Erreur de parsing shlex (guillemets non fermés...)
+            result = {"success": False, "output": f"❌ Commande invalide: {e}"}
+
+        if not result.get("success"):
+            self.errors += 1
+        self.latencies.append(time.perf_counter() - start)
+        return {"session": session_id, "success": bool(result.get("success")), "output": result.get("output", "")}
+
+    # --- Statistiques ---
+
+    def metrics_report(self, fmt: str = "") -> dict:
+        if self.metrics is None:
+            return {"success": False, "output": "❌ Métriques désactivées."}
+        if fmt == "prometheus":
+            return {"success": True, "output": self.metrics.to_prometheus()}
+        return {"success": True, "metrics": self.metrics.snapshot()}
+
+    def stats(self) -> dict:
+        """Sessions actives, sessions par cœur et latence des requêtes (en ms)."""
+        cores = os.cpu_count() or 1
+        ordered = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+        # Mémoire par session estimée sur un échantillon pour garder STATS peu coûteux
+        sample = [session.engine.memory_usage()["total"]
+                  for session in itertools.islice(self.sessions.sessions.values(), 100)]
+
+        uptime = time.monotonic() - self.started
+        return {
+            "sessions": len(self.sessions),
+            "evicted_sessions": self.sessions.evicted,
+            "cpu_cores": cores,
+            "sessions_per_core": len(self.sessions) / cores,
+            "requests": self.requests,
+            "errors": self.errors,
+            "requests_per_s": self.requests / uptime if uptime > 0 else 0.0,
+            "cpu_s": time.process_time() - self._cpu_started,
+            "session_memory_bytes": sum(sample) / len(sample) if sample else 0,
+            "latency_ms": {
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": ordered[-1] * 1000 if ordered else 0.0,
+            },
+        }
+
+
+def run_server(host: str = "127.0.0.1", port: int = 7777, unix_path: str = None, idle_timeout: float = 600.0,
+               commands_file: str = DEFAULT_COMMANDS_FILE, progression: bool = True, ids: bool = True):
+    """Lance le serveur jusqu'à interruption (Ctrl+C)."""
+    server = SimulatorServer(host, port, unix_path, idle_timeout, commands_file,
+                             progression=progression, ids=ids)
+
+    async def serve():
+        await server.start()
+        where = unix_path or f"{server.host}:{server.port}"
+        print(f"🛰️ Serveur headless en écoute sur {where} ({len(server.registry.command_metadata)} commandes)")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n🛑 Serveur arrêté.")
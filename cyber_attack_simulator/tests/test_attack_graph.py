@@ -0,0 +1,128 @@
+import pickle
+import random
+
+from cyber_attack_simulator.benchmarks.synthetic import make_synthetic_attack_deltas
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.attack_graph import INFINITY, ROOT, AttackGraph, attach_attack_graph
+from cyber_attack_simulator.utils.network import LOCAL_ADMIN, get_default_universe
+from cyber_attack_simulator.utils.simulator import RealisticSimulator
+
+def full_recompute(graph: AttackGraph) -> list:
+    """Référence indépendante du graphe : relaxation de Bellman-Ford jusqu'à stabilité."""
+    dist = [INFINITY] * len(graph)
+    dist[0] = 0.0
+    changed = True
+    while changed:
+        changed = False
+        for u, edges in enumerate(graph.edges):
+            for v, cost, _ in edges:
+                if dist[u] + cost < dist[v]:
+                    dist[v] = dist[u] + cost
+                    changed = True
+    return dist
+
+def test_incremental_distances_match_full_recompute():
+    rng = random.Random(3)
+    graph = AttackGraph()
+    names = [ROOT] + [f"n{i}" for i in range(200)]
+    for step in range(1500):
+        graph.add_edge(rng.choice(names), rng.choice(names), round(rng.uniform(0, 1), 2), f"e{step % 3}")
+        if step % 100 == 0:
+            assert graph.dist == full_recompute(graph)
+    assert graph.dist == full_recompute(graph)
+
+def test_cheaper_edge_reroutes_paths():
+    graph = AttackGraph()
+    graph.add_edge(ROOT, "a", 1.0, "lent")
+    graph.add_edge("a", "b", 1.0, "x")
+    assert graph.cost("b") == 2.0
+    assert not graph.add_edge(ROOT, "a", 3.0, "lent")
+    relaxed = graph.relaxed
+    assert graph.add_edge(ROOT, "a", 0.5, "rapide")
+    assert graph.relaxed - relaxed == 2  # Seuls a et b sont revisités
+    assert graph.path("b") == [("a", "rapide", 0.5), ("b", "x", 1.5)]
+    assert not graph.reachable("inconnu") and graph.path("c") is None
+
+def test_ingest_builds_pivot_paths_to_roles():
+    graph = AttackGraph()
+    graph.ingest({
+        "10.0.0.5": {"ports": [22, 445], "exploits": [{"id": "CVE-1", "port": 445}]},
+        "10.0.0.9": {"ports": [88, 389]},
+    })
+    assert graph.reachable("10.0.0.5") and not graph.reachable("dc")
+    graph.ingest({"10.0.0.5": {"credentials": [{"user": "svc", "realm": "corp", "valid_on": ["10.0.0.9"]}]}})
+    steps = graph.path("dc")
+    assert [node for node, _, _ in steps] == ["service:10.0.0.5:445", "hote:10.0.0.5", "cred:svc@corp",
+                                              "hote:10.0.0.9"]
+    assert steps[-1][1] == "pivoter svc" and round(graph.cost("dc"), 2) == 0.9
+    graph.ingest({"10.0.0.9": {"compromised": True}})
+    assert graph.path("dc") == [("hote:10.0.0.9", "contrôlé", 0.0)]
+
+def test_synthetic_campaign_stays_consistent():
+    graph = AttackGraph()
+    for ip, info in make_synthetic_attack_deltas(2000, seed=7):
+        graph.ingest({ip: info})
+    assert graph.dist == full_recompute(graph)
+    assert graph.reachable_count() > 2000
+
+def test_engine_feeds_graph_and_rebuilds_on_restore():
+    engine = CyberAttackEngine(seed=4)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    for command in ("scannervulnerabilites", "exploiter", "extrairecredentials"):
+        engine.handlers[command].__self__.config["success_rate"] = 1.0
+    graph = attach_attack_graph(engine)
+    ip, cve = next((f"10.0.0.{n}", f["id"]) for n in range(256)
+                   for f in RealisticSimulator.simulate_vulnerability_check(f"10.0.0.{n}")["vulnerabilities"]
+                   if f["exploit"] and get_default_universe().is_alive([n])[0])
+    snapshot = pickle.dumps(engine.snapshot())
+    engine.execute_command("scannervulnerabilites", {"ip": ip})
+    assert graph.path(ip)[-1][1].startswith("exploiter CVE-")
+    result = engine.execute_command("exploiter", {"ip": ip, "cve": cve})
+    assert result["success"] and "HOST_COMPROMISED" in engine.flags
+    assert graph.cost(ip) == 0.0
+    refused = engine.execute_command("exploiter", {"ip": ip, "cve": "CVE-0000-0000"})
+    assert not refused["success"]
+    engine.restore_snapshot(pickle.loads(snapshot))
+    assert not graph.reachable(ip) and len(graph) == 1
+
+def test_streamed_scans_feed_the_graph():
+    """Les blocs d'un scan transmis au fil de l'eau alimentent le graphe comme une restauration."""
+    engine = CyberAttackEngine(seed=4)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    engine.handlers["scannerports"].__self__.config["success_rate"] = 1.0
+    graph = attach_attack_graph(engine)
+    assert engine.execute_command("scannerports", {"ip": "10.0.0.0/24"})["success"]
+    rebuilt = AttackGraph(engine.catalog)
+    rebuilt.ingest(engine.game_state.discovered_targets)
+    assert len(graph) == len(rebuilt) > 1
+    assert graph.reachable_count() == rebuilt.reachable_count()
+    assert graph.roles["dc"] and graph.roles == rebuilt.roles  # Rôles déduits des ports (88 : DC)
+
+def test_exploitation_requires_analysis_compromise_and_credentials():
+    engine = CyberAttackEngine(seed=4)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    for command in ("scannervulnerabilites", "exploiter", "extrairecredentials", "pivoter"):
+        engine.handlers[command].__self__.config["success_rate"] = 1.0
+    universe = get_default_universe()
+    ip, cve, target = next(
+        (f"10.0.0.{n}", f["id"], other)
+        for n in range(256) if universe.is_alive([n])[0]
+        for f in RealisticSimulator.simulate_vulnerability_check(f"10.0.0.{n}")["vulnerabilities"] if f["exploit"]
+        for c in universe.host_credentials(f"10.0.0.{n}") if c["user"] == LOCAL_ADMIN
+        for other in c["valid_on"] if other != f"10.0.0.{n}")
+
+    assert not engine.execute_command("exploiter", {"ip": ip, "cve": cve})["success"]
+    assert not engine.execute_command("extrairecredentials", {"ip": ip})["success"]
+    assert not engine.execute_command("extrairecredentials", {"ip": "10.0.0.0"})["success"]
+    assert not engine.execute_command("pivoter", {"ip": target, "utilisateur": LOCAL_ADMIN})["success"]
+
+    engine.execute_command("scannervulnerabilites", {"ip": ip})
+    assert engine.execute_command("exploiter", {"ip": ip, "cve": cve})["success"]
+    assert engine.execute_command("extrairecredentials", {"ip": ip})["success"]
+    # L'identifiant ne vaut que dans le /24 de l'hôte d'origine
+    outside = next(f"10.0.5.{n}" for n in range(256)
+                   if universe.credential_valid(LOCAL_ADMIN, "10.0.5.0/24", f"10.0.5.{n}"))
+    assert not engine.execute_command("pivoter", {"ip": outside, "utilisateur": LOCAL_ADMIN})["success"]
+    assert engine.execute_command("pivoter", {"ip": target, "utilisateur": LOCAL_ADMIN})["success"]
+    assert engine.game_state.discovered_targets[target]["compromised"]
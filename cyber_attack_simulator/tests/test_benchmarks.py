@@ -0,0 +1,21 @@
+from cyber_attack_simulator.benchmarks.suite import compare, flatten, run_suite
+
+def test_compare_flags_slower_timings_and_lower_throughput():
+    baseline = {"sizes": {"100": {"startup": {"cold_boot_s": 0.010, "commands": 100},
+                                  "dispatch": {"parse_per_s": 10000.0, "dispatch_overhead_us": 5.0}}}}
+    current = {"sizes": {"100": {"startup": {"cold_boot_s": 0.015, "commands": 200},
+                                 "dispatch": {"parse_per_s": 7000.0, "dispatch_overhead_us": 5.5}}}}
+    regressions = {metric for metric, *_ in compare(baseline, current, threshold=0.2)}
+    assert regressions == {"sizes.100.startup.cold_boot_s", "sizes.100.dispatch.parse_per_s"}
+
+def test_compare_ignores_improvements_and_missing_metrics():
+    baseline = {"sizes": {"100": {"dispatch": {"parse_per_s": 10000.0, "handler_mean_us": 4.0}}}}
+    current = {"sizes": {"100": {"dispatch": {"parse_per_s": 20000.0}}}}
+    assert compare(baseline, current) == []
+
+def test_small_suite_produces_comparable_results():
+    results = run_suite(sizes=(20,), repeat=1, iterations=1, real_catalog=False)
+    flat = flatten(results)
+    assert flat["sizes.20.dispatch.handlers"] == 20
+    assert flat["sizes.20.startup.cold_boot_s"] > 0
+    assert compare(results, results) == []
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from cyber_attack_simulator.campaign import CampaignSimulator, playthrough_seed
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.rng import get_rng, use_rng
+
+def run_session(seed: int) -> list:
+    engine = CyberAttackEngine(seed=seed)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    return [engine.execute_command("resoudredns", {"domaine": "example.com"})["output"] for _ in range(5)]
+
+def test_engine_seed_reproduces_handler_output():
+    """Une même graine rejoue exactement les mêmes tirages des handlers."""
+    assert run_session(123) == run_session(123)
+    assert run_session(123) != run_session(124)
+
+def test_session_rng_is_isolated_from_global_random():
+    """Le générateur des handlers est celui du moteur, jamais celui du module random."""
+    engine = CyberAttackEngine(seed=5)
+    with use_rng(engine.rng):
+        assert get_rng() is engine.rng
+    assert get_rng() is not engine.rng
+    random.seed(0)
+    first = get_rng().random()
+    random.seed(0)
+    assert get_rng().random() != first
+
+def test_playthrough_seeds_are_distinct_and_stable():
+    seeds = [playthrough_seed(7, i) for i in range(100)]
+    assert len(set(seeds)) == 100
+    assert seeds == [playthrough_seed(7, i) for i in range(100)]
+
+def test_campaign_results_do_not_depend_on_worker_count():
+    """Le découpage en lots et le nombre de processus ne changent pas les statistiques."""
+    simulator = CampaignSimulator(randomize=True, steps=6, target_flag="RESOUDREDNS_EXECUTED")
+
+    sequential = simulator.run(60, seed=3, workers=1, chunk_size=60)
+    parallel = simulator.run(60, seed=3, workers=2, chunk_size=7)
+
+    # Seul l'ordre des sommes flottantes diffère d'un découpage à l'autre
+    for key in ("success_ratio_histogram", "final_detection_histogram", "flag_reached_ratio"):
+        assert sequential[key] == parallel[key]
+    assert sequential["mean_detection_curve"] == pytest.approx(parallel["mean_detection_curve"])
+    assert sequential["time_to_flag"]["histogram"] == parallel["time_to_flag"]["histogram"]
+    assert sequential["runs"] == 60
+    assert sum(sequential["final_detection_histogram"]) == 60
+    assert len(sequential["mean_detection_curve"]) == 6
+    assert 0.0 < sequential["flag_reached_ratio"] <= 1.0
@@ -0,0 +1,75 @@
+import json
+import os
+import pytest
+
+from cyber_attack_simulator.command_catalog import CommandCatalog, CommandSpec
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+
+def write_commands(path, commands):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"commands": commands}, f)
+
+SAMPLE_COMMANDS = [
+    {"id": 1, "name": "resoudredns", "category": "reconnaissance", "params": ["domaine"],
+     "risk": 0.02, "time": 0.1, "flags": ["DNS_RESOLVED"], "template": "dns_handler"},
+    {"id": 252, "name": "scannerports", "category": "scanning", "params": ["ip", "ports"],
+     "risk": 0.15, "time": 0.4, "flags": ["PORTS_SCANNED"], "template": "port_scanner"},
+]
+
+def test_catalog_compiles_specs_and_writes_cache(tmp_path):
+    """Vérifie la compilation des entrées JSON et la création du cache binaire."""
+    commands_file = str(tmp_path / "commands.json")
+    write_commands(commands_file, SAMPLE_COMMANDS + [{"name": "incomplete"}])
+
+    catalog = CommandCatalog.load(commands_file)
+
+    assert len(catalog) == 2
+    spec = catalog.get("scannerports")
+    assert isinstance(spec, CommandSpec)
+    assert spec.params == ("ip", "ports")
+    assert spec.risk == 0.15
+    assert spec.index == 1
+    assert os.path.exists(CommandCatalog.cache_path_for(commands_file))
+
+def test_catalog_cache_is_reused_then_invalidated(tmp_path, monkeypatch):
+    """Le cache est réutilisé tant que la source ne change pas, puis recompilé."""
+    commands_file = str(tmp_path / "commands.json")
+    write_commands(commands_file, SAMPLE_COMMANDS)
+    CommandCatalog.load(commands_file)
+
+    compiled = []
+    original = CommandCatalog.compile_commands
+    monkeypatch.setattr(CommandCatalog, "compile_commands",
+                        staticmethod(lambda commands: compiled.append(1) or original(commands)))
+
+    # Cache valide (mtime identique) puis fichier simplement touché (même empreinte)
+    CommandCatalog.load(commands_file)
+    stat = os.stat(commands_file)
+    os.utime(commands_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    CommandCatalog.load(commands_file)
+    assert compiled == []
+
+    # Contenu modifié : recompilation
+    write_commands(commands_file, SAMPLE_COMMANDS[:1])
+    catalog = CommandCatalog.load(commands_file)
+    assert compiled == [1]
+    assert len(catalog) == 1
+
+def test_lazy_initialization_resolves_handler_on_first_execution():
+    """En mode lazy, aucun handler n'est importé avant la première exécution."""
+    engine = CyberAttackEngine()
+    CommandHandlerFactory(engine).initialize_all_handlers(lazy=True)
+
+    assert len(engine.handlers) == 0
+    assert engine.command_metadata["resoudredns"] == ["domaine"]
+    assert "scannerports" in engine.command_metadata
+
+    result = engine.execute_command("resoudredns", {"domaine": "example.com"})
+    assert "output" in result
+    assert "resoudredns" in engine.handlers
+
+    # Commande cataloguée mais non implémentée
+    result = engine.execute_command("scannerportsudp", {"ip": "10.0.0.1"})
+    assert result["success"] is False
+    assert "scannerportsudp" not in engine.handlers
@@ -18,12 +18,14 @@ def test_factory_loads_implemented_handlers():
     # Les commandes suivantes sont définies dans commands.json ET ont une classe Handler implémentée.
     implemented_commands = [
         "resoudredns", "resoudredns_inverse", "obtenirrecordsdns", "trouversousdomaines", "trouversousdomaines_api",
-        "analyserwhois", "trouveripspubliques", "collecterosint"
+        "analyserwhois", "trouveripspubliques", "collecterosint", "scannervulnerabilites",
+        "scannerhotes", "scannerports", "scanneros", "identifierversions",
+        "exploiter", "extrairecredentials", "pivoter", "enumererldap", "enumerersmb"
     ]
 
     unimplemented_commands = [
-        "scannerports", # Le fichier port_scanner.py est vide
-        "testersql"     # Le fichier web_vuln.py est vide
+        "scannerportsudp", # Pas de classe dans port_scanner.py
+        "testersql"        # Le fichier web_vuln.py est vide
     ]
 
     assert len(engine.handlers) == len(implemented_commands), \
@@ -0,0 +1,69 @@
+from cyber_attack_simulator.benchmarks.synthetic import write_synthetic_catalog
+from cyber_attack_simulator.command_catalog import CommandCatalog, CommandSpec
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.main import run_help_command
+from cyber_attack_simulator.utils.command_search import CommandIndex, fold, tokenize
+
+def spec(index, name, category, description, flags=()):
+    return CommandSpec(index=index, id=index, name=name, category=category, template="t", params=(),
+                       risk=0.1, time=0.1, flags=tuple(flags), description=description)
+
+SPECS = [
+    spec(0, "resoudredns", "reconnaissance", "Résolution DNS d'un domaine", ["DNS_RESOLVED"]),
+    spec(1, "scannervulnerabilites", "scanning", "Recherche des vulnérabilités connues"),
+    spec(2, "scannerports", "scanning", "Scan des ports ouverts d'une cible", ["PORTS_SCANNED"]),
+    spec(3, "enumerersmb", "enumeration", "Énumération des partages SMB"),
+]
+
+def names(index, query, limit=10):
+    return [SPECS[doc].name for _, doc in index.search(query, limit)]
+
+def test_fold_and_tokenize_ignore_accents_stopwords_and_plurals():
+    assert fold("Énumération Œuvre") == "enumeration oeuvre"
+    assert tokenize("Scan des ports d'une cible") == ["scan", "port", "cible"]
+    assert tokenize("vulnérabilités") == tokenize("VULNERABILITE")
+
+def test_search_matches_folded_terms_name_suffixes_and_prefixes():
+    index = CommandIndex.build(SPECS)
+    assert names(index, "resolution")[0] == "resoudredns"
+    assert names(index, "énumération smb")[0] == "enumerersmb"
+    assert names(index, "dns")[0] == "resoudredns"                 # suffixe du nom
+    assert names(index, "vulnerabilite")[0] == "scannervulnerabilites"
+    assert names(index, "resou") == ["resoudredns"]                # préfixe
+    assert names(index, "ports_scanned")[0] == "scannerports"      # flag
+    assert index.search("des de la") == [] and index.search("introuvable") == []
+
+def test_search_ranking_is_deterministic_and_limited():
+    index = CommandIndex.build(SPECS)
+    results = index.search("scanner", limit=10)
+    assert sorted(doc for _, doc in results) == [1, 2]
+    assert index.search("scanner", limit=1) == results[:1]
+    assert index.search("scanner", limit=0) == []
+
+    # À score égal, les premières commandes du catalogue l'emportent
+    clones = [spec(i, f"clone{i}", "scanning", "Scan des ports") for i in range(50)]
+    results = CommandIndex.build(clones).search("scan", limit=5)
+    assert [doc for _, doc in results] == [0, 1, 2, 3, 4]
+    assert len({score for score, _ in results}) == 1
+
+def test_index_is_cached_with_the_catalog(tmp_path):
+    commands_file = write_synthetic_catalog(str(tmp_path), 500)
+    compiled = CommandCatalog.load(commands_file)
+    cached = CommandCatalog.load(commands_file)
+    rebuilt = CommandIndex.build(compiled.specs)
+    for query in ("résolution dns", "enumeration smb", "kerb", "scan furtif"):
+        assert cached.search_index.search(query) == rebuilt.search(query)
+        assert [s.name for s in cached.search(query)] == [s.name for s in compiled.search(query)]
+
+def test_help_command_lists_ranked_commands(capsys):
+    engine = CyberAttackEngine(seed=1)
+    CommandHandlerFactory(engine).initialize_all_handlers(lazy=True)
+    assert not run_help_command(engine, "resoudredns example.com")
+    assert run_help_command(engine, "aide résolution dns")
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1].strip().startswith("resoudredns <domaine>")
+    assert run_help_command(engine, "aide xyzzy")
+    assert "Aucune commande" in capsys.readouterr().out
+    assert run_help_command(engine, "aide")
+    assert "indice" in capsys.readouterr().out
@@ -0,0 +1,60 @@
+import pytest
+
+from cyber_attack_simulator.utils.completion import BKTree, CommandCompleter, PrefixTrie, levenshtein
+from cyber_attack_simulator.main import unknown_command_message
+
+METADATA = {
+    "resoudredns": ["domaine"],
+    "resoudredns_inverse": ["ip"],
+    "obtenirrecordsdns": ["domaine", "type"],
+    "trouversousdomaines": ["domaine", "wordlist"],
+    "trouversousdomaines_api": ["domaine"],
+    "analyserwhois": ["domaine"],
+}
+
+def test_levenshtein_distance_and_cutoff():
+    assert levenshtein("resoudredns", "resoudredns") == 0
+    assert levenshtein("resoudredns", "resodredns") == 1
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3
+    assert levenshtein("kitten", "sitting", max_distance=1) == 2
+
+def test_prefix_trie_completion():
+    trie = PrefixTrie(METADATA)
+    assert trie.complete("resoud") == ["resoudredns", "resoudredns_inverse"]
+    assert trie.complete("trouver", limit=1) == ["trouversousdomaines"]
+    assert trie.complete("zzz") == []
+    assert trie.common_prefix("tr") == "trouversousdomaines"
+    assert "analyserwhois" in trie
+
+def test_bktree_search_is_ranked():
+    tree = BKTree(METADATA)
+    assert tree.search("resoudrdns", 2)[0] == (1, "resoudredns")
+    assert tree.search("inconnu", 1) == []
+
+def test_completer_completes_commands_and_positional_params():
+    completer = CommandCompleter(METADATA)
+    assert completer.complete("obten") == ["obtenirrecordsdns"]
+    assert completer.complete("obtenirrecordsdns ") == ["<domaine>"]
+    assert completer.complete("obtenirrecordsdns example.com ") == ["<type>"]
+    assert completer.complete("obtenirrecordsdns example.com MX ") == []
+
+def test_readline_matches_hint_params_after_the_command():
+    completer = CommandCompleter(METADATA)
+    assert completer.readline_matches("resoud", "resoud") == ["resoudredns", "resoudredns_inverse"]
+    # Le paramètre attendu est affiché, pas inséré (candidat vide)
+    assert completer.readline_matches("obtenirrecordsdns ", "") == ["<domaine>", ""]
+    assert completer.readline_matches("obtenirrecordsdns example.com ", "") == ["<type>", ""]
+    assert completer.readline_matches("obtenirrecordsdns exa", "exa") == []
+    assert completer.readline_matches("obtenirrecordsdns example.com MX ", "") == []
+
+def test_completer_suggests_typo_corrections():
+    completer = CommandCompleter(METADATA)
+    assert completer.suggest("resoudrdns")[0] == "resoudredns"
+    assert completer.suggest("analsyerwhois")[0] == "analyserwhois"  # inversion de lettres
+    assert completer.suggest("trouversous")[0].startswith("trouversousdomaines")
+    assert completer.suggest("xyz") == []
+
+    message = unknown_command_message(completer, "resoudrdns")
+    assert "non reconnue" in message
+    assert "resoudredns" in message
@@ -0,0 +1,131 @@
+import re
+
+import pytest
+
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.directory import (IN_CHAIN_RULE, PRIVILEGED_GROUPS, Directory, DirectoryError,
+                                                    dn_name, parse_filter)
+from cyber_attack_simulator.utils.network import get_default_universe
+
+ADMINS = "CN=Admins du domaine,OU=Groupes,DC=corp,DC=local"
+
+
+@pytest.fixture(scope="module")
+def directory():
+    return Directory.generate(seed=11, users=600, groups=60, computers=120)
+
+def test_parse_filter():
+    assert parse_filter("(&(objectClass=user)(!(cn=a\\2a*)))") == \
+        ("and", [("eq", "objectclass", "user"), ("not", ("like", "cn", ("a*", "")))])
+    assert parse_filter("(cn=*a?[b]*c*)") == ("like", "cn", ("", "a?[b]", "c", ""))
+    assert parse_filter("department=IT") == ("eq", "department", "IT")
+    assert parse_filter(f"(memberOf:1.2.840.113556.1.4.1941:={ADMINS})") == ("chain", "memberof", ADMINS)
+    for bad in ("(&(objectClass=user)", "(cn>=a)", "(&)", "(cn=a))", "(memberOf:1.2.3:=x)"):
+        with pytest.raises(DirectoryError):
+            parse_filter(bad)
+
+def scan_match(directory: Directory, node: tuple, entry: dict) -> bool:
+    """Référence : le filtre est évalué sur l'entrée complète d'un objet, sans index."""
+    kind = node[0]
+    if kind in ("and", "or"):
+        matches = (scan_match(directory, child, entry) for child in node[1])
+        return all(matches) if kind == "and" else any(matches)
+    if kind == "not":
+        return not scan_match(directory, node[1], entry)
+    values = {key.lower(): value for key, value in entry.items()}
+    if node[1] == "memberof":
+        groups = {dn_name(dn).lower() for dn in values.get("memberof", [])}
+        if kind == "present":
+            return bool(groups)
+        if kind == "chain":
+            # Fermeture transitive des groupes parents
+            pending = list(groups)
+            while pending:
+                parent = directory.entry(directory.find(pending.pop())).get("memberOf", [])
+                for name in (dn_name(dn).lower() for dn in parent):
+                    if name not in groups:
+                        groups.add(name)
+                        pending.append(name)
+        return dn_name(node[2]).lower() in groups
+    value = values["samaccountname"] if node[1] in ("cn", "name") else values.get(node[1])
+    if value is None or kind == "present":
+        return value is not None
+    if kind == "like":
+        return re.fullmatch(".*".join(map(re.escape, node[2])), value, re.IGNORECASE | re.DOTALL) is not None
+    return value.lower() == node[2].lower()
+
+@pytest.mark.parametrize("query", [
+    "(objectClass=user)",
+    "(&(objectClass=user)(department=IT)(!(userAccountControl=514)))",
+    "(|(sAMAccountName=j*)(cn=DC-*)(servicePrincipalName=*))",
+    f"(&(objectClass=user)(memberOf:1.2.840.113556.1.4.1941:={ADMINS}))",
+    "(&(objectClass=group)(memberOf=*)(adminCount=1))",
+    "(!(objectClass=computer))",
+    "(inconnu=*)",
+])
+def test_indexed_search_matches_full_scan(directory, query):
+    node = parse_filter(query)
+    expected = [i for i in range(directory.size) if scan_match(directory, node, directory.entry(i))]
+    assert directory.search(query).ids.tolist() == expected
+
+def test_patterns_match_literal_segments():
+    """Seul un `*` non échappé est un joker ; `?`, `[...]` et `\\2a` sont littéraux."""
+    directory = Directory.generate(seed=3, users=20, groups=8, computers=4)
+    column = directory.columns["samaccountname"]
+    names = [name.lower() for name in column.vocab]
+    column.vocab[:3] = ["a*b", "axb", "a?[c]"]
+    column._sorted = None
+    assert [column.vocab[column.codes[i]] for i in column.like(("a*", "")).tolist()] == ["a*b"]
+    assert [column.vocab[column.codes[i]] for i in column.like(("a?[", "")).tolist()] == ["a?[c]"]
+    assert len(column.like(("a", "b"))) == 2 and len(column.like(("", ""))) == len(names)
+    assert directory.search("(sAMAccountName=a\\2a*)").ids.tolist() == column.like(("a*", "")).tolist()
+
+def test_transitive_membership_is_memoized(directory):
+    admins = directory.find(ADMINS)
+    members = directory.chain_members(admins)
+    assert directory.chain_members(admins) is members
+    assert set(directory.direct_members(admins).tolist()) <= set(members.tolist())
+    for user in directory.search("(&(objectClass=user)(adminCount=1))").ids.tolist():
+        assert set(directory.chain_groups(user).tolist()) & set(range(PRIVILEGED_GROUPS))
+    nested = int(directory.search("(&(objectClass=user)(department=IT))").ids[0])
+    chain = directory.search(f"(member:{IN_CHAIN_RULE}:={directory.dn(nested)})").ids
+    assert set(directory.direct_groups(nested).tolist()) <= set(chain.tolist())
+
+def test_generation_is_reproducible_and_paged(directory):
+    again = Directory.generate(seed=11, users=600, groups=60, computers=120)
+    assert again.names == directory.names
+    found = directory.search("(objectClass=user)")
+    pages = list(found.pages(page_size=250, attributes=["sAMAccountName"]))
+    assert [len(page) for page in pages] == [250, 250, 100] == [len(found.page(n, 250)) for n in (1, 2, 3)]
+    assert set(pages[0][0]) == {"dn", "sAMAccountName"}
+    assert found.page(4, 250) == []
+
+def first_host(universe, predicate) -> str:
+    return next(ip for ip in (f"10.0.0.{n}" for n in range(1, 255)) if predicate(ip))
+
+def test_enumeration_handlers():
+    engine = CyberAttackEngine(seed=5)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    for command in ("enumererldap", "enumerersmb"):
+        engine.handlers[command].__self__.config["success_rate"] = 1.0
+    universe = get_default_universe()
+    dc = first_host(universe, lambda ip: universe.exposes(ip, (389, 88)))
+    smb = first_host(universe, lambda ip: universe.exposes(ip, (445, 139)))
+    dead = first_host(universe, lambda ip: not universe.open_ports(ip))
+
+    result = engine.execute_command("enumererldap", {"ip": dc, "filtre": "(adminCount=1)", "page": "2"})
+    assert result.data["Page"].startswith("2/") and len(result.data["Entrées"]) <= 25
+    assert engine.game_state.discovered_targets[dc]["role"] == "dc"
+    assert not engine.execute_command("enumererldap", {"ip": dc, "filtre": "(cn=x"})["success"]
+    assert not engine.execute_command("enumererldap", {"ip": dc, "page": "9999"})["success"]
+    shares = engine.execute_command("enumerersmb", {"ip": smb})
+    assert any(line.startswith("IPC$") for line in shares.data["Partages"])
+    assert "IPC$" in engine.game_state.discovered_targets[smb]["shares"]
+
+    # Ni une IP publique, ni un hôte éteint ne sont des contrôleurs de domaine ou des serveurs SMB
+    for ip in ("8.8.8.8", dead):
+        assert not engine.execute_command("enumererldap", {"ip": ip})["success"]
+    assert not engine.execute_command("enumerersmb", {"ip": dead})["success"]
+    assert "8.8.8.8" not in engine.game_state.discovered_targets
+    assert dead not in engine.game_state.discovered_targets
@@ -0,0 +1,95 @@
+import asyncio
+import time
+import pytest
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+
+def make_async_handler(delay: float, credits: int, flag: str):
+    async def handler(params: dict) -> dict:
+        await asyncio.sleep(delay)
+        return {
+            "success": True,
+            "output": f"ok {flag}",
+            "new_state": {"credits": credits},
+            "flags": [flag],
+            "time_consumed": delay
+        }
+    return handler
+
+def sync_handler(params: dict) -> dict:
+    return {"success": True, "output": "sync", "flags": ["SYNC_FLAG"], "time_consumed": 0.05}
+
+def failing_handler(params: dict) -> dict:
+    raise ValueError("boom")
+
+def test_async_effects_are_applied_in_submission_order():
+    """Une commande lente soumise en premier applique ses effets avant une commande rapide."""
+    engine = CyberAttackEngine()
+    engine.register_handler("lent", make_async_handler(0.05, 111, "LENT"))
+    engine.register_handler("rapide", make_async_handler(0.0, 222, "RAPIDE"))
+
+    applied = []
+    original_add_flag = engine.add_flag
+    engine.add_flag = lambda flag: applied.append(flag) or original_add_flag(flag)
+
+    results = asyncio.run(engine.execute_many_async([("lent", {}), ("rapide", {})]))
+
+    assert [r["output"] for r in results] == ["ok LENT", "ok RAPIDE"]
+    assert applied == ["LENT", "RAPIDE"]
+    assert engine.game_state.credits == 222
+    assert [h["command"] for h in engine.command_history] == ["lent", "rapide"]
+
+def test_async_commands_overlap_across_sessions():
+    """Les durées simulées de plusieurs sessions se chevauchent au lieu de s'additionner."""
+    engines = []
+    for _ in range(10):
+        engine = CyberAttackEngine()
+        engine.time_scale = 1.0
+        engine.register_handler("sync", sync_handler)
+        engines.append(engine)
+
+    async def run_all():
+        return await asyncio.gather(*(e.execute_command_async("sync", {}) for e in engines))
+
+    start = time.perf_counter()
+    results = asyncio.run(run_all())
+    elapsed = time.perf_counter() - start
+
+    assert all(r["success"] for r in results)
+    assert elapsed < 0.05 * 10 / 2
+    assert all("SYNC_FLAG" in e.flags for e in engines)
+
+def test_async_errors_do_not_block_following_commands():
+    """Une exception dans un handler est convertie en échec sans bloquer la file d'application."""
+    engine = CyberAttackEngine()
+    engine.offload_sync_handlers = True
+    engine.register_handler("boom", failing_handler)
+    engine.register_handler("sync", sync_handler)
+
+    results = asyncio.run(engine.execute_many_async([("boom", {}), ("sync", {}), ("inconnue", {})]))
+
+    assert results[0]["success"] is False
+    assert "boom" in results[0]["output"]
+    assert results[1]["success"] is True
+    assert "non reconnue" in results[2]["output"]
+    assert "SYNC_FLAG" in engine.flags
+
+def test_async_path_survives_successive_event_loops():
+    """Chaque `asyncio.run` a sa propre boucle : la file d'application ne reste pas liée à la première."""
+    engine = CyberAttackEngine()
+    engine.register_handler("lent", make_async_handler(0.01, 1, "LENT"))
+    engine.register_handler("rapide", make_async_handler(0.0, 2, "RAPIDE"))
+
+    for _ in range(3):
+        results = asyncio.run(engine.execute_many_async([("lent", {}), ("rapide", {})]))
+        assert [r["success"] for r in results] == [True, True]
+    assert engine._applied_ticket == engine._next_ticket == 6
+    assert engine.game_state.credits == 2
+
+def test_sync_path_runs_coroutine_handlers():
+    """Le chemin synchrone accepte aussi un handler asynchrone."""
+    engine = CyberAttackEngine()
+    engine.register_handler("async", make_async_handler(0.0, 5, "ASYNC"))
+    result = engine.execute_command("async", {})
+    assert result["success"] is True
+    assert engine.game_state.credits == 5
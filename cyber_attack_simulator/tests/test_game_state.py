@@ -0,0 +1,92 @@
+import pytest
+
+from cyber_attack_simulator.game_state import GameState
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.command_history import CommandHistory
+
+def test_update_state_keeps_unknown_attribute_protection(capsys):
+    """Les attributs inconnus sont refusés, les attributs existants mis à jour."""
+    state = GameState()
+    state.update_state({"credits": 42, "attribut_inconnu": 1})
+
+    assert state.credits == 42
+    assert not hasattr(state, "attribut_inconnu")
+    assert "attribut_inconnu" in capsys.readouterr().out
+    with pytest.raises(AttributeError):
+        state.nouvel_attribut = 1
+
+def test_last_command_results_are_stored_compactly(capsys):
+    """Les clés `last_<commande>` des handlers sont stockées sans avertissement."""
+    state = GameState()
+    state.update_state({"last_resoudredns": {"params": {"domaine": "example.com"}, "time": 12.5}})
+
+    assert capsys.readouterr().out == ""
+    assert state.get_last_result("resoudredns") == {"params": {"domaine": "example.com"}, "time": 12.5}
+    assert state.get_last_result("scannerports") is None
+    assert state.last_result_commands() == ["resoudredns"]
+
+def test_history_is_a_bounded_ring_buffer():
+    """L'historique conserve uniquement les dernières entrées, dans l'ordre."""
+    history = CommandHistory(capacity=3)
+    for i in range(5):
+        history.record(f"cmd{i}", {"cible": f"10.0.0.{i}"})
+
+    assert len(history) == 3
+    assert history.total == 5
+    assert [entry["command"] for entry in history] == ["cmd2", "cmd3", "cmd4"]
+    assert history[-1] == {"command": "cmd4", "params": {"cible": "10.0.0.4"}}
+    assert history[0]["command"] == "cmd2"
+    assert [e["command"] for e in history[1:]] == ["cmd3", "cmd4"]
+    with pytest.raises(IndexError):
+        history[3]
+
+def test_history_spills_evicted_entries_to_disk(tmp_path):
+    """Les entrées évincées sont conservées sur disque si un fichier est fourni."""
+    spill_path = str(tmp_path / "history.jsonl")
+    history = CommandHistory(capacity=2, spill_path=spill_path, spill_batch=2)
+    for i in range(6):
+        history.record("scan", {"port": i})
+
+    entries = list(history.iter_all())
+    assert [entry["params"]["port"] for entry in entries] == list(range(6))
+
+def test_engine_spills_both_histories(tmp_path):
+    """Le fichier de débordement du moteur sert aussi à `scan_history` (suffixe .scans), même après restauration."""
+    spill_path = str(tmp_path / "history.jsonl")
+    engine = CyberAttackEngine(history_capacity=2, history_spill_path=spill_path)
+    engine.register_handler("scan", lambda params: {"success": True, "output": "ok",
+                                                    "new_state": {"scan_history": [("scan", params)]}})
+    engine.restore_snapshot(engine.snapshot())
+    for i in range(5):
+        engine.execute_command("scan", {"port": i})
+
+    for history in (engine.command_history, engine.game_state.scan_history):
+        assert [entry["params"]["port"] for entry in history.iter_all()] == list(range(5))
+    assert engine.game_state.scan_history.spill_path == spill_path + ".scans"
+
+def test_engine_reports_bounded_session_memory():
+    """La mémoire d'une session reste bornée quelle que soit la longueur de l'historique."""
+    engine = CyberAttackEngine(history_capacity=100)
+    engine.register_handler("mock", lambda params: {"success": True, "output": "ok",
+                                                    "new_state": {"last_mock": {"params": params, "time": 1.0}}})
+    for i in range(100):
+        engine.execute_command("mock", {"cible": "example.com"})
+    usage_after_100 = engine.memory_usage()["total"]
+    for i in range(1000):
+        engine.execute_command("mock", {"cible": "example.com"})
+
+    assert len(engine.command_history) == 100
+    assert engine.command_history.total == 1100
+    assert engine.memory_usage()["total"] == usage_after_100
+
+def test_unpickled_snapshot_is_independent_of_the_session():
+    """Un instantané gardé en mémoire (sans pickle) n'est pas modifié par la suite de la partie."""
+    engine = CyberAttackEngine()
+    snapshot = engine.snapshot()
+    engine.game_state.unlock_command("scan")
+    engine.game_state.own_alerts().append({"rule": "r", "time": 0.0})
+    engine.restore_snapshot(snapshot)
+    assert "scan" not in engine.game_state.unlocked_commands and engine.game_state.active_alerts == []
+    engine.game_state.unlock_command("scan")
+    engine.restore_snapshot(snapshot)
+    assert "scan" not in engine.game_state.unlocked_commands
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.handlers.generic import GenericHandler, compile_template
+from cyber_attack_simulator.utils.rng import use_rng
+
+BEHAVIOR = {
+    "required": {"domaine": "❌ Erreur: Domaine manquant."},
+    "defaults": {"type": "any"},
+    "output": {
+        "Records": {"template": "{type|upper} record {i} for {domaine}", "count": [2, 2]},
+        "Emails": {"template": "{item}@{domaine}", "items": ["info", "contact"]},
+        "Port": {"int": [80, 80]},
+        "Registrar": {"value": "Simulated Registrar Inc."},
+    },
+    "success_rate": 1.0,
+    "time": 0.3,
+}
+
+CATALOG = CommandCatalog(CommandCatalog.compile_commands([
+    {"name": "declaree", "category": "reconnaissance", "template": "absent", "behavior": BEHAVIOR},
+]))
+
+def run_generic(params):
+    engine = CyberAttackEngine(seed=1)
+    handler = GenericHandler(engine).handler_for(CATALOG.get("declaree"))
+    with use_rng(engine.rng):
+        return handler(params)
+
+def test_template_placeholders_and_filters():
+    render = compile_template("host-{ip|dashed}.{rand:7-7}.{zone|upper}")
+    assert render(random.Random(0), {"ip": "10.0.0.1", "zone": "lan"}) == "host-10-0-0-1.7.LAN"
+    with pytest.raises(ValueError):
+        compile_template("{ip|inconnu}")
+
+def test_declared_behavior_generates_output():
+    result = run_generic({"domaine": "example.com"})
+    assert result["success"]
+    assert result.data == {
+        "Records": ["ANY record 1 for example.com", "ANY record 2 for example.com"],
+        "Emails": ["info@example.com", "contact@example.com"],
+        "Port": 80,
+        "Registrar": "Simulated Registrar Inc.",
+    }
+    assert result["time_consumed"] == 0.3
+    assert result["flags"] == ["DECLAREE_EXECUTED"]
+
+def test_missing_required_param():
+    result = run_generic({})
+    assert not result["success"]
+    assert result["output"] == "❌ Erreur: Domaine manquant."
+
+def test_factory_prefers_handler_class_over_behavior():
+    engine = CyberAttackEngine()
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    # trouversousdomaines garde une classe écrite à la main, resoudredns est déclarative
+    assert type(engine.handlers["trouversousdomaines"].__self__).__name__ == "TrouversousdomainesHandler"
+    assert engine.handlers["resoudredns"].func.__name__ == "execute_plan"
+    result = engine.execute_command("analyserwhois", {"domaine": "example.com"})
+    assert not result["success"] or result.data["Admin Email"] == "admin@example.com"
@@ -0,0 +1,123 @@
+import pickle
+import random
+
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.game_state import GameState
+from cyber_attack_simulator.utils.command_history import CommandHistory
+from cyber_attack_simulator.utils.hints import search_hint, unearned_flags
+from cyber_attack_simulator.utils.layered_map import MAX_LAYERS, LayeredMap
+from cyber_attack_simulator.utils.progression import attach_progression
+
+def make_engine(seed: int = 5) -> CyberAttackEngine:
+    engine = CyberAttackEngine(seed=seed)
+    CommandHandlerFactory(engine).initialize_all_handlers(lazy=True)
+    return engine
+
+def test_layered_map_branches_behave_like_dicts():
+    rng = random.Random(2)
+    maps, references = [LayeredMap()], [{}]
+    for step in range(3000):
+        i = rng.randrange(len(maps))
+        key = f"k{rng.randrange(60)}"
+        action = rng.random()
+        if action < 0.05:
+            maps.append(maps[i].fork())
+            references.append(dict(references[i]))
+        elif action < 0.2 and key in references[i]:
+            del maps[i][key]
+            del references[i][key]
+        else:
+            maps[i][key] = references[i][key] = step
+        assert len(maps[i]) == len(references[i])
+    for layered, reference in zip(maps, references):
+        assert layered == reference and sorted(layered) == sorted(reference)
+        assert sorted(reversed(layered)) == sorted(reference)
+        assert pickle.loads(pickle.dumps(layered)) == reference
+    assert max(m._depth for m in maps) <= MAX_LAYERS
+
+def test_layered_map_keeps_insertion_order_across_layers():
+    base = LayeredMap({"a": 1, "b": 2})
+    branch = base.fork()
+    branch["c"] = 3
+    branch["a"] = 10
+    base["d"] = 4
+    assert list(branch) == ["a", "b", "c"] and list(base) == ["a", "b", "d"]
+    assert list(reversed(branch)) == ["a", "c", "b"]
+
+def test_forked_state_shares_until_written():
+    state = GameState()
+    state.update_state({"discovered_targets": {"10.0.0.1": {"ports": [22]}}})
+    state.unlock_command("resoudredns")
+    branch = state.fork()
+    assert branch.discovered_targets is not state.discovered_targets
+    assert branch.unlocked_commands is state.unlocked_commands
+
+    branch.update_state({"discovered_targets": {"10.0.0.1": {"os": "Linux"}, "10.0.0.2": {}},
+                         "last_scanneros": {"params": {"ip": "10.0.0.1"}, "time": 1.0}})
+    branch.unlock_command("scanneros")
+    branch.own_alerts().append({"rule": "x"})
+    assert branch.discovered_targets == {"10.0.0.1": {"ports": [22], "os": "Linux"}, "10.0.0.2": {}}
+    assert state.discovered_targets == {"10.0.0.1": {"ports": [22]}}
+    assert state.unlocked_commands == {"resoudredns"} and state.active_alerts == []
+    assert state.get_last_result("scanneros") is None
+    assert branch.get_last_result("scanneros")["params"] == {"ip": "10.0.0.1"}
+
+def test_forked_history_copies_only_written_blocks():
+    history = CommandHistory(capacity=200)
+    for i in range(250):
+        history.record("scan", {"port": i})
+    branch = history.fork()
+    branch.record("fork", {})
+    history.record("original", {})
+    assert [e["command"] for e in branch][-2:] == ["scan", "fork"]
+    assert [e["command"] for e in history][-2:] == ["scan", "original"]
+    assert branch[0]["params"] == {"port": 51} and history[0]["params"] == {"port": 51}
+    shared = sum(a is b for a, b in zip(branch._blocks, history._blocks))
+    assert shared == len(history._blocks) - 1
+
+def test_engine_fork_replays_the_same_future_without_touching_the_session():
+    engine = make_engine()
+    engine.execute_command("scannerhotes", {"reseau": "10.0.0.0/24"})
+    before = pickle.dumps(engine.snapshot())
+    branch = engine.fork()
+    ip = next(iter(engine.game_state.discovered_targets))
+    forked = branch.execute_command("scanneros", {"ip": ip})
+    assert branch.command_history.total == engine.command_history.total + 1
+    assert pickle.dumps(engine.snapshot()) == before
+    assert engine.execute_command("scanneros", {"ip": ip})["output"] == forked["output"]
+    assert engine.flags == branch.flags
+
+def test_forked_progression_is_independent():
+    engine = make_engine()
+    attach_progression(engine)
+    branch = engine.fork()
+    assert branch.progression.engine is branch
+    branch.add_flag("DNS_RESOLVED")
+    branch.add_flag("WHOIS_ANALYZED")
+    assert "analyserheadershttp" in branch.game_state.unlocked_commands
+    assert "analyserheadershttp" not in engine.game_state.unlocked_commands
+    assert not engine.execute_command("analyserheadershttp", {"url": "http://cible.example"})["success"]
+
+def test_search_hint_finds_a_path_to_compromise():
+    engine = make_engine()
+    before = pickle.dumps(engine.snapshot())
+    hint = search_hint(engine, goals={"HOST_COMPROMISED"}, max_nodes=3000, max_depth=3)
+    assert hint.flag == "HOST_COMPROMISED"
+    assert [command for command, _ in hint.path] == ["scannerhotes", "scannervulnerabilites", "exploiter"]
+    assert (hint.command, hint.params) == hint.path[0]
+    assert pickle.dumps(engine.snapshot()) == before
+
+    # Le chemin conseillé se rejoue tel quel sur la session
+    for command, params in hint.path:
+        engine.execute_command(command, params)
+    assert "HOST_COMPROMISED" in engine.flags
+
+def test_search_hint_targets_progression_flags_and_respects_budget():
+    engine = make_engine()
+    attach_progression(engine)
+    goals = unearned_flags(engine)
+    assert "DNS_RESOLVED" in goals and not any(flag.startswith("@") for flag in goals)
+    hint = search_hint(engine)
+    assert hint.flag in goals and hint.nodes <= 300
+    assert search_hint(engine, goals={"HOST_COMPROMISED"}, max_nodes=20).nodes == 20
@@ -0,0 +1,100 @@
+import pytest
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.intrusion import IDSError, IDSRuleset, IntrusionDetector, attach_ids
+from cyber_attack_simulator.utils.journal import SessionJournal, restore_session
+from cyber_attack_simulator.utils.results import CommandResult
+
+CATALOG = CommandCatalog(CommandCatalog.compile_commands([
+    {"name": "scan", "category": "scanning", "params": ["ip"], "time": 1.0, "template": "t"},
+    {"name": "dns", "category": "reconnaissance", "params": ["domaine"], "time": 0.5, "template": "t"},
+]))
+
+RULES = {
+    "alert_ttl": 100,
+    "max_alerts": 3,
+    "rules": [
+        {"id": "rate", "match": {"categories": ["scanning"]}, "window": 10, "threshold": 3,
+         "detection": 0.2, "message": "{count} scans sur {target}"},
+        {"id": "sweep", "type": "sweep", "match": {"commands": ["scan"]}, "window": 10, "threshold": 3},
+        {"id": "fail", "type": "failures", "window": 5, "threshold": 2},
+    ],
+}
+
+def detector():
+    return IntrusionDetector(IDSRuleset(RULES, CATALOG))
+
+def ids_of(alerts):
+    return [alert["rule"] for alert in alerts]
+
+def test_rate_rule_uses_sliding_window_per_target():
+    ids = detector()
+    assert ids.observe("scan", {"ip": "a"}, True, 0) == []
+    assert ids.observe("scan", {"ip": "a"}, True, 5) == []
+    # La première occurrence (t=0) sort de la fenêtre de 10 s à t=10
+    assert ids.observe("scan", {"ip": "a"}, True, 10) == []
+    alerts = ids.observe("scan", {"ip": "a"}, True, 12)
+    assert ids_of(alerts) == ["rate"] and alerts[0]["message"] == "3 scans sur a"
+    # Période de refroidissement : pas de nouvelle alerte tant que la fenêtre n'est pas écoulée
+    assert ids.observe("scan", {"ip": "a"}, True, 13) == []
+    assert ids.observe("dns", {"domaine": "a"}, True, 13) == []
+
+def test_sweep_counts_distinct_targets():
+    ids = detector()
+    ids.observe("scan", {"ip": "a"}, True, 0)
+    ids.observe("scan", {"ip": "a"}, True, 1)
+    ids.observe("scan", {"ip": "b"}, True, 2)
+    alerts = ids.observe("scan", {"ip": "c"}, True, 3)
+    assert ids_of(alerts) == ["sweep"] and alerts[0]["count"] == 3
+
+def test_failures_and_alert_expiry():
+    ids = detector()
+    ids.observe("dns", {"domaine": "x"}, False, 0)
+    assert ids_of(ids.observe("dns", {"domaine": "x"}, False, 1)) == ["fail"]
+    assert ids.observe("dns", {"domaine": "y"}, True, 2) == []
+    ids.observe("dns", {"domaine": "z"}, False, 200)
+    ids.observe("dns", {"domaine": "z"}, False, 201)
+    # L'alerte de t=1 a expiré (alert_ttl = 100)
+    assert [alert["time"] for alert in ids.active_alerts] == [201]
+    assert len(ids.drain_alerts()) == 2 and ids.drain_alerts() == []
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(IDSError):
+        IDSRuleset({"rules": [{"id": "x", "type": "inconnu", "window": 1, "threshold": 1}]})
+    with pytest.raises(IDSError):
+        IDSRuleset({"rules": [{"id": "x", "window": 1, "threshold": 1}] * 2})
+
+def test_engine_integration_feeds_active_alerts():
+    engine = CyberAttackEngine()
+    engine.catalog = CATALOG
+    engine.register_handler("scan", lambda params: CommandResult("scan", data={}, time_consumed=1.0))
+    attach_ids(engine, IDSRuleset(RULES, CATALOG))
+    for _ in range(3):
+        engine.execute_command("scan", {"ip": "10.0.0.1"})
+    assert ids_of(engine.game_state.active_alerts) == ["rate"]
+    assert engine.now == 3.0
+    before = engine.detection_level
+    engine.execute_command("scan", {"ip": "10.0.0.1"})
+    assert engine.detection_level > before
+
+def test_alerts_are_journaled(tmp_path):
+    """Les alertes (et leur effet sur la détection) survivent à une restauration depuis le journal."""
+    engine = CyberAttackEngine(seed=1)
+    engine.catalog = CATALOG
+    engine.register_handler("scan", lambda params: CommandResult("scan", data={}, time_consumed=1.0))
+    attach_ids(engine, IDSRuleset(RULES, CATALOG))
+    journal = SessionJournal(str(tmp_path / "session.journal"))
+    journal.attach(engine)
+    for n in range(12):
+        engine.execute_command("scan", {"ip": f"10.0.0.{n % 2}"})
+    journal.close()
+    assert engine.game_state.active_alerts
+
+    restored = restore_session(journal.path)
+    assert restored.game_state.active_alerts == engine.game_state.active_alerts
+    assert restored.detection_level == engine.detection_level
+
+def test_bundled_rules_load():
+    ruleset = IDSRuleset.load()
+    assert len(ruleset.rules) >= 5
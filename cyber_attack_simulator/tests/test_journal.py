@@ -0,0 +1,164 @@
+import pytest
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.utils.journal import (SessionJournal, read_records, restore_session,
+                                                  replay_session, RECORD_COMMAND, RECORD_JOB_CANCEL)
+
+SCRIPT = [
+    ("resoudredns", {"domaine": "example.com"}),
+    ("trouversousdomaines", {"domaine": "example.com"}),
+    ("collecterosint", {"cible": "CibleCorp"}),
+    ("analyserwhois", {"domaine": "example.org"}),
+    ("trouversousdomaines", {"domaine": "example.net"}),
+]
+
+@pytest.fixture(scope="module")
+def registry():
+    engine = CyberAttackEngine()
+    CommandHandlerFactory(engine).initialize_all_handlers(lazy=True)
+    return engine
+
+def play(registry, path, seed=42, snapshot_every=1000, rounds=1):
+    engine = CyberAttackEngine(seed=seed)
+    engine.share_registry(registry)
+    journal = SessionJournal(str(path), fsync="never", batch_size=4, snapshot_every=snapshot_every)
+    journal.attach(engine)
+    for _ in range(rounds):
+        for command, params in SCRIPT:
+            engine.execute_command(command, params)
+    journal.close()
+    return engine
+
+def session_view(engine):
+    state = engine.game_state
+    return (sorted(engine.flags), engine.detection_level, engine.command_history.total,
+            [entry["command"] for entry in engine.command_history],
+            state.experience, state.credits, sorted(state.last_result_commands()))
+
+def test_journal_records_every_command(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    play(registry, path)
+    commands = [payload[0] for kind, payload in read_records(str(path)) if kind == RECORD_COMMAND]
+    assert commands == [command for command, _ in SCRIPT]
+
+def test_restore_from_deltas_matches_session(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    original = play(registry, path)
+    restored = restore_session(str(path))
+    assert session_view(restored) == session_view(original)
+    assert restored.game_state.get_last_result("resoudredns") == original.game_state.get_last_result("resoudredns")
+
+def test_restore_uses_snapshot_then_deltas(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    original = play(registry, path, snapshot_every=7, rounds=3)
+    assert (tmp_path / "session.journal.snap").exists()
+    restored = restore_session(str(path))
+    assert session_view(restored) == session_view(original)
+    assert restored.repetitions == original.repetitions
+    # L'état du générateur suit l'instantané : la suite de la partie reste reproductible
+    without_snapshot = restore_session(str(path), use_snapshot=False)
+    assert session_view(without_snapshot) == session_view(original)
+
+def test_replay_is_deterministic(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    original = play(registry, path, seed=7)
+    replayed = replay_session(str(path), registry)
+    assert session_view(replayed)[:4] == session_view(original)[:4]
+    assert replayed.game_state.get_last_result("resoudredns") is not None
+
+def test_reopened_journal_appends(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    play(registry, path)
+    restored = restore_session(str(path))
+    restored.share_registry(registry)
+    journal = SessionJournal(str(path), fsync="never")
+    assert journal.sequence == len(SCRIPT)
+    journal.attach(restored)
+    restored.execute_command("resoudredns", {"domaine": "example.fr"})
+    journal.close()
+    assert restore_session(str(path)).command_history.total == len(SCRIPT) + 1
+
+def test_truncated_tail_is_ignored(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    play(registry, path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    restored = restore_session(str(path))
+    assert restored.command_history.total == len(SCRIPT) - 1
+
+def test_replay_relaunches_jobs_in_launch_order(registry, tmp_path):
+    """Le handler d'un job tire ses nombres au lancement : le rejeu suit cet ordre, pas celui des échéances."""
+    for seed in range(20):
+        path = tmp_path / f"jobs-{seed}.journal"
+        engine = CyberAttackEngine(seed=seed)
+        engine.share_registry(registry)
+        journal = SessionJournal(str(path), fsync="never")
+        journal.attach(engine)
+        engine.launch_job("collecterosint", {"cible": "CibleCorp"})
+        engine.execute_command("analyserwhois", {"domaine": "example.org"})
+        cancelled = engine.launch_job("trouversousdomaines", {"domaine": "example.net"})
+        engine.cancel_job(cancelled.id)
+        engine.wait_for_job()
+        engine.execute_command("resoudredns", {"domaine": "example.com"})
+        journal.close()
+
+        replayed = replay_session(str(path), registry)
+        assert replayed.rng.getstate() == engine.rng.getstate()
+        assert session_view(replayed)[:4] == session_view(engine)[:4]
+        assert replayed.now == engine.now
+        restored = restore_session(str(path))
+        assert session_view(restored) == session_view(engine) and restored.now == engine.now
+
+def test_reopened_journal_abandons_running_jobs(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    engine = CyberAttackEngine(seed=3)
+    engine.share_registry(registry)
+    journal = SessionJournal(str(path), fsync="never")
+    journal.attach(engine)
+    job = engine.launch_job("collecterosint", {"cible": "CibleCorp"})
+    journal.close()
+
+    restored = restore_session(str(path))
+    restored.share_registry(registry)
+    assert restored.jobs == {} and restored.command_history.total == 1
+    SessionJournal(str(path), fsync="never").attach(restored)
+    restored.journal.close()
+    assert [payload for kind, payload in read_records(str(path)) if kind == RECORD_JOB_CANCEL] == [job.id]
+    assert replay_session(str(path), registry).jobs == {}
+
+def test_seedless_session_replays_with_its_drawn_seed(registry, tmp_path):
+    """Sans graine explicite, la graine tirée au hasard est journalisée ; le cache ne fausse pas le rejeu."""
+    path = tmp_path / "session.journal"
+    original = play(registry, path, seed=None, rounds=3)
+    assert isinstance(original.seed, int)
+    assert any(not payload[3] and payload[2] for kind, payload in read_records(str(path))
+               if kind == RECORD_COMMAND)  # au moins une commande servie depuis le cache
+    replayed = replay_session(str(path), registry)
+    assert replayed.seed == original.seed
+    assert replayed.rng.getstate() == original.rng.getstate()
+    assert session_view(replayed)[:4] == session_view(original)[:4]
+
+def test_restore_without_snapshot_restores_generator(registry, tmp_path):
+    path = tmp_path / "session.journal"
+    original = play(registry, path, rounds=2)
+    restored = restore_session(str(path), use_snapshot=False)
+    assert restored.seed == original.seed
+    assert restored.rng.getstate() == original.rng.getstate()
+
+def test_reopened_journal_truncates_torn_tail(registry, tmp_path):
+    """Les ajouts après une réouverture ne se retrouvent jamais derrière un lot partiellement écrit."""
+    path = tmp_path / "session.journal"
+    play(registry, path)
+    path.write_bytes(path.read_bytes()[:-10])
+    restored = restore_session(str(path))
+    restored.share_registry(registry)
+    committed = restored.command_history.total
+    journal = SessionJournal(str(path), fsync="never")
+    journal.attach(restored)
+    restored.execute_command("resoudredns", {"domaine": "example.fr"})
+    journal.close()
+    again = restore_session(str(path))
+    assert again.command_history.total == committed + 1
+    assert [entry["command"] for entry in again.command_history][-1] == "resoudredns"
+    assert replay_session(str(path), registry).command_history.total == committed + 1
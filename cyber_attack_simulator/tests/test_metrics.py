@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.metrics import EngineMetrics, LatencyHistogram, bucket_bounds, bucket_index
+
+CATALOG = CommandCatalog(CommandCatalog.compile_commands([
+    {"name": "ok", "category": "reconnaissance", "template": "dns_handler"},
+    {"name": "ko", "category": "reconnaissance", "template": "dns_handler"},
+    {"name": "boom", "category": "exploitation", "template": "exploit_handler"},
+]))
+
+def boom(params):
+    raise RuntimeError("panne")
+
+def make_engine():
+    engine = CyberAttackEngine()
+    engine.catalog = CATALOG
+    engine.register_handler("ok", lambda params: {"success": True, "output": "ok"})
+    engine.register_handler("ko", lambda params: {"success": False, "output": "ko"})
+    engine.register_handler("boom", boom)
+    return engine
+
+def test_bucket_bounds_contain_their_values():
+    for value in (0, 1, 63, 64, 65, 1000, 123456, 10**9, 3 * 10**12):
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value < high
+        # Erreur relative bornée par la précision des cases
+        assert (high - low) <= max(1, value / 30)
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value * 1000)
+    assert histogram.count == 10000
+    assert abs(histogram.percentile(50) - 5_000_000) / 5_000_000 < 0.04
+    assert abs(histogram.percentile(99) - 9_900_000) / 9_900_000 < 0.04
+    assert histogram.percentile(100) == histogram.max
+
+def test_engine_records_outcomes_per_command_and_category():
+    engine = make_engine()
+    metrics = EngineMetrics().attach(engine)
+    for _ in range(3):
+        engine.execute_command("ok", {})
+    engine.execute_command("ko", {})
+    engine.execute_command("boom", {})
+
+    snapshot = metrics.snapshot()
+    assert snapshot["commands"]["ok"]["success"] == 3
+    assert snapshot["commands"]["ko"]["failure"] == 1
+    assert snapshot["commands"]["boom"]["exception"] == 1
+    recon = snapshot["categories"]["reconnaissance"]
+    assert (recon["calls"], recon["success"], recon["failure"]) == (4, 3, 1)
+    assert recon["error_rate"] == 0.25
+    assert json.loads(metrics.to_json())["categories"]["exploitation"]["exception"] == 1
+
+def test_async_path_is_instrumented():
+    engine = make_engine()
+    metrics = EngineMetrics().attach(engine)
+    asyncio.run(engine.execute_many_async([("ok", {}), ("boom", {})]))
+    assert metrics.commands["ok"].success == 1
+    assert metrics.commands["boom"].exception == 1
+
+def test_prometheus_export():
+    engine = make_engine()
+    metrics = EngineMetrics().attach(engine)
+    engine.execute_command("ok", {})
+    text = metrics.to_prometheus()
+    assert '# TYPE cyberattack_command_latency_seconds histogram' in text
+    assert 'cyberattack_command_calls_total{command="ok",outcome="success"} 1' in text
+    assert 'cyberattack_category_latency_seconds_count{category="reconnaissance"} 1' in text
+    assert 'cyberattack_command_latency_seconds_bucket{command="ok",le="+Inf"} 1' in text
+
+def test_profiler_targets_a_single_command():
+    engine = make_engine()
+    metrics = EngineMetrics().attach(engine)
+    assert metrics.profile_command(engine, "ok")
+    engine.execute_command("ok", {})
+    engine.execute_command("ko", {})
+    assert "ok" in metrics.profiles and "ko" not in metrics.profiles
+    assert "function calls" in metrics.profile_report("ok")
+    metrics.stop_profiling(engine, "ok")
+    assert engine.execute_command("ok", {})["success"]
+
+def test_disabled_metrics_record_nothing():
+    engine = make_engine()
+    assert engine.metrics is None
+    assert engine.execute_command("ok", {})["success"]
@@ -0,0 +1,64 @@
+import asyncio
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+
+def make_engine():
+    engine = CyberAttackEngine()
+    engine.register_handler("ok", lambda params: {"success": True, "output": "ok", "flags": ["OK_FLAG"]})
+    engine.register_handler("boom", lambda params: 1 / 0)
+    return engine
+
+def test_empty_chain_compiles_to_nothing():
+    engine = make_engine()
+    assert (engine.middleware.pre, engine.middleware.post, engine.middleware.on_error) == (None, None, None)
+    engine.add_middleware("trace", pre=lambda e, c, p: None)
+    engine.remove_middleware("trace")
+    assert engine.middleware.pre is None
+
+def test_hooks_run_in_onion_order():
+    engine = make_engine()
+    calls = []
+    for name in ("a", "b"):
+        engine.add_middleware(name,
+                              pre=lambda e, c, p, name=name: calls.append(f"pre-{name}"),
+                              post=lambda e, c, p, r, name=name: calls.append(f"post-{name}"))
+    result = engine.execute_command("ok", {})
+    assert result["success"]
+    assert calls == ["pre-a", "pre-b", "post-b", "post-a"]
+
+def test_pre_hook_short_circuits_without_touching_state():
+    engine = make_engine()
+    engine.add_middleware("verrou", pre=lambda e, c, p: {"success": False, "output": "🔒 Commande verrouillée."})
+    result = engine.execute_command("ok", {})
+    assert result["output"] == "🔒 Commande verrouillée."
+    assert engine.flags == set()
+    assert engine.command_history.total == 0
+
+def test_post_hook_can_replace_result():
+    engine = make_engine()
+    engine.add_middleware("suffixe", post=lambda e, c, p, r: {**r, "output": r["output"] + " !"})
+    assert engine.execute_command("ok", {})["output"] == "ok !"
+    # Le résultat d'origine a déjà été appliqué à l'état
+    assert "OK_FLAG" in engine.flags
+
+def test_on_error_hook_replaces_error_message():
+    engine = make_engine()
+    seen = []
+
+    def on_error(e, command, params, error):
+        seen.append(type(error))
+        return {"success": False, "output": f"⚠️ {command} indisponible."}
+
+    engine.add_middleware("erreurs", on_error=on_error)
+    assert engine.execute_command("boom", {})["output"] == "⚠️ boom indisponible."
+    assert asyncio.run(engine.execute_command_async("boom", {}))["output"] == "⚠️ boom indisponible."
+    assert seen == [ZeroDivisionError, ZeroDivisionError]
+
+def test_shared_registry_shares_the_chain():
+    registry = make_engine()
+    session = CyberAttackEngine()
+    session.share_registry(registry)
+    calls = []
+    registry.add_middleware("trace", post=lambda e, c, p, r: calls.append(e))
+    asyncio.run(session.execute_command_async("ok", {}))
+    assert calls == [session]
@@ -0,0 +1,123 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.game_state import GameState
+from cyber_attack_simulator.utils.journal import SessionJournal, restore_session
+from cyber_attack_simulator.utils.network import (PORTS, NetworkError, NetworkUniverse, format_address,
+                                                  get_default_universe, parse_ports, parse_targets)
+
+
+@pytest.fixture(scope="module")
+def universe():
+    return NetworkUniverse.generate(seed=7, network="10.1.0.0/20", extra_ports_per_host=1.0)
+
+def test_parsers():
+    assert parse_ports("443,22,20-23").tolist() == [20, 21, 22, 23, 443]
+    assert parse_ports("all").size == 65535 and parse_ports(None).size == PORTS.size
+    assert parse_targets("10.0.0.0/24") == (167772160, 256)
+    assert parse_targets("8.8.8.8") == (134744072, 1)
+    for bad in ("0-10", "22,x"):
+        with pytest.raises(NetworkError):
+            parse_ports(bad)
+    with pytest.raises(NetworkError):
+        parse_targets("10.0.0.0/8")
+
+def test_generation_is_deterministic(universe):
+    again = NetworkUniverse.generate(seed=7, network="10.1.0.0/20", extra_ports_per_host=1.0)
+    for name in NetworkUniverse.ARRAYS:
+        assert np.array_equal(getattr(universe, name), getattr(again, name))
+    assert universe.host_services("10.1.2.3") == again.host_services("10.1.2.3")
+
+def test_vectorized_scan_matches_per_host_lookup(universe):
+    first, count = parse_targets("10.1.0.0/22")
+    scanned = {}
+    for addresses, ports in universe.scan(first, count, chunk_hosts=100):
+        for address, port in zip(addresses.tolist(), ports.tolist()):
+            scanned.setdefault(format_address(address), []).append(port)
+    expected = {format_address(first + n): universe.open_ports(format_address(first + n)) for n in range(count)}
+    assert scanned == {ip: ports for ip, ports in expected.items() if ports}
+    assert any(port not in PORTS for ports in scanned.values() for port in ports)
+    # Restriction à une liste de ports
+    only = [port for _, ports in universe.scan(first, count, parse_ports("22,445")) for port in ports.tolist()]
+    assert set(only) <= {22, 445} and len(only) == sum(p in (22, 445) for v in scanned.values() for p in v)
+
+def test_outside_targets_map_to_alive_hosts(universe):
+    for target in ("8.8.8.8", "203.0.113.42", "example.com"):
+        index = universe.target_index(target)
+        assert universe.is_alive([index])[0]
+        assert universe.target_index(target) == index
+
+def test_save_and_mmap_load(universe, tmp_path):
+    universe.save(str(tmp_path))
+    loaded = NetworkUniverse.load(str(tmp_path))
+    assert isinstance(loaded.masks, np.memmap)
+    assert loaded.nbytes() == universe.nbytes()
+    assert loaded.host_services("10.1.0.9") == universe.host_services("10.1.0.9")
+
+def test_scan_handlers_fill_discovered_targets():
+    engine = CyberAttackEngine(seed=2)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    for command in ("scannerhotes", "scannerports", "identifierversions"):
+        engine.handlers[command].__self__.config["success_rate"] = 1.0
+    hosts = engine.execute_command("scannerhotes", {"reseau": "10.0.0.0/24"})
+    assert hosts.data["Total"] > 0 and hosts.data["Adresses sondées"] == 256
+    sweep = engine.execute_command("scannerports", {"ip": "10.0.0.0/24", "ports": "all"})
+    assert sweep.data["Sondes"] == 256 * 65535
+    assert sweep.data["Hôtes avec ports ouverts"] <= hosts.data["Total"]
+    ip = sweep.data["Ports ouverts"][0].split(" : ")[0]
+    engine.execute_command("identifierversions", {"ip": ip})
+    target = engine.game_state.discovered_targets[ip]
+    assert target["alive"] and sorted(target["services"]) == target["ports"]
+    refused = engine.execute_command("scannerports", {"ip": "10.0.0.0/8"})
+    assert not refused["success"] and "trop large" in refused["output"]
+
+def scanning_engine(seed: int) -> CyberAttackEngine:
+    engine = CyberAttackEngine(seed=seed)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    for command in ("scannerports", "scanneros", "identifierversions"):
+        engine.handlers[command].__self__.config["success_rate"] = 1.0
+    return engine
+
+def test_scans_stream_blocks_into_the_session(tmp_path, monkeypatch):
+    """Chaque bloc balayé complète l'état pendant le scan ; le journal et le chemin asynchrone concordent."""
+    engine = scanning_engine(3)
+    journal = SessionJournal(str(tmp_path / "session.journal"))
+    journal.attach(engine)
+    sizes = []
+    update_state = GameState.update_state
+    monkeypatch.setattr(GameState, "update_state", lambda state, data: update_state(state, data) or sizes.append(
+        len(state.discovered_targets)))
+
+    params = {"ip": "10.0.0.0/18", "ports": "22,80,445"}
+    assert engine.execute_command("scannerports", params)["success"]
+    assert len(sizes) == 5 and sizes[:4] == sorted(sizes[:4]) and sizes[0] < sizes[3]
+    blocks = [entry["params"]["bloc"] for entry in engine.game_state.scan_history]
+    assert blocks == ["10.0.0.0-10.0.15.255", "10.0.16.0-10.0.31.255",
+                      "10.0.32.0-10.0.47.255", "10.0.48.0-10.0.63.255"]
+    journal.close()
+    monkeypatch.undo()
+
+    restored = restore_session(journal.path)
+    background = scanning_engine(3)
+    asyncio.run(background.execute_command_async("scannerports", params))
+    for other in (restored, background):
+        assert dict(other.game_state.discovered_targets.items()) == dict(engine.game_state.discovered_targets.items())
+        assert list(other.game_state.scan_history) == list(engine.game_state.scan_history)
+
+def test_rescans_accumulate_ports_and_dead_hosts_are_refused():
+    engine = scanning_engine(4)
+    universe = get_default_universe()
+    ip = next(f"10.0.0.{n}" for n in range(1, 255) if {22, 80} <= set(universe.open_ports(f"10.0.0.{n}")))
+    engine.execute_command("scannerports", {"ip": ip, "ports": "22"})
+    engine.execute_command("scannerports", {"ip": ip, "ports": "80"})
+    assert engine.game_state.discovered_targets[ip]["ports"] == [22, 80]
+
+    dead = next(f"10.0.0.{n}" for n in range(1, 255) if not universe.host_alive(f"10.0.0.{n}"))
+    for command in ("scanneros", "identifierversions"):
+        result = engine.execute_command(command, {"ip": dead})
+        assert not result["success"] and "ne répond pas" in result["output"]
+    assert dead not in engine.game_state.discovered_targets
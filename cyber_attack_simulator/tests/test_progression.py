@@ -0,0 +1,110 @@
+import pytest
+
+from cyber_attack_simulator.command_catalog import CommandCatalog, DEFAULT_COMMANDS_FILE
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.game_state import GameState
+from cyber_attack_simulator.utils.progression import Progression, ProgressionError, attach_progression
+
+CATALOG = CommandCatalog(CommandCatalog.compile_commands([
+    {"name": "recon", "category": "reconnaissance", "template": "dns_handler", "flags": ["RECON_DONE"], "risk": 0.1},
+    {"name": "scan", "category": "scanning", "template": "port_scanner", "flags": ["SCAN_DONE"]},
+    {"name": "enum", "category": "enumeration", "template": "smb_enum", "flags": ["ENUM_DONE"]},
+    {"name": "exploit", "category": "exploitation", "template": "exploit_handler", "flags": ["PWNED"]},
+]))
+
+SCENARIO = {
+    "level_thresholds": [0, 50, 100],
+    "xp": {"base": 10, "per_risk": 100},
+    "initial_commands": ["recon"],
+    "nodes": [
+        {"id": "scan", "requires": {"flags": ["RECON_DONE"]}, "unlocks": ["scan"], "rewards": {"xp": 5}},
+        {"id": "enum", "requires": {"flags": ["SCAN_DONE"], "level": 2}, "unlocks": ["enum"],
+         "rewards": {"credits": 100}},
+        {"id": "exploit", "requires": {"after": ["enum"], "xp": 90}, "unlocks": ["exploit"]},
+    ],
+}
+
+def make_engine(enforce=True):
+    engine = CyberAttackEngine()
+    engine.catalog = CATALOG
+    for spec in CATALOG:
+        engine.register_handler(spec.name, lambda params: {"success": True, "output": "ok"})
+    tracker = attach_progression(engine, Progression(SCENARIO, CATALOG), enforce)
+    return engine, tracker
+
+def test_add_experience_levels_up():
+    state = GameState()
+    assert state.add_experience(120) == 1
+    assert (state.level, state.experience) == (2, 120)
+    assert state.add_experience(500) == 2
+    assert state.unlock_command("scan") and not state.unlock_command("scan")
+
+def test_flags_from_catalog_unlock_nodes_incrementally():
+    engine, tracker = make_engine()
+    assert engine.game_state.unlocked_commands == {"recon"}
+    engine.execute_command("recon", {})
+    assert "RECON_DONE" in engine.flags
+    # 10 + 100 * 0.1 XP pour la commande, 5 XP de récompense du nœud
+    assert engine.game_state.experience == 25
+    assert tracker.drain_unlocks() == ["scan"]
+
+def test_level_and_xp_thresholds_gate_nodes():
+    engine, tracker = make_engine()
+    engine.execute_command("recon", {})
+    engine.execute_command("scan", {})
+    assert "enum" not in engine.game_state.unlocked_commands  # niveau 2 requis
+    tracker.add_experience(20)
+    assert "enum" in engine.game_state.unlocked_commands
+    assert engine.game_state.credits == 1100
+    assert "exploit" not in engine.game_state.unlocked_commands
+    tracker.add_experience(40)
+    assert "exploit" in engine.game_state.unlocked_commands
+
+def test_locked_commands_are_refused_with_missing_requirements():
+    engine, _ = make_engine()
+    result = engine.execute_command("enum", {})
+    assert not result["success"]
+    assert "verrouillée" in result["output"] and "SCAN_DONE" in result["output"]
+    assert engine.command_history.total == 0
+
+def test_sync_after_restore_keeps_progress():
+    engine, tracker = make_engine()
+    engine.execute_command("recon", {})
+    snapshot = engine.snapshot()
+    restored, restored_tracker = make_engine()
+    restored.restore_snapshot(snapshot)
+    assert restored.game_state.unlocked_commands == {"recon", "scan"}
+    assert restored_tracker.unlocked_nodes == tracker.unlocked_nodes
+
+def test_restore_does_not_reward_nodes_twice():
+    scenario = dict(SCENARIO, nodes=SCENARIO["nodes"] + [
+        {"id": "bonus", "requires": {"flags": ["RECON_DONE"]}, "rewards": {"credits": 500}}])
+    engine = CyberAttackEngine()
+    engine.catalog = CATALOG
+    engine.register_handler("recon", lambda params: {"success": True, "output": "ok"})
+    tracker = attach_progression(engine, Progression(scenario, CATALOG))
+    engine.execute_command("recon", {})
+    assert engine.game_state.credits == 1500
+    snapshot = engine.snapshot()
+    for _ in range(2):
+        engine.restore_snapshot(snapshot)
+        assert engine.game_state.credits == 1500
+    assert tracker.progression.by_id["bonus"].index in tracker.unlocked_nodes
+
+def test_cycles_are_rejected_at_load():
+    cyclic = {
+        "initial_commands": ["recon"],
+        "nodes": [
+            {"id": "a", "requires": {"flags": ["SCAN_DONE"]}, "unlocks": ["enum"]},
+            {"id": "b", "requires": {"flags": ["ENUM_DONE"]}, "unlocks": ["scan"]},
+        ],
+    }
+    with pytest.raises(ProgressionError, match="Cycle"):
+        Progression(cyclic, CATALOG)
+    with pytest.raises(ProgressionError, match="inconnue"):
+        Progression({"nodes": [{"id": "a", "requires": {"after": ["z"]}}]})
+
+def test_shipped_progression_loads():
+    progression = Progression.load(catalog=CommandCatalog.load(DEFAULT_COMMANDS_FILE, use_cache=False))
+    assert len(progression.order) == len(progression.nodes)
+    assert "scannerports" in progression.gated_commands
@@ -0,0 +1,106 @@
+import pytest
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.result_cache import ResultCache, make_cache_key
+from cyber_attack_simulator.utils.results import CommandResult
+
+CATALOG = CommandCatalog(CommandCatalog.compile_commands([
+    {"name": "resoudredns", "category": "reconnaissance", "template": "dns_handler", "cache_ttl": 300},
+    {"name": "scannerports", "category": "scanning", "template": "port_scanner"},
+]))
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def make_engine(clock: FakeClock):
+    engine = CyberAttackEngine()
+    engine.catalog = CATALOG
+    engine.result_cache = ResultCache(clock=clock)
+    calls = []
+
+    def handler(params):
+        calls.append(params)
+        return CommandResult("resoudredns", data={"IPs": [f"10.0.0.{len(calls)}"]},
+                             flags=["DNS_FLAG"], new_state={"experience": 10 * len(calls)})
+
+    engine.register_handler("resoudredns", handler)
+    engine.register_handler("scannerports", handler)
+    return engine, calls
+
+def test_cache_key_normalizes_params():
+    assert make_cache_key("resoudredns", {"domaine": "Example.COM."}) == \
+        make_cache_key("resoudredns", {"domaine": " example.com"})
+    # Un chemin de wordlist garde sa casse : deux fichiers distincts, deux entrées
+    assert make_cache_key("trouversousdomaines", {"domaine": "a.com", "wordlist": "/data/Words.txt"}) != \
+        make_cache_key("trouversousdomaines", {"domaine": "a.com", "wordlist": "/data/words.txt"})
+
+def test_cache_hit_returns_same_data_without_reapplying_state():
+    """Un succès en cache ne rapporte ni flags ni expérience une seconde fois."""
+    clock = FakeClock()
+    engine, calls = make_engine(clock)
+
+    first = engine.execute_command("resoudredns", {"domaine": "example.com"})
+    engine.flags.clear()
+    second = engine.execute_command("resoudredns", {"domaine": "EXAMPLE.com"})
+
+    assert len(calls) == 1
+    assert second["output"] == first["output"]
+    assert second["cached"] is True
+    assert "cached" not in first
+    assert engine.flags == set()
+    assert engine.game_state.experience == 10
+    assert len(engine.command_history) == 2
+    assert engine.result_cache.stats()["hits"] == 1
+
+def test_cached_results_share_no_mutable_fields():
+    """Modifier le premier résultat ou un succès en cache n'altère pas l'entrée du cache."""
+    engine, calls = make_engine(FakeClock())
+
+    first = engine.execute_command("resoudredns", {"domaine": "example.com"})
+    first["flags"].append("MUTATED")
+    first["new_state"]["experience"] = 999
+    hit = engine.execute_command("resoudredns", {"domaine": "example.com"})
+    hit["flags"].append("MUTATED")
+    hit.data["IPs"].append("10.0.0.99")
+    again = engine.execute_command("resoudredns", {"domaine": "example.com"})
+
+    assert len(calls) == 1
+    assert again["flags"] == ["DNS_FLAG"]
+    assert again["new_state"] == {"experience": 10}
+    assert again.data == {"IPs": ["10.0.0.1"]}
+    assert "cached" not in first
+
+def test_cache_entries_expire_after_ttl():
+    clock = FakeClock()
+    engine, calls = make_engine(clock)
+    engine.execute_command("resoudredns", {"domaine": "example.com"})
+    clock.now = 301.0
+    result = engine.execute_command("resoudredns", {"domaine": "example.com"})
+
+    assert len(calls) == 2
+    assert "cached" not in result
+    assert engine.result_cache.expirations == 1
+
+def test_non_cacheable_commands_always_run():
+    engine, calls = make_engine(FakeClock())
+    engine.execute_command("scannerports", {"ip": "10.0.0.1"})
+    engine.execute_command("scannerports", {"ip": "10.0.0.1"})
+    assert len(calls) == 2
+
+def test_cache_is_bounded_in_entries_and_memory():
+    cache = ResultCache(max_entries=2, max_bytes=10**6, clock=FakeClock())
+    for i in range(3):
+        cache.put(("cmd", i), {"success": True, "output": "x"}, ttl=60)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(("cmd", 0)) is None
+
+    small = ResultCache(max_entries=100, max_bytes=2000, clock=FakeClock())
+    for i in range(50):
+        small.put(("cmd", i), {"success": True, "output": "x" * 100}, ttl=60)
+    assert small.bytes <= 2000
+    assert small.evictions > 0
@@ -0,0 +1,55 @@
+import json
+import pytest
+
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.results import CommandResult
+
+def make_result() -> CommandResult:
+    return CommandResult("resoudredns", data={"IPs": ["10.0.0.1"]},
+                         new_state={"credits": 500}, flags=["DNS_FLAG"], time_consumed=0.1)
+
+def test_result_renders_text_report_lazily():
+    """Le rapport texte n'est construit qu'au premier accès à `output`."""
+    result = make_result()
+    assert result._output is None
+
+    assert result["output"] == ("--- Rapport pour resoudredns ---\n"
+                                "  - IPs: ['10.0.0.1']\n"
+                                "---------------------------------\n")
+    assert result._output is not None
+
+def test_result_is_compatible_with_dict_access():
+    result = make_result()
+    assert result.get("success") is True
+    assert result["flags"] == ["DNS_FLAG"]
+    assert "output" in result
+    assert "new_state" in result
+    assert result.get("inconnu", "défaut") == "défaut"
+    with pytest.raises(KeyError):
+        result["inconnu"]
+
+    failure = CommandResult.failure("❌ Erreur: Domaine manquant.")
+    assert failure["output"] == "❌ Erreur: Domaine manquant."
+    assert failure.get("success") is False
+    assert "flags" not in failure
+    assert dict(failure) == {"success": False, "output": "❌ Erreur: Domaine manquant."}
+
+def test_result_renders_json_and_jsonl():
+    result = make_result()
+    result["cached"] = True
+    payload = json.loads(result.render("json"))
+    assert payload == {"command": "resoudredns", "success": True, "data": {"IPs": ["10.0.0.1"]},
+                       "flags": ["DNS_FLAG"], "time_consumed": 0.1, "cached": True}
+    assert result.render("jsonl").endswith("}\n")
+    with pytest.raises(ValueError):
+        result.render("xml")
+
+def test_engine_applies_structured_results():
+    """Le moteur applique l'état et les flags d'un CommandResult comme d'un dict."""
+    engine = CyberAttackEngine()
+    engine.register_handler("resoudredns", lambda params: make_result())
+    result = engine.execute_command("resoudredns", {"domaine": "example.com"})
+
+    assert result["success"] is True
+    assert engine.game_state.credits == 500
+    assert "DNS_FLAG" in engine.flags
@@ -0,0 +1,68 @@
+import pytest
+
+from cyber_attack_simulator.command_catalog import CommandCatalog
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.risk_calculator import RiskCalculator, DetectionEngine
+
+CATALOG = CommandCatalog(CommandCatalog.compile_commands([
+    {"name": "resoudredns", "category": "reconnaissance", "template": "dns_handler", "risk": 0.02},
+    {"name": "scannerports", "category": "scanning", "template": "port_scanner", "risk": 0.15},
+]))
+
+def make_engine(detection: DetectionEngine) -> CyberAttackEngine:
+    engine = CyberAttackEngine()
+    engine.detection = detection
+    engine.register_handler("scannerports", lambda params: {"success": True, "output": "ok"})
+    return engine
+
+def test_risk_calculator_uses_catalog_risks():
+    """La table des risques provient du champ `risk` du catalogue de la session."""
+    assert RiskCalculator.calculate_detection_risk("scannerports", {}, CATALOG) == 0.15
+    assert RiskCalculator.calculate_detection_risk("inconnue", {}, CATALOG) == 0.1
+    assert RiskCalculator.calculate_detection_risk("testersql", {}, CATALOG) == 0.1
+    # Sans catalogue : valeurs historiques, sans effet d'une autre session
+    assert RiskCalculator.calculate_detection_risk("testersql", {}) == 0.25
+
+def test_detection_modifiers():
+    """Discrétion, répétitions et sensibilité de la cible modulent le risque de base."""
+    detection = DetectionEngine(CATALOG, sensitivity={"10.0.0.1": 2.0}, repetition_factor=0.5)
+
+    assert detection.score("scannerports", {}) == pytest.approx(0.15)
+    assert detection.score("scannerports", {}, stealth_level=2.0) == pytest.approx(0.075)
+    assert detection.score("scannerports", {}, repetitions=2) == pytest.approx(0.30)
+    assert detection.score("scannerports", {"ip": "10.0.0.1"}) == pytest.approx(0.30)
+    assert detection.score("scannerports", {"ip": "10.0.0.1"}, repetitions=20) == 1.0
+
+def test_engine_accumulates_detection_on_success():
+    """Chaque commande réussie augmente le niveau de détection de la session."""
+    engine = make_engine(DetectionEngine(CATALOG, repetition_factor=1.0))
+    engine.execute_command("scannerports", {})
+    engine.execute_command("scannerports", {})
+
+    assert engine.detection_level == pytest.approx(0.15 + 0.30)
+    assert engine.repetitions["scannerports"] == 2
+
+def test_batch_matches_sequential_scoring():
+    """Un lot vectorisé donne le même résultat que les appels unitaires successifs."""
+    detection = DetectionEngine(CATALOG, sensitivity={"10.0.0.1": 2.0})
+    sequential = [make_engine(detection) for _ in range(3)]
+    batched = [make_engine(detection) for _ in range(3)]
+    for engine in batched:
+        engine.batch_detection = True
+
+    plan = [(0, "scannerports", {"ip": "10.0.0.1"}), (1, "resoudredns", {"domaine": "a.com"}),
+            (0, "scannerports", {}), (2, "inconnue", {}), (0, "scannerports", {}), (2, "autre", {}),
+            (2, "inconnue", {})]
+    for slot, command, params in plan:
+        engine = sequential[slot]
+        engine.update_detection(engine.detection_risk(command, params))
+        engine.repetitions[command] = engine.repetitions.get(command, 0) + 1
+        batched[slot].pending_detection.append((command, params))
+
+    risks = detection.apply_pending(batched)
+
+    assert len(risks) == len(plan)
+    for expected, engine in zip(sequential, batched):
+        assert engine.detection_level == pytest.approx(expected.detection_level)
+        assert engine.repetitions == expected.repetitions
+        assert engine.pending_detection == []
@@ -0,0 +1,74 @@
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.results import CommandResult
+from cyber_attack_simulator.utils.scheduler import EventScheduler, JOB_CANCELLED, JOB_DONE
+
+def test_events_fire_in_due_order():
+    clock = EventScheduler()
+    fired = []
+    clock.schedule(5, lambda: fired.append(("b", clock.now)))
+    clock.schedule(2, lambda: fired.append(("a", clock.now)))
+    clock.schedule(5, lambda: fired.append(("c", clock.now)))
+    assert clock.advance(4) == 1 and clock.now == 4
+    assert clock.advance_to(10) == 2
+    assert fired == [("a", 2), ("b", 5), ("c", 5)]
+    assert clock.now == 10 and not clock.run_next()
+
+def test_cancelled_events_never_fire():
+    clock = EventScheduler()
+    fired = []
+    events = [clock.schedule(n, lambda n=n: fired.append(n)) for n in range(200)]
+    for event in events[::2]:
+        assert clock.cancel(event)
+    assert not clock.cancel(events[0])
+    assert len(clock) == 100
+    clock.advance(1000)
+    assert fired == list(range(1, 200, 2))
+
+def test_cancel_from_a_callback_rebuilding_the_heap():
+    """Une annulation déclenchée par un rappel peut reconstruire le tas pendant `advance_to`."""
+    clock = EventScheduler()
+    fired = []
+    late = [clock.schedule(100 + n, lambda n=n: fired.append(n)) for n in range(100)]
+    clock.schedule(1, lambda: [clock.cancel(event) for event in late[:90]])
+    clock.schedule(2, lambda: fired.append("après"))
+    clock.advance(1000)
+    assert fired == ["après"] + list(range(90, 100))
+    assert len(clock) == 0
+
+def make_engine():
+    engine = CyberAttackEngine()
+    engine.register_handler("long", lambda params: CommandResult("long", data={}, flags=["LONG_DONE"],
+                                                                 time_consumed=10.0))
+    engine.register_handler("court", lambda params: CommandResult("court", data={}, time_consumed=4.0))
+    return engine
+
+def test_background_job_applies_at_completion():
+    engine = make_engine()
+    job = engine.launch_job("long", {})
+    assert job.due == 10.0 and engine.now == 0.0 and "LONG_DONE" not in engine.flags
+    engine.execute_command("court", {})
+    engine.execute_command("court", {})
+    assert engine.now == 8.0 and job.id in engine.jobs
+    engine.execute_command("court", {})
+    # La commande au premier plan a fait passer l'horloge au-delà de l'échéance du job
+    assert engine.now == 12.0 and job.status == JOB_DONE and "LONG_DONE" in engine.flags
+    assert engine.drain_finished_jobs() == [job] and engine.drain_finished_jobs() == []
+
+def test_wait_and_cancel_jobs():
+    engine = make_engine()
+    first, second = engine.launch_job("long", {}), engine.launch_job("court", {})
+    assert engine.wait_for_job(second.id) and engine.now == 4.0
+    assert engine.cancel_job(first.id) and first.status == JOB_CANCELLED
+    assert not engine.wait_for_job(first.id)
+    engine.wait_for_job()
+    assert "LONG_DONE" not in engine.flags and engine.now == 4.0
+    unknown = engine.launch_job("inconnue", {})
+    assert unknown.status == JOB_DONE and not unknown.result["success"]
+
+def test_snapshot_keeps_clock():
+    engine = make_engine()
+    engine.execute_command("court", {})
+    engine.launch_job("long", {})
+    restored = make_engine()
+    restored.restore_snapshot(engine.snapshot())
+    assert restored.now == 4.0 and restored.jobs == {}
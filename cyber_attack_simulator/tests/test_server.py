@@ -0,0 +1,114 @@
+import asyncio
+import json
+import pytest
+
+from cyber_attack_simulator.server import SimulatorServer, SessionManager
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+
+def mock_handler(params: dict) -> dict:
+    return {"success": True, "output": f"cible={params.get('cible')}", "flags": ["MOCK_FLAG"]}
+
+def make_server() -> SimulatorServer:
+    server = SimulatorServer(port=0)
+    server.registry.register_handler("mock", mock_handler)
+    server.registry.register_command_metadata("mock", ["cible"])
+    return server
+
+def test_sessions_are_isolated_but_share_the_registry():
+    """Chaque session a son propre état, mais toutes partagent les mêmes handlers."""
+    server = make_server()
+
+    async def scenario():
+        first = await server.handle_line("alice mock 10.0.0.1")
+        await server.handle_line("bob commande_inconnue")
+        return first
+
+    response = asyncio.run(scenario())
+
+    assert response == {"session": "alice", "success": True, "output": "cible=10.0.0.1"}
+    alice = server.sessions.sessions["alice"].engine
+    bob = server.sessions.sessions["bob"].engine
+    assert "MOCK_FLAG" in alice.flags
+    assert "MOCK_FLAG" not in bob.flags
+    assert alice.handlers is bob.handlers is server.registry.handlers
+    assert alice.game_state is not bob.game_state
+
+    stats = server.stats()
+    assert stats["sessions"] == 2
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+    assert stats["sessions_per_core"] > 0
+
+def test_parse_errors_are_returned_not_printed(capsys):
+    server = make_server()
+    response = asyncio.run(server.handle_line("alice mock 10.0.0.1 en_trop"))
+    assert response["success"] is False
+    assert "Trop d'arguments" in response["output"] and "Attendus: 1, fournis: 2" in response["output"]
+    assert capsys.readouterr().out == ""
+
+def test_sessions_get_progression_ids_and_attack_graph():
+    """Chaque session a son suivi de progression, son défenseur et son graphe ; les options les retirent."""
+    server = make_server()
+    asyncio.run(server.handle_line("alice mock 10.0.0.1"))
+    asyncio.run(server.handle_line("bob mock 10.0.0.2"))
+    alice = server.sessions.sessions["alice"].engine
+    bob = server.sessions.sessions["bob"].engine
+    for engine in (alice, bob):
+        assert engine.progression is not None and engine.ids is not None and engine.attack_graph is not None
+    assert alice.progression is not bob.progression and alice.ids is not bob.ids
+    assert alice.progression.progression is bob.progression.progression
+    server.registry.register_handler("exploiter", mock_handler)
+    assert "verrouillée" in asyncio.run(server.handle_line("alice exploiter 10.0.0.1"))["output"]
+
+    bare = SimulatorServer(port=0, progression=False, ids=False)
+    engine = bare.sessions.get_or_create("carol").engine
+    assert engine.progression is None and engine.ids is None and engine.attack_graph is not None
+
+def test_idle_sessions_are_evicted():
+    """Les sessions inactives au-delà du délai sont évincées."""
+    now = [0.0]
+    manager = SessionManager(CyberAttackEngine(), idle_timeout=10.0, clock=lambda: now[0])
+    manager.get_or_create("ancienne")
+    now[0] = 8.0
+    manager.get_or_create("recente")
+    now[0] = 15.0
+
+    assert manager.evict_idle() == 1
+    assert list(manager.sessions) == ["recente"]
+    assert manager.evicted == 1
+
+def test_tcp_line_protocol_round_trip():
+    """Le protocole ligne par ligne fonctionne de bout en bout sur TCP."""
+    server = make_server()
+
+    async def scenario():
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        responses = []
+        for line in (b"carol mock 192.168.1.1\n", b"STATS\n", b"CLOSE carol\n"):
+            writer.write(line)
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+        await server.stop()
+        return responses
+
+    executed, stats, closed = asyncio.run(scenario())
+
+    assert executed["success"] is True
+    assert stats["sessions"] == 1
+    assert closed == {"success": True}
+    assert len(server.sessions) == 0
+
+def test_metrics_are_shared_across_sessions():
+    server = make_server()
+
+    async def scenario():
+        await server.handle_line("alice mock 10.0.0.1")
+        await server.handle_line("bob mock 10.0.0.2")
+        return await server.handle_line("METRICS"), await server.handle_line("METRICS prometheus")
+
+    report, prometheus = asyncio.run(scenario())
+    assert report["metrics"]["commands"]["mock"]["success"] == 2
+    assert 'command="mock",outcome="success"} 2' in prometheus["output"]
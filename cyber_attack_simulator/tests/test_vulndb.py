@@ -0,0 +1,66 @@
+import random
+
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.game_state import GameState
+from cyber_attack_simulator.utils.simulator import RealisticSimulator
+from cyber_attack_simulator.utils.vulndb import IntervalTree, VulnerabilityDatabase, encode_version
+
+def test_version_encoding_is_ordered():
+    versions = ["0.9.8", "1.0.1", "1.0.1f", "1.0.1g", "1.0.2", "2.4.9", "2.4.49", "9.3p1", "9.3p2", "10.0"]
+    assert sorted(versions, key=encode_version) == versions
+    assert encode_version("2.4") == encode_version("2.4.0")
+
+def test_interval_tree_matches_brute_force():
+    rng = random.Random(5)
+    intervals = []
+    for n in range(300):
+        start = rng.randrange(1000)
+        intervals.append((start, start + rng.randrange(1, 200), n))
+    tree = IntervalTree(intervals)
+    for point in range(0, 1200, 7):
+        expected = [n for s, e, n in intervals if s <= point < e]
+        assert sorted(tree.stab(point)) == sorted(expected)
+
+DATA = {"advisories": [
+    {"id": "A", "product": "OpenSSH", "introduced": "5.0", "fixed": "7.3"},
+    {"id": "B", "product": "openssh", "introduced": "7.0", "fixed": None, "severity": "critical", "cvss": 9.8},
+    {"id": "C", "product": "apache", "introduced": "2.4.49", "fixed": "2.4.50"},
+]}
+
+def test_database_matches_ranges_and_caches():
+    database = VulnerabilityDatabase.from_data(DATA, cache_size=2)
+    assert [a.id for a in database.match("openssh", "7.2")] == ["A", "B"]
+    assert [a.id for a in database.match("openssh", "7.3")] == ["B"]
+    assert database.match("openssh", "4.9") == ()
+    assert database.match("inconnu", "1.0") == ()
+    assert len(database._cache) == 2
+    assert database.match("openssh", "7.3") is database.match("openssh", "7.3")
+    services = [{"product": "apache", "version": "2.4.49"}, {"product": "apache", "version": "2.4.50"}]
+    assert [(s["version"], [a.id for a in found]) for s, found in database.match_services(services)] \
+        == [("2.4.49", ["C"])]
+
+def test_bundled_database_and_simulated_check():
+    check = RealisticSimulator.simulate_vulnerability_check("10.0.0.7")
+    assert check == RealisticSimulator.simulate_vulnerability_check("10.0.0.7")
+    heartbleed = RealisticSimulator.simulate_vulnerability_check(
+        "x", services=[{"port": 443, "product": "openssl", "version": "1.0.1f"}])
+    assert "CVE-2014-0160" in [f["id"] for f in heartbleed["vulnerabilities"]]
+
+def test_discovered_targets_are_merged():
+    state = GameState()
+    state.update_state({"discovered_targets": {"10.0.0.1": {"services": {22: "ssh"}}}})
+    state.update_state({"discovered_targets": {"10.0.0.1": {"vulnerabilities": ["A"]}, "10.0.0.2": {}}})
+    assert state.discovered_targets == {"10.0.0.1": {"services": {22: "ssh"}, "vulnerabilities": ["A"]},
+                                        "10.0.0.2": {}}
+
+def test_vulnerability_scan_handler():
+    engine = CyberAttackEngine(seed=1)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    engine.handlers["scannervulnerabilites"].__self__.config["success_rate"] = 1.0
+    result = engine.execute_command("scannervulnerabilites", {"ip": "10.0.0.7"})
+    expected = RealisticSimulator.simulate_vulnerability_check("10.0.0.7")
+    assert len(result.data["Vulnérabilités"]) == len(expected["vulnerabilities"])
+    target = engine.game_state.discovered_targets["10.0.0.7"]
+    assert target["vulnerabilities"] == [f["id"] for f in expected["vulnerabilities"]]
+    assert "VULNS_SCANNED" in engine.flags
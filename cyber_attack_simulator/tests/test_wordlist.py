@@ -0,0 +1,71 @@
+import pytest
+
+from cyber_attack_simulator.command_handler_factory import CommandHandlerFactory
+from cyber_attack_simulator.game_engine import CyberAttackEngine
+from cyber_attack_simulator.utils.wordlist import (BloomFilter, Wordlist, WordlistError,
+                                                   iter_line_chunks, resolve_wordlist)
+
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("# commentaire\nAdmin\nadmin\n\nbackup\nx\nverylongword-to-split\nlast", encoding="utf-8")
+    return str(path)
+
+def test_chunks_keep_whole_lines(wordlist, tmp_path):
+    # Blocs plus petits que certaines lignes, fichier sans saut de ligne final
+    lines = [line for _, chunk in iter_line_chunks(wordlist, chunk_size=4) for line in chunk]
+    assert lines == ["# commentaire", "Admin", "admin", "", "backup", "x", "verylongword-to-split", "last"]
+    empty = tmp_path / "vide.txt"
+    empty.write_bytes(b"")
+    assert list(iter_line_chunks(str(empty))) == []
+
+def test_pipeline_stages(wordlist):
+    words = list(Wordlist(wordlist, chunk_size=8).mutate(["lower"], keep_original=False)
+                 .length(2, 10).dedupe())
+    assert words == ["admin", "backup", "last"]
+    variants = list(Wordlist(wordlist).match("[a-z]+").mutate(["suffix:-dev", "digits:1"]).limit(5))
+    assert variants == ["admin", "admin-dev", "admin0", "admin1", "admin2"]
+    with pytest.raises(WordlistError):
+        Wordlist(wordlist).mutate(["inconnue"])
+
+def test_progress_reports_bytes_and_candidates(wordlist):
+    reports = []
+    pipeline = Wordlist(wordlist, chunk_size=16, progress=lambda p: reports.append((p.bytes_read, p.fraction)))
+    words = list(pipeline)
+    assert len(reports) > 1 and reports[-1][1] == 1.0
+    assert [position for position, _ in reports] == sorted(position for position, _ in reports)
+    assert pipeline.progress.lines == 8 and pipeline.progress.candidates == len(words) == 6
+
+def test_bloom_filter_never_forgets():
+    bloom = BloomFilter(bits=1 << 12)
+    assert sum(bloom.add(f"mot{n}") for n in range(200)) >= 195
+    assert not any(bloom.add(f"mot{n}") for n in range(200))
+    assert len(bloom.bits) == 512
+
+def test_dedupe_is_stable_and_restarts_with_each_iteration(wordlist):
+    pipeline = Wordlist(wordlist).mutate(["lower"], keep_original=False).dedupe()
+    assert list(pipeline) == list(pipeline) == ["admin", "backup", "x", "verylongword-to-split", "last"]
+    # Mêmes bits d'un processus à l'autre (hachage indépendant de PYTHONHASHSEED)
+    bloom = BloomFilter(bits=1 << 12)
+    bloom.add("admin")
+    assert [i for i, byte in enumerate(bloom.bits) if byte] == [24, 77, 130, 430, 483]
+
+def test_resolve_stays_in_wordlist_dir(wordlist):
+    assert resolve_wordlist("subdomains").endswith("subdomains.txt")
+    with pytest.raises(WordlistError):
+        resolve_wordlist(wordlist)
+    assert resolve_wordlist(wordlist, allow_paths=True) == wordlist
+
+def test_subdomain_handler_streams_wordlist():
+    engine = CyberAttackEngine(seed=3)
+    CommandHandlerFactory(engine).initialize_all_handlers()
+    handler = engine.handlers["trouversousdomaines"].__self__
+    handler.config["success_rate"] = 1.0
+    result = engine.execute_command("trouversousdomaines", {"domaine": "example.com"})
+    assert result.data["Subdomains"][:4] == ["www.example.com", "mail.example.com", "dev.example.com",
+                                              "api.example.com"]
+    assert result.data["Candidats testés"] > 100
+    assert result.data["Trouvés"] >= len(result.data["Subdomains"])
+    missing = engine.execute_command("trouversousdomaines", {"domaine": "example.org", "wordlist": "/etc/passwd"})
+    assert not missing["success"] and "introuvable" in missing["output"]
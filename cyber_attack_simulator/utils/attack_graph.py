@@ -0,0 +1,204 @@
+# utils/attack_graph.py
+import heapq
+
+ROOT = "attaquant"
+INFINITY = float("inf")
+
+# Commande qui franchit chaque type d'arête : son `risk` au catalogue en est le coût
+EDGE_COMMANDS = {
+    "exploit": "exploiter",
+    "dump": "extrairecredentials",
+    "login": "pivoter",
+    "trust": "pivoter",
+}
+# Coûts de repli quand le catalogue n'est pas disponible
+DEFAULT_EDGE_RISKS = {"exploiter": 0.35, "extrairecredentials": 0.3, "pivoter": 0.25}
+# Ports qui désignent le rôle d'un hôte
+ROLE_PORTS = {88: "dc"}
+
+
+def host_node(ip: str) -> str:
+    return f"hote:{ip}"
+
+
+def service_node(ip: str, port) -> str:
+    return f"service:{ip}:{port}"
+
+
+def credential_node(credential: dict) -> str:
+    return f"cred:{credential['user']}@{credential.get('realm', '')}"
+
+
+class AttackGraph:
+    """
+    Graphe d'attaque de la session : hôtes, services, identifiants et relations de confiance.
+
+    Les plus courts chemins depuis l'attaquant (pondérés par le risque de détection
+    des commandes) sont maintenus à chaque insertion d'arête : seuls les nœuds dont la
+    distance baisse sont revisités, par un Dijkstra partant de l'extrémité de l'arête.
+    Accessibilité et coût sont donc lus en O(1) et un chemin en O(longueur), quelle que
+    soit la taille du graphe. Les arêtes ne font que s'ajouter ou devenir moins chères.
+    """
+    __slots__ = ("catalog", "ids", "names", "edges", "costs", "dist", "parent", "parent_label",
+                 "roles", "relaxed")
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog
+        self.clear()
+
+    def clear(self):
+        self.ids = {}
+        self.names = []
+        self.edges = []          # Par nœud : liste de (destination, coût, libellé)
+        self.costs = {}          # (origine, destination, libellé) -> coût retenu
+        self.dist = []
+        self.parent = []
+        self.parent_label = []
+        self.roles = {}          # rôle -> ensemble d'IPs
+        self.relaxed = 0         # Nœuds revisités par les insertions (instrumentation)
+        self.dist[self.node(ROOT)] = 0.0
+
+    def __len__(self):
+        return len(self.names)
+
+    def edge_count(self) -> int:
+        return len(self.costs)
+
+    def node(self, name: str) -> int:
+        node_id = self.ids.get(name)
+        if node_id is None:
+            node_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.edges.append([])
+            self.dist.append(INFINITY)
+            self.parent.append(-1)
+            self.parent_label.append(None)
+        return node_id
+
+    def risk(self, kind: str) -> float:
+        command = EDGE_COMMANDS[kind]
+        spec = self.catalog.get(command) if self.catalog is not None else None
+        return spec.risk if spec is not None else DEFAULT_EDGE_RISKS[command]
+
+    # --- Insertions ---
+
+    def add_edge(self, source: str, target: str, cost: float, label: str = None) -> bool:
+        """Ajoute (ou rend moins chère) une arête. Retourne True si des distances ont baissé."""
+        u, v = self.node(source), self.node(target)
+        key = (u, v, label)
+        known = self.costs.get(key)
+        if known is not None and known <= cost:
+            return False
+        self.costs[key] = cost
+        self.edges[u].append((v, cost, label))
+        candidate = self.dist[u] + cost
+        if candidate >= self.dist[v]:
+            return False
+        self.dist[v] = candidate
+        self.parent[v] = u
+        self.parent_label[v] = label
+        self._propagate(v)
+        return True
+
+    def _propagate(self, start: int):
+        dist, parent, parent_label, edges = self.dist, self.parent, self.parent_label, self.edges
+        heap = [(dist[start], start)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            self.relaxed += 1
+            for v, cost, label in edges[u]:
+                candidate = d + cost
+                if candidate < dist[v]:
+                    dist[v] = candidate
+                    parent[v] = u
+                    parent_label[v] = label
+                    heapq.heappush(heap, (candidate, v))
+
+    def ingest(self, targets: dict):
+        """
+        Intègre un delta de `discovered_targets` ({ip: infos}).
+
+        Clés reconnues : `ports`/`services` (services joignables), `exploits`
+        ([{id, port}]), `compromised`, `credentials` ([{user, realm, valid_on}]) et
+        `trusts` (IPs auxquelles l'hôte donne accès).
+        """
+        for ip, info in targets.items():
+            host = host_node(ip)
+            self.node(host)
+            ports = list(info.get("ports") or ())
+            ports.extend(info.get("services") or ())
+            for port in ports:
+                port = int(port)
+                self.add_edge(ROOT, service_node(ip, port), 0.0, "accès réseau")
+                role = ROLE_PORTS.get(port)
+                if role is not None:
+                    self.roles.setdefault(role, set()).add(ip)
+            if info.get("role"):
+                self.roles.setdefault(info["role"], set()).add(ip)
+            for exploit in info.get("exploits") or ():
+                self.add_edge(service_node(ip, exploit["port"]), host, self.risk("exploit"),
+                              f"exploiter {exploit['id']}")
+            for credential in info.get("credentials") or ():
+                name = credential_node(credential)
+                self.add_edge(host, name, self.risk("dump"), "extrairecredentials")
+                for other in credential.get("valid_on") or ():
+                    self.add_edge(name, host_node(other), self.risk("login"), f"pivoter {credential['user']}")
+            for other in info.get("trusts") or ():
+                self.add_edge(host, host_node(other), self.risk("trust"), "relation de confiance")
+            if info.get("compromised"):
+                self.add_edge(ROOT, host, 0.0, "contrôlé")
+
+    # --- Requêtes ---
+
+    def _resolve(self, target: str) -> int:
+        """Nœud d'une cible : nom de nœud, IP, ou rôle (nœud le moins coûteux de ce rôle)."""
+        for name in (target, host_node(target)):
+            node_id = self.ids.get(name)
+            if node_id is not None:
+                return node_id
+        hosts = [self.ids[host_node(ip)] for ip in self.roles.get(target, ())]
+        return min(hosts, key=self.dist.__getitem__, default=None)
+
+    def reachable(self, target: str) -> bool:
+        node_id = self._resolve(target)
+        return node_id is not None and self.dist[node_id] < INFINITY
+
+    def cost(self, target: str) -> float:
+        node_id = self._resolve(target)
+        return self.dist[node_id] if node_id is not None else INFINITY
+
+    def path(self, target: str):
+        """Étapes [(nœud, action, coût cumulé)] du chemin le moins risqué, ou None."""
+        node_id = self._resolve(target)
+        if node_id is None or self.dist[node_id] == INFINITY:
+            return None
+        steps = []
+        while node_id != 0:
+            steps.append((self.names[node_id], self.parent_label[node_id], self.dist[node_id]))
+            node_id = self.parent[node_id]
+        steps.reverse()
+        return steps
+
+    def reachable_count(self) -> int:
+        return sum(1 for d in self.dist if d < INFINITY)
+
+
+def attack_graph_ingest(engine, command: str, params: dict, result):
+    """Crochet post : les cibles découvertes par une commande réussie alimentent le graphe."""
+    graph = engine.attack_graph
+    if graph is not None and result.get("success"):
+        new_state = result.get("new_state")
+        if isinstance(new_state, dict) and isinstance(new_state.get("discovered_targets"), dict):
+            graph.ingest(new_state["discovered_targets"])
+    return None
+
+
+def attach_attack_graph(engine) -> AttackGraph:
+    """Branche le graphe d'attaque sur un moteur (crochet post du middleware)."""
+    engine.attack_graph = AttackGraph(engine.catalog)
+    engine.attack_graph.ingest(engine.game_state.discovered_targets)
+    if "attack_graph" not in engine.middleware:
+        engine.add_middleware("attack_graph", post=attack_graph_ingest)
+    return engine.attack_graph
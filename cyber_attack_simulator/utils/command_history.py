@@ -0,0 +1,250 @@
+# utils/command_history.py
+import json
+import sys
+from array import array
+
+DEFAULT_HISTORY_CAPACITY = 1000
+HISTORY_BLOCK = 64  # Entrées par bloc de colonnes (unité de copie des branches)
+
+# --- Internement des noms de commandes et des schémas de paramètres ---
+# Partagés par toutes les sessions du processus : chaque entrée d'historique ne
+# stocke que deux entiers et un tuple de valeurs au lieu d'un dict complet.
+
+_COMMAND_IDS = {}
+_COMMAND_NAMES = []
+_LAYOUT_IDS = {}
+_LAYOUTS = []
+
+
+def intern_command(command: str) -> int:
+    """Retourne l'identifiant entier (stable dans le processus) d'un nom de commande."""
+    command_id = _COMMAND_IDS.get(command)
+    if command_id is None:
+        command_id = len(_COMMAND_NAMES)
+        _COMMAND_IDS[command] = command_id
+        _COMMAND_NAMES.append(sys.intern(command))
+    return command_id
+
+
+def command_name(command_id: int) -> str:
+    return _COMMAND_NAMES[command_id]
+
+
+def compact_params(params: dict) -> tuple:
+    """Encode un dict de paramètres en (id de schéma, tuple de valeurs)."""
+    if not params:
+        return 0, ()
+    keys = tuple(params)
+    layout_id = _LAYOUT_IDS.get(keys)
+    if layout_id is None:
+        layout_id = len(_LAYOUTS)
+        _LAYOUT_IDS[keys] = layout_id
+        _LAYOUTS.append(keys)
+    values = tuple(sys.intern(v) if type(v) is str else v for v in params.values())
+    return layout_id, values
+
+
+def expand_params(layout_id: int, values: tuple) -> dict:
+    """Reconstruit le dict de paramètres encodé par `compact_params`."""
+    if not values:
+        return {}
+    return dict(zip(_LAYOUTS[layout_id], values))
+
+
+# Le schéma 0 est réservé aux paramètres vides
+_LAYOUT_IDS[()] = 0
+_LAYOUTS.append(())
+
+
+def deep_getsizeof(obj, seen: set = None) -> int:
+    """Taille mémoire approximative d'un objet et de son contenu (conteneurs standards)."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_getsizeof(k, seen) + deep_getsizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_getsizeof(item, seen) for item in obj)
+    elif hasattr(obj, "memory_usage") and not isinstance(obj, type):
+        size = obj.memory_usage(seen)
+    return size
+
+
+class CommandHistory:
+    """
+    Historique de commandes en tampon circulaire colonne par colonne.
+
+    Seules les `capacity` dernières entrées restent en mémoire ; les plus anciennes
+    sont, si `spill_path` est fourni, ajoutées à un fichier JSON-lines avant d'être
+    écrasées. L'accès par index retourne un dict {"command": ..., "params": ...}.
+    Les colonnes sont découpées en blocs de HISTORY_BLOCK entrées, partagés entre un
+    historique et ses branches (`fork`) jusqu'à leur première écriture.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_CAPACITY, spill_path: str = None,
+                 spill_batch: int = 256):
+        if capacity <= 0:
+            raise ValueError("La capacité de l'historique doit être positive")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_batch = spill_batch
+        self._spill_buffer = []
+        self.total = 0  # Nombre total d'entrées ajoutées depuis la création
+        self._blocks = []  # Par bloc : (ids de commande, ids de schéma, valeurs)
+        self._owned = []   # False : bloc encore partagé avec une branche
+        self._size = 0
+        self._head = 0  # Position de l'entrée la plus ancienne une fois le tampon plein
+
+    def __len__(self):
+        return self._size
+
+    def append(self, entry: dict):
+        """Ajoute une entrée au format {"command": ..., "params": ...}."""
+        self.record(entry["command"], entry.get("params") or {})
+
+    def record(self, command: str, params: dict):
+        command_id = intern_command(command)
+        layout_id, values = compact_params(params)
+        self.total += 1
+
+        size = self._size
+        if size < self.capacity:
+            block_index, offset = divmod(size, HISTORY_BLOCK)
+            if offset == 0:
+                self._blocks.append((array('i'), array('i'), []))
+                self._owned.append(True)
+            command_ids, layout_ids, column = self._writable(block_index)
+            command_ids.append(command_id)
+            layout_ids.append(layout_id)
+            column.append(values)
+            self._size = size + 1
+            return
+
+        head = self._head
+        if self.spill_path:
+            self._spill(head)
+        block_index, offset = divmod(head, HISTORY_BLOCK)
+        command_ids, layout_ids, column = self._writable(block_index)
+        command_ids[offset] = command_id
+        layout_ids[offset] = layout_id
+        column[offset] = values
+        self._head = (head + 1) % self.capacity
+
+    def _writable(self, block_index: int) -> tuple:
+        """Bloc modifiable en place, copié d'abord s'il est encore partagé."""
+        block = self._blocks[block_index]
+        if not self._owned[block_index]:
+            command_ids, layout_ids, column = block
+            block = self._blocks[block_index] = (array('i', command_ids), array('i', layout_ids), list(column))
+            self._owned[block_index] = True
+        return block
+
+    def _slot(self, index: int) -> int:
+        size = self._size
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("index d'historique hors limites")
+        return (self._head + index) % self.capacity if size == self.capacity else index
+
+    def _entry(self, slot: int) -> dict:
+        command_ids, layout_ids, column = self._blocks[slot // HISTORY_BLOCK]
+        offset = slot % HISTORY_BLOCK
+        return {
+            "command": _COMMAND_NAMES[command_ids[offset]],
+            "params": expand_params(layout_ids[offset], column[offset]),
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._entry(self._slot(index))
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self._entry(self._slot(index))
+
+    def command_at(self, index: int) -> str:
+        """Nom de la commande à un index, sans reconstruire les paramètres."""
+        slot = self._slot(index)
+        return _COMMAND_NAMES[self._blocks[slot // HISTORY_BLOCK][0][slot % HISTORY_BLOCK]]
+
+    # --- Branches (copie sur écriture) ---
+
+    def fork(self) -> "CommandHistory":
+        """
+        Branche de l'historique en O(capacité / HISTORY_BLOCK) : les blocs sont partagés et
+        seul le bloc écrit est copié, par l'une ou l'autre branche. La branche ne déborde
+        jamais sur disque.
+        """
+        history = CommandHistory.__new__(CommandHistory)
+        history.__dict__.update(self.__dict__)
+        history.spill_path = None
+        history._spill_buffer = []
+        history._blocks = list(self._blocks)
+        history._owned = [False] * len(self._blocks)
+        self._owned = [False] * len(self._blocks)
+        return history
+
+    # --- Instantanés ---
+
+    def snapshot(self) -> dict:
+        """État sérialisable, indépendant des identifiants internés du processus."""
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "entries": [(entry["command"], entry["params"]) for entry in self],
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, spill_path: str = None) -> "CommandHistory":
+        history = cls(snapshot["capacity"], spill_path)
+        for command, params in snapshot["entries"]:
+            history.record(command, params)
+        history.total = snapshot["total"]
+        return history
+
+    # --- Débordement sur disque ---
+
+    def _spill(self, slot: int):
+        self._spill_buffer.append(self._entry(slot))
+        if len(self._spill_buffer) >= self.spill_batch:
+            self.flush()
+
+    def flush(self):
+        """Écrit sur disque les entrées évincées encore en attente."""
+        if not self._spill_buffer:
+            return
+        with open(self.spill_path, 'a', encoding='utf-8') as f:
+            f.writelines(json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+                         for entry in self._spill_buffer)
+        self._spill_buffer.clear()
+
+    def iter_all(self):
+        """Itère sur tout l'historique, y compris les entrées déversées sur disque."""
+        if self.spill_path:
+            self.flush()
+            try:
+                with open(self.spill_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        yield json.loads(line)
+            except FileNotFoundError:
+                pass
+        yield from self
+
+    def memory_usage(self, seen: set = None) -> int:
+        """Taille mémoire approximative de l'historique en octets."""
+        if seen is None:
+            seen = set()
+        seen.add(id(self))
+        size = sys.getsizeof(self) + sys.getsizeof(self._blocks)
+        for block in self._blocks:
+            # Les blocs partagés avec une branche déjà mesurée ne comptent qu'une fois
+            if id(block) not in seen:
+                seen.add(id(block))
+                command_ids, layout_ids, column = block
+                size += sys.getsizeof(command_ids) + sys.getsizeof(layout_ids) + deep_getsizeof(column, seen)
+        return size
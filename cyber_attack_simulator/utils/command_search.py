@@ -0,0 +1,170 @@
+# utils/command_search.py
+import bisect
+import re
+import unicodedata
+
+import numpy as np
+
+# Poids de chaque champ dans la fréquence d'un terme (BM25F simplifié)
+FIELD_WEIGHTS = {"name": 3.0, "category": 2.0, "flags": 2.0, "description": 1.0}
+# Suffixes des noms composés (« scannervulnerabilites » -> « vulnerabilites »), hors longueur BM25
+NAME_PART_WEIGHT = 1.0
+K1 = 1.2
+B = 0.75
+# Un terme de requête couvre aussi les termes qu'il préfixe (« resoudre » -> « resoudredns »)
+PREFIX_WEIGHT = 0.5
+MIN_PREFIX = 3
+MAX_EXPANSIONS = 64
+STOPWORDS = frozenset(("a", "au", "aux", "d", "de", "des", "du", "en", "et", "l", "la", "le", "les",
+                       "par", "pour", "sur", "un", "une", "via"))
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_LIGATURES = str.maketrans({"œ": "oe", "æ": "ae", "ß": "ss"})
+
+
+def fold(text: str) -> str:
+    """Minuscules sans accents : « Résolution » -> « resolution »."""
+    text = text.lower()
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFKD", text.translate(_LIGATURES)).encode("ascii", "ignore").decode("ascii")
+
+
+def _stem(token: str) -> str:
+    """Pluriels réguliers : « ports » et « port » donnent le même terme."""
+    return token[:-1] if len(token) > 4 and token[-1] in "sx" else token
+
+
+def _words(text: str) -> list:
+    return [token for token in _TOKEN.findall(fold(text)) if token not in STOPWORDS]
+
+
+def tokenize(text: str) -> list:
+    """Termes indexés d'un texte (repliés, sans mots vides ; `_` et `-` séparent les mots)."""
+    return [_stem(word) for word in _words(text)]
+
+
+def name_parts(name: str) -> list:
+    """Suffixes d'au moins MIN_PREFIX lettres des mots d'un nom de commande."""
+    return [_stem(word[start:]) for word in _words(name) for start in range(1, len(word) - MIN_PREFIX + 1)]
+
+
+def _fields(spec) -> tuple:
+    """Couples (poids, texte) des champs indexés d'une commande."""
+    return ((FIELD_WEIGHTS["name"], spec.name),
+            (FIELD_WEIGHTS["category"], spec.category),
+            (FIELD_WEIGHTS["flags"], " ".join(spec.flags)),
+            (FIELD_WEIGHTS["description"], spec.description))
+
+
+class CommandIndex:
+    """
+    Index inversé du catalogue : nom, catégorie, flags et description de chaque commande.
+
+    Les listes d'occurrences sont stockées à plat (CSR) et triées par terme ; le poids
+    BM25 de chaque occurrence est calculé à la construction, si bien qu'une requête se
+    résume à additionner quelques tranches de tableau puis à garder les meilleurs scores.
+    Le vocabulaire trié permet d'étendre un terme à ceux qu'il préfixe.
+    """
+    __slots__ = ("vocabulary", "offsets", "docs", "weights", "size", "_terms")
+
+    def __init__(self, vocabulary, offsets, docs, weights, size: int):
+        self.vocabulary = list(vocabulary)
+        self.offsets = offsets
+        self.docs = docs
+        self.weights = weights
+        self.size = size
+        self._terms = {term: term_id for term_id, term in enumerate(self.vocabulary)}
+
+    def __len__(self):
+        return len(self.vocabulary)
+
+    @classmethod
+    def build(cls, specs) -> "CommandIndex":
+        term_ids, doc_ids, frequencies = [], [], []
+        ids = {}
+        lengths = np.zeros(len(specs), dtype=np.float64)
+        for doc, spec in enumerate(specs):
+            counts = {}
+            length = 0.0
+            for weight, text in _fields(spec):
+                for term in tokenize(text):
+                    counts[term] = counts.get(term, 0.0) + weight
+                    length += weight
+            lengths[doc] = length
+            for part in name_parts(spec.name):
+                counts[part] = counts.get(part, 0.0) + NAME_PART_WEIGHT
+            for term, frequency in counts.items():
+                term_id = ids.get(term)
+                if term_id is None:
+                    term_id = ids[term] = len(ids)
+                term_ids.append(term_id)
+                doc_ids.append(doc)
+                frequencies.append(frequency)
+
+        # Identifiants renumérotés dans l'ordre alphabétique du vocabulaire
+        vocabulary = sorted(ids)
+        rank = np.empty(len(ids), dtype=np.int64)
+        rank[[ids[term] for term in vocabulary]] = np.arange(len(vocabulary))
+        terms = rank[np.asarray(term_ids, dtype=np.int64)]
+        docs = np.asarray(doc_ids, dtype=np.int32)
+        tf = np.asarray(frequencies, dtype=np.float64)
+        order = np.lexsort((docs, terms))
+        terms, docs, tf = terms[order], docs[order], tf[order]
+
+        df = np.bincount(terms, minlength=len(vocabulary))
+        offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(df, out=offsets[1:])
+        n = len(specs)
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        average = lengths.mean() if n else 1.0
+        norm = K1 * (1 - B + B * lengths[docs] / average)
+        weights = (idf[terms] * tf * (K1 + 1) / (tf + norm)).astype(np.float32)
+        return cls(vocabulary, offsets, docs, weights, n)
+
+    # --- Sérialisation (cache du catalogue) ---
+
+    def to_state(self) -> tuple:
+        return self.vocabulary, self.offsets, self.docs, self.weights, self.size
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "CommandIndex":
+        return cls(*state)
+
+    # --- Requêtes ---
+
+    def _expand(self, term: str) -> list:
+        """(id de terme, facteur) : le terme exact, puis les termes du vocabulaire qu'il préfixe."""
+        matches = []
+        term_id = self._terms.get(term)
+        if term_id is not None:
+            matches.append((term_id, 1.0))
+        if len(term) >= MIN_PREFIX:
+            vocabulary = self.vocabulary
+            start = bisect.bisect_right(vocabulary, term)
+            end = min(bisect.bisect_left(vocabulary, term + "\x7f", start), start + MAX_EXPANSIONS)
+            matches.extend((other, PREFIX_WEIGHT) for other in range(start, end))
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """Couples (score, index de commande) des meilleures commandes, par score décroissant."""
+        scores = None
+        offsets, docs, weights = self.offsets, self.docs, self.weights
+        for term in dict.fromkeys(tokenize(query)):
+            for term_id, factor in self._expand(term):
+                start, end = offsets[term_id], offsets[term_id + 1]
+                if scores is None:
+                    scores = np.zeros(self.size, dtype=np.float32)
+                # Une commande apparaît au plus une fois par liste : l'indexation groupée suffit
+                scores[docs[start:end]] += factor * weights[start:end]
+        if scores is None or limit <= 0:
+            return []
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            # Sélection partielle ; à score égal, les premières commandes du catalogue l'emportent
+            values = scores[matched]
+            kth = np.partition(values, len(values) - limit)[len(values) - limit]
+            above = matched[values > kth]
+            matched = np.concatenate((above, matched[values == kth][:limit - len(above)]))
+        matched = matched[np.lexsort((matched, -scores[matched]))]
+        return [(float(scores[doc]), int(doc)) for doc in matched]
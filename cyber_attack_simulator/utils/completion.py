@@ -0,0 +1,299 @@
+# utils/completion.py
+import bisect
+
+
+def _pattern_bits(pattern: str) -> dict:
+    """Masques de bits par caractère du motif (algorithme bit-parallèle de Myers)."""
+    peq = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
+
+
+def _myers_distance(peq: dict, m: int, text: str, max_distance: int = None) -> int:
+    """
+    Distance d'édition entre un motif (prétraité en `peq`, longueur `m`) et `text`.
+
+    Version bit-parallèle de Myers/Hyyrö : une colonne entière de la matrice de
+    programmation dynamique est mise à jour par quelques opérations sur entiers.
+    """
+    if m == 0:
+        return len(text)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    remaining = len(text)
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+        remaining -= 1
+        # Chaque caractère restant ne peut faire baisser la distance que de 1
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+def levenshtein(a: str, b: str, max_distance: int = None) -> int:
+    """
+    Distance d'édition entre deux chaînes.
+
+    Si `max_distance` est fourni, le calcul s'arrête dès que la distance le dépasse
+    et retourne `max_distance + 1`.
+    """
+    if a == b:
+        return 0
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    return _myers_distance(_pattern_bits(a), len(a), b, max_distance)
+
+
+class PrefixTrie:
+    """
+    Trie de préfixes sur une liste triée de mots.
+
+    Chaque nœud mémorise l'intervalle [début, fin) des mots qui commencent par son
+    préfixe dans la liste triée : une complétion coûte O(longueur du préfixe) plus
+    la taille du résultat, sans parcourir le sous-arbre.
+    """
+    __slots__ = ("words", "root")
+
+    def __init__(self, words):
+        self.words = sorted(set(words))
+        # Nœud : [enfants, début, fin]
+        self.root = [{}, 0, len(self.words)]
+        for index, word in enumerate(self.words):
+            node = self.root
+            for char in word:
+                child = node[0].get(char)
+                if child is None:
+                    child = node[0][char] = [{}, index, index + 1]
+                else:
+                    child[2] = index + 1
+                node = child
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        index = bisect.bisect_left(self.words, word)
+        return index < len(self.words) and self.words[index] == word
+
+    def complete(self, prefix: str, limit: int = None) -> list:
+        """Mots commençant par `prefix`, triés alphabétiquement."""
+        node = self.root
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return []
+        end = node[2] if limit is None else min(node[2], node[1] + limit)
+        return self.words[node[1]:end]
+
+    def common_prefix(self, prefix: str) -> str:
+        """Plus long préfixe commun des complétions (pour compléter d'un coup de tabulation)."""
+        node = self.root
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return prefix
+        extended = prefix
+        while len(node[0]) == 1 and node[2] - node[1] > 0:
+            # Arrêt si un mot se termine exactement ici
+            if self.words[node[1]] == extended:
+                break
+            char, node = next(iter(node[0].items()))
+            extended += char
+        return extended
+
+
+class BKTree:
+    """Arbre BK pour retrouver les mots proches au sens de la distance d'édition."""
+    __slots__ = ("root", "size")
+
+    def __init__(self, words=()):
+        self.root = None  # Nœud : (mot, {distance: enfant})
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        if self.root is None:
+            self.root = (word, {})
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list:
+        """Retourne les couples (distance, mot) à distance <= max_distance, du plus proche au plus lointain."""
+        if self.root is None:
+            return []
+        peq, m = _pattern_bits(word), len(word)
+        matches = []
+        stack = [self.root]
+        while stack:
+            candidate, children = stack.pop()
+            distance = _myers_distance(peq, m, candidate)
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        matches.sort()
+        return matches
+
+
+class DeletionIndex:
+    """
+    Index des voisinages par suppression d'un caractère (approche « symmetric delete »).
+
+    Deux mots dont l'un s'obtient de l'autre par une substitution, une insertion, une
+    suppression ou une inversion de lettres voisines partagent une variante à une
+    suppression près : les fautes de frappe courantes se retrouvent en quelques
+    accès dict, sans calcul de distance sur tout le catalogue.
+    """
+    __slots__ = ("variants",)
+
+    def __init__(self, words=()):
+        self.variants = {}
+        for word in words:
+            for variant in self._deletes(word):
+                bucket = self.variants.get(variant)
+                if bucket is None:
+                    self.variants[variant] = word
+                elif isinstance(bucket, list):
+                    bucket.append(word)
+                elif bucket != word:
+                    # Une chaîne seule évite une liste par clé : la plupart des variantes sont uniques
+                    self.variants[variant] = [bucket, word]
+
+    @staticmethod
+    def _deletes(word: str) -> set:
+        variants = {word[:i] + word[i + 1:] for i in range(len(word))}
+        variants.add(word)
+        return variants
+
+    def candidates(self, word: str) -> set:
+        found = set()
+        for variant in self._deletes(word):
+            bucket = self.variants.get(variant)
+            if bucket is None:
+                continue
+            if isinstance(bucket, list):
+                found.update(bucket)
+            else:
+                found.add(bucket)
+        return found
+
+
+class CommandCompleter:
+    """Complétion des noms de commandes et de paramètres, et suggestions en cas de faute de frappe."""
+
+    def __init__(self, command_metadata: dict):
+        self.command_metadata = command_metadata
+        self.trie = PrefixTrie(command_metadata)
+        self.deletions = DeletionIndex(self.trie.words)
+        self._bktree = None
+
+    @property
+    def bktree(self) -> BKTree:
+        """Arbre BK construit à la première faute lourde (rarement nécessaire)."""
+        if self._bktree is None:
+            self._bktree = BKTree(self.trie.words)
+        return self._bktree
+
+    @classmethod
+    def from_engine(cls, engine) -> "CommandCompleter":
+        return cls(engine.command_metadata)
+
+    def complete_command(self, prefix: str, limit: int = None) -> list:
+        return self.trie.complete(prefix, limit)
+
+    def complete_params(self, command: str, args: list) -> list:
+        """Noms des paramètres positionnels restants pour une commande (ex. ['<domaine>', '<type>'])."""
+        param_names = self.command_metadata.get(command) or []
+        return [f"<{name}>" for name in param_names[len(args):]]
+
+    def complete(self, line: str, limit: int = None) -> list:
+        """Complétions pour une ligne saisie : nom de commande ou paramètre attendu."""
+        parts = line.split()
+        if not parts or (len(parts) == 1 and not line.endswith(" ")):
+            return self.complete_command(parts[0] if parts else "", limit)
+        args = parts[1:] if line.endswith(" ") else parts[1:-1]
+        return self.complete_params(parts[0], args)[:1]
+
+    def readline_matches(self, line: str, text: str) -> list:
+        """
+        Candidats readline pour le mot `text` qui termine `line` (ligne jusqu'au curseur).
+
+        Après le nom de commande, le paramètre attendu est proposé comme indication :
+        un candidat vide l'accompagne pour que readline l'affiche sans l'insérer.
+        """
+        parts = line.split()
+        if not parts or (len(parts) == 1 and text):
+            return self.complete_command(text)
+        if text:
+            return []  # Valeur de paramètre en cours de saisie : rien à compléter
+        hints = self.complete_params(parts[0], parts[1:])[:1]
+        return hints + [""] if hints else []
+
+    def suggest(self, name: str, limit: int = 3, max_distance: int = None) -> list:
+        """Commandes les plus proches d'un nom inconnu, de la plus probable à la moins probable."""
+        if max_distance is None:
+            max_distance = 2 if len(name) < 12 else 3
+        peq, m = _pattern_bits(name), len(name)
+        ranked = sorted((_myers_distance(peq, m, word), word) for word in self.deletions.candidates(name))
+        ranked = [(distance, word) for distance, word in ranked if distance <= max_distance]
+        if not ranked:
+            # Faute plus lourde : recherche par rayon croissant dans l'arbre BK, arrêtée
+            # au premier rayon qui donne un résultat (les plus proches d'abord)
+            for radius in range(2, max_distance + 1):
+                ranked = self.bktree.search(name, radius)
+                if ranked:
+                    break
+        suggestions = [word for _, word in ranked]
+        # Un préfixe exact (« resoudre » -> « resoudredns ») est aussi une bonne suggestion
+        for word in self.trie.complete(name, limit):
+            if word not in suggestions:
+                suggestions.append(word)
+        return suggestions[:limit]
+
+
+def install_readline_completer(completer: CommandCompleter) -> bool:
+    """Active la complétion par tabulation dans le REPL si le module readline est disponible."""
+    try:
+        import readline
+    except ImportError:
+        return False
+
+    matches = []
+
+    def complete(text: str, state: int):
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_endidx()]
+            matches[:] = completer.readline_matches(line, text)
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+    return True
@@ -0,0 +1,557 @@
+# utils/directory.py
+import bisect
+import random
+import zlib
+
+import numpy as np
+
+DEFAULT_DIRECTORY_SEED = 1337
+DEFAULT_DOMAIN = "corp.local"
+DEFAULT_PAGE_SIZE = 100
+FILTER_CACHE_SIZE = 256
+IN_CHAIN_RULE = "1.2.840.113556.1.4.1941"  # LDAP_MATCHING_RULE_IN_CHAIN (appartenance transitive)
+
+OBJECT_CLASSES = ("group", "user", "computer")
+OBJECT_OUS = {"group": "Groupes", "user": "Utilisateurs", "computer": "Ordinateurs"}
+FIRST_NAMES = ("alice", "bruno", "camille", "david", "emma", "farid", "gabriel", "hugo", "ines", "jules",
+               "karim", "lea", "louis", "manon", "nathan", "olivia", "paul", "quentin", "rose", "sarah",
+               "thomas", "ugo", "victor", "yasmine", "zoe", "antoine", "chloe", "eric", "julie", "marc")
+LAST_NAMES = ("martin", "bernard", "dubois", "thomas", "robert", "richard", "petit", "durand", "leroy",
+              "moreau", "simon", "laurent", "lefebvre", "michel", "garcia", "david", "bertrand", "roux",
+              "vincent", "fournier", "morel", "girard", "andre", "mercier", "dupont", "lambert", "bonnet",
+              "francois", "martinez", "legrand", "garnier", "faure", "rousseau", "blanc", "guerin", "muller")
+DEPARTMENTS = ("Finance", "RH", "IT", "Ventes", "Marketing", "Juridique", "Production", "Direction",
+               "Support", "Recherche")
+TITLES = ("Analyste", "Ingénieur", "Responsable", "Assistant", "Directeur", "Technicien", "Stagiaire",
+          "Consultant", "Administrateur")
+OPERATING_SYSTEMS = ("Windows 10 Entreprise", "Windows 11 Entreprise", "Windows Server 2016",
+                     "Windows Server 2019", "Windows Server 2022")
+SPN_SERVICES = ("MSSQLSvc", "HTTP", "CIFS", "exchangeMDB", "TERMSRV")
+ACCOUNT_CONTROL = ("512", "514")  # Compte actif, compte désactivé
+
+# Groupes intégrés (index 0..n-1) ; les premiers confèrent adminCount=1
+BUILTIN_GROUPS = ("Admins du domaine", "Administrateurs de l'entreprise", "Administrateurs",
+                  "Opérateurs de sauvegarde", "Utilisateurs du domaine", "Ordinateurs du domaine")
+PRIVILEGED_GROUPS = 4
+DOMAIN_USERS, DOMAIN_COMPUTERS = 4, 5
+DOMAIN_CONTROLLERS = 2
+EVERYONE = "Tout le monde"
+SHARE_NAMES = ("Partage", "Public", "Scripts", "Sauvegardes", "Projets", "Logiciels", "Finance", "RH")
+
+
+class DirectoryError(ValueError):
+    """Filtre LDAP invalide ou non pris en charge."""
+
+
+# --- Filtres LDAP (RFC 4515, sous-ensemble) ---
+
+def _unescape(value: str) -> str:
+    """Décode les échappements \\XX d'une valeur de filtre."""
+    if "\\" not in value:
+        return value
+    out, i = [], 0
+    while i < len(value):
+        if value[i] == "\\":
+            try:
+                out.append(chr(int(value[i + 1:i + 3], 16)))
+            except ValueError:
+                raise DirectoryError(f"Échappement invalide dans '{value}'") from None
+            i += 3
+        else:
+            out.append(value[i])
+            i += 1
+    return "".join(out)
+
+
+def parse_filter(text: str) -> tuple:
+    """
+    Analyse un filtre LDAP en arbre de tuples.
+
+    Nœuds : ("and", [...]), ("or", [...]), ("not", f), ("eq", attr, valeur),
+    ("present", attr), ("like", attr, segments) et ("chain", attr, valeur) pour la règle
+    d'appartenance transitive. Les segments d'un motif sont les morceaux littéraux
+    (échappements décodés) séparés par les `*` non échappés : "a\\2a*b*" donne
+    ("a*", "b", ""). Les attributs sont normalisés en minuscules.
+    """
+    text = text.strip()
+    if not text.startswith("("):
+        text = f"({text})"
+    node, end = _parse(text, 0)
+    if end != len(text):
+        raise DirectoryError(f"Caractères inattendus après le filtre : '{text[end:]}'")
+    return node
+
+
+def _parse(text: str, pos: int) -> tuple:
+    if pos >= len(text) or text[pos] != "(":
+        raise DirectoryError(f"'(' attendu en position {pos}")
+    pos += 1
+    if pos >= len(text):
+        raise DirectoryError("Filtre incomplet")
+    operator = text[pos]
+    if operator in "&|":
+        children, pos = [], pos + 1
+        while pos < len(text) and text[pos] == "(":
+            child, pos = _parse(text, pos)
+            children.append(child)
+        if not children:
+            raise DirectoryError(f"'{operator}' sans sous-filtre")
+        node = ("and" if operator == "&" else "or", children)
+    elif operator == "!":
+        child, pos = _parse(text, pos + 1)
+        node = ("not", child)
+    else:
+        end = text.find(")", pos)
+        if end < 0:
+            raise DirectoryError("')' manquante")
+        node = _parse_item(text[pos:end])
+        pos = end
+    if pos >= len(text) or text[pos] != ")":
+        raise DirectoryError(f"')' attendue en position {pos}")
+    return node, pos + 1
+
+
+def _parse_item(item: str) -> tuple:
+    attribute, sep, value = item.partition("=")
+    if not sep or not attribute:
+        raise DirectoryError(f"Comparaison invalide : '{item}'")
+    if attribute[-1] in "<>~":
+        raise DirectoryError(f"Opérateur non pris en charge : '{item}'")
+    if attribute.endswith(":"):
+        attribute, _, rule = attribute[:-1].partition(":")
+        if rule != IN_CHAIN_RULE:
+            raise DirectoryError(f"Règle de correspondance non prise en charge : '{rule}'")
+        return ("chain", attribute.lower(), _unescape(value))
+    attribute = attribute.lower()
+    if value == "*":
+        return ("present", attribute)
+    if "*" in value:
+        # Un `*` littéral s'écrit \2a : le découpage précède le décodage des échappements
+        return ("like", attribute, tuple(_unescape(part) for part in value.split("*")))
+    return ("eq", attribute, _unescape(value))
+
+
+def match_substrings(value: str, segments: tuple) -> bool:
+    """
+    Correspondance d'une valeur avec les segments d'un motif (RFC 4515, sans tenir compte
+    de la casse) : le premier segment préfixe la valeur, le dernier la termine, ceux du
+    milieu s'y suivent dans l'ordre. Aucun autre caractère n'est spécial.
+    """
+    value = value.lower()
+    first, *middle, last = (segment.lower() for segment in segments)
+    if not value.startswith(first):
+        return False
+    position = len(first)
+    for segment in middle:
+        found = value.find(segment, position)
+        if found < 0:
+            return False
+        position = found + len(segment)
+    return len(value) - position >= len(last) and value.endswith(last)
+
+
+def dn_name(dn: str) -> str:
+    """Valeur du premier RDN d'un DN ("CN=Admins du domaine,OU=..." -> "Admins du domaine")."""
+    first = dn.split(",", 1)[0]
+    return first.split("=", 1)[1].strip() if "=" in first else first.strip()
+
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _contains(haystack: np.ndarray, needles: np.ndarray) -> np.ndarray:
+    """Masque des `needles` présents dans `haystack` (trié), par dichotomie : O(n log m)."""
+    if not haystack.size:
+        return np.zeros(needles.size, dtype=bool)
+    positions = np.searchsorted(haystack, needles).clip(max=haystack.size - 1)
+    return haystack[positions] == needles
+
+
+def intersect(small: np.ndarray, large: np.ndarray) -> np.ndarray:
+    """Intersection de deux tableaux triés sans doublons, proportionnelle au plus petit."""
+    return small[_contains(large, small)]
+
+
+def difference(ids: np.ndarray, removed: np.ndarray) -> np.ndarray:
+    return ids[~_contains(removed, ids)]
+
+
+class Column:
+    """
+    Attribut à valeur unique, codé : `codes[id]` indexe `vocab` (-1 = absent).
+
+    L'index inversé (ids triés par valeur, en CSR) est construit à la première requête
+    sur l'attribut, l'index des préfixes à la première recherche par motif.
+    """
+    __slots__ = ("vocab", "codes", "_lookup", "_order", "_offsets", "_present", "_sorted")
+
+    def __init__(self, vocab, codes: np.ndarray):
+        self.vocab = list(vocab)
+        self.codes = codes
+        self._lookup = None
+        self._order = None
+
+    def value(self, object_id: int):
+        code = self.codes[object_id]
+        return self.vocab[code] if code >= 0 else None
+
+    def _index(self):
+        if self._order is None:
+            present = np.flatnonzero(self.codes >= 0)
+            codes = self.codes[present]
+            self._order = present[np.argsort(codes, kind="stable")]
+            self._offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(self.vocab)))))
+            self._present = present
+            self._lookup = {}
+            for code, value in enumerate(self.vocab):
+                self._lookup.setdefault(value.lower(), code)
+            self._sorted = None
+
+    def _ids(self, code: int) -> np.ndarray:
+        return self._order[self._offsets[code]:self._offsets[code + 1]]
+
+    def equal(self, value: str) -> np.ndarray:
+        self._index()
+        code = self._lookup.get(value.lower())
+        return self._ids(code) if code is not None else _EMPTY
+
+    def present(self) -> np.ndarray:
+        self._index()
+        return self._present
+
+    def like(self, segments: tuple) -> np.ndarray:
+        """Valeurs correspondant aux segments d'un motif ; le segment initial borne la recherche par dichotomie."""
+        self._index()
+        if self._sorted is None:
+            self._sorted = sorted((value.lower(), code) for code, value in enumerate(self.vocab))
+        prefix = segments[0].lower()
+        lo = bisect.bisect_left(self._sorted, (prefix,))
+        hi = bisect.bisect_left(self._sorted, (prefix + "\uffff",)) if prefix else len(self._sorted)
+        codes = [code for value, code in self._sorted[lo:hi] if match_substrings(value, segments)]
+        if not codes:
+            return _EMPTY
+        return np.unique(np.concatenate([self._ids(code) for code in codes]))
+
+
+def _csr(rows: np.ndarray, values: np.ndarray, size: int) -> tuple:
+    """(offsets, valeurs triées) d'une relation rows -> values."""
+    order = np.lexsort((values, rows))
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=size))))
+    return offsets, values[order].astype(np.int64)
+
+
+class Directory:
+    """
+    Annuaire simulé (utilisateurs, groupes imbriqués, ordinateurs, partages et ACL), généré
+    depuis une graine et stocké en colonnes.
+
+    Les groupes occupent les premiers ids, puis les utilisateurs et les ordinateurs. Un
+    filtre est évalué sur les index inversés : chaque comparaison donne un tableau trié
+    d'ids et `&`, `|`, `!` deviennent intersection, union et différence, sans parcourir
+    les objets. L'appartenance transitive d'un groupe est calculée une fois puis mémorisée.
+    """
+
+    def __init__(self, seed: int, domain: str, names: list, columns: dict, member_of: tuple, groups: int):
+        self.seed = seed
+        self.domain = domain
+        self.base_dn = ",".join(f"DC={part}" for part in domain.split("."))
+        self.names = names
+        self.columns = columns
+        self.groups = groups
+        self.size = len(names)
+        # Les ids sont regroupés par classe : groupes, utilisateurs puis ordinateurs
+        self.first_computer = int(np.searchsorted(columns["objectclass"].codes, OBJECT_CLASSES.index("computer")))
+        self.all_ids = np.arange(self.size, dtype=np.int64)
+        # Appartenance directe (objet -> groupes) et inverse (groupe -> membres), en CSR
+        rows, values = member_of
+        self.member_of_offsets, self.member_of = _csr(rows, values, self.size)
+        self.members_offsets, self.members = _csr(values, rows, groups)
+        self._chain = {}
+        self._filters = {}
+
+    # --- Génération ---
+
+    @classmethod
+    def generate(cls, seed: int = DEFAULT_DIRECTORY_SEED, users: int = 2000, groups: int = 150,
+                 computers: int = 400, domain: str = DEFAULT_DOMAIN) -> "Directory":
+        rng = np.random.default_rng(seed)
+        groups = max(groups, len(BUILTIN_GROUPS) + 1)
+        computers = max(computers, DOMAIN_CONTROLLERS)
+        size = groups + users + computers
+        first_user, first_computer = groups, groups + users
+
+        names = list(BUILTIN_GROUPS)
+        group_departments = rng.integers(0, len(DEPARTMENTS), groups - len(BUILTIN_GROUPS))
+        names.extend(f"GG_{DEPARTMENTS[d]}_{n}" for n, d in enumerate(group_departments.tolist(), len(BUILTIN_GROUPS)))
+        seen = {}
+        firsts = rng.integers(0, len(FIRST_NAMES), users).tolist()
+        lasts = rng.integers(0, len(LAST_NAMES), users).tolist()
+        for first, last in zip(firsts, lasts):
+            login = f"{FIRST_NAMES[first][0]}{LAST_NAMES[last]}"
+            count = seen.get(login, 0)
+            seen[login] = count + 1
+            names.append(f"{login}{count}" if count else login)
+        os_codes = rng.integers(0, len(OPERATING_SYSTEMS), computers)
+        os_codes[:DOMAIN_CONTROLLERS] = OPERATING_SYSTEMS.index("Windows Server 2022")
+        for n, code in enumerate(os_codes.tolist()):
+            prefix = "DC" if n < DOMAIN_CONTROLLERS else "SRV" if "Server" in OPERATING_SYSTEMS[code] else "PC"
+            names.append(f"{prefix}-{n:05d}")
+
+        classes = np.repeat(np.arange(3, dtype=np.int32), [groups, users, computers])
+        departments = np.full(size, -1, dtype=np.int32)
+        departments[len(BUILTIN_GROUPS):groups] = group_departments
+        departments[first_user:] = rng.integers(0, len(DEPARTMENTS), users + computers)
+        titles = np.full(size, -1, dtype=np.int32)
+        titles[first_user:first_computer] = rng.integers(0, len(TITLES), users)
+        control = np.full(size, -1, dtype=np.int32)
+        control[first_user:] = rng.random(users + computers) < 0.07
+        systems = np.full(size, -1, dtype=np.int32)
+        systems[first_computer:] = os_codes
+        spn_users = np.flatnonzero(rng.random(users) < 0.01) + first_user
+        spn_vocab = [f"{SPN_SERVICES[n % len(SPN_SERVICES)]}/{names[i].lower()}.{domain}"
+                     for n, i in enumerate(spn_users.tolist())]
+        spns = np.full(size, -1, dtype=np.int32)
+        spns[spn_users] = np.arange(spn_users.size)
+
+        # Groupes métier imbriqués : un groupe n'est membre que de groupes d'index inférieur
+        # (pas de cycle) ; le premier, délégué aux Admins du domaine, n'en contient aucun
+        first_group = len(BUILTIN_GROUPS)
+        rows, values = [np.array([first_group])], [np.array([0])]
+        nested = np.arange(first_group + 2, groups)
+        parents = first_group + 1 + (rng.random(nested.size) * (nested - first_group - 1)).astype(np.int64)
+        keep = rng.random(nested.size) < 0.3
+        rows.append(nested[keep])
+        values.append(parents[keep])
+        # Utilisateurs : Utilisateurs du domaine + 1 à 4 groupes métier
+        user_ids = np.arange(first_user, first_computer)
+        rows.append(user_ids)
+        values.append(np.full(users, DOMAIN_USERS))
+        if groups > len(BUILTIN_GROUPS):
+            extra = rng.integers(1, 5, users)
+            member_rows = np.repeat(user_ids, extra)
+            rows.append(member_rows)
+            values.append(rng.integers(len(BUILTIN_GROUPS), groups, member_rows.size))
+        # Quelques administrateurs directs, et tous les ordinateurs
+        admins = rng.choice(user_ids, size=min(users, max(3, users // 500)), replace=False) if users else user_ids
+        rows.append(admins)
+        values.append(rng.integers(0, PRIVILEGED_GROUPS, admins.size))
+        rows.append(np.arange(first_computer, size))
+        values.append(np.full(computers, DOMAIN_COMPUTERS))
+        rows, values = np.concatenate(rows).astype(np.int64), np.concatenate(values).astype(np.int64)
+        keys = np.unique(rows * groups + values)
+
+        columns = {
+            "objectclass": Column(OBJECT_CLASSES, classes),
+            "samaccountname": Column(names, np.arange(size, dtype=np.int32)),
+            "department": Column(DEPARTMENTS, departments),
+            "title": Column(TITLES, titles),
+            "useraccountcontrol": Column(ACCOUNT_CONTROL, control.astype(np.int32)),
+            "operatingsystem": Column(OPERATING_SYSTEMS, systems),
+            "serviceprincipalname": Column(spn_vocab, spns),
+        }
+        columns["cn"] = columns["name"] = columns["samaccountname"]
+        directory = cls(seed, domain, names, columns, (keys // groups, keys % groups), groups)
+
+        # adminCount=1 : membres (transitifs) des groupes privilégiés
+        admin = np.full(size, -1, dtype=np.int32)
+        for group in range(PRIVILEGED_GROUPS):
+            admin[directory.chain_members(group)] = 0
+        columns["admincount"] = Column(("1",), admin)
+        return directory
+
+    # --- Objets ---
+
+    def object_class(self, object_id: int) -> str:
+        return OBJECT_CLASSES[self.columns["objectclass"].codes[object_id]]
+
+    def dn(self, object_id: int) -> str:
+        return f"CN={self.names[object_id]},OU={OBJECT_OUS[self.object_class(object_id)]},{self.base_dn}"
+
+    def find(self, name: str):
+        """Id d'un objet par nom ou DN, ou None."""
+        ids = self.columns["samaccountname"].equal(dn_name(name))
+        return int(ids[0]) if ids.size else None
+
+    def direct_groups(self, object_id: int) -> np.ndarray:
+        return self.member_of[self.member_of_offsets[object_id]:self.member_of_offsets[object_id + 1]]
+
+    def direct_members(self, group_id: int) -> np.ndarray:
+        return self.members[self.members_offsets[group_id]:self.members_offsets[group_id + 1]]
+
+    def chain_members(self, group_id: int) -> np.ndarray:
+        """Membres directs et indirects d'un groupe (ids triés), mémorisés par groupe."""
+        cached = self._chain.get(group_id)
+        if cached is not None:
+            return cached
+        self._chain[group_id] = _EMPTY  # Garde contre un cycle d'imbrication
+        direct = self.direct_members(group_id)
+        parts = [direct] + [self.chain_members(int(g)) for g in direct[direct < self.groups]]
+        members = np.unique(np.concatenate(parts)) if len(parts) > 1 else direct
+        self._chain[group_id] = members
+        return members
+
+    def chain_groups(self, object_id: int) -> np.ndarray:
+        """Groupes dont l'objet est membre directement ou par imbrication (remontée des parents)."""
+        seen, pending = set(), [object_id]
+        while pending:
+            for group in self.direct_groups(pending.pop()).tolist():
+                if group not in seen:
+                    seen.add(group)
+                    pending.append(group)
+        return np.array(sorted(seen), dtype=np.int64)
+
+    def entry(self, object_id: int, attributes=None) -> dict:
+        """Entrée LDAP d'un objet ; `attributes` restreint les attributs retournés."""
+        entry = {"dn": self.dn(object_id), "objectClass": self.object_class(object_id),
+                 "sAMAccountName": self.names[object_id]}
+        for name, label in (("department", "department"), ("title", "title"),
+                            ("useraccountcontrol", "userAccountControl"), ("operatingsystem", "operatingSystem"),
+                            ("serviceprincipalname", "servicePrincipalName"), ("admincount", "adminCount")):
+            value = self.columns[name].value(object_id)
+            if value is not None:
+                entry[label] = value
+        groups = self.direct_groups(object_id)
+        if groups.size:
+            entry["memberOf"] = [self.dn(int(g)) for g in groups]
+        if self.object_class(object_id) == "computer":
+            entry["dNSHostName"] = f"{self.names[object_id].lower()}.{self.domain}"
+        if attributes:
+            wanted = {a.lower() for a in attributes} | {"dn"}
+            entry = {k: v for k, v in entry.items() if k.lower() in wanted}
+        return entry
+
+    # --- Recherche ---
+
+    def compile(self, text: str) -> tuple:
+        node = self._filters.get(text)
+        if node is None:
+            node = parse_filter(text)
+            if len(self._filters) >= FILTER_CACHE_SIZE:
+                del self._filters[next(iter(self._filters))]
+            self._filters[text] = node
+        return node
+
+    def evaluate(self, node: tuple) -> np.ndarray:
+        """Ids triés des objets satisfaisant un filtre analysé."""
+        kind = node[0]
+        if kind == "and":
+            positive = [child for child in node[1] if child[0] != "not"]
+            if not positive:
+                positive = [("present", "objectclass")]
+            sets = sorted((self.evaluate(child) for child in positive), key=len)
+            result = sets[0]
+            for ids in sets[1:]:
+                if not result.size:
+                    break
+                result = intersect(result, ids)
+            # Une négation sous un ET retire des candidats au lieu de complémenter tout l'annuaire
+            for child in node[1]:
+                if child[0] == "not" and result.size:
+                    result = difference(result, self.evaluate(child[1]))
+            return result
+        if kind == "or":
+            return np.unique(np.concatenate([self.evaluate(child) for child in node[1]]))
+        if kind == "not":
+            return difference(self.all_ids, self.evaluate(node[1]))
+
+        attribute = node[1]
+        if attribute in ("memberof", "member"):
+            return self._membership(kind, attribute, node[2] if len(node) > 2 else None)
+        if kind == "chain":
+            raise DirectoryError(f"Règle transitive non prise en charge pour '{attribute}'")
+        if attribute == "distinguishedname" and kind == "eq":
+            found = self.find(node[2])
+            return np.array([found], dtype=np.int64) if found is not None else _EMPTY
+        column = self.columns.get(attribute)
+        if column is None:
+            return _EMPTY  # Attribut inconnu : aucune entrée ne le porte
+        if kind == "present":
+            return column.present()
+        if kind == "like":
+            return column.like(node[2])
+        return column.equal(node[2])
+
+    def _membership(self, kind: str, attribute: str, value) -> np.ndarray:
+        if kind == "present":
+            offsets = self.members_offsets if attribute == "member" else self.member_of_offsets
+            return np.flatnonzero(np.diff(offsets) > 0).astype(np.int64)
+        if kind == "like":
+            raise DirectoryError(f"Motif non pris en charge pour '{attribute}'")
+        target = self.find(value)
+        if target is None:
+            return _EMPTY
+        if attribute == "memberof":
+            if target >= self.groups:
+                return _EMPTY
+            return self.chain_members(target) if kind == "chain" else self.direct_members(target)
+        # member=DN : groupes dont l'objet est membre (directement, ou transitivement)
+        if kind == "chain":
+            return self.chain_groups(target)
+        return self.direct_groups(target)
+
+    def search(self, text: str) -> "SearchResult":
+        return SearchResult(self, self.evaluate(self.compile(text)))
+
+    # --- Partages SMB ---
+
+    def computer_for(self, target: str) -> int:
+        """Ordinateur de l'annuaire associé (par hachage) à une IP ou un nom d'hôte."""
+        return self.first_computer + zlib.crc32(target.encode()) % (self.size - self.first_computer)
+
+    def shares(self, computer_id: int) -> list:
+        """Partages d'un ordinateur et leurs ACL [(groupe, droit)], stables pour une graine."""
+        rng = random.Random(self.seed * 1_000_003 + computer_id)
+        shares = [
+            {"name": "ADMIN$", "acl": [("Administrateurs", "FULL")]},
+            {"name": "C$", "acl": [("Administrateurs", "FULL")]},
+            {"name": "IPC$", "acl": [(EVERYONE, "READ")]},
+        ]
+        if self.names[computer_id].startswith("DC-"):
+            shares.append({"name": "SYSVOL", "acl": [(BUILTIN_GROUPS[DOMAIN_USERS], "READ")]})
+            shares.append({"name": "NETLOGON", "acl": [(BUILTIN_GROUPS[DOMAIN_USERS], "READ")]})
+        for name in rng.sample(SHARE_NAMES, rng.randint(0, 3)):
+            group = self.names[rng.randrange(len(BUILTIN_GROUPS), self.groups)] if self.groups > len(BUILTIN_GROUPS) \
+                else BUILTIN_GROUPS[DOMAIN_USERS]
+            acl = [(group, "CHANGE")]
+            roll = rng.random()
+            if roll < 0.15:
+                acl.append((EVERYONE, "FULL" if roll < 0.05 else "READ"))
+            elif roll < 0.4:
+                acl.append((BUILTIN_GROUPS[DOMAIN_USERS], "READ"))
+            shares.append({"name": name, "acl": acl})
+        return shares
+
+
+class SearchResult:
+    """Résultat d'une recherche : les ids seuls sont calculés, les entrées sont construites page par page."""
+    __slots__ = ("directory", "ids")
+
+    def __init__(self, directory: Directory, ids: np.ndarray):
+        self.directory = directory
+        self.ids = ids
+
+    def __len__(self):
+        return int(self.ids.size)
+
+    def page_count(self, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        return -(-len(self) // page_size)
+
+    def page(self, number: int, page_size: int = DEFAULT_PAGE_SIZE, attributes=None) -> list:
+        """Entrées de la page `number` (à partir de 1)."""
+        start = (number - 1) * page_size
+        return [self.directory.entry(int(i), attributes) for i in self.ids[start:start + page_size]]
+
+    def pages(self, page_size: int = DEFAULT_PAGE_SIZE, attributes=None):
+        for number in range(1, self.page_count(page_size) + 1):
+            yield self.page(number, page_size, attributes)
+
+
+_default_directory = None
+
+
+def get_default_directory() -> Directory:
+    """Annuaire partagé par toutes les sessions, généré à la première utilisation."""
+    global _default_directory
+    if _default_directory is None:
+        _default_directory = Directory.generate()
+    return _default_directory
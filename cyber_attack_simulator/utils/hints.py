@@ -0,0 +1,165 @@
+# utils/hints.py
+import heapq
+import itertools
+import time
+from typing import NamedTuple, Optional
+
+from cyber_attack_simulator.utils.progression import NODE_BIT_PREFIX
+
+DEFAULT_MAX_NODES = 300
+DEFAULT_MAX_DEPTH = 4
+MAX_TARGETS = 4     # IPs candidates par nœud (les plus récemment découvertes)
+MAX_VALUES = 3      # Valeurs candidates par paramètre
+MAX_ARGUMENTS = 6   # Jeux de paramètres essayés par commande et par nœud
+# Chaque flag, commande ou niveau gagné compense une demi-étape de profondeur
+PROGRESS_WEIGHT = 0.5
+# Valeurs d'exemple du jeu, proposées tant que le joueur n'en a utilisé aucune
+DEFAULT_VALUES = {
+    "domaine": "cible.example",
+    "cible": "cible.example",
+    "organisation": "CibleCorp",
+    "url": "http://cible.example",
+    "reseau": "10.0.0.0/24",
+}
+
+
+class Hint(NamedTuple):
+    """Prochaine commande conseillée et chemin exploré pour y arriver."""
+    command: str
+    params: dict
+    flag: Optional[str]   # Flag visé atteint au bout du chemin (None : meilleure progression)
+    path: tuple           # ((commande, paramètres), ...) depuis l'état courant
+    nodes: int            # Branches jouées par la recherche
+    elapsed: float        # Durée de la recherche, en secondes
+
+
+def unearned_flags(engine) -> set:
+    """Flags encore à obtenir : ceux qu'attend la progression, sinon ceux du catalogue."""
+    if engine.progression is not None:
+        flags = {flag for flag in engine.progression.progression.flag_bits
+                 if not flag.startswith(NODE_BIT_PREFIX)}
+    elif engine.catalog is not None:
+        flags = {flag for spec in engine.catalog for flag in spec.flags}
+    else:
+        flags = set()
+    return flags - engine.flags
+
+
+def available_commands(engine) -> list:
+    """Commandes jouables dans l'état courant, dans l'ordre du catalogue."""
+    tracker = engine.progression
+    return [command for command in engine.command_metadata
+            if tracker is None or tracker.is_unlocked(command)]
+
+
+def candidate_values(engine) -> dict:
+    """Valeurs de paramètres connues de la session : nom de paramètre -> liste ordonnée."""
+    pools = {}
+    state = engine.game_state
+    targets = state.discovered_targets
+    # Les cibles les plus récentes d'abord, sans parcourir un /16 entier
+    pools["ip"] = dict.fromkeys(itertools.islice(reversed(targets), MAX_TARGETS))
+    for command in state.last_result_commands():
+        for name, value in state.get_last_result(command)["params"].items():
+            if isinstance(value, str) and value:
+                pools.setdefault(name, {})[value] = None
+    for name, value in DEFAULT_VALUES.items():
+        pools.setdefault(name, {value: None})
+    return {name: list(values) for name, values in pools.items() if values}
+
+
+def _target_values(info: dict) -> dict:
+    """Valeurs propres à une cible : ses vulnérabilités exploitables et identifiants."""
+    values = {}
+    exploits = info.get("exploits")
+    if exploits:
+        values["cve"] = [exploit["id"] for exploit in exploits]
+    credentials = info.get("credentials")
+    if credentials:
+        values["utilisateur"] = [credential["user"] for credential in credentials]
+    return values
+
+
+def candidate_params(engine, command: str, pools: dict) -> list:
+    """Jeux de paramètres à essayer pour une commande (au plus MAX_ARGUMENTS)."""
+    names = engine.command_metadata.get(command) or []
+    if "ip" in names:
+        targets = engine.game_state.discovered_targets
+        scopes = [(ip, _target_values(targets.get(ip) or {})) for ip in pools.get("ip", ())]
+    else:
+        scopes = [(None, {})]
+    candidates = []
+    for ip, local in scopes:
+        choices = []
+        for name in names:
+            values = [ip] if name == "ip" else local.get(name) or pools.get(name) or [None]
+            choices.append(values[:MAX_VALUES])
+        # Un paramètre sans valeur connue est omis : le handler signale lui-même l'échec
+        for values in itertools.product(*choices):
+            candidates.append({name: value for name, value in zip(names, values) if value is not None})
+            if len(candidates) >= MAX_ARGUMENTS:
+                return candidates
+    return candidates
+
+
+def _signature(engine) -> tuple:
+    state = engine.game_state
+    return frozenset(engine.flags), len(state.discovered_targets), len(state.unlocked_commands), state.level
+
+
+def _progress(engine) -> int:
+    state = engine.game_state
+    return len(engine.flags) + len(state.unlocked_commands) + state.level
+
+
+def search_hint(engine, goals=None, max_nodes: int = DEFAULT_MAX_NODES,
+                max_depth: int = DEFAULT_MAX_DEPTH) -> Optional[Hint]:
+    """
+    Recherche best-first bornée de la prochaine commande vers un flag non obtenu.
+
+    Chaque nœud est une branche du moteur (`CyberAttackEngine.fork`) où une commande
+    candidate a réellement été jouée : les effets (flags, déblocages, détection) sont
+    ceux du jeu, sans toucher à la session. La priorité favorise les chemins courts,
+    discrets et qui rapportent ; les états déjà vus sont ignorés. Retourne la première
+    commande du chemin atteignant un des `goals` (par défaut `unearned_flags`), sinon
+    celle du chemin le plus prometteur, ou None si aucune commande ne réussit.
+    """
+    start = time.perf_counter()
+    goals = set(goals if goals is not None else unearned_flags(engine)) - engine.flags
+    base = _progress(engine)
+    order = itertools.count()
+    frontier = [(0.0, next(order), engine, ())]
+    seen = {_signature(engine)}
+    best, best_score = None, None
+    nodes = 0
+
+    while frontier and nodes < max_nodes:
+        _, _, node, path = heapq.heappop(frontier)
+        if len(path) >= max_depth:
+            continue
+        pools = candidate_values(node)
+        for command in available_commands(node):
+            for params in candidate_params(node, command, pools):
+                if nodes >= max_nodes:
+                    break
+                branch = node.fork()
+                result = branch.execute_command(command, params)
+                nodes += 1
+                if not result.get("success"):
+                    continue
+                signature = _signature(branch)
+                if signature in seen:
+                    continue
+                seen.add(signature)
+                steps = path + ((command, params),)
+                reached = goals & branch.flags
+                if reached:
+                    return Hint(*steps[0], min(reached), steps, nodes, time.perf_counter() - start)
+                score = len(steps) + branch.detection_level - PROGRESS_WEIGHT * (_progress(branch) - base)
+                if best_score is None or score < best_score:
+                    best, best_score = steps, score
+                heapq.heappush(frontier, (score, next(order), branch, steps))
+
+    if best is None:
+        return None
+    return Hint(*best[0], None, best, nodes, time.perf_counter() - start)
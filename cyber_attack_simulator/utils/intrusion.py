@@ -0,0 +1,276 @@
+# utils/intrusion.py
+import json
+import os
+from collections import deque
+from typing import NamedTuple
+
+from cyber_attack_simulator.utils.risk_calculator import DetectionEngine
+
+DEFAULT_IDS_RULES_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'ids_rules.json')
+
+# Nombre d'événements entre deux purges des fenêtres inactives
+GC_INTERVAL = 4096
+
+RULE_TYPES = ("rate", "sweep", "failures")
+RULE_KEYS = ("target", "command", "global")
+OUTCOMES = {"any": None, "success": True, "failure": False}
+
+
+class IDSError(ValueError):
+    """Règle de détection invalide."""
+
+
+class IDSRule(NamedTuple):
+    """Règle compilée : fenêtre glissante de `window` secondes simulées."""
+    index: int
+    id: str
+    type: str
+    commands: frozenset
+    categories: frozenset
+    key: str
+    outcome: object  # None (tout résultat), True ou False
+    window: float
+    threshold: int
+    cooldown: float
+    severity: str
+    detection: float
+    message: str
+
+    def matches(self, command: str, category: str) -> bool:
+        if not self.commands and not self.categories:
+            return True
+        return command in self.commands or category in self.categories
+
+
+def _target(params: dict):
+    if params:
+        for key in DetectionEngine.TARGET_PARAMS:
+            target = params.get(key)
+            if target is not None:
+                return target
+    return None
+
+
+class IDSRuleset:
+    """
+    Règles du défenseur simulé, compilées une fois et partagées entre sessions.
+
+    Les règles applicables à chaque commande sont calculées à la première occurrence
+    de la commande puis mises en cache : un événement n'examine que ses propres règles.
+    """
+
+    def __init__(self, data: dict, catalog=None):
+        self.catalog = catalog
+        self.alert_ttl = float(data.get("alert_ttl", 300.0))
+        self.max_alerts = int(data.get("max_alerts", 50))
+        self.rules = []
+        seen = set()
+        for entry in data.get("rules", []):
+            rule_id = entry["id"]
+            if rule_id in seen:
+                raise IDSError(f"Règle IDS en double: {rule_id}")
+            seen.add(rule_id)
+            self.rules.append(self._compile(len(self.rules), entry))
+        self._by_command = {}
+
+    @staticmethod
+    def _compile(index: int, entry: dict) -> IDSRule:
+        rule_id = entry["id"]
+        rule_type = entry.get("type", "rate")
+        if rule_type not in RULE_TYPES:
+            raise IDSError(f"Type de règle inconnu pour '{rule_id}': {rule_type}")
+        key = entry.get("key", "global" if rule_type == "sweep" else "target")
+        if key not in RULE_KEYS:
+            raise IDSError(f"Clé de corrélation inconnue pour '{rule_id}': {key}")
+        outcome = entry.get("outcome", "failure" if rule_type == "failures" else "any")
+        if outcome not in OUTCOMES:
+            raise IDSError(f"Résultat attendu inconnu pour '{rule_id}': {outcome}")
+        window = float(entry["window"])
+        threshold = int(entry["threshold"])
+        if window <= 0 or threshold <= 0:
+            raise IDSError(f"Fenêtre et seuil de '{rule_id}' doivent être positifs")
+        match = entry.get("match", {})
+        return IDSRule(
+            index=index,
+            id=rule_id,
+            type=rule_type,
+            commands=frozenset(match.get("commands", ())),
+            categories=frozenset(match.get("categories", ())),
+            key=key,
+            outcome=OUTCOMES[outcome],
+            window=window,
+            threshold=threshold,
+            cooldown=float(entry.get("cooldown", window)),
+            severity=entry.get("severity", "medium"),
+            detection=float(entry.get("detection", 0.0)),
+            message=entry.get("message", f"Règle {rule_id} déclenchée sur {{target}}"),
+        )
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_IDS_RULES_FILE, catalog=None) -> "IDSRuleset":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), catalog)
+
+    def rules_for(self, command: str) -> tuple:
+        rules = self._by_command.get(command)
+        if rules is None:
+            spec = self.catalog.get(command) if self.catalog is not None else None
+            category = spec.category if spec is not None else None
+            rules = self._by_command[command] = tuple(rule for rule in self.rules if rule.matches(command, category))
+        return rules
+
+
+class IntrusionDetector:
+    """
+    Corrélation des commandes d'une session par fenêtres glissantes.
+
+    Chaque couple (règle, clé) garde une file des horodatages encore dans sa fenêtre :
+    un événement ajoute une entrée et retire les entrées expirées en tête, soit un coût
+    amorti O(1) par règle concernée, sans jamais relire l'historique. Les règles `sweep`
+    comptent en plus les cibles distinctes de la fenêtre. Les alertes levées vont dans
+    `GameState.active_alerts` et augmentent le niveau de détection de la session.
+    """
+    __slots__ = ("ruleset", "engine", "windows", "last_alert", "recent_alerts",
+                 "events", "_alerts")
+
+    def __init__(self, ruleset: IDSRuleset, engine=None):
+        self.ruleset = ruleset
+        self.engine = engine
+        self._alerts = []  # Utilisée sans moteur (benchmarks, tests)
+        self.reset()
+
+    def reset(self):
+        """Vide les fenêtres (les alertes actives appartiennent à l'état de jeu et sont conservées)."""
+        self.windows = {}
+        self.last_alert = {}
+        self.recent_alerts = []
+        self.events = 0
+
+    @property
+    def active_alerts(self) -> list:
+        return self.engine.game_state.active_alerts if self.engine is not None else self._alerts
+
+    def drain_alerts(self) -> list:
+        """Retourne et oublie les alertes levées depuis le dernier appel."""
+        alerts, self.recent_alerts = self.recent_alerts, []
+        return alerts
+
+    def observe(self, command: str, params: dict, success: bool, now: float) -> list:
+        """Intègre un événement (horodaté en secondes de jeu) et retourne les alertes qu'il déclenche."""
+        self.events += 1
+        if self.events % GC_INTERVAL == 0:
+            self._collect(now)
+        raised = []
+        rules = self.ruleset.rules_for(command)
+        if not rules:
+            return raised
+
+        target = _target(params)
+        windows = self.windows
+        for rule in rules:
+            if rule.outcome is not None and rule.outcome is not bool(success):
+                continue
+            key = target if rule.key == "target" else command if rule.key == "command" else None
+            slot = (rule.index, key)
+            horizon = now - rule.window
+            if rule.type == "sweep":
+                window = windows.get(slot)
+                if window is None:
+                    window = windows[slot] = (deque(), {})
+                events, counts = window
+                events.append((now, target))
+                counts[target] = counts.get(target, 0) + 1
+                while events[0][0] <= horizon:
+                    _, expired = events.popleft()
+                    remaining = counts[expired] - 1
+                    if remaining:
+                        counts[expired] = remaining
+                    else:
+                        del counts[expired]
+                count = len(counts)
+            else:
+                events = windows.get(slot)
+                if events is None:
+                    events = windows[slot] = deque()
+                events.append(now)
+                while events[0] <= horizon:
+                    events.popleft()
+                count = len(events)
+
+            if count >= rule.threshold:
+                last = self.last_alert.get(slot)
+                if last is None or now - last >= rule.cooldown:
+                    self.last_alert[slot] = now
+                    raised.append(self._raise(rule, command, key, count, now))
+        return raised
+
+    def _raise(self, rule: IDSRule, command: str, key, count: int, now: float) -> dict:
+        alert = {
+            "rule": rule.id,
+            "severity": rule.severity,
+            "target": key,
+            "count": count,
+            "time": now,
+            "message": rule.message.format(target=key or "*", count=count, window=rule.window, command=command),
+        }
+        # Modifiée en place : copiée d'abord si l'état partage encore la liste avec une branche
+        alerts = self.engine.game_state.own_alerts() if self.engine is not None else self._alerts
+        # Les alertes sont ajoutées dans l'ordre du temps : les expirées sont en tête
+        expired = 0
+        ttl = self.ruleset.alert_ttl
+        while expired < len(alerts) and alerts[expired]["time"] + ttl <= now:
+            expired += 1
+        overflow = len(alerts) - expired + 1 - self.ruleset.max_alerts
+        if expired or overflow > 0:
+            del alerts[:expired + max(0, overflow)]
+        alerts.append(alert)
+        self.recent_alerts.append(alert)
+        if self.engine is not None:
+            if rule.detection:
+                self.engine.update_detection(rule.detection)
+            # Crochet post : la commande est déjà journalisée, son alerte l'est à part
+            if self.engine.journal is not None:
+                self.engine.journal.record_alerts(alerts, self.engine.detection_level)
+        return alert
+
+    def _collect(self, now: float):
+        """Oublie les fenêtres dont tous les événements ont expiré (cibles abandonnées)."""
+        rules = self.ruleset.rules
+        stale = []
+        for slot, window in self.windows.items():
+            newest = window[0][-1][0] if isinstance(window, tuple) else window[-1]
+            if newest <= now - rules[slot[0]].window:
+                stale.append(slot)
+        for slot in stale:
+            del self.windows[slot]
+            self.last_alert.pop(slot, None)
+
+    def pending_events(self) -> int:
+        """Nombre d'événements encore retenus dans les fenêtres."""
+        return sum(len(w[0]) if isinstance(w, tuple) else len(w) for w in self.windows.values())
+
+
+def ids_observe(engine, command: str, params: dict, result):
+    """Crochet post : transmet chaque commande exécutée au détecteur de la session."""
+    detector = engine.ids
+    if detector is not None:
+        detector.observe(command, params, result.get("success", False), engine.clock.now)
+    return None
+
+
+def ids_observe_error(engine, command: str, params: dict, error: Exception):
+    """Crochet on_error : une commande qui plante reste visible du défenseur, comme un échec."""
+    detector = engine.ids
+    if detector is not None:
+        detector.observe(command, params, False, engine.clock.now)
+    return None
+
+
+def attach_ids(engine, ruleset: IDSRuleset = None) -> IntrusionDetector:
+    """Branche le défenseur simulé sur un moteur (crochets post et on_error du middleware)."""
+    if ruleset is None:
+        ruleset = IDSRuleset.load(catalog=engine.catalog)
+    engine.ids = IntrusionDetector(ruleset, engine)
+    if "ids" not in engine.middleware:
+        engine.add_middleware("ids", post=ids_observe, on_error=ids_observe_error)
+    return engine.ids
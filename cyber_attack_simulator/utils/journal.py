@@ -0,0 +1,337 @@
+# utils/journal.py
+import os
+import pickle
+import struct
+
+JOURNAL_MAGIC = b"CASJ2\n"
+_RECORD_HEADER = struct.Struct("<IB")  # longueur du contenu, type d'enregistrement
+
+RECORD_META = 0
+RECORD_COMMAND = 1
+RECORD_JOB_LAUNCH = 2  # (id, commande, paramètres, accepté) : le handler du job s'exécute ici
+RECORD_JOB_CANCEL = 3  # id du job annulé
+RECORD_CLOCK = 4       # heure de jeu atteinte par une attente explicite (wait_for_job)
+RECORD_CHECKPOINT = 5  # fin d'un lot écrit : état du générateur de la session à cet instant
+RECORD_ALERTS = 6      # alertes actives et niveau de détection après une alerte de l'IDS (crochet post)
+
+FSYNC_ALWAYS = "always"  # fsync après chaque commande
+FSYNC_BATCH = "batch"    # fsync à chaque écriture d'un lot
+FSYNC_NEVER = "never"    # laisse le système vider ses tampons
+
+
+def snapshot_path_for(journal_path: str) -> str:
+    return journal_path + ".snap"
+
+
+class SessionJournal:
+    """
+    Journal binaire en ajout seul d'une session.
+
+    Chaque commande exécutée est enregistrée avec son delta d'état (new_state appliqué,
+    flags, niveau de détection, heure de jeu), suivie des alertes qu'elle a déclenchées.
+    Les jobs en arrière-plan le sont à leur lancement, puis à leur échéance (ou à leur annulation). Les écritures sont regroupées par lots de `batch_size`
+    enregistrements ; `fsync` choisit la durabilité. Chaque lot se termine par un point
+    de contrôle (état du générateur) qui le valide : à la lecture, un lot sans point de
+    contrôle (arrêt brutal) est ignoré, et il est tronqué à la réouverture. Un instantané compact du moteur est
+    écrit toutes les `snapshot_every` commandes pour une restauration sans tout rejouer.
+    """
+
+    def __init__(self, path: str, fsync: str = FSYNC_BATCH, batch_size: int = 64, snapshot_every: int = 1000):
+        if fsync not in (FSYNC_ALWAYS, FSYNC_BATCH, FSYNC_NEVER):
+            raise ValueError(f"Mode fsync inconnu: {fsync}")
+        self.path = path
+        self.fsync = fsync
+        self.batch_size = 1 if fsync == FSYNC_ALWAYS else max(1, batch_size)
+        self.snapshot_every = snapshot_every
+        self.sequence = 0
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._engine = None
+
+        self._is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        # Jobs lancés mais jamais terminés : perdus avec le processus qui les exécutait
+        self._abandoned_jobs = []
+        if not self._is_new:
+            running = {}
+            committed = len(JOURNAL_MAGIC)
+            for records, _, committed in read_batches(path):
+                for kind, payload in records:
+                    if kind == RECORD_COMMAND:
+                        self.sequence += 1
+                        running.pop(payload[8], None)
+                    elif kind == RECORD_JOB_LAUNCH and payload[3]:
+                        running[payload[0]] = True
+                    elif kind == RECORD_JOB_CANCEL:
+                        running.pop(payload, None)
+            self._abandoned_jobs = list(running)
+            if committed < os.path.getsize(path):
+                # Lot partiellement écrit : tronqué, sinon les ajouts suivraient des octets illisibles
+                os.truncate(path, committed)
+        self._file = open(path, 'ab')
+        if self._is_new:
+            self._file.write(JOURNAL_MAGIC)
+
+    # --- Écriture ---
+
+    def attach(self, engine):
+        """
+        Branche le journal sur un moteur et enregistre ses métadonnées (graine).
+
+        Sur un journal rouvert, les jobs restés en cours sont journalisés comme annulés :
+        la session restaurée ne les a plus, le rejeu doit les abandonner au même endroit.
+        """
+        engine.journal = self
+        self._engine = engine
+        if self._is_new:
+            self._append(RECORD_META, {"seed": engine.seed})
+            self._is_new = False
+        for job_id in self._abandoned_jobs:
+            self.record_cancel(job_id)
+        self._abandoned_jobs = []
+        self.flush()
+
+    def record(self, engine, command: str, params: dict, result, applied: bool = True,
+               job: int = None, clock: float = None, streamed: list = None):
+        """
+        Enregistre une commande exécutée et le delta qu'elle a appliqué à l'état.
+
+        `job` est l'identifiant du job dont c'est le résultat ; `clock` l'heure de jeu à
+        la fin de la commande (par défaut, l'heure courante). `streamed` : deltas partiels
+        appliqués pendant l'exécution ; ils sont alors enregistrés en liste, avant le delta final.
+        """
+        success = bool(result.get("success"))
+        applied = applied and success
+        new_state = result.get("new_state") if applied else None
+        new_state = new_state if isinstance(new_state, dict) else None
+        if streamed:
+            new_state = [*streamed, new_state] if new_state else list(streamed)
+        flags = None
+        if applied:
+            # Flags du résultat et du catalogue : la restauration n'a pas besoin du catalogue
+            flags = list(result.get("flags") or ())
+            spec = engine.catalog.get(command) if engine.catalog is not None else None
+            if spec is not None:
+                flags.extend(spec.flags)
+        self._append(RECORD_COMMAND, (
+            command,
+            params,
+            success,
+            applied,
+            new_state,
+            flags,
+            engine.detection_level,
+            engine.repetitions.get(command, 0),
+            job,
+            engine.clock.now if clock is None else clock,
+        ))
+        self.sequence += 1
+        if self.snapshot_every and self.sequence % self.snapshot_every == 0:
+            self.write_snapshot(engine, clock)
+
+    def record_launch(self, job_id: int, command: str, params: dict, accepted: bool):
+        self._append(RECORD_JOB_LAUNCH, (job_id, command, params, accepted))
+
+    def record_cancel(self, job_id: int):
+        self._append(RECORD_JOB_CANCEL, job_id)
+
+    def record_clock(self, now: float):
+        self._append(RECORD_CLOCK, now)
+
+    def record_alerts(self, alerts: list, detection_level: float):
+        """Enregistre l'effet d'une alerte, levée après la journalisation de la commande qui l'a causée."""
+        self._append(RECORD_ALERTS, (list(alerts), detection_level))
+
+    def _encode(self, kind: int, payload):
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        self._buffer += _RECORD_HEADER.pack(len(data), kind)
+        self._buffer += data
+
+    def _append(self, kind: int, payload):
+        self._encode(kind, payload)
+        self._buffered += 1
+        if self._buffered >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Écrit le lot en attente, validé par un point de contrôle (et synchronisé selon le mode fsync)."""
+        if self._buffer:
+            if self._engine is not None:
+                self._encode(RECORD_CHECKPOINT, self._engine.rng.getstate())
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+        self._file.flush()
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(self._file.fileno())
+
+    def write_snapshot(self, engine, clock: float = None):
+        """Écrit atomiquement un instantané du moteur et la position correspondante du journal."""
+        self.flush()
+        state = engine.snapshot()
+        if clock is not None:
+            state["clock"] = clock  # Heure de fin de la commande qui vient d'être journalisée
+        snapshot = {"sequence": self.sequence, "offset": self._file.tell(), "engine": state}
+        target = snapshot_path_for(self.path)
+        tmp = target + ".tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.fsync != FSYNC_NEVER:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, target)
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+# --- Lecture ---
+
+def _read_raw(path: str, offset: int = None):
+    """Itère sur les enregistrements complets (type, octets, offset de fin) d'un journal."""
+    with open(path, 'rb') as f:
+        if f.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+            raise ValueError(f"'{path}' n'est pas un journal de session")
+        if offset is not None:
+            f.seek(offset)
+        while True:
+            header = f.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            length, kind = _RECORD_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                # Dernier lot partiellement écrit (arrêt brutal) : ignoré
+                return
+            yield kind, data, f.tell()
+
+
+def read_records(path: str, offset: int = None):
+    """Itère sur les enregistrements (type, contenu) d'un journal, à partir d'un offset optionnel."""
+    for kind, data, _ in _read_raw(path, offset):
+        yield kind, pickle.loads(data)
+
+
+def read_batches(path: str, offset: int = None):
+    """
+    Itère sur les lots validés : (enregistrements, état du générateur, offset de fin).
+
+    Les enregistrements qui ne sont suivis d'aucun point de contrôle sont ignorés.
+    """
+    records = []
+    for kind, data, end in _read_raw(path, offset):
+        payload = pickle.loads(data)
+        if kind == RECORD_CHECKPOINT:
+            yield records, payload, end
+            records = []
+        else:
+            records.append((kind, payload))
+
+
+def apply_record(engine, record: tuple):
+    """Réapplique à un moteur le delta enregistré pour une commande."""
+    command, params, success, applied, new_state, flags, detection_level, repetitions, job, clock = record
+    if job is None:
+        # La commande d'un job est historisée à son lancement
+        engine.command_history.record(command, params)
+    # Deltas partiels (appliqués même si la commande a échoué ensuite), puis delta final
+    for delta in (new_state if isinstance(new_state, list) else (new_state,)):
+        if delta:
+            engine.game_state.update_state(delta)
+    if applied:
+        engine.apply_rewards(command, flags)
+    engine.detection_level = detection_level
+    if repetitions:
+        engine.repetitions[command] = repetitions
+    engine.clock.advance_to(clock)
+
+
+def apply_launch(engine, launch: tuple):
+    """Réapplique le lancement d'un job : son résultat suit dans un enregistrement de commande."""
+    job_id, command, params, accepted = launch
+    engine._next_job_id = job_id + 1
+    if accepted:
+        engine.command_history.record(command, params)
+
+
+def apply_alerts(engine, payload: tuple):
+    alerts, detection_level = payload
+    engine.game_state.update_state({"active_alerts": list(alerts)})
+    engine.detection_level = detection_level
+
+
+def restore_session(path: str, engine=None, use_snapshot: bool = True):
+    """
+    Restaure une session depuis son journal : dernier instantané, puis deltas suivants.
+
+    Sans `engine`, un nouveau moteur est créé (il faudra lui partager un registre de handlers).
+    Les jobs encore en cours à la fin du journal ne sont pas recréés.
+    """
+    if engine is None:
+        from cyber_attack_simulator.game_engine import CyberAttackEngine
+        engine = CyberAttackEngine()
+
+    offset = None
+    snapshot_file = snapshot_path_for(path)
+    if use_snapshot and os.path.exists(snapshot_file):
+        with open(snapshot_file, 'rb') as f:
+            snapshot = pickle.load(f)
+        engine.restore_snapshot(snapshot["engine"])
+        offset = snapshot["offset"]
+
+    for records, rng_state, _ in read_batches(path, offset):
+        for kind, payload in records:
+            if kind == RECORD_META:
+                engine.seed = payload["seed"]
+            elif kind == RECORD_COMMAND:
+                apply_record(engine, payload)
+            elif kind == RECORD_JOB_LAUNCH:
+                apply_launch(engine, payload)
+            elif kind == RECORD_CLOCK:
+                engine.clock.advance_to(payload)
+            elif kind == RECORD_ALERTS:
+                apply_alerts(engine, payload)
+        # Les deltas ne rejouent pas les tirages : le générateur reprend l'état du point de contrôle
+        engine.rng.setstate(rng_state)
+    return engine
+
+
+def replay_session(path: str, registry) -> object:
+    """
+    Rejoue intégralement une session en réexécutant ses commandes avec la même graine.
+
+    Le résultat est déterministe : mêmes tirages, mêmes flags, même état final. Les jobs
+    sont relancés dans l'ordre de leur lancement ; leurs résultats, appliqués par
+    l'horloge, ne sont pas réexécutés. Le cache de résultats est contourné : une commande
+    servie depuis le cache est seulement historisée, les autres sont toutes réexécutées.
+    """
+    from cyber_attack_simulator.game_engine import CyberAttackEngine
+    from cyber_attack_simulator.utils.result_cache import ResultCache
+
+    engine = None
+    for records, _, _ in read_batches(path):
+        for kind, payload in records:
+            if kind == RECORD_META:
+                engine = CyberAttackEngine(seed=payload["seed"])
+                engine.share_registry(registry)
+                engine.result_cache = ResultCache(max_entries=0)
+            elif engine is None:
+                raise ValueError("Journal sans métadonnées de session")
+            elif kind == RECORD_COMMAND:
+                command, params, success, applied, job = payload[0], payload[1], payload[2], payload[3], payload[8]
+                if job is not None:
+                    continue
+                if success and not applied:
+                    engine.command_history.record(command, params)
+                else:
+                    engine.execute_command(command, params)
+            elif kind == RECORD_JOB_LAUNCH:
+                engine.launch_job(payload[1], payload[2])
+            elif kind == RECORD_JOB_CANCEL:
+                engine.cancel_job(payload)
+            elif kind == RECORD_CLOCK:
+                engine.clock.advance_to(payload)
+            elif kind == RECORD_ALERTS and engine.ids is None:
+                # Sans défenseur branché, les alertes ne sont pas recalculées : reprises du journal
+                apply_alerts(engine, payload)
+    return engine
@@ -0,0 +1,135 @@
+# utils/layered_map.py
+import sys
+from collections.abc import MutableMapping
+
+from cyber_attack_simulator.utils.command_history import deep_getsizeof
+
+# Au-delà, les couches d'une branche sont fusionnées à son prochain `fork`
+MAX_LAYERS = 8
+
+_ABSENT = object()   # Clé inconnue de la couche : chercher dans la couche inférieure
+_DELETED = object()  # Clé supprimée par la couche (ou inconnue de toutes les couches)
+
+
+class LayeredMap(MutableMapping):
+    """
+    Dictionnaire persistant par couches, pour des branches qui partagent leurs entrées.
+
+    `fork` gèle les entrées courantes dans une couche partagée en lecture seule et pose
+    dessus deux couches vides, une pour l'original et une pour la branche : créer une
+    branche est O(1) et chaque écriture ne touche que la couche de son propriétaire.
+    Une lecture remonte au plus MAX_LAYERS couches. L'itération suit l'ordre de première
+    insertion, comme un dict (une clé supprimée puis réinsérée peut toutefois garder sa
+    place) ; `reversed` donne les clés les plus récemment écrites d'abord.
+    """
+    __slots__ = ("_local", "_parent", "_depth", "_size")
+
+    def __init__(self, data=None):
+        self._local = dict(data) if data else {}
+        self._parent = None
+        self._depth = 0  # Nombre de couches gelées sous celle-ci
+        self._size = len(self._local)
+
+    def _lookup(self, key):
+        layer = self
+        while layer is not None:
+            value = layer._local.get(key, _ABSENT)
+            if value is not _ABSENT:
+                return value
+            layer = layer._parent
+        return _DELETED
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _DELETED else value
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key) is not _DELETED
+
+    def __setitem__(self, key, value):
+        if self._lookup(key) is _DELETED:
+            self._size += 1
+        self._local[key] = value
+
+    def __delitem__(self, key):
+        if self._lookup(key) is _DELETED:
+            raise KeyError(key)
+        self._size -= 1
+        if self._parent is None:
+            del self._local[key]
+        else:
+            self._local[key] = _DELETED
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _layers(self) -> list:
+        """Couches du plus récent au plus ancien."""
+        layers = []
+        layer = self
+        while layer is not None:
+            layers.append(layer._local)
+            layer = layer._parent
+        return layers
+
+    def __iter__(self):
+        if self._parent is None:
+            yield from self._local
+            return
+        seen = set()
+        for local in reversed(self._layers()):
+            for key in local:
+                if key not in seen:
+                    seen.add(key)
+                    if self._lookup(key) is not _DELETED:
+                        yield key
+
+    def __reversed__(self):
+        seen = set()
+        for local in self._layers():
+            for key, value in reversed(local.items()):
+                if key not in seen:
+                    seen.add(key)
+                    if value is not _DELETED:
+                        yield key
+
+    def __repr__(self) -> str:
+        return f"LayeredMap({dict(self.items())!r})"
+
+    def __reduce__(self):
+        # Instantanés, pickle et copies profondes ne voient qu'un dict aplati
+        return LayeredMap, (dict(self.items()),)
+
+    # --- Branches ---
+
+    def fork(self) -> "LayeredMap":
+        """Branche indépendante de la table, en O(1) (O(n) une fois toutes les MAX_LAYERS)."""
+        if self._local:
+            if self._depth >= MAX_LAYERS:
+                frozen = LayeredMap(self.items())
+            else:
+                frozen = LayeredMap.__new__(LayeredMap)
+                frozen._local, frozen._parent, frozen._depth = self._local, self._parent, self._depth
+                frozen._size = self._size
+            self._local, self._parent, self._depth = {}, frozen, frozen._depth + 1
+        branch = LayeredMap.__new__(LayeredMap)
+        branch._local, branch._parent, branch._depth, branch._size = {}, self._parent, self._depth, self._size
+        return branch
+
+    def memory_usage(self, seen: set = None) -> int:
+        """Taille mémoire approximative (les couches partagées déjà vues ne comptent pas)."""
+        if seen is None:
+            seen = set()
+        size = 0
+        layer = self
+        while layer is not None and id(layer) not in seen:
+            seen.add(id(layer))
+            size += sys.getsizeof(layer) + deep_getsizeof(layer._local, seen)
+            layer = layer._parent
+        return size
@@ -0,0 +1,283 @@
+# utils/metrics.py
+import cProfile
+import io
+import json
+import pstats
+import tracemalloc
+
+# Précision des histogrammes : 2^(SUB_BUCKET_BITS - 1) cases par puissance de deux (~3 % d'erreur)
+SUB_BUCKET_BITS = 6
+_HALF = 1 << (SUB_BUCKET_BITS - 1)
+_LINEAR = 1 << SUB_BUCKET_BITS
+
+# Bornes (en secondes) des cases exportées au format Prometheus
+PROMETHEUS_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+OUTCOMES = ("success", "failure", "exception")
+
+
+def bucket_index(value: int) -> int:
+    """Case log-linéaire d'une valeur entière (nanosecondes)."""
+    if value < _LINEAR:
+        return max(value, 0)
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> tuple:
+    """Intervalle [bas, haut) des valeurs rangées dans une case."""
+    if index < _LINEAR:
+        return index, index + 1
+    shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+    mantissa = index - (shift << (SUB_BUCKET_BITS - 1))
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """
+    Histogramme de latences à la manière de HdrHistogram.
+
+    Les cases sont log-linéaires : l'erreur relative reste bornée de la microseconde
+    à plusieurs minutes, pour une poignée d'entiers par commande (stockage creux).
+    """
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value_ns: int):
+        index = bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value_ns
+        if self.min is None or value_ns < self.min:
+            self.min = value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, p: float) -> int:
+        """Valeur (borne haute de case, bornée par le maximum observé) du percentile `p`."""
+        if not self.count:
+            return 0
+        rank = max(1, -(-p * self.count // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(bucket_bounds(index)[1] - 1, self.max)
+        return self.max
+
+    def cumulative(self, bounds_ns) -> list:
+        """Nombre de valeurs <= chaque borne (cases entières, borne haute)."""
+        items = sorted(self.counts.items())
+        result = []
+        seen = 0
+        position = 0
+        for bound in bounds_ns:
+            while position < len(items) and bucket_bounds(items[position][0])[1] - 1 <= bound:
+                seen += items[position][1]
+                position += 1
+            result.append(seen)
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_ns": self.total,
+            "min_ns": self.min or 0,
+            "max_ns": self.max,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "p999_ns": self.percentile(99.9),
+        }
+
+
+class CommandStats:
+    """Compteurs et histogramme d'une commande ou d'une catégorie."""
+    __slots__ = ("calls", "success", "failure", "exception", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.success = 0
+        self.failure = 0
+        self.exception = 0
+        self.latency = LatencyHistogram()
+
+    def record(self, outcome: str, elapsed_ns: int):
+        self.calls += 1
+        if outcome == "success":
+            self.success += 1
+        elif outcome == "failure":
+            self.failure += 1
+        else:
+            self.exception += 1
+        self.latency.record(elapsed_ns)
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "success": self.success,
+            "failure": self.failure,
+            "exception": self.exception,
+            "error_rate": (self.failure + self.exception) / self.calls if self.calls else 0.0,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class EngineMetrics:
+    """
+    Instrumentation du moteur : appels, issues et latences par commande et par catégorie.
+
+    Désactivée par défaut (`engine.metrics is None`) : le chemin d'exécution ne paie
+    alors qu'un test sur None. Une même instance peut être partagée par plusieurs sessions.
+    """
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog
+        self.commands = {}
+        self.categories = {}
+        self._category_of = {}
+        self.profiles = {}
+        self._profiled = {}
+
+    def attach(self, engine) -> "EngineMetrics":
+        engine.metrics = self
+        if self.catalog is None:
+            self.catalog = engine.catalog
+        return self
+
+    def _category(self, command: str) -> str:
+        category = self._category_of.get(command)
+        if category is None:
+            spec = self.catalog.get(command) if self.catalog is not None else None
+            category = self._category_of[command] = spec.category if spec is not None else "inconnue"
+        return category
+
+    def record(self, command: str, result, elapsed_ns: int, error: Exception = None):
+        """Enregistre une exécution (`error` renseigné si le handler a levé une exception)."""
+        if error is not None:
+            outcome = "exception"
+        else:
+            outcome = "success" if result.get("success") else "failure"
+        stats = self.commands.get(command)
+        if stats is None:
+            stats = self.commands[command] = CommandStats()
+        stats.record(outcome, elapsed_ns)
+        category = self._category(command)
+        stats = self.categories.get(category)
+        if stats is None:
+            stats = self.categories[category] = CommandStats()
+        stats.record(outcome, elapsed_ns)
+
+    def reset(self):
+        self.commands.clear()
+        self.categories.clear()
+
+    # --- Profilage ciblé ---
+
+    def profile_command(self, engine, command: str, mode: str = "cprofile", every: int = 1) -> bool:
+        """
+        Active un profileur (cProfile ou tracemalloc) sur une seule commande, une exécution
+        sur `every`. Le handler est enveloppé dans le registre : les autres commandes
+        ne paient rien. Retourne False si la commande n'a pas de handler.
+        """
+        if mode not in ("cprofile", "tracemalloc"):
+            raise ValueError(f"Profileur inconnu: {mode}")
+        handler = engine.handlers.get(command) or engine.resolve_handler(command)
+        if handler is None or command in self._profiled:
+            return handler is not None
+        self._profiled[command] = handler
+        calls = [0]
+
+        def profiled(params):
+            calls[0] += 1
+            if calls[0] % every:
+                return handler(params)
+            if mode == "cprofile":
+                profiler = self.profiles.get(command)
+                if profiler is None:
+                    profiler = self.profiles[command] = cProfile.Profile()
+                return profiler.runcall(handler, params)
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            try:
+                return handler(params)
+            finally:
+                after = tracemalloc.take_snapshot()
+                if started:
+                    tracemalloc.stop()
+                self.profiles.setdefault(command, []).append(after.compare_to(before, "lineno")[:10])
+
+        engine.handlers[command] = profiled
+        return True
+
+    def stop_profiling(self, engine, command: str):
+        handler = self._profiled.pop(command, None)
+        if handler is not None:
+            engine.handlers[command] = handler
+
+    def profile_report(self, command: str, limit: int = 15) -> str:
+        """Rapport texte du profil collecté pour une commande."""
+        profile = self.profiles.get(command)
+        if profile is None:
+            return ""
+        if isinstance(profile, cProfile.Profile):
+            out = io.StringIO()
+            pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(limit)
+            return out.getvalue()
+        lines = []
+        for run, stats in enumerate(profile[-limit:]):
+            lines.append(f"--- Exécution {run + 1} ---")
+            lines.extend(str(stat) for stat in stats)
+        return "\n".join(lines)
+
+    # --- Export ---
+
+    def snapshot(self) -> dict:
+        return {
+            "commands": {name: stats.to_dict() for name, stats in self.commands.items()},
+            "categories": {name: stats.to_dict() for name, stats in self.categories.items()},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, **kwargs)
+
+    def to_prometheus(self, prefix: str = "cyberattack") -> str:
+        """Instantané au format texte d'exposition Prometheus."""
+        bounds_ns = [int(bound * 1e9) for bound in PROMETHEUS_BUCKETS]
+        lines = []
+        for scope, table in (("command", self.commands), ("category", self.categories)):
+            name = f"{prefix}_{scope}"
+            lines.append(f"# HELP {name}_calls_total Exécutions par {scope} et par issue.")
+            lines.append(f"# TYPE {name}_calls_total counter")
+            for key, stats in sorted(table.items()):
+                for outcome in OUTCOMES:
+                    lines.append(f'{name}_calls_total{{{scope}="{key}",outcome="{outcome}"}} '
+                                 f'{getattr(stats, outcome)}')
+            lines.append(f"# HELP {name}_latency_seconds Latence d'exécution par {scope}.")
+            lines.append(f"# TYPE {name}_latency_seconds histogram")
+            for key, stats in sorted(table.items()):
+                histogram = stats.latency
+                for bound, count in zip(PROMETHEUS_BUCKETS, histogram.cumulative(bounds_ns)):
+                    lines.append(f'{name}_latency_seconds_bucket{{{scope}="{key}",le="{bound}"}} {count}')
+                lines.append(f'{name}_latency_seconds_bucket{{{scope}="{key}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_latency_seconds_sum{{{scope}="{key}"}} {histogram.total / 1e9:.9f}')
+                lines.append(f'{name}_latency_seconds_count{{{scope}="{key}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
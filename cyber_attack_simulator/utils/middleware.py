@@ -0,0 +1,121 @@
+# utils/middleware.py
+
+
+class Middleware:
+    """
+    Ensemble de crochets autour de l'exécution d'une commande.
+
+    - pre(engine, commande, paramètres) : appelé avant le dispatch ; retourner un
+      résultat court-circuite la commande (rien n'est exécuté ni appliqué).
+    - post(engine, commande, paramètres, résultat) : appelé après application du
+      résultat ; retourner un résultat le remplace, None le conserve.
+    - on_error(engine, commande, paramètres, exception) : appelé si le handler lève
+      une exception ; retourner un résultat remplace le message d'erreur standard.
+    """
+    __slots__ = ("name", "pre", "post", "on_error")
+
+    def __init__(self, name: str, pre=None, post=None, on_error=None):
+        self.name = name
+        self.pre = pre
+        self.post = post
+        self.on_error = on_error
+
+    def __repr__(self):
+        return f"Middleware({self.name!r})"
+
+
+def _compile_pre(hooks: tuple):
+    if not hooks:
+        return None
+    if len(hooks) == 1:
+        return hooks[0]
+
+    def pre(engine, command, params):
+        for hook in hooks:
+            result = hook(engine, command, params)
+            if result is not None:
+                return result
+        return None
+    return pre
+
+
+def _compile_post(hooks: tuple):
+    if not hooks:
+        return None
+
+    def post(engine, command, params, result):
+        for hook in hooks:
+            replaced = hook(engine, command, params, result)
+            if replaced is not None:
+                result = replaced
+        return result
+    return post
+
+
+def _compile_on_error(hooks: tuple):
+    if not hooks:
+        return None
+
+    def on_error(engine, command, params, error):
+        for hook in hooks:
+            result = hook(engine, command, params, error)
+            if result is not None:
+                return result
+        return None
+    return on_error
+
+
+class MiddlewareChain:
+    """
+    Chaîne ordonnée de middlewares, recompilée à chaque modification.
+
+    Chaque étape (pre, post, on_error) est fusionnée en un seul appelable : le moteur
+    ne teste qu'un attribut par étape, None tant qu'aucun crochet n'est enregistré.
+    Les crochets `pre` s'exécutent dans l'ordre d'enregistrement, `post` et `on_error`
+    dans l'ordre inverse (le premier middleware enveloppe tous les autres).
+    """
+    __slots__ = ("entries", "pre", "post", "on_error")
+
+    def __init__(self):
+        self.entries = []
+        self.pre = None
+        self.post = None
+        self.on_error = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __contains__(self, name: str) -> bool:
+        return any(entry.name == name for entry in self.entries)
+
+    def add(self, name: str, pre=None, post=None, on_error=None, index: int = None) -> Middleware:
+        """Ajoute un middleware (à la fin, ou à la position `index`)."""
+        if name in self:
+            raise ValueError(f"Middleware '{name}' déjà enregistré")
+        middleware = Middleware(name, pre, post, on_error)
+        if index is None:
+            self.entries.append(middleware)
+        else:
+            self.entries.insert(index, middleware)
+        self.compile()
+        return middleware
+
+    def remove(self, name: str) -> bool:
+        remaining = [entry for entry in self.entries if entry.name != name]
+        removed = len(remaining) != len(self.entries)
+        self.entries = remaining
+        self.compile()
+        return removed
+
+    def clear(self):
+        self.entries = []
+        self.compile()
+
+    def compile(self):
+        self.pre = _compile_pre(tuple(entry.pre for entry in self.entries if entry.pre))
+        reverse = self.entries[::-1]
+        self.post = _compile_post(tuple(entry.post for entry in reverse if entry.post))
+        self.on_error = _compile_on_error(tuple(entry.on_error for entry in reverse if entry.on_error))
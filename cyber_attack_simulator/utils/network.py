@@ -0,0 +1,383 @@
+# utils/network.py
+import ipaddress
+import json
+import os
+import zlib
+
+import numpy as np
+
+DEFAULT_WORLD_SEED = 1337
+DEFAULT_NETWORK = "10.0.0.0/16"
+DEFAULT_CHUNK_HOSTS = 4096
+MAX_SCAN_PREFIX = 16  # Plus grande plage balayable en une commande : un /16
+
+# Ports courants : un bit par port dans le masque 64 bits de chaque hôte, avec leur
+# probabilité d'ouverture sur un hôte actif
+COMMON_PORTS = (
+    (21, 0.08), (22, 0.55), (23, 0.03), (25, 0.06), (53, 0.08), (80, 0.40), (110, 0.03), (111, 0.05),
+    (135, 0.12), (139, 0.12), (143, 0.03), (161, 0.05), (389, 0.04), (443, 0.35), (445, 0.15), (465, 0.02),
+    (514, 0.02), (587, 0.03), (631, 0.02), (636, 0.02), (873, 0.01), (993, 0.03), (995, 0.02), (1080, 0.01),
+    (1433, 0.03), (1521, 0.02), (1723, 0.01), (2049, 0.03), (2375, 0.01), (3000, 0.02), (3268, 0.01), (3306, 0.08),
+    (3389, 0.10), (4443, 0.01), (5000, 0.02), (5432, 0.05), (5601, 0.01), (5900, 0.03), (5985, 0.04), (6379, 0.04),
+    (6443, 0.01), (7001, 0.01), (8000, 0.03), (8080, 0.10), (8081, 0.02), (8443, 0.05), (8888, 0.02), (9000, 0.02),
+    (9090, 0.02), (9100, 0.02), (9200, 0.02), (9418, 0.01), (10000, 0.01), (11211, 0.01), (27017, 0.02), (50000, 0.01),
+    (69, 0.01), (88, 0.02), (102, 0.005), (502, 0.005), (1883, 0.01), (5060, 0.01), (5353, 0.01), (5672, 0.01),
+)
+PORTS = np.array([port for port, _ in COMMON_PORTS], dtype=np.uint16)
+PORT_BITS = {port: bit for bit, (port, _) in enumerate(COMMON_PORTS)}
+_BIT_SHIFTS = np.arange(len(COMMON_PORTS), dtype=np.uint64)
+
+# Logiciels exposés par port : (produit, versions rencontrées). Les produits et
+# versions recoupent data/vulnerabilities.json.
+PORT_PRODUCTS = {
+    21: (("vsftpd", ("2.3.4", "3.0.3", "3.0.5")), ("proftpd", ("1.3.5", "1.3.6", "1.3.8"))),
+    22: (("openssh", ("7.2", "7.4", "8.2", "8.9", "9.3p1", "9.8p1")),),
+    25: (("exim", ("4.89", "4.92", "4.96")), ("postfix", ("3.4.13", "3.7.6"))),
+    53: (("bind", ("9.11.4", "9.16.1", "9.18.24")),),
+    80: (("apache", ("2.4.29", "2.4.41", "2.4.49", "2.4.50", "2.4.57")), ("nginx", ("1.4.0", "1.18.0", "1.20.1", "1.24.0")),
+         ("iis", ("7.5", "8.5", "10.0"))),
+    443: (("apache", ("2.4.41", "2.4.57")), ("nginx", ("1.18.0", "1.24.0")), ("openssl", ("1.0.1f", "1.0.2k", "1.1.1k", "3.0.2"))),
+    445: (("samba", ("4.5.9", "4.11.6", "4.13.0", "4.17.5")), ("smb", ("1.0", "2.1", "3.0", "3.1.1"))),
+    139: (("samba", ("4.5.9", "4.13.0")), ("smb", ("1.0", "2.1"))),
+    1433: (("mssql", ("2012", "2016", "2019")),),
+    3306: (("mysql", ("5.1.60", "5.5.62", "5.7.14", "8.0.30")),),
+    3389: (("rdp", ("6.1", "10.0")),),
+    5432: (("postgresql", ("9.6.24", "12.17", "15.5")),),
+    6379: (("redis", ("2.8.19", "5.0.7", "6.2.6", "7.0.11")),),
+    8080: (("tomcat", ("7.0.81", "9.0.30", "9.0.80")), ("jetty", ("9.4.43", "11.0.15"))),
+    8443: (("tomcat", ("9.0.30", "9.0.80")),),
+    9200: (("elasticsearch", ("6.8.23", "7.17.9", "8.11.1")),),
+    27017: (("mongodb", ("3.6.23", "4.4.25", "6.0.12")),),
+}
+# Nom de service des autres ports courants (version générique)
+SERVICE_NAMES = {
+    23: "telnet", 69: "tftp", 88: "kerberos", 102: "s7comm", 110: "pop3", 111: "rpcbind", 135: "msrpc",
+    143: "imap", 161: "snmp", 389: "ldap", 465: "smtps", 502: "modbus", 514: "syslog", 587: "submission",
+    631: "ipp", 636: "ldaps", 873: "rsync", 993: "imaps", 995: "pop3s", 1080: "socks", 1521: "oracle",
+    1723: "pptp", 1883: "mqtt", 2049: "nfs", 2375: "docker", 3268: "globalcatalog", 5060: "sip",
+    5353: "mdns", 5601: "kibana", 5672: "amqp", 5900: "vnc", 5985: "winrm", 6443: "kubernetes",
+    9100: "jetdirect", 9418: "git", 11211: "memcached",
+}
+GENERIC_VERSIONS = ("1.0", "2.0", "2.3", "3.1")
+
+OS_NAMES = ("Linux 5.x", "Linux 3.x", "Windows Server 2019", "Windows Server 2012 R2", "Windows 10", "FreeBSD 13",
+            "Cisco IOS 15")
+OS_WEIGHTS = (0.35, 0.1, 0.2, 0.1, 0.12, 0.05, 0.08)
+WINDOWS_OS = np.array([name.startswith("Windows") for name in OS_NAMES])
+
+# Identifiants récupérables sur un hôte compromis : un compte administrateur local
+# réutilisé par un hôte sur REUSE_GROUPS de chaque /24, et un compte de service
+# valable sur les contrôleurs de domaine (port 88) du même /24
+REUSE_GROUPS = 4
+LOCAL_ADMIN = "administrateur"
+SERVICE_ACCOUNT = "svc_backup"
+
+_GOLDEN = np.uint64(0x9E3779B1)
+
+
+class NetworkError(ValueError):
+    """Adresse, plage ou liste de ports invalide."""
+
+
+def parse_ports(spec: str = None) -> np.ndarray:
+    """
+    Ports d'une spécification : "22,80,443", "1-1024", "top" (ports courants) ou "all".
+
+    Retourne un tableau trié sans doublons.
+    """
+    if not spec or spec == "top":
+        return np.sort(PORTS)
+    if spec in ("all", "-"):
+        return np.arange(1, 65536, dtype=np.uint16)
+    chunks = []
+    try:
+        for part in spec.split(","):
+            low, _, high = part.strip().partition("-")
+            low = int(low)
+            high = int(high) if high else low
+            if not 1 <= low <= high <= 65535:
+                raise ValueError
+            chunks.append(np.arange(low, high + 1, dtype=np.uint16))
+    except ValueError:
+        raise NetworkError(f"Liste de ports invalide: {spec}") from None
+    return np.unique(np.concatenate(chunks))
+
+
+def parse_targets(spec: str) -> tuple:
+    """(première adresse, nombre d'adresses) d'une IP ou d'un réseau CIDR (/16 au plus)."""
+    try:
+        network = ipaddress.IPv4Network(spec, strict=False)
+    except ValueError:
+        raise NetworkError(f"Adresse ou réseau invalide: {spec}") from None
+    if network.prefixlen < MAX_SCAN_PREFIX:
+        raise NetworkError(f"Plage trop large: {spec} (/{MAX_SCAN_PREFIX} au plus)")
+    return int(network.network_address), network.num_addresses
+
+
+def format_address(address: int) -> str:
+    return str(ipaddress.IPv4Address(int(address)))
+
+
+class NetworkUniverse:
+    """
+    Réseau simulé déterministe, dérivé d'une graine et stocké en tableaux compacts.
+
+    - `alive` : un bit par hôte (np.packbits) ;
+    - `masks` : un uint64 par hôte, un bit par port de COMMON_PORTS ouvert ;
+    - `os` : un octet par hôte (index dans OS_NAMES) ;
+    - `extra_hosts`/`extra_ports` : ports ouverts hors COMMON_PORTS, triés par hôte.
+
+    Les adresses du réseau de base correspondent directement à un hôte ; toute autre
+    adresse (IP publique, nom d'hôte) est rattachée par hachage à un hôte actif, si
+    bien que chaque cible a un comportement stable. Les balayages opèrent sur des
+    blocs d'hôtes avec NumPy, sans boucle Python par port.
+    """
+
+    ARRAYS = ("alive", "masks", "os", "extra_hosts", "extra_ports")
+
+    def __init__(self, network: str, seed: int, alive, masks, os_ids, extra_hosts, extra_ports):
+        self.network = ipaddress.IPv4Network(network)
+        self.base = int(self.network.network_address)
+        self.size = self.network.num_addresses
+        self.seed = seed
+        self.alive = alive
+        self.masks = masks
+        self.os = os_ids
+        self.extra_hosts = extra_hosts
+        self.extra_ports = extra_ports
+        alive_indices = np.flatnonzero(np.unpackbits(np.asarray(alive))[:self.size]).astype(np.uint64)
+        # Cibles hors du réseau de base : rattachées aux hôtes actifs
+        self.alive_indices = alive_indices if alive_indices.size else np.arange(self.size, dtype=np.uint64)
+
+    # --- Génération et persistance ---
+
+    @classmethod
+    def generate(cls, seed: int = DEFAULT_WORLD_SEED, network: str = DEFAULT_NETWORK,
+                 alive_rate: float = 0.25, extra_ports_per_host: float = 0.3) -> "NetworkUniverse":
+        rng = np.random.default_rng(seed)
+        size = ipaddress.IPv4Network(network).num_addresses
+        alive = rng.random(size) < alive_rate
+
+        masks = np.zeros(size, dtype=np.uint64)
+        for bit, (_, probability) in enumerate(COMMON_PORTS):
+            masks |= (rng.random(size) < probability).astype(np.uint64) << np.uint64(bit)
+        masks[~alive] = 0
+
+        os_ids = rng.choice(len(OS_NAMES), size=size, p=OS_WEIGHTS).astype(np.uint8)
+
+        counts = rng.poisson(extra_ports_per_host, size) * alive
+        hosts = np.repeat(np.arange(size, dtype=np.uint64), counts)
+        ports = rng.integers(1024, 65536, hosts.size, dtype=np.uint64)
+        keep = ~np.isin(ports, PORTS.astype(np.uint64))
+        # Tri par hôte puis port, doublons retirés
+        keys = np.unique((hosts[keep] << np.uint64(16)) | ports[keep])
+        extra_hosts = (keys >> np.uint64(16)).astype(np.uint32)
+        extra_ports = (keys & np.uint64(0xFFFF)).astype(np.uint16)
+
+        return cls(network, seed, np.packbits(alive), masks, os_ids, extra_hosts, extra_ports)
+
+    def save(self, directory: str):
+        """Écrit les tableaux (.npy) et les métadonnées dans `directory`."""
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(directory, "meta.json"), 'w', encoding='utf-8') as f:
+            json.dump({"network": str(self.network), "seed": self.seed}, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "NetworkUniverse":
+        """Recharge un univers sauvegardé ; avec `mmap`, les tableaux restent sur disque."""
+        with open(os.path.join(directory, "meta.json"), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        mode = "r" if mmap else None
+        arrays = [np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode) for name in cls.ARRAYS]
+        return cls(meta["network"], meta["seed"], *arrays)
+
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.ARRAYS)
+
+    # --- Adressage ---
+
+    def host_index(self, addresses: np.ndarray) -> np.ndarray:
+        """Index d'hôte de chaque adresse (uint64)."""
+        addresses = np.asarray(addresses, dtype=np.uint64)
+        offset = addresses - np.uint64(self.base)
+        inside = (addresses >= np.uint64(self.base)) & (offset < np.uint64(self.size))
+        if inside.all():
+            return offset
+        hashed = ((addresses * _GOLDEN) & np.uint64(0xFFFFFFFF)) % np.uint64(self.alive_indices.size)
+        return np.where(inside, offset, self.alive_indices[hashed])
+
+    def target_index(self, target: str) -> int:
+        """Index d'hôte d'une IP, ou d'un nom d'hôte (rattaché par hachage)."""
+        try:
+            address = int(ipaddress.IPv4Address(target))
+        except ValueError:
+            address = zlib.crc32(target.encode())
+        return int(self.host_index(np.array([address]))[0])
+
+    def is_alive(self, indices: np.ndarray) -> np.ndarray:
+        indices = np.asarray(indices, dtype=np.uint64)
+        shift = np.uint64(7) - (indices & np.uint64(7))
+        return ((self.alive[indices >> np.uint64(3)] >> shift.astype(np.uint8)) & 1).astype(bool)
+
+    # --- Balayages ---
+
+    def _extras(self, indices: np.ndarray) -> tuple:
+        """(rangs dans `indices`, ports) des ports hors COMMON_PORTS ouverts sur ces hôtes."""
+        lo = np.searchsorted(self.extra_hosts, indices, side="left")
+        hi = np.searchsorted(self.extra_hosts, indices, side="right")
+        counts = hi - lo
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.uint16)
+        rows = np.repeat(np.arange(indices.size), counts)
+        starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        return rows, np.asarray(self.extra_ports)[np.arange(total) + starts]
+
+    def scan(self, first: int, count: int, ports: np.ndarray = None, chunk_hosts: int = DEFAULT_CHUNK_HOSTS):
+        """
+        Balaye `count` adresses consécutives à partir de `first` (entier).
+
+        Produit, bloc par bloc, des couples (adresses, ports) de tableaux alignés des ports
+        ouverts, triés par adresse puis par port. `ports` None = les 65 535 ports.
+        """
+        if ports is None:
+            wanted_bits = np.uint64(0xFFFFFFFFFFFFFFFF)
+            extra_ports = None
+        else:
+            ports = np.asarray(ports, dtype=np.uint16)
+            bits = [PORT_BITS[int(p)] for p in ports[np.isin(ports, PORTS)]]
+            wanted_bits = np.uint64(sum(1 << bit for bit in bits))
+            extra_ports = ports
+        for start in range(0, count, chunk_hosts):
+            addresses = np.arange(first + start, first + min(count, start + chunk_hosts), dtype=np.uint64)
+            indices = self.host_index(addresses)
+            masks = self.masks[indices] & wanted_bits
+            rows, bits = np.nonzero((masks[:, None] >> _BIT_SHIFTS) & np.uint64(1))
+            found_rows, found_ports = [rows], [PORTS[bits]]
+            extra_rows, extra = self._extras(indices)
+            if extra.size:
+                if extra_ports is not None:
+                    keep = np.isin(extra, extra_ports)
+                    extra_rows, extra = extra_rows[keep], extra[keep]
+                found_rows.append(extra_rows)
+                found_ports.append(extra)
+            rows = np.concatenate(found_rows)
+            open_ports = np.concatenate(found_ports)
+            order = np.lexsort((open_ports, rows))
+            yield addresses[rows[order]], open_ports[order]
+
+    def discover(self, first: int, count: int, chunk_hosts: int = DEFAULT_CHUNK_HOSTS):
+        """Adresses des hôtes actifs, bloc par bloc."""
+        for start in range(0, count, chunk_hosts):
+            addresses = np.arange(first + start, first + min(count, start + chunk_hosts), dtype=np.uint64)
+            yield addresses[self.is_alive(self.host_index(addresses))]
+
+    # --- Services ---
+
+    def open_ports(self, target: str) -> list:
+        index = self.target_index(target)
+        mask = int(self.masks[index])
+        ports = [int(port) for bit, port in enumerate(PORTS) if mask >> bit & 1]
+        lo, hi = np.searchsorted(self.extra_hosts, [index, index + 1])
+        ports.extend(int(port) for port in self.extra_ports[lo:hi])
+        return sorted(ports)
+
+    def service(self, index: int, port: int) -> dict:
+        """Logiciel et version exposés sur un port (stables pour un univers donné)."""
+        salt = (index * 0x9E3779B1 + port * 0x85EBCA77 + self.seed) & 0xFFFFFFFF
+        products = PORT_PRODUCTS.get(port)
+        if products is None:
+            return {"port": port, "product": SERVICE_NAMES.get(port, "unknown"),
+                    "version": GENERIC_VERSIONS[salt % len(GENERIC_VERSIONS)]}
+        product, versions = products[salt % len(products)]
+        return {"port": port, "product": product, "version": versions[(salt >> 8) % len(versions)]}
+
+    def host_alive(self, target: str) -> bool:
+        return bool(self.is_alive(np.array([self.target_index(target)]))[0])
+
+    def contains(self, target: str) -> bool:
+        """La cible est-elle une adresse du réseau de base (et non rattachée par hachage) ?"""
+        try:
+            address = int(ipaddress.IPv4Address(target))
+        except ValueError:
+            return False
+        return self.base <= address < self.base + self.size
+
+    def exposes(self, target: str, ports) -> bool:
+        """La cible est-elle un hôte actif avec au moins un des `ports` ouvert ?"""
+        open_ports = self.open_ports(target)
+        return any(port in open_ports for port in ports)
+
+    def host_services(self, target: str) -> list:
+        index = self.target_index(target)
+        return [self.service(index, port) for port in self.open_ports(target)]
+
+    def host_os(self, target: str) -> str:
+        return OS_NAMES[int(self.os[self.target_index(target)])]
+
+    # --- Identifiants ---
+
+    def _salt(self, indices):
+        return (np.asarray(indices, dtype=np.uint64) * _GOLDEN + np.uint64(self.seed)) & np.uint64(0xFFFFFFFF)
+
+    def _reuses_admin(self, indices) -> np.ndarray:
+        return self._salt(indices) % np.uint64(REUSE_GROUPS) == 0
+
+    def _is_dc(self, indices) -> np.ndarray:
+        return (self.masks[indices] >> np.uint64(PORT_BITS[88])) & np.uint64(1) == 1
+
+    def host_credentials(self, target: str) -> list:
+        """Identifiants extraits d'un hôte : [{"user", "realm", "valid_on": [IPs]}]."""
+        index = self.target_index(target)
+        subnet = index & ~0xFF
+        indices = np.arange(subnet, min(subnet + 256, self.size), dtype=np.uint64)
+        indices = indices[self.is_alive(indices)]
+        realm = f"{format_address(self.base + subnet)}/24"
+        credentials = []
+        if self._reuses_admin([index])[0]:
+            valid = indices[self._reuses_admin(indices)]
+            credentials.append({"user": LOCAL_ADMIN, "realm": realm,
+                                "valid_on": [format_address(self.base + int(i)) for i in valid]})
+        if WINDOWS_OS[self.os[index]] and int(self._salt([index])[0]) >> 4 & 1:
+            valid = indices[self._is_dc(indices)]
+            credentials.append({"user": SERVICE_ACCOUNT, "realm": realm,
+                                "valid_on": [format_address(self.base + int(i)) for i in valid]})
+        return credentials
+
+    def credential_valid(self, user: str, realm: str, target: str) -> bool:
+        """
+        Un identifiant extrait dans `realm` (le /24 de son hôte d'origine) ouvre-t-il `target` ?
+
+        Même règle que `host_credentials` : la cible doit appartenir au /24 d'origine.
+        """
+        try:
+            if ipaddress.IPv4Address(target) not in ipaddress.IPv4Network(realm):
+                return False
+        except ValueError:
+            return False
+        index = self.target_index(target)
+        if not self.is_alive([index])[0]:
+            return False
+        if user == LOCAL_ADMIN:
+            return bool(self._reuses_admin([index])[0])
+        if user == SERVICE_ACCOUNT:
+            return bool(self._is_dc([index])[0])
+        return False
+
+
+_default_universe = None
+
+
+def get_default_universe() -> NetworkUniverse:
+    """Univers partagé par toutes les sessions, généré à la première utilisation."""
+    global _default_universe
+    if _default_universe is None:
+        _default_universe = NetworkUniverse.generate()
+    return _default_universe
+
+
+def set_default_universe(universe: NetworkUniverse):
+    global _default_universe
+    _default_universe = universe
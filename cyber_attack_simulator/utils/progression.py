@@ -0,0 +1,343 @@
+# utils/progression.py
+import bisect
+import json
+import os
+from typing import NamedTuple
+
+from cyber_attack_simulator.game_state import DEFAULT_LEVEL_THRESHOLDS
+
+DEFAULT_PROGRESSION_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'progression.json')
+
+# Préfixe des bits représentant un nœud déjà débloqué (dépendances « after »)
+NODE_BIT_PREFIX = "@"
+
+
+class ProgressionError(ValueError):
+    """Scénario de progression invalide (nœud inconnu, cycle de dépendances...)."""
+
+
+class ProgressionNode(NamedTuple):
+    """Nœud compilé : prérequis encodés dans un masque de bits, récompenses et déblocages."""
+    index: int
+    id: str
+    description: str
+    unlocks: tuple
+    requires_flags: tuple
+    after: tuple
+    min_level: int
+    min_xp: int
+    reward_xp: int
+    reward_credits: int
+    mask: int  # Bits des flags (et nœuds) requis
+
+
+class Progression:
+    """
+    Scénario de progression compilé en graphe de dépendances.
+
+    Chaque flag requis reçoit un bit ; les prérequis d'un nœud forment un masque, et
+    l'index inverse bit -> nœuds ne fait examiner, à chaque nouveau flag, que les
+    nœuds qui l'attendent. Les seuils de niveau et d'expérience sont triés pour
+    n'examiner que les nœuds dont le seuil vient d'être franchi.
+    """
+
+    def __init__(self, data: dict, catalog=None):
+        self.level_thresholds = tuple(data.get("level_thresholds", DEFAULT_LEVEL_THRESHOLDS))
+        xp = data.get("xp", {})
+        self.xp_base = xp.get("base", 10)
+        self.xp_per_risk = xp.get("per_risk", 0)
+        self.xp_overrides = dict(xp.get("commands", {}))
+        self.initial_commands = frozenset(data.get("initial_commands", ()))
+        self.catalog = catalog
+
+        self.flag_bits = {}
+        self.nodes = []
+        by_id = {}
+        for entry in data.get("nodes", []):
+            node_id = entry["id"]
+            if node_id in by_id:
+                raise ProgressionError(f"Nœud de progression en double: {node_id}")
+            by_id[node_id] = entry
+
+        for entry in by_id.values():
+            requires = entry.get("requires", {})
+            for dependency in requires.get("after", ()):
+                if dependency not in by_id:
+                    raise ProgressionError(f"Nœud '{entry['id']}' : dépendance inconnue '{dependency}'")
+            mask = 0
+            for flag in requires.get("flags", ()):
+                mask |= 1 << self._bit(flag)
+            for dependency in requires.get("after", ()):
+                mask |= 1 << self._bit(NODE_BIT_PREFIX + dependency)
+            rewards = entry.get("rewards", {})
+            self.nodes.append(ProgressionNode(
+                index=len(self.nodes),
+                id=entry["id"],
+                description=entry.get("description", ""),
+                unlocks=tuple(entry.get("unlocks", ())),
+                requires_flags=tuple(requires.get("flags", ())),
+                after=tuple(requires.get("after", ())),
+                min_level=int(requires.get("level", 1)),
+                min_xp=int(requires.get("xp", 0)),
+                reward_xp=int(rewards.get("xp", 0)),
+                reward_credits=int(rewards.get("credits", 0)),
+                mask=mask,
+            ))
+        self.by_id = {node.id: node for node in self.nodes}
+        self.node_bits = tuple(self._bit(NODE_BIT_PREFIX + node.id) for node in self.nodes)
+
+        # Index inverses : bit -> nœuds qui l'attendent, seuils triés
+        waiting = {}
+        for node in self.nodes:
+            mask, bit = node.mask, 0
+            while mask:
+                if mask & 1:
+                    waiting.setdefault(bit, []).append(node.index)
+                mask >>= 1
+                bit += 1
+        self.waiting_on_bit = {bit: tuple(indices) for bit, indices in waiting.items()}
+        self.level_gates = sorted((node.min_level, node.index) for node in self.nodes if node.min_level > 1)
+        self.xp_gates = sorted((node.min_xp, node.index) for node in self.nodes if node.min_xp > 0)
+        self.roots = tuple(node.index for node in self.nodes
+                           if not node.mask and node.min_level <= 1 and node.min_xp <= 0)
+
+        self.unlocked_by = {}
+        for node in self.nodes:
+            for command in node.unlocks:
+                self.unlocked_by.setdefault(command, []).append(node.index)
+        self.gated_commands = frozenset(self.unlocked_by) - self.initial_commands
+        self.order = self._topological_order()
+
+    def _bit(self, flag: str) -> int:
+        bit = self.flag_bits.get(flag)
+        if bit is None:
+            bit = self.flag_bits[flag] = len(self.flag_bits)
+        return bit
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PROGRESSION_FILE, catalog=None) -> "Progression":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), catalog)
+
+    # --- Graphe de dépendances ---
+
+    def dependencies(self) -> dict:
+        """
+        Arêtes nœud -> nœuds dépendants.
+
+        Un nœud dépend de ceux qu'il cite dans `after`, et de ceux qui débloquent les
+        commandes produisant (champ `flags` du catalogue) un flag qu'il requiert.
+        """
+        producers = {}
+        if self.catalog is not None:
+            for spec in self.catalog:
+                for flag in spec.flags:
+                    producers.setdefault(flag, []).append(spec.name)
+
+        edges = {node.index: set() for node in self.nodes}
+        for node in self.nodes:
+            for dependency in node.after:
+                edges[self.by_id[dependency].index].add(node.index)
+            for flag in node.requires_flags:
+                for command in producers.get(flag, ()):
+                    if command in self.gated_commands:
+                        for parent in self.unlocked_by[command]:
+                            edges[parent].add(node.index)
+        return edges
+
+    def _topological_order(self) -> tuple:
+        """Ordre topologique (Kahn) ; lève ProgressionError si le graphe contient un cycle."""
+        edges = self.dependencies()
+        indegree = {index: 0 for index in edges}
+        for children in edges.values():
+            for child in children:
+                indegree[child] += 1
+        ready = [index for index, degree in indegree.items() if degree == 0]
+        order = []
+        while ready:
+            index = ready.pop()
+            order.append(index)
+            for child in edges[index]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        if len(order) != len(self.nodes):
+            cycle = sorted(self.nodes[index].id for index, degree in indegree.items() if degree > 0)
+            raise ProgressionError(f"Cycle de dépendances dans la progression: {', '.join(cycle)}")
+        return tuple(order)
+
+    # --- Règles ---
+
+    def command_xp(self, command: str) -> int:
+        xp = self.xp_overrides.get(command)
+        if xp is not None:
+            return xp
+        spec = self.catalog.get(command) if self.catalog is not None else None
+        risk = spec.risk if spec is not None else 0.0
+        return int(round(self.xp_base + self.xp_per_risk * risk))
+
+    def missing_requirements(self, command: str, tracker: "ProgressionTracker") -> list:
+        """Prérequis manquants (lisibles) du nœud le plus proche de débloquer une commande."""
+        best = None
+        for index in self.unlocked_by.get(command, ()):
+            node = self.nodes[index]
+            missing = [flag for flag in node.requires_flags if flag not in tracker.engine.flags]
+            missing += [f"nœud {dependency}" for dependency in node.after
+                        if self.by_id[dependency].index not in tracker.unlocked_nodes]
+            state = tracker.engine.game_state
+            if state.level < node.min_level:
+                missing.append(f"niveau {node.min_level}")
+            if state.experience < node.min_xp:
+                missing.append(f"{node.min_xp} XP")
+            if best is None or len(missing) < len(best):
+                best = missing
+        return best or []
+
+
+class ProgressionTracker:
+    """
+    Suivi incrémental de la progression d'une session.
+
+    Chaque nouveau flag, gain d'expérience ou de niveau ne fait examiner que les nœuds
+    concernés ; un nœud débloqué ajoute son propre bit, ce qui propage les déblocages
+    en cascade sans jamais reparcourir tout le scénario.
+    """
+    __slots__ = ("progression", "engine", "mask", "unlocked_nodes", "recent_unlocks")
+
+    def __init__(self, progression: Progression, engine):
+        self.progression = progression
+        self.engine = engine
+        self.mask = 0
+        self.unlocked_nodes = set()
+        self.recent_unlocks = []  # Commandes débloquées depuis le dernier `drain_unlocks`
+        self.sync()
+
+    def sync(self, unlocked_nodes=None):
+        """
+        Recalcule l'état depuis le moteur (après restauration d'un instantané).
+
+        `unlocked_nodes` (identifiants, voir `node_ids`) évite de redonner les récompenses
+        des nœuds déjà atteints ; sans lui, ils sont déduits des commandes débloquées.
+        """
+        progression = self.progression
+        state = self.engine.game_state
+        for command in progression.initial_commands:
+            state.unlock_command(command)
+        self.mask = 0
+        for flag in self.engine.flags:
+            bit = progression.flag_bits.get(flag)
+            if bit is not None:
+                self.mask |= 1 << bit
+        self.unlocked_nodes = set()
+        if unlocked_nodes is not None:
+            self.unlocked_nodes = {progression.by_id[node_id].index for node_id in unlocked_nodes
+                                   if node_id in progression.by_id}
+        else:
+            # Ancien instantané : un nœud est considéré débloqué si toutes ses commandes le sont déjà
+            for node in progression.nodes:
+                if node.unlocks and all(command in state.unlocked_commands for command in node.unlocks):
+                    self.unlocked_nodes.add(node.index)
+        for index in self.unlocked_nodes:
+            self.mask |= 1 << progression.node_bits[index]
+        self._evaluate(progression.roots + tuple(index for _, index in progression.level_gates)
+                       + tuple(index for _, index in progression.xp_gates)
+                       + tuple(index for indices in progression.waiting_on_bit.values() for index in indices))
+
+    def fork(self, engine) -> "ProgressionTracker":
+        """Copie du suivi pour une branche du moteur (voir `CyberAttackEngine.fork`)."""
+        tracker = ProgressionTracker.__new__(ProgressionTracker)
+        tracker.progression = self.progression
+        tracker.engine = engine
+        tracker.mask = self.mask
+        tracker.unlocked_nodes = set(self.unlocked_nodes)
+        tracker.recent_unlocks = []
+        return tracker
+
+    def node_ids(self) -> list:
+        """Identifiants des nœuds débloqués, pour l'instantané du moteur."""
+        return sorted(self.progression.nodes[index].id for index in self.unlocked_nodes)
+
+    def is_unlocked(self, command: str) -> bool:
+        return (command not in self.progression.gated_commands
+                or command in self.engine.game_state.unlocked_commands)
+
+    def drain_unlocks(self) -> list:
+        unlocks, self.recent_unlocks = self.recent_unlocks, []
+        return unlocks
+
+    # --- Événements ---
+
+    def on_flag(self, flag: str):
+        bit = self.progression.flag_bits.get(flag)
+        if bit is None or self.mask >> bit & 1:
+            return
+        self.mask |= 1 << bit
+        self._evaluate(self.progression.waiting_on_bit.get(bit, ()))
+
+    def on_success(self, command: str):
+        """Crédite l'expérience d'une commande réussie."""
+        self.add_experience(self.progression.command_xp(command))
+
+    def add_experience(self, xp: int):
+        state = self.engine.game_state
+        old_level, old_xp = state.level, state.experience
+        state.add_experience(xp, self.progression.level_thresholds)
+        self._evaluate(self._crossed(old_level, old_xp))
+
+    def _crossed(self, old_level: int, old_xp: int) -> list:
+        """Nœuds dont un seuil de niveau ou d'expérience vient d'être franchi."""
+        progression = self.progression
+        state = self.engine.game_state
+        candidates = []
+        for gates, old, new in ((progression.level_gates, old_level, state.level),
+                                (progression.xp_gates, old_xp, state.experience)):
+            if new > old:
+                start = bisect.bisect_right(gates, (old, len(progression.nodes)))
+                end = bisect.bisect_right(gates, (new, len(progression.nodes)))
+                candidates.extend(index for _, index in gates[start:end])
+        return candidates
+
+    def _evaluate(self, candidates):
+        progression = self.progression
+        state = self.engine.game_state
+        pending = list(candidates)
+        while pending:
+            index = pending.pop()
+            if index in self.unlocked_nodes:
+                continue
+            node = progression.nodes[index]
+            if node.mask & ~self.mask or state.level < node.min_level or state.experience < node.min_xp:
+                continue
+            self.unlocked_nodes.add(index)
+            for command in node.unlocks:
+                if state.unlock_command(command):
+                    self.recent_unlocks.append(command)
+            bit = progression.node_bits[index]
+            self.mask |= 1 << bit
+            pending.extend(progression.waiting_on_bit.get(bit, ()))
+            if node.reward_credits:
+                state.credits += node.reward_credits
+            if node.reward_xp:
+                old_level, old_xp = state.level, state.experience
+                state.add_experience(node.reward_xp, progression.level_thresholds)
+                pending.extend(self._crossed(old_level, old_xp))
+
+
+def progression_gate(engine, command: str, params: dict):
+    """Crochet `pre` : refuse les commandes pas encore débloquées."""
+    tracker = engine.progression
+    if tracker is None or tracker.is_unlocked(command):
+        return None
+    missing = tracker.progression.missing_requirements(command, tracker)
+    detail = f" Prérequis : {', '.join(missing)}." if missing else ""
+    return {"success": False, "output": f"🔒 Commande '{command}' verrouillée.{detail}"}
+
+
+def attach_progression(engine, progression: Progression = None, enforce: bool = True) -> ProgressionTracker:
+    """Branche la progression sur un moteur (et le verrouillage des commandes si `enforce`)."""
+    if progression is None:
+        progression = Progression.load(catalog=engine.catalog)
+    engine.progression = ProgressionTracker(progression, engine)
+    if enforce and "progression" not in engine.middleware:
+        engine.add_middleware("progression", pre=progression_gate)
+    return engine.progression
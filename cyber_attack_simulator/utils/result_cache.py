@@ -0,0 +1,125 @@
+# utils/result_cache.py
+import copy
+import time
+from collections import OrderedDict
+
+from cyber_attack_simulator.utils.command_history import deep_getsizeof
+from cyber_attack_simulator.utils.results import CommandResult
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024
+
+# Paramètres sensibles à la casse (chemin de wordlist, URL, communauté SNMP) : seuls les espaces sont retirés
+VERBATIM_PARAMS = frozenset({"wordlist", "url", "community"})
+
+# Champs mutables d'un résultat, copiés pour que l'entrée en cache ne partage rien avec ses lecteurs
+MUTABLE_FIELDS = ("data", "new_state", "flags")
+
+
+def normalize_param_value(value, name: str = None):
+    """Normalise une valeur comme un nom DNS : casse et point final ignorés, espaces retirés."""
+    if isinstance(value, str):
+        if name in VERBATIM_PARAMS:
+            return value.strip()
+        return value.strip().lower().rstrip(".")
+    return value
+
+
+def make_cache_key(command: str, params: dict) -> tuple:
+    """Clé de cache indépendante de l'ordre et de la casse des paramètres."""
+    return command, tuple(sorted((key, normalize_param_value(value, key)) for key, value in (params or {}).items()))
+
+
+def copy_result(result):
+    """Copie d'un résultat dont les champs mutables (données, delta d'état, flags) sont dupliqués."""
+    duplicate = copy.copy(result)
+    if isinstance(result, CommandResult):
+        for name in MUTABLE_FIELDS + ("extra",):
+            setattr(duplicate, name, copy.deepcopy(getattr(result, name)))
+    else:
+        for name in MUTABLE_FIELDS:
+            if name in result:
+                duplicate[name] = copy.deepcopy(result[name])
+    return duplicate
+
+
+def mark_cached(result):
+    """Copie d'un résultat (voir `copy_result`), marquée comme servie depuis le cache."""
+    cached = copy_result(result)
+    cached["cached"] = True
+    return cached
+
+
+class ResultCache:
+    """
+    Cache LRU à durée de vie par entrée (sémantique des TTL DNS).
+
+    Une entrée expirée n'est jamais servie. Le cache est borné en nombre d'entrées
+    et en mémoire approximative ; les entrées les moins récemment utilisées sont
+    évincées en premier.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.entries = OrderedDict()  # clé -> (expiration, résultat, taille)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, result, size = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            self.bytes -= size
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result, ttl: float):
+        if ttl <= 0:
+            return
+        # Taille des données structurées, sans forcer le rendu du rapport texte
+        size = deep_getsizeof(result.to_dict() if hasattr(result, "to_dict") else result)
+        if size > self.max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous[2]
+        # Copie : le résultat d'origine est rendu à l'appelant, qui peut le modifier
+        self.entries[key] = (self.clock() + ttl, copy_result(result), size)
+        self.bytes += size
+        while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, _, evicted_size) = self.entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,113 @@
+# utils/results.py
+import json
+from collections.abc import Mapping
+
+REPORT_FOOTER = "---------------------------------\n"
+
+
+class CommandResult(Mapping):
+    """
+    Résultat structuré d'une commande.
+
+    Les données restent sous forme structurée ; le rapport texte (`output`) n'est
+    construit qu'au premier accès, puis mis en cache. L'objet reste compatible avec
+    l'ancien format dict : `result["output"]`, `result.get("success")`, `"flags" in result`.
+    """
+    __slots__ = ("command", "success", "data", "new_state", "flags", "time_consumed",
+                 "message", "extra", "_output")
+
+    # Clés exposées par l'interface dict, dans l'ordre historique
+    FIELDS = ("success", "output", "new_state", "flags", "time_consumed")
+
+    def __init__(self, command: str, success: bool = True, data: dict = None, new_state: dict = None,
+                 flags: list = None, time_consumed: float = None, message: str = None):
+        self.command = command
+        self.success = success
+        self.data = data
+        self.new_state = new_state
+        self.flags = flags
+        self.time_consumed = time_consumed
+        self.message = message  # Texte brut (échecs) remplaçant le rapport formaté
+        self.extra = None
+        self._output = None
+
+    @classmethod
+    def failure(cls, message: str, command: str = None) -> "CommandResult":
+        return cls(command, success=False, message=message)
+
+    # --- Rendu ---
+
+    @property
+    def output(self) -> str:
+        if self._output is None:
+            self._output = self.render("text")
+        return self._output
+
+    def render(self, fmt: str = "text") -> str:
+        """Rend le résultat en texte (rapport), JSON ou JSON-lines."""
+        if fmt == "text":
+            if self.message is not None or self.data is None:
+                return self.message or ""
+            lines = [f"--- Rapport pour {self.command} ---\n"]
+            lines.extend(f"  - {key}: {value}\n" for key, value in self.data.items())
+            lines.append(REPORT_FOOTER)
+            return "".join(lines)
+        if fmt == "json":
+            return json.dumps(self.to_dict(), ensure_ascii=False, default=str)
+        if fmt == "jsonl":
+            return self.render("json") + "\n"
+        raise ValueError(f"Format de rendu inconnu: {fmt}")
+
+    def to_dict(self) -> dict:
+        """Représentation structurée (sans le rapport texte)."""
+        result = {"command": self.command, "success": self.success}
+        for name in ("data", "flags", "time_consumed", "message"):
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    # --- Interface dict ---
+
+    def __getitem__(self, key: str):
+        if key == "output":
+            return self.output
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key == "output":
+            self._output = value
+        elif key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key) -> bool:
+        if key == "output":
+            return True
+        if key in self.FIELDS:
+            return getattr(self, key) is not None
+        return bool(self.extra) and key in self.extra
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if key in self:
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"CommandResult({self.to_dict()!r})"
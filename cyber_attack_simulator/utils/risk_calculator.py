@@ -1,14 +1,145 @@
 # utils/risk_calculator.py
+import numpy as np
+
+DEFAULT_RISK = 0.1
+
+# Valeurs historiques, utilisées pour une session sans catalogue
+_LEGACY_RISKS = {
+    "resoudredns": 0.02,
+    "scannerports": 0.15,
+    "testersql": 0.25,
+}
+
+
 class RiskCalculator:
     """Calcule les risques de détection pour chaque action"""
 
     @staticmethod
-    def calculate_detection_risk(command: str, params: dict) -> float:
-        """Calcule le risque de détection d'une commande"""
-        risks = {
-            "resoudredns": 0.02,
-            "scannerports": 0.15,
-            "testersql": 0.25,
-            # ... toutes les commandes
-        }
-        return risks.get(command, 0.1)
+    def calculate_detection_risk(command: str, params: dict, catalog=None) -> float:
+        """Calcule le risque de détection d'une commande (champ `risk` du catalogue de la session)"""
+        if catalog is None:
+            return _LEGACY_RISKS.get(command, DEFAULT_RISK)
+        spec = catalog.get(command)
+        return spec.risk if spec is not None else DEFAULT_RISK
+
+
+class DetectionEngine:
+    """
+    Moteur de détection vectorisé.
+
+    Le risque de base de chaque commande est précalculé dans un tableau NumPy indexé
+    par `CommandSpec.index`. Le risque effectif d'une action vaut :
+
+        base * (1 + repetition_factor * répétitions) * sensibilité_cible / stealth_level
+
+    borné à [0, 1]. `score_batch`/`apply_batch` évaluent des milliers d'actions en une
+    seule passe au lieu d'un appel Python par action.
+    """
+
+    # Paramètres identifiant la cible d'une commande, par ordre de priorité
+    TARGET_PARAMS = ("ip", "domaine", "url", "cible", "reseau", "organisation")
+
+    def __init__(self, catalog, sensitivity: dict = None, repetition_factor: float = 0.25,
+                 default_risk: float = DEFAULT_RISK):
+        self.index = {spec.name: spec.index for spec in catalog}
+        self.base_risk = np.array([spec.risk for spec in catalog] + [default_risk], dtype=np.float64)
+        # Dernière case : commandes absentes du catalogue
+        self.unknown_index = len(self.base_risk) - 1
+        self.sensitivity = dict(sensitivity or {})
+        self.repetition_factor = repetition_factor
+
+    # --- Modificateurs ---
+
+    def command_index(self, command: str) -> int:
+        return self.index.get(command, self.unknown_index)
+
+    def target_sensitivity(self, params: dict) -> float:
+        """Sensibilité de la cible (1.0 par défaut) d'après le premier paramètre de cible présent."""
+        if not self.sensitivity or not params:
+            return 1.0
+        for key in self.TARGET_PARAMS:
+            target = params.get(key)
+            if target is not None:
+                return self.sensitivity.get(target, 1.0)
+        return 1.0
+
+    # --- Évaluation unitaire ---
+
+    def score(self, command: str, params: dict, stealth_level: float = 1.0, repetitions: int = 0) -> float:
+        """Risque effectif d'une seule action."""
+        risk = (self.base_risk[self.command_index(command)]
+                * (1.0 + self.repetition_factor * repetitions)
+                * self.target_sensitivity(params)
+                / max(stealth_level, 1e-6))
+        return float(min(max(risk, 0.0), 1.0))
+
+    # --- Évaluation par lots ---
+
+    def score_batch(self, command_indices, stealth_levels=1.0, repetitions=0, sensitivities=1.0) -> np.ndarray:
+        """Risques effectifs d'un lot d'actions (tableaux ou scalaires diffusés)."""
+        risk = self.base_risk[np.asarray(command_indices, dtype=np.intp)]
+        risk = risk * (1.0 + self.repetition_factor * np.asarray(repetitions, dtype=np.float64))
+        risk = risk * np.asarray(sensitivities, dtype=np.float64)
+        risk = risk / np.maximum(np.asarray(stealth_levels, dtype=np.float64), 1e-6)
+        return np.clip(risk, 0.0, 1.0)
+
+    def apply_batch(self, actions: list) -> np.ndarray:
+        """
+        Applique un lot d'actions (engine, commande, paramètres) aux moteurs concernés.
+
+        Une même session peut apparaître plusieurs fois : ses risques sont cumulés,
+        puis chaque `detection_level` est mis à jour une seule fois. Retourne les risques.
+        """
+        if not actions:
+            return np.empty(0)
+
+        count = len(actions)
+        engine_list, commands, params = zip(*actions)
+        # Sessions et commandes ramenées à des indices : la suite du lot se calcule par tableaux
+        engine_ids = np.fromiter(map(id, engine_list), dtype=np.uint64, count=count)
+        _, first_seen, slots = np.unique(engine_ids, return_index=True, return_inverse=True)
+        engines = [engine_list[i] for i in first_seen.tolist()]
+        codes = {}
+        command_slots = np.fromiter((codes.setdefault(command, len(codes)) for command in commands),
+                                    dtype=np.intp, count=count)
+        names = list(codes)
+        command_indices = np.array([self.command_index(name) for name in names], dtype=np.intp)[command_slots]
+
+        # Les répétitions tiennent compte des actions précédentes du même lot : rang de
+        # chaque action parmi celles du même couple (session, commande)
+        groups, group_of, group_sizes = np.unique(slots * len(names) + command_slots,
+                                                  return_inverse=True, return_counts=True)
+        starts = np.cumsum(group_sizes) - group_sizes
+        ranks = np.empty(count, dtype=np.float64)
+        ranks[np.argsort(group_of, kind="stable")] = np.arange(count) - np.repeat(starts, group_sizes)
+        group_slots, group_commands = np.divmod(groups, len(names))
+        group_keys = list(zip(group_slots.tolist(), (names[c] for c in group_commands.tolist())))
+        previous = np.array([engines[slot].repetitions.get(command, 0) for slot, command in group_keys],
+                            dtype=np.float64)
+        repetitions = previous[group_of] + ranks
+
+        sensitivities = 1.0
+        if self.sensitivity:
+            sensitivities = np.fromiter(map(self.target_sensitivity, params), dtype=np.float64, count=count)
+
+        stealth = np.array([engine.game_state.stealth_level for engine in engines], dtype=np.float64)
+        risks = self.score_batch(command_indices, stealth[slots], repetitions, sensitivities)
+
+        levels = np.array([engine.detection_level for engine in engines], dtype=np.float64)
+        np.add.at(levels, slots, risks)
+        np.clip(levels, 0.0, 1.0, out=levels)
+
+        for slot, engine in enumerate(engines):
+            engine.detection_level = float(levels[slot])
+        for (slot, command), total in zip(group_keys, (previous + group_sizes).astype(int).tolist()):
+            engines[slot].repetitions[command] = total
+        return risks
+
+    def apply_pending(self, engines) -> np.ndarray:
+        """Évalue en un seul lot les actions en attente (`pending_detection`) de plusieurs sessions."""
+        actions = []
+        for engine in engines:
+            if engine.pending_detection:
+                actions.extend((engine, command, params) for command, params in engine.pending_detection)
+                engine.pending_detection = []
+        return self.apply_batch(actions)
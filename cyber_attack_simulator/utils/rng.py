@@ -0,0 +1,27 @@
+# utils/rng.py
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Générateur aléatoire de la session en cours d'exécution. Les handlers sont partagés
+# entre sessions : ils tirent leurs nombres via `get_rng()` plutôt que du module `random`,
+# ce qui rend chaque partie reproductible à partir de la graine de son moteur.
+_current_rng = ContextVar("current_rng", default=None)
+# Générateur de repli, hors de toute session (handler appelé directement, scripts)
+_fallback_rng = random.Random()
+
+
+def get_rng() -> random.Random:
+    """Retourne le générateur de la session courante (ou un générateur de repli propre au module)."""
+    rng = _current_rng.get()
+    return rng if rng is not None else _fallback_rng
+
+
+@contextmanager
+def use_rng(rng: random.Random):
+    """Active `rng` pour le code exécuté dans le bloc (thread ou tâche asyncio courante)."""
+    token = _current_rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _current_rng.reset(token)
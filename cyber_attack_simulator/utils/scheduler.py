@@ -0,0 +1,119 @@
+# utils/scheduler.py
+import heapq
+import itertools
+
+# Statuts d'un job en arrière-plan
+JOB_RUNNING = "en cours"
+JOB_DONE = "terminé"
+JOB_CANCELLED = "annulé"
+
+
+class ScheduledEvent:
+    """Événement planifié ; `callback()` est appelé quand l'horloge atteint `due`."""
+    __slots__ = ("due", "seq", "callback", "cancelled")
+
+    def __init__(self, due: float, seq: int, callback):
+        self.due = due
+        self.seq = seq
+        self.callback = callback
+        self.cancelled = False
+
+    def __lt__(self, other):
+        # L'ordre d'insertion départage les événements simultanés
+        return (self.due, self.seq) < (other.due, other.seq)
+
+
+class EventScheduler:
+    """
+    Horloge de jeu simulée et file d'événements discrets (tas binaire).
+
+    Planifier et déclencher un événement coûtent O(log n) quel que soit le nombre
+    d'événements en attente. Une annulation marque l'événement, qui est écarté à sa
+    sortie du tas ; le tas est reconstruit quand les annulés en forment la majorité.
+    """
+    __slots__ = ("now", "_heap", "_seq", "_cancelled")
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self._heap = []
+        self._seq = itertools.count()
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, delay: float, callback) -> ScheduledEvent:
+        """Planifie `callback` dans `delay` secondes de jeu."""
+        event = ScheduledEvent(self.now + max(0.0, delay), next(self._seq), callback)
+        heapq.heappush(self._heap, event)
+        return event
+
+    def cancel(self, event: ScheduledEvent) -> bool:
+        if event.cancelled or event.callback is None:
+            return False
+        event.cancelled = True
+        event.callback = None
+        self._cancelled += 1
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            self._heap = [e for e in self._heap if not e.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        return True
+
+    def next_due(self):
+        """Échéance du prochain événement, ou None si la file est vide."""
+        heap = self._heap
+        while heap and heap[0].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return heap[0].due if heap else None
+
+    def advance_to(self, when: float) -> int:
+        """
+        Avance l'horloge jusqu'à `when` en déclenchant, dans l'ordre, les événements échus.
+
+        L'horloge vaut l'échéance de chaque événement pendant son rappel. Retourne le
+        nombre d'événements déclenchés.
+        """
+        fired = 0
+        # `self._heap` est relu à chaque tour : une annulation dans un rappel peut le reconstruire
+        while self._heap and self._heap[0].due <= when:
+            event = heapq.heappop(self._heap)
+            if event.cancelled:
+                self._cancelled -= 1
+                continue
+            callback, event.callback = event.callback, None
+            self.now = max(self.now, event.due)
+            callback()
+            fired += 1
+        self.now = max(self.now, when)
+        return fired
+
+    def advance(self, delay: float) -> int:
+        return self.advance_to(self.now + delay)
+
+    def run_next(self) -> bool:
+        """Avance jusqu'au prochain événement et le déclenche. False si la file est vide."""
+        due = self.next_due()
+        if due is None:
+            return False
+        self.advance_to(due)
+        return True
+
+
+class Job:
+    """Commande lancée en arrière-plan : son résultat est appliqué à l'échéance."""
+    __slots__ = ("id", "command", "params", "started", "due", "status", "result", "event")
+
+    def __init__(self, job_id: int, command: str, params: dict, started: float):
+        self.id = job_id
+        self.command = command
+        self.params = params
+        self.started = started
+        self.due = started
+        self.status = JOB_RUNNING
+        self.result = None
+        self.event = None
+
+    def __repr__(self):
+        return f"Job(#{self.id} {self.command} {self.status})"
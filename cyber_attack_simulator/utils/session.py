@@ -0,0 +1,49 @@
+# utils/session.py
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# État de jeu de la session en cours d'exécution. Comme le générateur (utils.rng), il est
+# fourni par le moteur le temps d'un appel de handler : les handlers, partagés entre
+# sessions, y vérifient les prérequis d'une commande (hôte analysé, compromis...).
+_current_state = ContextVar("current_state", default=None)
+# Fonction du moteur appliquant sur-le-champ un delta partiel (chemin synchrone seulement)
+_stream_sink = ContextVar("stream_sink", default=None)
+
+
+def current_state():
+    """Retourne le GameState de la session courante, ou None hors session."""
+    return _current_state.get()
+
+
+def known_target(target: str) -> dict:
+    """Informations de la session sur une cible ({} si elle est inconnue, ou hors session)."""
+    state = _current_state.get()
+    if state is None:
+        return {}
+    return state.discovered_targets.get(target) or {}
+
+
+def stream_update(delta: dict) -> bool:
+    """
+    Transmet au moteur un delta partiel (bloc d'un balayage), appliqué tout de suite à l'état.
+
+    Retourne False quand le moteur applique le résultat en une fois (jobs, chemin
+    asynchrone) : le handler doit alors reporter le delta dans son `new_state`.
+    """
+    sink = _stream_sink.get()
+    if sink is None:
+        return False
+    sink(delta)
+    return True
+
+
+@contextmanager
+def use_state(state, sink=None):
+    """Active `state` (et le récepteur des deltas partiels) pour le code exécuté dans le bloc."""
+    token = _current_state.set(state)
+    sink_token = _stream_sink.set(sink)
+    try:
+        yield state
+    finally:
+        _stream_sink.reset(sink_token)
+        _current_state.reset(token)
@@ -1,4 +1,8 @@
 # utils/simulator.py
+from cyber_attack_simulator.utils.network import get_default_universe
+from cyber_attack_simulator.utils.vulndb import get_default_database
+
+
 class RealisticSimulator:
     """Simule des comportements réalistes pour les commandes"""
 
@@ -11,11 +15,36 @@ class RealisticSimulator:
     @staticmethod
     def simulate_network_scan(target: str) -> dict:
         """Simule un scan réseau réaliste"""
-        # Génère des ports ouverts, services, etc.
-        pass
+        # Ports ouverts, services et système de l'hôte dans l'univers réseau simulé
+        universe = get_default_universe()
+        index = universe.target_index(target)
+        return {
+            "target": target,
+            "alive": bool(universe.is_alive([index])[0]),
+            "open_ports": universe.open_ports(target),
+            "services": universe.host_services(target),
+            "os": universe.host_os(target),
+        }
 
     @staticmethod
-    def simulate_vulnerability_check(target: str) -> dict:
-        """Simule une vérification de vulnérabilité"""
-        # Génère des vulnérabilités réalistes
-        pass
+    def host_services(target: str) -> list:
+        """Services d'un hôte simulé : toujours les mêmes pour une même cible."""
+        return get_default_universe().host_services(target)
+
+    @staticmethod
+    def simulate_vulnerability_check(target: str, services: list = None, database=None) -> dict:
+        """
+        Simule une vérification de vulnérabilité
+
+        Les services (ceux de l'hôte simulé par défaut) sont confrontés à la base locale
+        de vulnérabilités ; retourne les services et les vulnérabilités trouvées.
+        """
+        if services is None:
+            services = RealisticSimulator.host_services(target)
+        database = database or get_default_database()
+        findings = []
+        for service, advisories in database.match_services(services):
+            for advisory in advisories:
+                findings.append(dict(advisory.to_dict(), port=service["port"], version=service["version"]))
+        findings.sort(key=lambda finding: -finding["cvss"])
+        return {"target": target, "services": services, "vulnerabilities": findings}
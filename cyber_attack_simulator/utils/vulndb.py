@@ -0,0 +1,175 @@
+# utils/vulndb.py
+import json
+import os
+import re
+from typing import NamedTuple
+
+DEFAULT_VULN_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'vulnerabilities.json')
+
+# Une version est encodée en entier : 5 composantes de 16 bits, comparables directement
+VERSION_PARTS = 5
+PART_BITS = 16
+UNBOUNDED = 1 << (VERSION_PARTS * PART_BITS)
+DEFAULT_MATCH_CACHE = 65536
+
+_VERSION_TOKEN = re.compile(r"\d+|[a-z]+")
+
+
+def encode_version(version: str) -> int:
+    """
+    Encode une chaîne de version ("2.4.49", "1.0.1f", "9.3p2") en entier ordonné.
+
+    Les lettres comptent comme une composante (a=1, b=2...) : 1.0.1 < 1.0.1f < 1.0.1g.
+    """
+    value = 0
+    parts = 0
+    for token in _VERSION_TOKEN.findall(version.lower()):
+        if parts == VERSION_PARTS:
+            break
+        part = int(token) if token.isdigit() else ord(token[0]) - 96
+        value = (value << PART_BITS) | min(part, (1 << PART_BITS) - 1)
+        parts += 1
+    return value << (PART_BITS * (VERSION_PARTS - parts))
+
+
+class Advisory(NamedTuple):
+    """Vulnérabilité affectant les versions [introduced, fixed) d'un produit."""
+    id: str
+    product: str
+    introduced: str
+    fixed: str  # None : aucune version corrigée
+    severity: str
+    cvss: float
+    title: str
+    exploit: str  # Commande d'exploitation associée, ou None
+
+    def to_dict(self) -> dict:
+        return self._asdict()
+
+
+class IntervalTree:
+    """
+    Arbre d'intervalles statique [début, fin), stocké dans des tableaux triés.
+
+    Les intervalles sont triés par début ; le nœud d'une sous-plage est son milieu et
+    retient la plus grande fin de sa sous-plage, ce qui permet d'élaguer toute
+    sous-plage qui ne peut pas contenir le point. Une recherche coûte O(log n + k).
+    """
+    __slots__ = ("starts", "ends", "items", "max_end")
+
+    def __init__(self, intervals):
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [interval[0] for interval in ordered]
+        self.ends = [interval[1] for interval in ordered]
+        self.items = [interval[2] for interval in ordered]
+        self.max_end = list(self.ends)
+        self._build(0, len(ordered))
+
+    def __len__(self):
+        return len(self.items)
+
+    def _build(self, lo: int, hi: int):
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        self.max_end[mid] = max(self.ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+        return self.max_end[mid]
+
+    def stab(self, point: int) -> list:
+        """Éléments dont l'intervalle contient `point`, par début croissant."""
+        found = []
+        starts, ends, max_end = self.starts, self.ends, self.max_end
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if max_end[mid] <= point:
+                continue
+            if starts[mid] <= point:
+                # Le sous-arbre droit ne commence qu'après `mid` : empilé en premier, traité en dernier
+                stack.append((mid + 1, hi))
+                if point < ends[mid]:
+                    found.append(mid)
+            stack.append((lo, mid))
+        found.sort()
+        return [self.items[i] for i in found]
+
+
+class VulnerabilityDatabase:
+    """
+    Base locale de vulnérabilités : un arbre d'intervalles de versions par produit.
+
+    `match` est mis en cache par (produit, version) : sur un réseau, les mêmes
+    logiciels reviennent d'un hôte à l'autre et la recherche n'est faite qu'une fois.
+    """
+
+    def __init__(self, advisories, cache_size: int = DEFAULT_MATCH_CACHE):
+        by_product = {}
+        for advisory in advisories:
+            start = encode_version(advisory.introduced) if advisory.introduced else 0
+            end = encode_version(advisory.fixed) if advisory.fixed else UNBOUNDED
+            by_product.setdefault(advisory.product, []).append((start, end, advisory))
+        self.trees = {product: IntervalTree(intervals) for product, intervals in by_product.items()}
+        self.count = sum(len(tree) for tree in self.trees.values())
+        self.cache_size = cache_size
+        self._cache = {}
+
+    @classmethod
+    def from_data(cls, data: dict, **kwargs) -> "VulnerabilityDatabase":
+        return cls((Advisory(
+            id=entry["id"],
+            product=entry["product"].lower(),
+            introduced=entry.get("introduced"),
+            fixed=entry.get("fixed"),
+            severity=entry.get("severity", "medium"),
+            cvss=float(entry.get("cvss", 0.0)),
+            title=entry.get("title", ""),
+            exploit=entry.get("exploit"),
+        ) for entry in data.get("advisories", [])), **kwargs)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_VULN_FILE, **kwargs) -> "VulnerabilityDatabase":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_data(json.load(f), **kwargs)
+
+    def __len__(self):
+        return self.count
+
+    def match(self, product: str, version: str) -> tuple:
+        """Vulnérabilités affectant une version d'un produit."""
+        key = (product, version)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        tree = self.trees.get(product.lower())
+        found = tuple(tree.stab(encode_version(version))) if tree is not None and version else ()
+        if not self.cache_size:
+            return found
+        if len(self._cache) >= self.cache_size:
+            # Éviction du plus ancien (ordre d'insertion des dict)
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = found
+        return found
+
+    def match_services(self, services) -> list:
+        """Couples (service, vulnérabilités) pour des services {"product", "version", ...} vulnérables."""
+        matches = []
+        match = self.match
+        for service in services:
+            found = match(service["product"], service["version"])
+            if found:
+                matches.append((service, found))
+        return matches
+
+
+_default_database = None
+
+
+def get_default_database() -> VulnerabilityDatabase:
+    """Base livrée (data/vulnerabilities.json), chargée une seule fois et partagée."""
+    global _default_database
+    if _default_database is None:
+        _default_database = VulnerabilityDatabase.load()
+    return _default_database
@@ -0,0 +1,235 @@
+# utils/wordlist.py
+import mmap
+import os
+import re
+from zlib import crc32
+
+WORDLIST_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'wordlists')
+
+DEFAULT_CHUNK_SIZE = 1 << 18     # Octets lus par bloc
+DEFAULT_BLOOM_BITS = 1 << 23     # 1 Mo de bits : ~1 % de faux positifs à 800 000 mots distincts
+DEFAULT_BLOOM_HASHES = 5
+
+_LEET = str.maketrans({"a": "4", "e": "3", "i": "1", "o": "0", "s": "5", "t": "7"})
+
+
+class WordlistError(ValueError):
+    """Wordlist introuvable ou règle de mutation invalide."""
+
+
+def resolve_wordlist(name: str, allow_paths: bool = False) -> str:
+    """
+    Chemin d'une wordlist livrée (data/wordlists/<nom>[.txt]).
+
+    Les chemins arbitraires ne sont acceptés qu'avec `allow_paths` : un client du
+    serveur ne doit pas pouvoir lire n'importe quel fichier de la machine.
+    """
+    if allow_paths and os.path.isfile(name):
+        return name
+    base = os.path.basename(name)
+    for candidate in (base, base + ".txt"):
+        path = os.path.join(WORDLIST_DIR, candidate)
+        if os.path.isfile(path):
+            return path
+    raise WordlistError(f"Wordlist '{name}' introuvable")
+
+
+def iter_line_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Lit un fichier projeté en mémoire par blocs de lignes entières.
+
+    Produit des couples (position atteinte en octets, lignes du bloc) : seule la page
+    en cours est chargée, la mémoire utilisée ne dépend pas de la taille du fichier.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    newline = mapped.rfind(b"\n", start, end)
+                    if newline == -1:
+                        # Ligne plus longue qu'un bloc : on l'étend jusqu'à sa fin
+                        newline = mapped.find(b"\n", end)
+                        end = size if newline == -1 else newline + 1
+                    else:
+                        end = newline + 1
+                yield end, mapped[start:end].decode('utf-8', errors='replace').splitlines()
+                start = end
+
+
+class BloomFilter:
+    """
+    Filtre de Bloom de taille fixe pour dédupliquer un flux de mots.
+
+    La mémoire est bornée quelle que soit la longueur du flux ; en contrepartie, de rares
+    faux positifs écartent un mot jamais vu (jamais l'inverse). Le hachage (CRC-32 du mot et
+    de ses octets inversés) est stable d'un processus à l'autre, contrairement à `hash()` :
+    les mêmes mots sont écartés à chaque exécution.
+    """
+    __slots__ = ("bits", "mask", "hashes")
+
+    def __init__(self, bits: int = DEFAULT_BLOOM_BITS, hashes: int = DEFAULT_BLOOM_HASHES):
+        size = 1 << max(3, (bits - 1).bit_length())  # Puissance de deux pour un masque
+        self.bits = bytearray(size >> 3)
+        self.mask = size - 1
+        self.hashes = hashes
+
+    def add(self, item: str) -> bool:
+        """Ajoute un mot ; retourne False s'il était (probablement) déjà présent."""
+        data = item.encode()
+        h1 = crc32(data)
+        # Une graine différente ne ferait que xorer une constante (CRC linéaire) : octets inversés
+        h2 = crc32(data[::-1]) | 1
+        bits = self.bits
+        new = False
+        for i in range(self.hashes):
+            position = (h1 + i * h2) & self.mask
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                new = True
+        return new
+
+
+def compile_rule(rule: str):
+    """Compile une règle de mutation en fonction mot -> variantes."""
+    name, _, argument = rule.partition(":")
+    if name == "lower":
+        return lambda word: (word.lower(),)
+    if name == "upper":
+        return lambda word: (word.upper(),)
+    if name == "capitalize":
+        return lambda word: (word.capitalize(),)
+    if name == "reverse":
+        return lambda word: (word[::-1],)
+    if name == "leet":
+        return lambda word: (word.lower().translate(_LEET),)
+    if name == "prefix":
+        return lambda word: (argument + word,)
+    if name == "suffix":
+        return lambda word: (word + argument,)
+    if name == "digits":
+        width = int(argument or 1)
+        suffixes = tuple(str(n).zfill(width) for n in range(10 ** width))
+        return lambda word: tuple(word + suffix for suffix in suffixes)
+    raise WordlistError(f"Règle de mutation inconnue: {rule}")
+
+
+class WordlistProgress:
+    """Avancement d'un flux de wordlist, transmis au rappel de progression à chaque bloc."""
+    __slots__ = ("bytes_read", "total_bytes", "lines", "candidates")
+
+    def __init__(self, total_bytes: int):
+        self.bytes_read = 0
+        self.total_bytes = total_bytes
+        self.lines = 0
+        self.candidates = 0
+
+    @property
+    def fraction(self) -> float:
+        return self.bytes_read / self.total_bytes if self.total_bytes else 1.0
+
+
+class Wordlist:
+    """
+    Flux de candidats tirés d'une wordlist, traité bloc par bloc.
+
+        Wordlist(path).mutate(["lower", "suffix:-dev"]).dedupe().limit(10000)
+
+    Les étapes s'appliquent dans l'ordre d'appel, sur des listes de la taille d'un bloc :
+    la mémoire reste constante quel que soit le nombre de lignes du fichier. Chaque
+    itération reconstruit les étapes à état (filtre de `dedupe`) : le flux peut être relu.
+    """
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, progress=None):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.progress_callback = progress
+        self.stages = []  # Fabriques d'étapes, appelées au début de chaque lecture
+        self.max_candidates = None
+        self.progress = None
+
+    @classmethod
+    def named(cls, name: str, **kwargs) -> "Wordlist":
+        return cls(resolve_wordlist(name), **kwargs)
+
+    # --- Étapes du pipeline ---
+
+    def _stage(self, stage) -> "Wordlist":
+        """Ajoute une étape sans état, partagée par toutes les lectures."""
+        self.stages.append(lambda: stage)
+        return self
+
+    def filter(self, predicate) -> "Wordlist":
+        return self._stage(lambda words: [word for word in words if predicate(word)])
+
+    def match(self, pattern: str) -> "Wordlist":
+        """Ne garde que les mots entièrement conformes à une expression régulière."""
+        fullmatch = re.compile(pattern).fullmatch
+        return self.filter(lambda word: fullmatch(word) is not None)
+
+    def length(self, minimum: int = 1, maximum: int = None) -> "Wordlist":
+        if maximum is None:
+            return self.filter(lambda word: len(word) >= minimum)
+        return self.filter(lambda word: minimum <= len(word) <= maximum)
+
+    def mutate(self, rules, keep_original: bool = True) -> "Wordlist":
+        """Ajoute les variantes produites par chaque règle (voir compile_rule)."""
+        mutations = tuple(compile_rule(rule) for rule in rules)
+
+        def stage(words):
+            out = []
+            for word in words:
+                if keep_original:
+                    out.append(word)
+                for mutation in mutations:
+                    out.extend(mutation(word))
+            return out
+        return self._stage(stage)
+
+    def dedupe(self, bits: int = None, hashes: int = DEFAULT_BLOOM_HASHES) -> "Wordlist":
+        """Écarte les doublons ; le filtre est dimensionné d'après le fichier, plafonné à `DEFAULT_BLOOM_BITS`."""
+        if bits is None:
+            bits = min(DEFAULT_BLOOM_BITS, max(1 << 16, os.path.getsize(self.path) * 8))
+
+        def make_stage():
+            bloom = BloomFilter(bits, hashes)
+            return lambda words: [word for word in words if bloom.add(word)]
+        self.stages.append(make_stage)
+        return self
+
+    def limit(self, count: int) -> "Wordlist":
+        self.max_candidates = count
+        return self
+
+    # --- Lecture ---
+
+    def chunks(self):
+        """Produit les candidats par listes, une par bloc du fichier."""
+        self.progress = progress = WordlistProgress(os.path.getsize(self.path))
+        remaining = self.max_candidates
+        stages = [make_stage() for make_stage in self.stages]
+        for position, lines in iter_line_chunks(self.path, self.chunk_size):
+            progress.bytes_read = position
+            progress.lines += len(lines)
+            words = [word for word in map(str.strip, lines) if word and not word.startswith("#")]
+            for stage in stages:
+                words = stage(words)
+            if remaining is not None:
+                words = words[:remaining]
+                remaining -= len(words)
+            progress.candidates += len(words)
+            if self.progress_callback is not None:
+                self.progress_callback(progress)
+            if words:
+                yield words
+            if remaining == 0:
+                return
+
+    def __iter__(self):
+        for words in self.chunks():
+            yield from words